@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  compression.py
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Compare the compressed size and the decompression (decode) time of the
+  compressions supported by 'securesystemslib.util' (gzip, bz2 and xz) for a
+  large, targets-like JSON metadata file.
+
+  Usage:
+    $ python benchmarks/compression.py [number_of_targets]
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import sys
+import gzip
+import bz2
+import json
+import hashlib
+import shutil
+import tempfile
+import timeit
+
+import securesystemslib.util
+
+try:
+  import lzma
+
+except ImportError: # pragma: no cover
+  lzma = None
+
+
+def make_targets_json(number_of_targets):
+  targets = {}
+  for index in range(number_of_targets):
+    targets['/packages/package-' + str(index) + '.tar.gz'] = {
+      'hashes': {
+        'sha256': hashlib.sha256(
+            str(index).encode('utf-8')).hexdigest(),
+        'sha512': hashlib.sha512(
+            str(index).encode('utf-8')).hexdigest()},
+      'length': index * 17 % 100000}
+
+  signed = {'_type': 'Targets', 'version': 1,
+      'expires': '2030-01-01T00:00:00Z', 'targets': targets}
+
+  return json.dumps({'signatures': [], 'signed': signed}, indent=1,
+      sort_keys=True).encode('utf-8')
+
+
+def main():
+  number_of_targets = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+  data = make_targets_json(number_of_targets)
+
+  compressors = [('gz', gzip.compress if hasattr(gzip, 'compress') else None),
+      ('bz2', bz2.compress)]
+  if lzma is not None:
+    compressors.append(('xz', lzma.compress))
+
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    print('Uncompressed: ' + str(len(data)) + ' bytes (' +
+        str(number_of_targets) + ' targets)')
+    print('{0:>6} {1:>12} {2:>8} {3:>16}'.format('codec', 'bytes', 'ratio',
+        'load_json_file'))
+
+    for extension, compress in compressors:
+      if compress is None: # pragma: no cover
+        continue
+
+      filepath = os.path.join(temporary_directory,
+          'targets.json.' + extension)
+      with open(filepath, 'wb') as file_object:
+        file_object.write(compress(data))
+
+      size = os.path.getsize(filepath)
+      seconds = min(timeit.repeat(
+          lambda: securesystemslib.util.load_json_file(filepath),
+          number=1, repeat=5))
+
+      print('{0:>6} {1:>12} {2:>8.3f} {3:>15.4f}s'.format(extension, size,
+          size / len(data), seconds))
+
+  finally:
+    shutil.rmtree(temporary_directory)
+
+
+if __name__ == '__main__':
+  main()
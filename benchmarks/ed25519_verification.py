@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  ed25519_verification.py
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Measure the throughput (signatures per second) of ed25519 signature
+  verification with the pure Python implementation of ed25519
+  ('securesystemslib._vendor.ed25519'), which is used when PyNaCl is
+  unavailable, one by one and in a batch
+  ('securesystemslib.ed25519_keys.verify_signatures()'), and with PyNaCl for
+  comparison.  The signatures are made by a
+  few keys, over targets-like metadata of a typical size.
+
+  Usage:
+    $ python benchmarks/ed25519_verification.py [number_of_signatures]
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import sys
+import json
+import timeit
+
+import securesystemslib.ed25519_keys
+
+
+def main():
+  number_of_signatures = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+  keys = [securesystemslib.ed25519_keys.generate_public_and_private()
+      for index in range(4)]
+  jobs = []
+  for index in range(number_of_signatures):
+    public, private = keys[index % len(keys)]
+    data = json.dumps({'_type': 'Targets', 'version': index,
+        'targets': dict(('/file-' + str(number), {'length': number})
+        for number in range(20))}).encode('utf-8')
+    signature, scheme = securesystemslib.ed25519_keys.create_signature(public,
+        private, data, 'ed25519')
+    jobs.append((public, signature, data))
+
+  def verify(use_pynacl):
+    for public, signature, data in jobs:
+      assert securesystemslib.ed25519_keys.verify_signature(public, 'ed25519',
+          signature, data, use_pynacl=use_pynacl)
+
+  def verify_batch(use_pynacl):
+    assert all(securesystemslib.ed25519_keys.verify_signatures(
+        [(public, 'ed25519', signature, data)
+        for public, signature, data in jobs], use_pynacl))
+
+  print(str(number_of_signatures) + ' ed25519 signatures')
+  print('{0:>14} {1:>12} {2:>14}'.format('library', 'us/signature',
+      'signatures/s'))
+
+  for library, function, use_pynacl in [('pure python', verify, False),
+      ('batch', verify_batch, False), ('pynacl', verify, True)]:
+    # The tables of the pure Python implementation are computed the first time
+    # that it is used.
+    function(use_pynacl)
+    seconds = min(timeit.repeat(lambda: function(use_pynacl), number=1,
+        repeat=3))
+
+    print('{0:>14} {1:>12.1f} {2:>14.1f}'.format(library,
+        seconds / number_of_signatures * 1000000,
+        number_of_signatures / seconds))
+
+
+if __name__ == '__main__':
+  main()
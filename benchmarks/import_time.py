@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  import_time.py
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Measure the time it takes to import a securesystemslib module (by default,
+  'securesystemslib.keys') in a new interpreter, as short-lived command-line
+  tools do, with Python's '-X importtime' option (Python 3.7+).  The
+  bytecode cache is written to a temporary directory before the module is
+  imported repeatedly, and the fastest run is reported along with the modules
+  that take the longest to import, and the crypto libraries that were
+  imported.
+
+  Usage:
+    $ python benchmarks/import_time.py [module] [number_of_runs]
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+
+
+# The crypto libraries that should not be imported until they are used.
+CRYPTO_LIBRARIES = ['Crypto', 'cryptography', 'nacl']
+
+
+def import_module(module_name, environment):
+  """
+  Import 'module_name' in a new interpreter, and return the '-X importtime'
+  entries as (module name, self microseconds, cumulative microseconds).
+  """
+
+  output = subprocess.check_output([sys.executable, '-X', 'importtime', '-c',
+      'import ' + module_name], stderr=subprocess.STDOUT, env=environment)
+
+  entries = []
+  for line in output.decode('utf-8').splitlines():
+    if not line.startswith('import time:') or 'self [us]' in line:
+      continue
+
+    self_time, cumulative_time, name = line[len('import time:'):].split('|')
+    entries.append((name.strip(), int(self_time), int(cumulative_time)))
+
+  return entries
+
+
+def main():
+  module_name = sys.argv[1] if len(sys.argv) > 1 else 'securesystemslib.keys'
+  number_of_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+  # Import the securesystemslib in this directory, with a bytecode cache, as
+  # an installed package would be.
+  environment = dict(os.environ)
+  environment.pop('PYTHONDONTWRITEBYTECODE', None)
+  environment['PYTHONPATH'] = os.path.dirname(os.path.dirname(
+      os.path.abspath(__file__)))
+  environment['PYTHONPYCACHEPREFIX'] = tempfile.mkdtemp()
+
+  try:
+    # Write the bytecode cache.
+    import_module(module_name, environment)
+
+    runs = [import_module(module_name, environment)
+        for index in range(number_of_runs)]
+
+  finally:
+    shutil.rmtree(environment['PYTHONPYCACHEPREFIX'])
+
+  def total_time(entries):
+    return [cumulative_time for name, self_time, cumulative_time in entries
+        if name == module_name][0]
+
+  totals = sorted([total_time(entries) for entries in runs])
+  fastest_run = min(runs, key=total_time)
+
+  print('import ' + module_name + ': {0:.1f} ms (fastest), {1:.1f} ms'
+      ' (median) over {2} runs'.format(totals[0] / 1000,
+      totals[len(totals) // 2] / 1000, number_of_runs))
+
+  print('\nSlowest modules of the fastest run (self time):')
+  print('{0:>10} {1:>12}  {2}'.format('self [ms]', 'cumul. [ms]', 'module'))
+  for name, self_time, cumulative_time in sorted(fastest_run,
+      key=lambda entry: entry[1], reverse=True)[:15]:
+    print('{0:>10.2f} {1:>12.2f}  {2}'.format(self_time / 1000,
+        cumulative_time / 1000, name))
+
+  imported_libraries = sorted(set([name.split('.')[0]
+      for name, self_time, cumulative_time in fastest_run
+      if name.split('.')[0] in CRYPTO_LIBRARIES]))
+  print('\nCrypto libraries imported: ' + (', '.join(imported_libraries)
+      or 'none'))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  parallel_signing.py
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Measure how signing the metadata of a release (several payloads, each with a
+  threshold of keys) with 'securesystemslib.parallel.sign_payloads()' scales
+  with the number of workers, up to the number of CPUs, compared to calling
+  'securesystemslib.keys.create_signature()' for every payload and key in
+  turn.
+
+  Usage:
+    $ python benchmarks/parallel_signing.py [keytype] [number_of_payloads] [threads|processes]
+
+  where 'keytype' is 'ed25519' (default), 'rsa' or 'ecdsa-sha2-nistp256'.  The
+  pool type defaults to the one that 'sign_payloads()' selects for the keytype.
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import sys
+import hashlib
+import timeit
+import multiprocessing
+
+import securesystemslib.keys
+import securesystemslib.parallel
+
+
+KEY_GENERATORS = {
+  'ed25519': securesystemslib.keys.generate_ed25519_key,
+  'rsa': securesystemslib.keys.generate_rsa_key,
+  'ecdsa-sha2-nistp256': securesystemslib.keys.generate_ecdsa_key}
+
+
+def make_payload(index):
+  targets = {}
+  for target_index in range(500):
+    targets['/packages/package-' + str(target_index) + '.tar.gz'] = {
+      'hashes': {'sha256': hashlib.sha256(
+          str(index * target_index).encode('utf-8')).hexdigest()},
+      'length': target_index}
+
+  return {'_type': 'Targets', 'version': index,
+      'expires': '2030-01-01T00:00:00Z', 'targets': targets}
+
+
+def main():
+  keytype = sys.argv[1] if len(sys.argv) > 1 else 'ed25519'
+  number_of_payloads = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+  use_processes = None
+  if len(sys.argv) > 3:
+    use_processes = sys.argv[3] == 'processes'
+
+  # Every payload is signed by a threshold of three keys.
+  key_dicts = [KEY_GENERATORS[keytype]() for index in range(3)]
+  payloads = {}
+  for index in range(number_of_payloads):
+    payloads['role-' + str(index) + '.json'] = (make_payload(index), key_dicts)
+
+  def sign_serially():
+    return dict([(name, [securesystemslib.keys.create_signature(key_dict, data)
+        for key_dict in key_dicts]) for name, (data, key_dicts) in
+        payloads.items()])
+
+  serial_seconds = min(timeit.repeat(sign_serially, number=1, repeat=3))
+
+  print(str(number_of_payloads) + ' payloads x ' + str(len(key_dicts)) + ' ' +
+      keytype + ' keys, ' + str(multiprocessing.cpu_count()) + ' CPUs')
+  print('{0:>10} {1:>12} {2:>8}'.format('workers', 'seconds', 'speedup'))
+  print('{0:>10} {1:>11.4f}s {2:>8.2f}'.format('serial', serial_seconds, 1))
+
+  for max_workers in range(1, multiprocessing.cpu_count() + 1):
+    seconds = min(timeit.repeat(lambda: securesystemslib.parallel.sign_payloads(
+        payloads, max_workers=max_workers, use_processes=use_processes),
+        number=1, repeat=3))
+
+    print('{0:>10} {1:>11.4f}s {2:>8.2f}'.format(max_workers, seconds,
+        serial_seconds / seconds))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  parallel_verification.py
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Measure how the verification of many signatures with
+  'securesystemslib.parallel.VerificationExecutor' scales with the number of
+  workers, up to the number of CPUs, compared to the serial path
+  ('securesystemslib.keys.verify_signature()' for each signature in turn).
+
+  Usage:
+    $ python benchmarks/parallel_verification.py [keytype] [number_of_signatures] [threads|processes]
+
+  where 'keytype' is 'ed25519' (default), 'rsa' or 'ecdsa-sha2-nistp256'.  The
+  pool type defaults to the one that the executor selects for the keytype.
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import sys
+import timeit
+import multiprocessing
+
+import securesystemslib.keys
+import securesystemslib.parallel
+
+
+KEY_GENERATORS = {
+  'ed25519': securesystemslib.keys.generate_ed25519_key,
+  'rsa': securesystemslib.keys.generate_rsa_key,
+  'ecdsa-sha2-nistp256': securesystemslib.keys.generate_ecdsa_key}
+
+
+def main():
+  keytype = sys.argv[1] if len(sys.argv) > 1 else 'ed25519'
+  number_of_signatures = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+  use_processes = None
+  if len(sys.argv) > 3:
+    use_processes = sys.argv[3] == 'processes'
+
+  key_dicts = [KEY_GENERATORS[keytype]() for index in range(8)]
+  jobs = []
+  for index in range(number_of_signatures):
+    key_dict = key_dicts[index % len(key_dicts)]
+    data = {'_type': 'Targets', 'version': index}
+    jobs.append((securesystemslib.keys.create_signature(key_dict, data), data))
+
+  serial_jobs = [(key_dicts[index % len(key_dicts)], signature, data)
+      for index, (signature, data) in enumerate(jobs)]
+
+  def verify_serially():
+    return [securesystemslib.keys.verify_signature(key_dict, signature, data)
+        for key_dict, signature, data in serial_jobs]
+
+  serial_results = verify_serially()
+  serial_seconds = min(timeit.repeat(verify_serially, number=1, repeat=3))
+
+  print(str(number_of_signatures) + ' ' + keytype + ' signatures, ' +
+      str(multiprocessing.cpu_count()) + ' CPUs')
+  print('{0:>10} {1:>10} {2:>12} {3:>8}'.format('workers', 'pool', 'seconds',
+      'speedup'))
+  print('{0:>10} {1:>10} {2:>11.4f}s {3:>8.2f}'.format('serial', '-',
+      serial_seconds, 1))
+
+  for max_workers in range(1, multiprocessing.cpu_count() + 1):
+    with securesystemslib.parallel.VerificationExecutor(key_dicts,
+        max_workers=max_workers, use_processes=use_processes) as executor:
+      assert executor.verify(jobs) == serial_results
+      seconds = min(timeit.repeat(lambda: executor.verify(jobs), number=1,
+          repeat=3))
+
+      print('{0:>10} {1:>10} {2:>11.4f}s {3:>8.2f}'.format(max_workers,
+          'processes' if executor.use_processes else 'threads', seconds,
+          serial_seconds / seconds))
+
+
+if __name__ == '__main__':
+  main()
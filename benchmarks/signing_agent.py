@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  signing_agent.py
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Measure the latency of a signature by a key held by a local
+  'securesystemslib.agent.SigningAgent', compared to that of a short-lived
+  process that imports the encrypted key file and signs with it
+  ('securesystemslib.interface.import_signer_from_file()' followed by
+  'Signer.sign()').
+
+  Usage:
+    $ python benchmarks/signing_agent.py [keytype] [number_of_signatures]
+
+  where 'keytype' is 'ed25519' (default), 'rsa' or 'ecdsa-sha2-nistp256'.
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import securesystemslib.agent
+import securesystemslib.interface
+
+
+KEY_GENERATORS = {
+  'ed25519': securesystemslib.interface.generate_and_write_ed25519_keypair,
+  'rsa': securesystemslib.interface.generate_and_write_rsa_keypair,
+  'ecdsa-sha2-nistp256':
+      securesystemslib.interface.generate_and_write_ecdsa_keypair}
+
+
+def main():
+  keytype = sys.argv[1] if len(sys.argv) > 1 else 'ed25519'
+  number_of_signatures = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+  temporary_directory = tempfile.mkdtemp()
+  filepath = os.path.join(temporary_directory, 'key')
+  socket_path = os.path.join(temporary_directory, 'agent.sock')
+  data = {'_type': 'Targets', 'version': 1}
+
+  try:
+    KEY_GENERATORS[keytype](filepath, password='password')
+
+    start = time.time()
+    for index in range(5):
+      signer = securesystemslib.interface.import_signer_from_file(filepath,
+          keytype, password='password')
+      signer.sign(data)
+    import_seconds = (time.time() - start) / 5
+
+    with securesystemslib.agent.SigningAgent(socket_path) as agent:
+      agent.start()
+      keyid = securesystemslib.interface.add_key_to_agent(filepath, keytype,
+          password='password', socket_path=socket_path)
+
+      signer = securesystemslib.interface.import_signer_from_agent(keyid,
+          socket_path)
+      start = time.time()
+      for index in range(number_of_signatures):
+        signer.sign(data)
+      agent_seconds = (time.time() - start) / number_of_signatures
+      signer.close()
+
+  finally:
+    shutil.rmtree(temporary_directory)
+
+  print(keytype + ' signature latency')
+  print('{0:>24} {1:>12.1f} us'.format('import key file + sign',
+      import_seconds * 1e6))
+  print('{0:>24} {1:>12.1f} us'.format('signing agent',
+      agent_seconds * 1e6))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  verification_daemon.py
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Load test a local 'securesystemslib.daemon.VerificationDaemon': measure the
+  throughput (signatures per second) of an increasing number of concurrent
+  clients, each of which sends requests of a few signatures over the Unix
+  domain socket of the daemon, compared to the serial path
+  ('securesystemslib.keys.verify_signature()' for each signature in turn).
+  No network is needed.
+
+  Usage:
+    $ python benchmarks/verification_daemon.py [keytype] [number_of_signatures] [signatures_per_request]
+
+  where 'keytype' is 'ed25519' (default), 'rsa' or 'ecdsa-sha2-nistp256'.
+"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import multiprocessing
+
+import securesystemslib.daemon
+import securesystemslib.keys
+
+
+KEY_GENERATORS = {
+  'ed25519': securesystemslib.keys.generate_ed25519_key,
+  'rsa': securesystemslib.keys.generate_rsa_key,
+  'ecdsa-sha2-nistp256': securesystemslib.keys.generate_ecdsa_key}
+
+
+def main():
+  keytype = sys.argv[1] if len(sys.argv) > 1 else 'ed25519'
+  number_of_signatures = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+  signatures_per_request = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+  key_dicts = [KEY_GENERATORS[keytype]() for index in range(8)]
+  jobs = []
+  for index in range(number_of_signatures):
+    key_dict = key_dicts[index % len(key_dicts)]
+    data = {'_type': 'Targets', 'version': index}
+    jobs.append((key_dict, securesystemslib.keys.create_signature(key_dict,
+        data), data))
+
+  start = time.time()
+  serial_results = [securesystemslib.keys.verify_signature(*job)
+      for job in jobs]
+  serial_seconds = time.time() - start
+
+  print(str(number_of_signatures) + ' ' + keytype + ' signatures, ' +
+      str(signatures_per_request) + ' per request, ' +
+      str(multiprocessing.cpu_count()) + ' CPUs')
+  print('{0:>10} {1:>12} {2:>14}'.format('clients', 'seconds',
+      'signatures/s'))
+  print('{0:>10} {1:>11.4f}s {2:>14.1f}'.format('serial', serial_seconds,
+      number_of_signatures / serial_seconds))
+
+  temporary_directory = tempfile.mkdtemp()
+  socket_path = os.path.join(temporary_directory, 'daemon.sock')
+
+  try:
+    with securesystemslib.daemon.VerificationDaemon(key_dicts,
+        socket_path) as daemon:
+      daemon.start()
+
+      number_of_clients = 1
+      while number_of_clients <= 4 * multiprocessing.cpu_count():
+        seconds = _run_clients(socket_path, jobs, serial_results,
+            number_of_clients, signatures_per_request)
+        print('{0:>10} {1:>11.4f}s {2:>14.1f}'.format(number_of_clients,
+            seconds, number_of_signatures / seconds))
+        number_of_clients *= 2
+
+  finally:
+    shutil.rmtree(temporary_directory)
+
+
+def _run_clients(socket_path, jobs, serial_results, number_of_clients,
+    signatures_per_request):
+  """
+  Verify 'jobs' with 'number_of_clients' concurrent clients, which split the
+  requests between them, and return the elapsed seconds.
+  """
+
+  requests = [(start, jobs[start:start + signatures_per_request])
+      for start in range(0, len(jobs), signatures_per_request)]
+  clients = [securesystemslib.daemon.VerificationClient(socket_path)
+      for index in range(number_of_clients)]
+  results = [None] * len(jobs)
+
+  def send_requests(client, client_requests):
+    for start, request in client_requests:
+      results[start:start + len(request)] = client.verify_signatures(request)
+
+  threads = [threading.Thread(target=send_requests,
+      args=(client, requests[index::number_of_clients]))
+      for index, client in enumerate(clients)]
+
+  start = time.time()
+  for thread in threads:
+    thread.start()
+
+  for thread in threads:
+    thread.join()
+
+  seconds = time.time() - start
+
+  for client in clients:
+    client.close()
+
+  assert results == serial_results
+  return seconds
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,1074 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  agent.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Sign with private keys that are unlocked once, and held by a long-running
+  signing agent, in the manner of ssh-agent.  Importing an encrypted key file
+  (e.g., with 'securesystemslib.interface.import_signer_from_file()') derives
+  the key that decrypts it with PBKDF2 ('settings.PBKDF2_ITERATIONS'
+  iterations) and deserializes the private key, which takes hundreds of
+  milliseconds.  Once a key is added to a SigningAgent, short-lived processes
+  sign with it over the Unix domain socket of the agent, at the cost of a
+  single request.
+
+  The private keys never leave the agent: its clients can add and remove
+  keys, list the public keys, and request signatures, but no request returns
+  a private key.  A key may be added with a lifetime, after which the agent
+  removes it.
+
+  AgentClient connects to an agent, and AgentSigner is a drop-in replacement
+  for 'securesystemslib.keys.Signer' that signs with a key of an agent.  See
+  also 'securesystemslib.interface.add_key_to_agent()' and
+  'securesystemslib.interface.import_signer_from_agent()'.  The socket of the
+  agent defaults to 'settings.SIGNING_AGENT_SOCKET'.
+
+  Requests and responses are sent as the frames of 'securesystemslib.daemon'
+  (see 'securesystemslib.daemon.encode_frame()').  The body of a request is
+  the code of its operation (a byte), followed by its arguments, and the body
+  of a response is 0 (a byte), followed by the result of the operation, or 2,
+  followed by the exception that it raised (see
+  'securesystemslib.daemon.encode_exception()').
+
+  The socket is only accessible to the user that created it: it is created
+  with a umask that denies access to other users.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import json
+import time
+import errno
+import socket
+import struct
+import logging
+import binascii
+import threading
+
+import securesystemslib.daemon
+import securesystemslib.exceptions
+import securesystemslib.formats
+import securesystemslib.keys
+import securesystemslib.settings
+
+import six
+from six.moves import socketserver
+
+# See 'log.py' to learn how logging is handled in securesystemslib.
+logger = logging.getLogger('securesystemslib_agent')
+
+# The operations of a request.
+_ADD = 1
+_REMOVE = 2
+_REMOVE_ALL = 3
+_LIST = 4
+_SIGN = 5
+
+# The status of a response.
+_OK = 0
+_EXCEPTION = 2
+
+_KEYID_LENGTH = struct.Struct('!H')
+
+
+class SigningAgent(object):
+  """
+  <Purpose>
+    Hold unlocked private keys, and sign with them for the clients that
+    connect to the Unix domain socket 'socket_path'.  Keys are added with
+    add_key(), or by clients.  serve_forever() serves the requests in the
+    calling thread, and start() in a background thread, until close() is
+    called.  A SigningAgent may be used as a context manager, which closes it
+    on exit.
+
+    >>> import tempfile
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> data = 'The quick brown fox jumps over the lazy dog'
+    >>> socket_path = os.path.join(tempfile.mkdtemp(), 'agent.sock')
+    >>> with SigningAgent(socket_path) as agent:
+    ...   agent.add_key(key)
+    ...   agent.start()
+    ...   signer = AgentSigner(key['keyid'], socket_path)
+    ...   signer.sign(data) == securesystemslib.keys.create_signature(key, data)
+    True
+
+  <Arguments>
+    socket_path:
+      The path of the socket, which must not exist.  It is removed by
+      close().
+
+    max_lifetime:
+      The maximum lifetime of the keys of the agent, in seconds, which is
+      also the lifetime of keys that are added without one.  None if keys
+      are held until they are removed.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if Unix domain
+    sockets are unavailable on this platform.
+
+    socket.error, if the socket cannot be created (e.g., if 'socket_path'
+    exists).
+
+  <Side Effects>
+    Creates the socket.
+  """
+
+  def __init__(self, socket_path, max_lifetime=None):
+    _check_unix_sockets()
+    securesystemslib.formats.PATH_SCHEMA.check_match(socket_path)
+    if max_lifetime is not None:
+      securesystemslib.formats.THRESHOLD_SCHEMA.check_match(max_lifetime)
+
+    self.socket_path = socket_path
+    self.max_lifetime = max_lifetime
+
+    # The (Signer, public key dictionary, expiration time) of every keyid,
+    # and the timers that remove the keys when their lifetime is over.
+    self._keys = {}
+    self._timers = {}
+    self._lock = threading.Lock()
+    self._serving = False
+
+    # The socket is created with permissions 0o600, so that no other user can
+    # ever connect to it.  The umask is that of the process, and is restored
+    # as soon as the socket exists.
+    umask = os.umask(0o177)
+
+    try:
+      self._server = _UnixStreamServer(socket_path, _RequestHandler)
+
+    finally:
+      os.umask(umask)
+
+    self._server.signing_agent = self
+
+
+
+  def add_key(self, key_dict, lifetime=None):
+    """
+    <Purpose>
+      Add the private key 'key_dict' to the agent, for 'lifetime' seconds.  A
+      key that the agent already holds is replaced.
+
+    <Arguments>
+      key_dict:
+        A key conformant to 'securesystemslib.formats.ANYKEY_SCHEMA', or a Key
+        object, that contains a private key.
+
+      lifetime:
+        The number of seconds after which the key is removed, or None to use
+        the maximum lifetime of the agent.  It is limited to the maximum
+        lifetime.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      Any exception raised by 'securesystemslib.keys.Signer' for 'key_dict'.
+
+    <Side Effects>
+      Deserializes the private key.
+
+    <Returns>
+      None.
+    """
+
+    if lifetime is not None:
+      securesystemslib.formats.THRESHOLD_SCHEMA.check_match(lifetime)
+
+    if self.max_lifetime is not None:
+      lifetime = min(lifetime or self.max_lifetime, self.max_lifetime)
+
+    signer = securesystemslib.keys.Signer(key_dict)
+    if isinstance(key_dict, securesystemslib.keys.Key):
+      key_dict = key_dict.to_dict()
+
+    public_key_dict = dict(key_dict)
+    public_key_dict['keyval'] = {'public': key_dict['keyval']['public']}
+
+    expiration_time = None
+    if lifetime is not None:
+      expiration_time = time.time() + lifetime
+
+    with self._lock:
+      self._keys[signer.keyid] = (signer, public_key_dict, expiration_time)
+      self._cancel_timer(signer.keyid)
+
+      # The key is removed when its lifetime is over, even if the agent serves
+      # no request in the meantime.
+      if expiration_time is not None:
+        timer = threading.Timer(lifetime, self._expire_key,
+            [signer.keyid, expiration_time])
+        timer.daemon = True
+        timer.start()
+        self._timers[signer.keyid] = timer
+
+    logger.debug('Added key ' + repr(signer.keyid) + ' to the agent.')
+
+
+
+  def remove_key(self, keyid):
+    """
+    <Purpose>
+      Remove the key of 'keyid' from the agent.
+
+    <Arguments>
+      keyid:
+        The keyid of the key.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'keyid' is improperly
+      formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if the agent does not hold
+      the key.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      None.
+    """
+
+    securesystemslib.formats.KEYID_SCHEMA.check_match(keyid)
+
+    with self._lock:
+      self._remove_expired_keys()
+      if self._keys.pop(keyid, None) is None:
+        raise securesystemslib.exceptions.UnknownKeyError('The agent does not'
+            ' hold the key ' + repr(keyid) + '.')
+
+      self._cancel_timer(keyid)
+
+
+
+  def remove_all_keys(self):
+    """
+    <Purpose>
+      Remove all the keys of the agent.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      None.
+    """
+
+    with self._lock:
+      self._keys.clear()
+
+      for keyid in list(self._timers):
+        self._cancel_timer(keyid)
+
+
+
+  def list_keys(self):
+    """
+    <Purpose>
+      Return the public keys of the keys that the agent holds.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Removes the keys whose lifetime is over.
+
+    <Returns>
+      A list of key dictionaries, conformant to
+      'securesystemslib.formats.ANYKEY_SCHEMA', without their private keys.
+    """
+
+    with self._lock:
+      self._remove_expired_keys()
+      return [dict(public_key_dict)
+          for signer, public_key_dict, expiration_time in self._keys.values()]
+
+
+
+  def sign(self, keyid, data):
+    """
+    <Purpose>
+      Return the signature of 'data', a bytes-like object that is signed as
+      is, by the key of 'keyid' (see
+      'securesystemslib.keys.Signer.sign_over_bytes()').
+
+    <Arguments>
+      keyid:
+        The keyid of the key.
+
+      data:
+        The data to be signed, as a bytes-like object.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if the agent does not hold
+      the key.
+
+      securesystemslib.exceptions.CryptoError, if the signature cannot be
+      generated.
+
+    <Side Effects>
+      The cryptography library is called to generate the signature.
+
+    <Returns>
+      A signature dictionary, conformant to
+      'securesystemslib.formats.SIGNATURE_SCHEMA'.
+    """
+
+    securesystemslib.formats.KEYID_SCHEMA.check_match(keyid)
+
+    with self._lock:
+      self._remove_expired_keys()
+      held_key = self._keys.get(keyid)
+
+    if held_key is None:
+      raise securesystemslib.exceptions.UnknownKeyError('The agent does not'
+          ' hold the key ' + repr(keyid) + '.')
+
+    return held_key[0].sign_over_bytes(data)
+
+
+
+  def serve_forever(self):
+    """
+    <Purpose>
+      Serve requests in the calling thread until close() is called (from
+      another thread).
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Accepts connections on the socket, and serves each of them in a thread.
+
+    <Returns>
+      None.
+    """
+
+    self._serving = True
+    logger.debug('Serving signing requests on ' + repr(self.socket_path))
+    self._server.serve_forever()
+
+
+
+  def start(self):
+    """
+    <Purpose>
+      Serve requests in a background thread until close() is called.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Starts a thread that calls serve_forever().
+
+    <Returns>
+      None.
+    """
+
+    self._serving = True
+    thread = threading.Thread(target=self.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+
+
+  def close(self):
+    """
+    <Purpose>
+      Stop serving requests, remove all the keys, and remove the socket.  The
+      agent can no longer be used.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Closes the socket.
+
+    <Returns>
+      None.
+    """
+
+    if self._serving:
+      self._server.shutdown()
+      self._serving = False
+
+    self._server.server_close()
+    self.remove_all_keys()
+
+    try:
+      os.remove(self.socket_path)
+
+    except OSError as e: # pragma: no cover
+      if e.errno != errno.ENOENT:
+        raise
+
+
+
+  def __enter__(self):
+    return self
+
+
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.close()
+
+
+
+  def _remove_expired_keys(self):
+    """
+    Remove the keys whose lifetime is over.  The caller holds the lock.
+    """
+
+    now = time.time()
+    for keyid, (signer, public_key_dict, expiration_time) in \
+        list(self._keys.items()):
+      if expiration_time is not None and expiration_time <= now:
+        del self._keys[keyid]
+        self._cancel_timer(keyid)
+        logger.debug('The lifetime of key ' + repr(keyid) + ' is over.')
+
+
+
+  def _expire_key(self, keyid, expiration_time):
+    """
+    Remove the key of 'keyid' when its timer fires, unless it has been
+    replaced since.
+    """
+
+    with self._lock:
+      key = self._keys.get(keyid)
+      if key is not None and key[2] == expiration_time:
+        del self._keys[keyid]
+        self._timers.pop(keyid, None)
+        logger.debug('The lifetime of key ' + repr(keyid) + ' is over.')
+
+
+
+  def _cancel_timer(self, keyid):
+    """
+    Cancel the timer of the key of 'keyid', if any.  The caller holds the
+    lock.
+    """
+
+    timer = self._timers.pop(keyid, None)
+    if timer is not None:
+      timer.cancel()
+
+
+
+  def _handle_request(self, body):
+    """
+    Perform the request of 'body', the body of a frame, and return the result
+    of the operation, as bytes.
+    """
+
+    if not body:
+      raise securesystemslib.exceptions.FormatError('Empty request.')
+
+    operation = six.indexbytes(body, 0)
+    arguments = body[1:]
+
+    if operation == _SIGN:
+      try:
+        keyid_length, = _KEYID_LENGTH.unpack_from(arguments, 0)
+
+      except struct.error as e:
+        raise securesystemslib.exceptions.FormatError('Invalid request: ' +
+            str(e))
+
+      offset = _KEYID_LENGTH.size + keyid_length
+      keyid = arguments[_KEYID_LENGTH.size:offset].decode('utf-8')
+      signature = self.sign(keyid, memoryview(arguments)[offset:])
+      return binascii.unhexlify(signature['sig'].encode('utf-8'))
+
+    elif operation == _LIST:
+      return json.dumps(self.list_keys()).encode('utf-8')
+
+    elif operation == _ADD:
+      try:
+        key_dict, lifetime = json.loads(arguments.decode('utf-8'))
+
+      except (ValueError, TypeError) as e:
+        raise securesystemslib.exceptions.FormatError('Invalid request: ' +
+            str(e))
+
+      self.add_key(key_dict, lifetime)
+
+    elif operation == _REMOVE:
+      self.remove_key(arguments.decode('utf-8'))
+
+    elif operation == _REMOVE_ALL:
+      self.remove_all_keys()
+
+    else:
+      raise securesystemslib.exceptions.FormatError('Unknown operation: ' +
+          repr(operation))
+
+    return b''
+
+
+
+
+
+class AgentClient(object):
+  """
+  <Purpose>
+    A connection to the SigningAgent that listens on 'socket_path'.  The
+    methods of a client may be called from several threads, whose requests
+    are sent one at a time.  An AgentClient may be used as a context manager,
+    which closes it on exit.
+
+  <Arguments>
+    socket_path:
+      The path of the socket of the agent, or None for
+      'settings.SIGNING_AGENT_SOCKET'.
+
+    timeout:
+      The timeout of the socket, in seconds, or None to wait for the agent
+      indefinitely.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'socket_path' is improperly
+    formatted, or None and 'settings.SIGNING_AGENT_SOCKET' is not set.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if Unix domain
+    sockets are unavailable on this platform.
+
+    socket.error, if the client cannot connect to the agent.
+
+  <Side Effects>
+    Connects to the agent.
+  """
+
+  def __init__(self, socket_path=None, timeout=None):
+    if socket_path is None:
+      socket_path = securesystemslib.settings.SIGNING_AGENT_SOCKET
+
+    securesystemslib.formats.PATH_SCHEMA.check_match(socket_path)
+    _check_unix_sockets()
+
+    self.socket_path = socket_path
+    self._lock = threading.Lock()
+    self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+      self._socket.settimeout(timeout)
+      self._socket.connect(socket_path)
+
+    except Exception:
+      self._socket.close()
+      raise
+
+    self._file = self._socket.makefile('rb')
+
+
+
+  def add_key(self, key_dict, lifetime=None):
+    """
+    <Purpose>
+      Add the private key 'key_dict' to the agent.  See
+      'SigningAgent.add_key()'.
+
+    <Arguments>
+      key_dict:
+        A key conformant to 'securesystemslib.formats.ANYKEY_SCHEMA', or a Key
+        object, that contains a private key.
+
+      lifetime:
+        The number of seconds after which the key is removed, or None.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      Any exception raised by 'SigningAgent.add_key()' in the agent.
+
+    <Side Effects>
+      Sends the private key to the agent.
+
+    <Returns>
+      None.
+    """
+
+    if isinstance(key_dict, securesystemslib.keys.Key):
+      key_dict = key_dict.to_dict()
+
+    securesystemslib.formats.ANYKEY_SCHEMA.check_match(key_dict)
+    if lifetime is not None:
+      securesystemslib.formats.THRESHOLD_SCHEMA.check_match(lifetime)
+
+    self._request(_ADD, json.dumps([key_dict, lifetime]).encode('utf-8'))
+
+
+
+  def remove_key(self, keyid):
+    """
+    <Purpose>
+      Remove the key of 'keyid' from the agent.
+
+    <Arguments>
+      keyid:
+        The keyid of the key.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'keyid' is improperly
+      formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if the agent does not hold
+      the key.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      None.
+    """
+
+    securesystemslib.formats.KEYID_SCHEMA.check_match(keyid)
+    self._request(_REMOVE, keyid.encode('utf-8'))
+
+
+
+  def remove_all_keys(self):
+    """
+    <Purpose>
+      Remove all the keys of the agent.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      None.
+    """
+
+    self._request(_REMOVE_ALL, b'')
+
+
+
+  def list_keys(self):
+    """
+    <Purpose>
+      Return the public keys of the keys that the agent holds.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      A list of key dictionaries, conformant to
+      'securesystemslib.formats.ANYKEY_SCHEMA', without their private keys.
+    """
+
+    return json.loads(self._request(_LIST, b'').decode('utf-8'))
+
+
+
+  def sign(self, keyid, data):
+    """
+    <Purpose>
+      Return the signature of the canonical JSON encoding of 'data' by the key
+      of 'keyid' (see 'securesystemslib.keys.create_signature()').
+
+    <Arguments>
+      keyid:
+        The keyid of the key.
+
+      data:
+        The data object to be signed.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if the agent does not hold
+      the key.
+
+    <Side Effects>
+      The agent generates the signature.
+
+    <Returns>
+      A signature dictionary, conformant to
+      'securesystemslib.formats.SIGNATURE_SCHEMA'.
+    """
+
+    data = securesystemslib.formats.encode_canonical(data).encode('utf-8')
+    return self.sign_over_bytes(keyid, data)
+
+
+
+  def sign_over_bytes(self, keyid, data):
+    """
+    <Purpose>
+      Return the signature of 'data', a bytes-like object that is signed as
+      is, by the key of 'keyid' (see
+      'securesystemslib.keys.create_signature_over_bytes()').
+
+    <Arguments>
+      keyid:
+        The keyid of the key.
+
+      data:
+        The data to be signed, as a bytes-like object.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if the agent does not hold
+      the key.
+
+    <Side Effects>
+      The agent generates the signature.
+
+    <Returns>
+      A signature dictionary, conformant to
+      'securesystemslib.formats.SIGNATURE_SCHEMA'.
+    """
+
+    securesystemslib.formats.KEYID_SCHEMA.check_match(keyid)
+    securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
+
+    encoded_keyid = keyid.encode('utf-8')
+    sig = self._request(_SIGN, _KEYID_LENGTH.pack(len(encoded_keyid)) +
+        encoded_keyid + memoryview(data).tobytes())
+
+    return {'keyid': keyid, 'sig': binascii.hexlify(sig).decode('utf-8')}
+
+
+
+  def close(self):
+    """
+    <Purpose>
+      Close the connection to the agent.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Closes the socket.
+
+    <Returns>
+      None.
+    """
+
+    self._file.close()
+    self._socket.close()
+
+
+
+  def __enter__(self):
+    return self
+
+
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.close()
+
+
+
+  def _request(self, operation, arguments):
+    """
+    Send the request of 'operation' with 'arguments' (bytes), and return the
+    result of the operation, or raise its exception.
+    """
+
+    frame = securesystemslib.daemon.encode_frame(six.int2byte(operation) +
+        arguments)
+
+    with self._lock:
+      self._socket.sendall(frame)
+      response = securesystemslib.daemon.read_frame(self._file)
+
+    if not response:
+      raise securesystemslib.exceptions.Error('The signing agent closed the'
+          ' connection.')
+
+    if six.indexbytes(response, 0) == _EXCEPTION:
+      raise securesystemslib.daemon.decode_exception(response[1:])
+
+    return response[1:]
+
+
+
+
+
+class AgentSigner(object):
+  """
+  <Purpose>
+    A drop-in replacement for 'securesystemslib.keys.Signer' that signs with
+    the key of 'keyid' that a SigningAgent holds.  The signatures of sign()
+    and sign_many() are those of 'securesystemslib.keys.Signer'.
+
+  <Arguments>
+    keyid:
+      The keyid of the key.
+
+    socket_path:
+      The path of the socket of the agent, or None for
+      'settings.SIGNING_AGENT_SOCKET'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnknownKeyError, if the agent does not hold
+    the key.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if Unix domain
+    sockets are unavailable on this platform.
+
+    socket.error, if the client cannot connect to the agent.
+
+  <Side Effects>
+    Connects to the agent.
+  """
+
+  def __init__(self, keyid, socket_path=None):
+    securesystemslib.formats.KEYID_SCHEMA.check_match(keyid)
+
+    self._client = AgentClient(socket_path)
+
+    try:
+      for key_dict in self._client.list_keys():
+        if key_dict['keyid'] == keyid:
+          break
+
+      else:
+        raise securesystemslib.exceptions.UnknownKeyError('The agent does not'
+            ' hold the key ' + repr(keyid) + '.')
+
+    except Exception:
+      self._client.close()
+      raise
+
+    self.keyid = keyid
+    self.keytype = key_dict['keytype']
+    self.scheme = key_dict['scheme']
+    self.public_key_dict = key_dict
+
+
+
+  def sign(self, data):
+    """
+    <Purpose>
+      Return a signature dictionary of the canonical JSON encoding of 'data'.
+      See 'securesystemslib.keys.Signer.sign()'.
+
+    <Arguments>
+      data:
+        Data object to be signed.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'data' cannot be encoded in
+      canonical JSON format.
+
+      securesystemslib.exceptions.UnknownKeyError, if the agent no longer
+      holds the key.
+
+    <Side Effects>
+      The agent generates the signature.
+
+    <Returns>
+      A signature dictionary.
+    """
+
+    return self._client.sign(self.keyid, data)
+
+
+
+  def sign_over_bytes(self, data):
+    """
+    <Purpose>
+      Return a signature dictionary of 'data', a bytes-like object that is
+      signed as is.  See 'securesystemslib.keys.Signer.sign_over_bytes()'.
+
+    <Arguments>
+      data:
+        The data to be signed, as a bytes-like object.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'data' is not a bytes-like
+      object.
+
+      securesystemslib.exceptions.UnknownKeyError, if the agent no longer
+      holds the key.
+
+    <Side Effects>
+      The agent generates the signature.
+
+    <Returns>
+      A signature dictionary.
+    """
+
+    return self._client.sign_over_bytes(self.keyid, data)
+
+
+
+  def sign_many(self, data_objects):
+    """
+    <Purpose>
+      Return the list of signature dictionaries of each of the data objects
+      in the iterable 'data_objects', in the same order.
+
+    <Arguments>
+      data_objects:
+        An iterable of data objects to be signed.
+
+    <Exceptions>
+      Same as sign().
+
+    <Side Effects>
+      The agent generates the signatures.
+
+    <Returns>
+      A list of signature dictionaries.
+    """
+
+    return [self.sign(data) for data in data_objects]
+
+
+
+  def close(self):
+    """
+    <Purpose>
+      Close the connection to the agent.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Closes the socket.
+
+    <Returns>
+      None.
+    """
+
+    self._client.close()
+
+
+
+
+
+# Unix domain sockets, and the servers of the socketserver module that use
+# them, are unavailable on some platforms (e.g., Windows).  This module can
+# still be imported there, but a SigningAgent cannot be started.
+if hasattr(socket, 'AF_UNIX'):
+  class _UnixStreamServer(socketserver.ThreadingMixIn,
+      socketserver.UnixStreamServer):
+    """
+    The server of a SigningAgent, which serves every connection in a thread.
+    """
+
+    daemon_threads = True
+
+
+
+
+
+def _check_unix_sockets():
+  """
+  Raise 'securesystemslib.exceptions.UnsupportedLibraryError' if Unix domain
+  sockets are unavailable on this platform.
+  """
+
+  if not hasattr(socket, 'AF_UNIX'): # pragma: no cover
+    raise securesystemslib.exceptions.UnsupportedLibraryError('Unix domain'
+        ' sockets are unavailable on this platform.')
+
+
+
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+  """
+  Serve the requests of a connection, until it is closed or a frame is
+  improperly formatted.
+  """
+
+  def handle(self):
+    agent = self.server.signing_agent
+
+    while True:
+      try:
+        body = securesystemslib.daemon.read_frame(self.rfile)
+
+      except securesystemslib.exceptions.Error as e:
+        logger.warning('Closing a connection: ' + str(e))
+        return
+
+      if body is None:
+        return
+
+      try:
+        response = six.int2byte(_OK) + agent._handle_request(body)
+
+      except Exception as e:
+        response = six.int2byte(_EXCEPTION) + \
+            securesystemslib.daemon.encode_exception(e)
+
+      self.wfile.write(securesystemslib.daemon.encode_frame(response))
+
+
+
+if __name__ == '__main__':
+  # The interactive sessions of the documentation strings can
+  # be tested by running 'agent.py' as a standalone module.
+  # python -B agent.py
+  import doctest
+  doctest.testmod()
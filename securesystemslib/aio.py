@@ -0,0 +1,855 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  aio.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Awaitable versions of the CPU-bound operations of securesystemslib (signing,
+  verification, batch verification, key encryption and decryption, and key
+  file import), for applications that run an asyncio event loop.  Calling the
+  synchronous functions from a coroutine blocks the loop for the duration of
+  the operation, e.g., about a hundred milliseconds for the PBKDF2 key
+  derivation of 'securesystemslib.keys.decrypt_key()'.
+
+  The operations of an AsyncExecutor run in a pool of threads if their
+  cryptography library releases Python's global interpreter lock (see
+  'securesystemslib.keys.library_releases_gil()'), and in a pool of processes
+  otherwise, so that they neither block the loop nor hold the lock while it
+  runs.  The number of operations that are submitted to the pools at once is
+  limited ('max_pending'), and further operations wait, without a worker,
+  until one of them completes.  Cancelling the future of an operation that
+  waits, or that a worker has not started, withdraws it.
+
+  The methods of an AsyncExecutor, and the functions of this module, which
+  use a default AsyncExecutor, must be called from a thread with an event
+  loop (e.g., from a coroutine).  They return asyncio futures, which are
+  awaited:
+
+    signature = await securesystemslib.aio.create_signature(key, data)
+
+  The operations that run in a process pool are those of the libraries and
+  backends selected when the pool is started, and the arguments and results
+  of their calls are pickled.
+
+  asyncio is part of the standard library since Python 3.4.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import logging
+import threading
+import collections
+import multiprocessing
+
+import securesystemslib.backends
+import securesystemslib.exceptions
+import securesystemslib.formats
+import securesystemslib.interface
+import securesystemslib.keys
+
+try:
+  import asyncio
+  import concurrent.futures
+
+except ImportError: # pragma: no cover
+  asyncio = None
+
+# See 'log.py' to learn how logging is handled in securesystemslib.
+logger = logging.getLogger('securesystemslib_aio')
+
+# The number of operations that an AsyncExecutor submits to its pools at once,
+# per worker, when 'max_pending' is not specified.
+_PENDING_PER_WORKER = 4
+
+# The functions of interface.py that import a private key file of each key
+# type.
+_PRIVATE_KEY_IMPORTERS = {
+  'rsa': securesystemslib.interface.import_rsa_privatekey_from_file,
+  'ed25519': securesystemslib.interface.import_ed25519_privatekey_from_file,
+  'ecdsa-sha2-nistp256':
+      securesystemslib.interface.import_ecdsa_privatekey_from_file}
+
+# The AsyncExecutor of the functions of this module, which is created on first
+# use.
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+class AsyncExecutor(object):
+  """
+  <Purpose>
+    Run the operations of securesystemslib in a pool of threads or of
+    processes, and return an asyncio future of the result of each.  The
+    pools are started on first use, and are reused until close() is called.
+    An AsyncExecutor may be used as a context manager, which closes it on
+    exit.
+
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> data = 'The quick brown fox jumps over the lazy dog'
+    >>> async def sign_and_verify(executor):
+    ...   signature = await executor.create_signature(key, data)
+    ...   return await executor.verify_signature(key, signature, data)
+    >>> with AsyncExecutor(max_workers=2) as executor:
+    ...   asyncio.run(sign_and_verify(executor))
+    True
+
+  <Arguments>
+    max_workers:
+      The number of threads, and of processes, of the pools that the
+      executor starts.  The number of CPUs by default.
+
+    max_pending:
+      The maximum number of operations submitted to the pools at once.  By
+      default, a few per worker.
+
+    thread_pool:
+      A 'concurrent.futures.Executor' that runs the operations that release
+      the global interpreter lock, instead of a pool of threads started by
+      the executor.  It is not shut down by close().
+
+    process_pool:
+      A 'concurrent.futures.Executor' that runs the other operations, instead
+      of a pool of processes started by the executor.  It is not shut down
+      by close().  A thread pool may be given to run all the operations in
+      threads.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if asyncio is not
+    available.
+
+  <Side Effects>
+    None.
+  """
+
+  def __init__(self, max_workers=None, max_pending=None, thread_pool=None,
+      process_pool=None):
+
+    if asyncio is None: # pragma: no cover
+      raise securesystemslib.exceptions.UnsupportedLibraryError(
+          'Awaitable operations require "asyncio" (Python 3.4 or later).')
+
+    if max_workers is None:
+      max_workers = multiprocessing.cpu_count()
+
+    securesystemslib.formats.THRESHOLD_SCHEMA.check_match(max_workers)
+
+    if max_pending is None:
+      max_pending = max_workers * _PENDING_PER_WORKER
+
+    securesystemslib.formats.THRESHOLD_SCHEMA.check_match(max_pending)
+
+    for pool in [thread_pool, process_pool]:
+      if pool is not None and not isinstance(pool,
+          concurrent.futures.Executor):
+        raise securesystemslib.exceptions.FormatError('Expected a'
+            ' concurrent.futures.Executor, got ' + repr(type(pool)) + '.')
+
+    self.max_workers = max_workers
+    self.max_pending = max_pending
+
+    self._thread_pool = thread_pool
+    self._process_pool = process_pool
+    self._owned_pools = []
+
+    # The operations that wait for one of the 'max_pending' submitted
+    # operations to complete, and the number of submitted operations.  The
+    # lock protects them, and the pools, from the threads that complete the
+    # operations and the threads of other event loops.
+    self._lock = threading.Lock()
+    self._waiting_operations = collections.deque()
+    self._number_of_submitted_operations = 0
+    self._closed = False
+
+
+
+  def create_signature(self, key_dict, data):
+    """
+    <Purpose>
+      Return a future of the signature dictionary of 'data' by 'key_dict'.
+      See 'securesystemslib.keys.create_signature()'.
+
+    <Arguments>
+      key_dict:
+        A key conformant to 'securesystemslib.formats.ANYKEY_SCHEMA', or a Key
+        object, that contains a private key.
+
+      data:
+        The data object to be signed.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'key_dict' is improperly
+      formatted.
+
+      securesystemslib.exceptions.Error, if the executor is closed.
+
+      The future raises any exception that create_signature() raises.
+
+    <Side Effects>
+      Submits the operation to a pool.
+
+    <Returns>
+      An asyncio future of a signature dictionary, conformant to
+      'securesystemslib.formats.SIGNATURE_SCHEMA'.
+    """
+
+    key_dict = _get_key_dict(key_dict)
+
+    return self._submit(_key_releases_gil(key_dict),
+        securesystemslib.keys.create_signature, key_dict, data)
+
+
+
+  def verify_signature(self, key_dict, signature, data):
+    """
+    <Purpose>
+      Return a future of whether 'signature' is a valid signature of 'data' by
+      'key_dict'.  See 'securesystemslib.keys.verify_signature()'.
+
+    <Arguments>
+      key_dict:
+        A key conformant to 'securesystemslib.formats.ANYKEY_SCHEMA', or a Key
+        object.
+
+      signature:
+        A signature conformant to 'securesystemslib.formats.SIGNATURE_SCHEMA',
+        or a Signature object.
+
+      data:
+        The data object that was signed.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'key_dict' is improperly
+      formatted.
+
+      securesystemslib.exceptions.Error, if the executor is closed.
+
+      The future raises any exception that verify_signature() raises.
+
+    <Side Effects>
+      Submits the operation to a pool.
+
+    <Returns>
+      An asyncio future of a boolean.
+    """
+
+    key_dict = _get_key_dict(key_dict)
+
+    return self._submit(_key_releases_gil(key_dict),
+        securesystemslib.keys.verify_signature, key_dict, signature, data)
+
+
+
+  def verify_signatures(self, jobs):
+    """
+    <Purpose>
+      Return a future of the results of the verification of the signatures of
+      'jobs', which are verified together by a single worker, so that the
+      ed25519 signatures of the pure Python implementation are verified in a
+      batch.  See 'securesystemslib.keys.verify_signatures()', and
+      'securesystemslib.parallel' to verify many signatures with several
+      workers.
+
+    <Arguments>
+      jobs:
+        A list of (key_dict, signature, data) tuples, as passed to
+        'securesystemslib.keys.verify_signature()'.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'jobs' is improperly
+      formatted.
+
+      securesystemslib.exceptions.Error, if the executor is closed.
+
+      The future raises any exception that verify_signatures() raises.
+
+    <Side Effects>
+      Submits the operation to a pool.
+
+    <Returns>
+      An asyncio future of a list of booleans, in the order of 'jobs'.
+    """
+
+    if not isinstance(jobs, list):
+      raise securesystemslib.exceptions.FormatError('Expected a list of'
+          ' jobs, got ' + repr(type(jobs)) + '.')
+
+    checked_jobs = []
+    for job in jobs:
+      if not isinstance(job, tuple) or len(job) != 3:
+        raise securesystemslib.exceptions.FormatError('Expected a tuple of'
+            ' 3 items, got ' + repr(job) + '.')
+
+      key_dict, signature, data = job
+      checked_jobs.append((_get_key_dict(key_dict), signature, data))
+
+    releases_gil = all([_key_releases_gil(key_dict)
+        for key_dict, signature, data in checked_jobs])
+
+    return self._submit(releases_gil, securesystemslib.keys.verify_signatures,
+        checked_jobs)
+
+
+
+  def encrypt_key(self, key_object, password):
+    """
+    <Purpose>
+      Return a future of the encrypted key of 'key_object', encrypted with a
+      key derived from 'password'.  See 'securesystemslib.keys.encrypt_key()'.
+
+    <Arguments>
+      key_object:
+        A key conformant to 'securesystemslib.formats.ANYKEY_SCHEMA', or a Key
+        object.
+
+      password:
+        The password, or passphrase, to encrypt the key with.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      securesystemslib.exceptions.Error, if the executor is closed.
+
+      The future raises any exception that encrypt_key() raises.
+
+    <Side Effects>
+      Submits the operation to a pool.
+
+    <Returns>
+      An asyncio future of an encrypted key, conformant to
+      'securesystemslib.formats.ENCRYPTEDKEY_SCHEMA'.
+    """
+
+    key_object = _get_key_dict(key_object)
+    securesystemslib.formats.PASSWORD_SCHEMA.check_match(password)
+
+    releases_gil = securesystemslib.backends.general_library_releases_gil()
+    return self._submit(releases_gil, securesystemslib.keys.encrypt_key,
+        key_object, password)
+
+
+
+  def decrypt_key(self, encrypted_key, password):
+    """
+    <Purpose>
+      Return a future of the key of 'encrypted_key', decrypted with a key
+      derived from 'password'.  See 'securesystemslib.keys.decrypt_key()'.
+
+    <Arguments>
+      encrypted_key:
+        An encrypted key, conformant to
+        'securesystemslib.formats.ENCRYPTEDKEY_SCHEMA'.
+
+      password:
+        The password, or passphrase, to decrypt the key with.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      securesystemslib.exceptions.Error, if the executor is closed.
+
+      The future raises any exception that decrypt_key() raises, e.g.,
+      'securesystemslib.exceptions.CryptoError' for a wrong password.
+
+    <Side Effects>
+      Submits the operation to a pool.
+
+    <Returns>
+      An asyncio future of a key dictionary, conformant to
+      'securesystemslib.formats.ANYKEY_SCHEMA'.
+    """
+
+    securesystemslib.formats.ENCRYPTEDKEY_SCHEMA.check_match(encrypted_key)
+    securesystemslib.formats.PASSWORD_SCHEMA.check_match(password)
+
+    releases_gil = securesystemslib.backends.general_library_releases_gil()
+    return self._submit(releases_gil, securesystemslib.keys.decrypt_key,
+        encrypted_key, password)
+
+
+
+  def import_privatekey_from_file(self, filepath, keytype, password):
+    """
+    <Purpose>
+      Return a future of the key of the encrypted private key file in
+      'filepath', of key type 'keytype'.  See, e.g.,
+      'securesystemslib.interface.import_ed25519_privatekey_from_file()'.
+
+    <Arguments>
+      filepath:
+        <filepath> file, an encrypted key file.
+
+      keytype:
+        The key type of the key file, one of 'rsa', 'ed25519' or
+        'ecdsa-sha2-nistp256'.
+
+      password:
+        The password, or passphrase, to decrypt the key file.  Unlike the
+        functions of interface.py, the user is never prompted for it.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      securesystemslib.exceptions.Error, if the executor is closed.
+
+      The future raises any exception that the import function raises.
+
+    <Side Effects>
+      Submits the operation to a pool, which reads 'filepath'.
+
+    <Returns>
+      An asyncio future of a key dictionary, conformant to
+      'securesystemslib.formats.ANYKEY_SCHEMA'.
+    """
+
+    securesystemslib.formats.PATH_SCHEMA.check_match(filepath)
+    securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+    securesystemslib.formats.PASSWORD_SCHEMA.check_match(password)
+
+    releases_gil = securesystemslib.backends.general_library_releases_gil()
+    return self._submit(releases_gil, _PRIVATE_KEY_IMPORTERS[keytype],
+        filepath, password)
+
+
+
+  def close(self):
+    """
+    <Purpose>
+      Cancel the operations that wait to be submitted, and shut down the
+      pools that the executor started, after their operations complete.  The
+      executor can no longer be used.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Waits for the workers to finish.
+
+    <Returns>
+      None.
+    """
+
+    with self._lock:
+      self._closed = True
+      waiting_operations = list(self._waiting_operations)
+      self._waiting_operations.clear()
+      owned_pools = self._owned_pools
+      self._owned_pools = []
+
+    for operation in waiting_operations:
+      operation.complete(None)
+
+    for pool in owned_pools:
+      pool.shutdown(wait=True)
+
+
+
+  def __enter__(self):
+    return self
+
+
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.close()
+
+
+
+  def _submit(self, releases_gil, function, *args):
+    """
+    Return an asyncio future of the result of 'function' called with 'args'
+    in the thread pool if 'releases_gil' is True, and in the process pool
+    otherwise, once fewer than 'max_pending' operations are submitted.
+    """
+
+    loop = asyncio.get_event_loop()
+    operation = _Operation(loop, releases_gil, function, args)
+
+    with self._lock:
+      if self._closed:
+        raise securesystemslib.exceptions.Error('The executor is closed.')
+
+      submit = self._number_of_submitted_operations < self.max_pending
+      if submit:
+        self._number_of_submitted_operations += 1
+
+      else:
+        self._waiting_operations.append(operation)
+
+    operation.future.add_done_callback(
+        lambda future: future.cancelled() and self._cancel(operation))
+
+    if submit:
+      self._start(operation)
+
+    return operation.future
+
+
+
+  def _start(self, operation):
+    """
+    Submit 'operation' to its pool, or, if it is cancelled or cannot be
+    submitted, the next waiting operation, so that the number of submitted
+    operations is unchanged.
+    """
+
+    while operation is not None:
+      exception = None
+
+      with self._lock:
+        if not operation.cancelled:
+          try:
+            operation.concurrent_future = self._get_pool(
+                operation.releases_gil).submit(operation.function,
+                *operation.args)
+
+          # E.g., a process pool whose process was killed.
+          except Exception as e:
+            exception = e
+
+      if operation.concurrent_future is not None:
+        operation.concurrent_future.add_done_callback(
+            lambda concurrent_future, operation=operation:
+            self._complete(operation))
+        return
+
+      next_operation = self._release()
+      operation.complete(None, exception)
+      operation = next_operation
+
+
+
+  def _complete(self, operation):
+    """
+    Complete 'operation', whose concurrent future is done, and submit the next
+    waiting operation in its place.
+    """
+
+    next_operation = self._release()
+    operation.complete(operation.concurrent_future)
+    self._start(next_operation)
+
+
+
+  def _release(self):
+    """
+    Return the next waiting operation, which takes the place of a submitted
+    operation, or None if there is none.
+    """
+
+    with self._lock:
+      if self._waiting_operations and not self._closed:
+        return self._waiting_operations.popleft()
+
+      self._number_of_submitted_operations -= 1
+      return None
+
+
+
+  def _cancel(self, operation):
+    """
+    Withdraw 'operation', whose future is cancelled, if it is waiting or its
+    worker has not started it.
+    """
+
+    with self._lock:
+      operation.cancelled = True
+
+      try:
+        self._waiting_operations.remove(operation)
+
+      except ValueError:
+        pass
+
+    if operation.concurrent_future is not None:
+      operation.concurrent_future.cancel()
+
+
+
+  def _get_pool(self, releases_gil):
+    """
+    Return the thread pool if 'releases_gil' is True, and the process pool
+    otherwise, and start it if it is not started.  The caller holds the lock.
+    """
+
+    if releases_gil:
+      if self._thread_pool is None:
+        self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+            self.max_workers)
+        self._owned_pools.append(self._thread_pool)
+
+      return self._thread_pool
+
+    if self._process_pool is None:
+      self._process_pool = concurrent.futures.ProcessPoolExecutor(
+          self.max_workers)
+      self._owned_pools.append(self._process_pool)
+      logger.debug('Started a pool of ' + repr(self.max_workers) +
+          ' processes.')
+
+    return self._process_pool
+
+
+
+
+
+class _Operation(object):
+  """
+  An operation of an AsyncExecutor: the call of 'function' with 'args' in the
+  thread pool if 'releases_gil' is True, and in the process pool otherwise,
+  whose result is set on an asyncio future of 'loop'.
+  """
+
+  def __init__(self, loop, releases_gil, function, args):
+    self.loop = loop
+    self.releases_gil = releases_gil
+    self.function = function
+    self.args = args
+    self.cancelled = False
+    self.concurrent_future = None
+
+    self.future = loop.create_future()
+
+
+
+  def complete(self, concurrent_future, exception=None):
+    """
+    Set the result or exception of 'concurrent_future', or 'exception', on
+    the future of the operation, from any thread.  The future is cancelled if
+    both are None, or if 'concurrent_future' is cancelled.
+    """
+
+    try:
+      self.loop.call_soon_threadsafe(_set_result, self.future,
+          concurrent_future, exception)
+
+    # The loop is closed, and nothing awaits the future.
+    except RuntimeError:
+      pass
+
+
+
+
+
+def create_signature(key_dict, data):
+  """
+  <Purpose>
+    Return a future of the signature dictionary of 'data' by 'key_dict', with
+    the default AsyncExecutor.  See 'AsyncExecutor.create_signature()'.
+
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> data = 'The quick brown fox jumps over the lazy dog'
+    >>> async def sign_and_verify():
+    ...   signature = await create_signature(key, data)
+    ...   return await verify_signature(key, signature, data)
+    >>> asyncio.run(sign_and_verify())
+    True
+  """
+
+  return get_default_executor().create_signature(key_dict, data)
+
+
+
+def verify_signature(key_dict, signature, data):
+  """
+  <Purpose>
+    Return a future of whether 'signature' is a valid signature of 'data' by
+    'key_dict', with the default AsyncExecutor.  See
+    'AsyncExecutor.verify_signature()'.
+  """
+
+  return get_default_executor().verify_signature(key_dict, signature, data)
+
+
+
+def verify_signatures(jobs):
+  """
+  <Purpose>
+    Return a future of the results of the verification of the signatures of
+    'jobs', with the default AsyncExecutor.  See
+    'AsyncExecutor.verify_signatures()'.
+  """
+
+  return get_default_executor().verify_signatures(jobs)
+
+
+
+def encrypt_key(key_object, password):
+  """
+  <Purpose>
+    Return a future of the encrypted key of 'key_object', with the default
+    AsyncExecutor.  See 'AsyncExecutor.encrypt_key()'.
+  """
+
+  return get_default_executor().encrypt_key(key_object, password)
+
+
+
+def decrypt_key(encrypted_key, password):
+  """
+  <Purpose>
+    Return a future of the key of 'encrypted_key', with the default
+    AsyncExecutor.  See 'AsyncExecutor.decrypt_key()'.
+  """
+
+  return get_default_executor().decrypt_key(encrypted_key, password)
+
+
+
+def import_privatekey_from_file(filepath, keytype, password):
+  """
+  <Purpose>
+    Return a future of the key of the encrypted private key file in
+    'filepath', with the default AsyncExecutor.  See
+    'AsyncExecutor.import_privatekey_from_file()'.
+  """
+
+  return get_default_executor().import_privatekey_from_file(filepath,
+      keytype, password)
+
+
+
+def get_default_executor():
+  """
+  <Purpose>
+    Return the AsyncExecutor of the functions of this module, which is
+    created with the default arguments on first use.
+
+  <Arguments>
+    None.
+
+  <Exceptions>
+    securesystemslib.exceptions.UnsupportedLibraryError, if asyncio is not
+    available.
+
+  <Side Effects>
+    Creates the default executor.
+
+  <Returns>
+    An AsyncExecutor.
+  """
+
+  global _default_executor
+
+  with _default_executor_lock:
+    if _default_executor is None:
+      _default_executor = AsyncExecutor()
+
+    return _default_executor
+
+
+
+def set_default_executor(executor):
+  """
+  <Purpose>
+    Replace the AsyncExecutor of the functions of this module (e.g., with one
+    that limits the number of pending operations, or whose pools are those of
+    the application).  The previous executor is not closed.
+
+  <Arguments>
+    executor:
+      An AsyncExecutor, or None to create a new default executor on first
+      use.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'executor' is not an
+    AsyncExecutor.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    None.
+  """
+
+  if executor is not None and not isinstance(executor, AsyncExecutor):
+    raise securesystemslib.exceptions.FormatError('Expected an'
+        ' AsyncExecutor, got ' + repr(type(executor)) + '.')
+
+  global _default_executor
+
+  with _default_executor_lock:
+    _default_executor = executor
+
+
+
+
+
+def _get_key_dict(key_dict):
+  """
+  Return 'key_dict', or the dictionary of a Key object, after checking that
+  it is conformant to 'securesystemslib.formats.ANYKEY_SCHEMA'.
+  """
+
+  if isinstance(key_dict, securesystemslib.keys.Key):
+    key_dict = key_dict.to_dict()
+
+  securesystemslib.formats.ANYKEY_SCHEMA.check_match(key_dict)
+
+  return key_dict
+
+
+
+
+
+def _key_releases_gil(key_dict):
+  """
+  Return whether the libraries that sign and verify with 'key_dict' release
+  the global interpreter lock.
+  """
+
+  return securesystemslib.keys.library_releases_gil(key_dict['keytype'])
+
+
+
+
+
+def _set_result(future, concurrent_future, exception):
+  """
+  Set the result or exception of 'concurrent_future', or 'exception', on
+  'future', in the thread of its event loop.  See '_Operation.complete()'.
+  """
+
+  if future.done():
+    return
+
+  if exception is not None:
+    future.set_exception(exception)
+
+  elif concurrent_future is None or concurrent_future.cancelled():
+    future.cancel()
+
+  elif concurrent_future.exception() is not None:
+    future.set_exception(concurrent_future.exception())
+
+  else:
+    future.set_result(concurrent_future.result())
+
+
+
+if __name__ == '__main__':
+  # The interactive sessions of the documentation strings can
+  # be tested by running 'aio.py' as a standalone module.
+  # python -B aio.py
+  import doctest
+  doctest.testmod()
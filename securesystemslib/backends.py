@@ -0,0 +1,955 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  backends.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Provide the registry of the cryptography backends that create and verify
+  signatures for 'keys.py'.  A backend is a function that performs an
+  operation ('sign' or 'verify') for a (keytype, scheme), with a particular
+  cryptography library (e.g., 'pyca-cryptography' or 'pynacl').
+
+  The backends of the supported libraries are registered when this module is
+  imported, but a library is only imported the first time one of its backends
+  is used (see is_library_available()).  The library used for a keytype is
+  selected by 'settings' (RSA_CRYPTO_LIBRARY and ECDSA_CRYPTO_LIBRARY) or
+  set_library().
+  The library of a single (keytype, scheme, operation) may also be selected
+  with set_backend(), e.g., by 'calibration.py', which selects the fastest
+  backends if 'settings.CALIBRATE_BACKENDS' is set.  The backend of a
+  (keytype, scheme, operation) is resolved, i.e., its library selected and
+  checked, the first time it is needed, so that every later signature is
+  dispatched with a dictionary lookup.  Other libraries may register faster
+  backends with register_backend().
+
+  The general-purpose library that derives keys from passwords and encrypts
+  keys (see 'keys.encrypt_key()') is selected in the same way, by
+  'settings.GENERAL_CRYPTO_LIBRARY' or set_general_library().
+
+  A 'sign' backend is called as function(public, private, data, scheme) and
+  returns the signature as bytes.  A 'verify' backend is called as
+  function(public, signature, data, scheme) and returns True if the signature
+  is valid, and False otherwise.  'data' is a bytes-like object (e.g., bytes,
+  bytearray or memoryview), which backends should not copy, 'signature' is
+  bytes, and the public and private keys are those of the key dictionary,
+  except that those of ed25519 keys are raw 32-byte strings.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import logging
+import warnings
+import importlib
+import threading
+
+import securesystemslib.exceptions
+import securesystemslib.formats
+import securesystemslib.settings
+
+# The modules of the supported libraries.  A library is imported the first
+# time one of its backends is used, or its availability is checked, so that
+# importing 'keys.py' does not import every crypto library.
+_LIBRARY_MODULES = {
+  'pycrypto': ['securesystemslib.pycrypto_keys'],
+  'pyca-cryptography': ['securesystemslib.pyca_crypto_keys',
+      'securesystemslib.ecdsa_keys'],
+  'pynacl': ['nacl.signing', 'nacl.encoding',
+      'securesystemslib.ed25519_keys'],
+
+  # The optimized pure Python implementation of ed25519 is always available.
+  'ed25519': ['securesystemslib.ed25519_keys']}
+
+# Whether each library whose import has been attempted is available.
+_imported_libraries = {}
+
+# See 'log.py' to learn how logging is handled in securesystemslib.
+logger = logging.getLogger('securesystemslib_backends')
+
+# The registered backends of every (keytype, scheme, operation), in order of
+# preference.
+_backends = {}
+
+# The library selected for every keytype.  The backends of keytypes without a
+# selected library are those of the most preferred available library.
+# Ed25519 signatures have always been created and verified with PyNaCl if it
+# is available, regardless of 'settings.ED25519_CRYPTO_LIBRARY'.
+_selected_libraries = {
+  'rsa': securesystemslib.settings.RSA_CRYPTO_LIBRARY,
+  'ecdsa-sha2-nistp256': securesystemslib.settings.ECDSA_CRYPTO_LIBRARY}
+
+# The library selected for a single (keytype, scheme, operation), which takes
+# precedence over the library selected for the keytype.
+_selected_backends = {}
+
+# The supported and selected general-purpose libraries, and those that release
+# Python's global interpreter lock while they derive keys with PBKDF2.
+_SUPPORTED_GENERAL_LIBRARIES = ['pycrypto', 'pyca-cryptography']
+_GIL_RELEASING_GENERAL_LIBRARIES = ['pyca-cryptography']
+_general_library = securesystemslib.settings.GENERAL_CRYPTO_LIBRARY
+
+# Whether the backends have been calibrated (or calibration attempted), if
+# 'settings.CALIBRATE_BACKENDS' is set, and whether they are being calibrated.
+# Threads that need a backend while another calibrates wait for the lock; it
+# is reentrant because the calibrating thread itself uses the backends.
+_calibrated = False
+_calibrating = False
+_calibration_lock = threading.RLock()
+
+# The resolved backend of every (keytype, scheme, operation) that has been
+# used.  It is cleared whenever a backend is registered or a library selected.
+_resolved_backends = {}
+
+
+class Backend(object):
+  """
+  <Purpose>
+    A registered backend: the 'function' that performs an operation with
+    'library', and whether it releases Python's global interpreter lock
+    ('releases_gil'), so that the operation can run in parallel in threads.
+
+  <Arguments>
+    library:
+      The name of the cryptography library (e.g., 'pyca-cryptography').
+
+    function:
+      The callable that performs the operation.
+
+    releases_gil:
+      True if 'function' releases the global interpreter lock.
+
+  <Exceptions>
+    None.
+
+  <Side Effects>
+    None.
+  """
+
+  __slots__ = ['library', 'function', 'releases_gil']
+
+  def __init__(self, library, function, releases_gil=False):
+    self.library = library
+    self.function = function
+    self.releases_gil = releases_gil
+
+
+
+  def __repr__(self):
+    return 'Backend(' + repr(self.library) + ', ' + repr(self.function) + ')'
+
+
+
+
+
+def is_library_available(library):
+  """
+  <Purpose>
+    Determine whether 'library' can be used, importing its modules the first
+    time it is checked.  Libraries that only provide registered backends
+    (i.e., that are not supported by securesystemslib itself) are available.
+
+    >>> is_library_available('ed25519')
+    True
+
+  <Arguments>
+    library:
+      The name of the library (e.g., 'pyca-cryptography').
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'library' is improperly
+    formatted.
+
+  <Side Effects>
+    Imports the modules of 'library'.
+
+  <Returns>
+    Boolean.
+  """
+
+  try:
+    return _imported_libraries[library]
+
+  except KeyError:
+    pass
+
+  # Does 'library' have the correct format?
+  securesystemslib.formats.NAME_SCHEMA.check_match(library)
+
+  available = True
+
+  # NOTE: Version 0.2.3 of 'pynacl' prints: "UserWarning: reimporting '...'
+  # might overwrite older definitions." when importing 'nacl.signing'.
+  # Suppress user warnings temporarily (at least until this issue is fixed).
+  with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    try:
+      for module_name in _LIBRARY_MODULES.get(library, []):
+        importlib.import_module(module_name)
+
+    # PyNaCl's 'cffi' dependency may raise an 'IOError' exception when
+    # importing 'nacl.signing'.
+    except (ImportError, IOError): # pragma: no cover
+      available = False
+
+  _imported_libraries[library] = available
+
+  return available
+
+
+
+
+
+def register_backend(keytype, scheme, operation, library, function,
+    releases_gil=False):
+  """
+  <Purpose>
+    Register 'function' as the backend of 'library' that performs 'operation'
+    with keys of 'keytype' and 'scheme'.  The backend is preferred over the
+    backends registered before it, i.e., it is used if no library is selected
+    for 'keytype', or if 'library' is.  A backend registered for the same
+    (keytype, scheme, operation) and library is replaced.
+
+    >>> def verify_ed25519(public, signature, data, scheme):
+    ...   return False
+    >>> register_backend('ed25519', 'ed25519', 'verify', 'example',
+    ...     verify_ed25519)
+    >>> get_backend('ed25519', 'ed25519', 'verify').library
+    'example'
+    >>> unregister_backend('ed25519', 'ed25519', 'verify', 'example')
+
+  <Arguments>
+    keytype:
+      The key type (e.g., 'ed25519').
+
+    scheme:
+      The signature scheme (e.g., 'ed25519').
+
+    operation:
+      'sign' or 'verify'.
+
+    library:
+      The name of the library of the backend.
+
+    function:
+      The callable that performs the operation (see the module docstring for
+      the arguments it is called with).
+
+    releases_gil:
+      True if 'function' releases Python's global interpreter lock.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+  <Side Effects>
+    Clears the resolved backends.
+
+  <Returns>
+    None.
+  """
+
+  # Do the arguments have the correct format?
+  securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+  securesystemslib.formats.SIG_SCHEME_SCHEMA.check_match(scheme)
+  securesystemslib.formats.CRYPTO_OPERATION_SCHEMA.check_match(operation)
+  securesystemslib.formats.NAME_SCHEMA.check_match(library)
+  securesystemslib.formats.BOOLEAN_SCHEMA.check_match(releases_gil)
+
+  if not callable(function):
+    raise securesystemslib.exceptions.FormatError('Expected a callable'
+        ' backend, got ' + repr(function) + '.')
+
+  backends = [backend for backend in
+      _backends.get((keytype, scheme, operation), [])
+      if backend.library != library]
+  backends.insert(0, Backend(library, function, releases_gil))
+  _backends[(keytype, scheme, operation)] = backends
+
+  _resolved_backends.clear()
+
+
+
+
+
+def unregister_backend(keytype, scheme, operation, library):
+  """
+  <Purpose>
+    Remove the backend of 'library' that performs 'operation' with keys of
+    'keytype' and 'scheme'.
+
+  <Arguments>
+    keytype, scheme, operation, library:
+      See register_backend().
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if no such backend
+    is registered.
+
+  <Side Effects>
+    Clears the resolved backends.
+
+  <Returns>
+    None.
+  """
+
+  # Do the arguments have the correct format?
+  securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+  securesystemslib.formats.SIG_SCHEME_SCHEMA.check_match(scheme)
+  securesystemslib.formats.CRYPTO_OPERATION_SCHEMA.check_match(operation)
+  securesystemslib.formats.NAME_SCHEMA.check_match(library)
+
+  backends = _backends.get((keytype, scheme, operation), [])
+  remaining_backends = [backend for backend in backends
+      if backend.library != library]
+
+  if len(remaining_backends) == len(backends):
+    raise securesystemslib.exceptions.UnsupportedLibraryError('No ' +
+        repr(library) + ' backend is registered for ' + repr(operation) +
+        ' with ' + repr(keytype) + ' keys and the ' + repr(scheme) +
+        ' scheme.')
+
+  _backends[(keytype, scheme, operation)] = remaining_backends
+  _resolved_backends.clear()
+
+
+
+
+
+def set_library(keytype, library):
+  """
+  <Purpose>
+    Select the library whose backends sign and verify with keys of 'keytype',
+    in place of the library selected by 'settings'.  The library is checked
+    when its backends are first used.
+
+  <Arguments>
+    keytype:
+      The key type (e.g., 'rsa').
+
+    library:
+      The name of the library (e.g., 'pycrypto'), or None to use the backends
+      of the most preferred available library.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+  <Side Effects>
+    Clears the resolved backends.
+
+  <Returns>
+    None.
+  """
+
+  # Do the arguments have the correct format?
+  securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+
+  if library is None:
+    _selected_libraries.pop(keytype, None)
+
+  else:
+    securesystemslib.formats.NAME_SCHEMA.check_match(library)
+    _selected_libraries[keytype] = library
+
+  _resolved_backends.clear()
+
+
+
+
+
+def get_library(keytype):
+  """
+  <Purpose>
+    Return the library selected for 'keytype', or None if the backends of the
+    most preferred available library are used.
+
+  <Arguments>
+    keytype:
+      The key type (e.g., 'rsa').
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'keytype' is improperly
+    formatted.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    The name of the library, or None.
+  """
+
+  # Does 'keytype' have the correct format?
+  securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+
+  return _selected_libraries.get(keytype)
+
+
+
+
+
+def set_backend(keytype, scheme, operation, library):
+  """
+  <Purpose>
+    Select the library whose backend performs 'operation' with keys of
+    'keytype' and 'scheme', in place of the library selected for 'keytype'.
+
+    >>> set_backend('ed25519', 'ed25519', 'verify', 'ed25519')
+    >>> get_backend('ed25519', 'ed25519', 'verify').library
+    'ed25519'
+    >>> set_backend('ed25519', 'ed25519', 'verify', None)
+
+  <Arguments>
+    keytype, scheme, operation:
+      See register_backend().
+
+    library:
+      The name of the library, or None to use the library selected for
+      'keytype'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+  <Side Effects>
+    Clears the resolved backends.
+
+  <Returns>
+    None.
+  """
+
+  # Do the arguments have the correct format?
+  securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+  securesystemslib.formats.SIG_SCHEME_SCHEMA.check_match(scheme)
+  securesystemslib.formats.CRYPTO_OPERATION_SCHEMA.check_match(operation)
+
+  if library is None:
+    _selected_backends.pop((keytype, scheme, operation), None)
+
+  else:
+    securesystemslib.formats.NAME_SCHEMA.check_match(library)
+    _selected_backends[(keytype, scheme, operation)] = library
+
+  _resolved_backends.clear()
+
+
+
+
+
+def get_registered_backends():
+  """
+  <Purpose>
+    Return the registered backends of every (keytype, scheme, operation), in
+    order of preference, whether or not their library is selected.  Backends
+    whose library is unavailable are omitted.
+
+  <Arguments>
+    None.
+
+  <Exceptions>
+    None.
+
+  <Side Effects>
+    Imports the libraries of the registered backends.
+
+  <Returns>
+    A dictionary that maps (keytype, scheme, operation) tuples to lists of
+    Backend objects.
+  """
+
+  registered_backends = {}
+  for operation, backends in _backends.items():
+    backends = [backend for backend in backends
+        if is_library_available(backend.library)]
+
+    if backends:
+      registered_backends[operation] = backends
+
+  return registered_backends
+
+
+
+
+
+def set_general_library(library):
+  """
+  <Purpose>
+    Select the general-purpose library that derives keys from passwords and
+    encrypts keys, in place of 'settings.GENERAL_CRYPTO_LIBRARY'.  The library
+    is checked when it is first used.
+
+  <Arguments>
+    library:
+      The name of the library (e.g., 'pyca-cryptography').
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'library' is improperly
+    formatted.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    None.
+  """
+
+  # Does 'library' have the correct format?
+  securesystemslib.formats.NAME_SCHEMA.check_match(library)
+
+  global _general_library
+  _general_library = library
+
+
+
+
+
+def get_general_library():
+  """
+  <Purpose>
+    Return the selected general-purpose library, after checking that it is
+    supported and available.
+
+    >>> get_general_library() in get_general_libraries()
+    True
+
+  <Arguments>
+    None.
+
+  <Exceptions>
+    securesystemslib.exceptions.UnsupportedLibraryError, if the selected
+    library is unsupported or unavailable.
+
+  <Side Effects>
+    Calibrates the backends if 'settings.CALIBRATE_BACKENDS' is set and they
+    have not been calibrated.
+
+  <Returns>
+    The name of the library.
+  """
+
+  _calibrate_on_first_use()
+
+  if _general_library not in _SUPPORTED_GENERAL_LIBRARIES:
+    raise securesystemslib.exceptions.UnsupportedLibraryError('The ' +
+        repr(_general_library) + ' general-purpose crypto library is not'
+        ' supported.\nSupported crypto libraries: ' +
+        repr(_SUPPORTED_GENERAL_LIBRARIES) + '.')
+
+  if not is_library_available(_general_library):
+    raise securesystemslib.exceptions.UnsupportedLibraryError('The ' +
+        repr(_general_library) + ' general-purpose crypto library could not'
+        ' be imported.')
+
+  return _general_library
+
+
+
+
+
+def get_general_libraries():
+  """
+  <Purpose>
+    Return the supported general-purpose libraries that are available.
+
+  <Arguments>
+    None.
+
+  <Exceptions>
+    None.
+
+  <Side Effects>
+    Imports the general-purpose libraries.
+
+  <Returns>
+    A list of library names.
+  """
+
+  return [library for library in _SUPPORTED_GENERAL_LIBRARIES
+      if is_library_available(library)]
+
+
+
+
+
+def get_backend(keytype, scheme, operation):
+  """
+  <Purpose>
+    Return the Backend that performs 'operation' with keys of 'keytype' and
+    'scheme'.  The backend is resolved the first time it is requested, and
+    looked up in a dictionary thereafter.
+
+    >>> backend = get_backend('ecdsa-sha2-nistp256', 'ecdsa-sha2-nistp256',
+    ...     'sign')
+    >>> backend.library
+    'pyca-cryptography'
+
+  <Arguments>
+    keytype:
+      The key type (e.g., 'rsa').
+
+    scheme:
+      The signature scheme (e.g., 'rsassa-pss-sha256').
+
+    operation:
+      'sign' or 'verify'.
+
+  <Exceptions>
+    securesystemslib.exceptions.UnsupportedAlgorithmError, if no backend is
+    registered for 'keytype', 'scheme' and 'operation'.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if the library
+    selected for 'keytype' has no backend for them, e.g., because it is
+    unsupported or unavailable.
+
+  <Side Effects>
+    Caches the resolved backend.  Calibrates the backends if
+    'settings.CALIBRATE_BACKENDS' is set and they have not been calibrated.
+
+  <Returns>
+    A Backend.
+  """
+
+  # Backends resolved during the calibration are not returned before it
+  # completes.
+  _calibrate_on_first_use()
+
+  try:
+    return _resolved_backends[(keytype, scheme, operation)]
+
+  except KeyError:
+    backend = _resolve_backend(keytype, scheme, operation)
+    _resolved_backends[(keytype, scheme, operation)] = backend
+
+    return backend
+
+
+
+
+
+def releases_gil(keytype):
+  """
+  <Purpose>
+    Determine whether all the backends that sign and verify with keys of
+    'keytype' release Python's global interpreter lock (GIL), so that these
+    operations can run in parallel in threads.  Backends that cannot be used,
+    e.g., because their library is unavailable, are not considered.
+
+    >>> releases_gil('ecdsa-sha2-nistp256')
+    True
+
+  <Arguments>
+    keytype:
+      The key type (e.g., 'rsa').
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'keytype' is improperly
+    formatted.
+
+  <Side Effects>
+    Resolves the backends of 'keytype'.
+
+  <Returns>
+    Boolean.
+  """
+
+  # Does 'keytype' have the correct format?
+  securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+
+  for registered_keytype, scheme, operation in list(_backends):
+    if registered_keytype != keytype:
+      continue
+
+    try:
+      backend = get_backend(keytype, scheme, operation)
+
+    except (securesystemslib.exceptions.UnsupportedAlgorithmError,
+        securesystemslib.exceptions.UnsupportedLibraryError):
+      continue
+
+    if not backend.releases_gil:
+      return False
+
+  return True
+
+
+
+
+
+def general_library_releases_gil():
+  """
+  <Purpose>
+    Determine whether the selected general-purpose library releases Python's
+    global interpreter lock (GIL) while it encrypts and decrypts keys (i.e.,
+    while it derives their encryption keys with PBKDF2), so that these
+    operations can run in parallel in threads.
+
+  <Arguments>
+    None.
+
+  <Exceptions>
+    None.
+
+  <Side Effects>
+    Calibrates the backends if 'settings.CALIBRATE_BACKENDS' is set and they
+    have not been calibrated.
+
+  <Returns>
+    Boolean.  True if the selected library is unsupported or unavailable,
+    since the operations then fail without any key derivation.
+  """
+
+  try:
+    return get_general_library() in _GIL_RELEASING_GENERAL_LIBRARIES
+
+  except securesystemslib.exceptions.UnsupportedLibraryError:
+    return True
+
+
+
+
+
+def _calibrate_on_first_use():
+  """
+  Non-public function that calibrates the backends, once, if
+  'settings.CALIBRATE_BACKENDS' is set.  Other threads wait until the
+  calibration completes.  'calibration.py' is imported here because it
+  imports 'keys.py', which imports this module.
+  """
+
+  global _calibrated
+  global _calibrating
+
+  if _calibrated or not securesystemslib.settings.CALIBRATE_BACKENDS:
+    return
+
+  with _calibration_lock:
+    # Another thread may have calibrated the backends while this one waited,
+    # and the calibration itself uses backends.
+    if _calibrated or _calibrating:
+      return
+
+    _calibrating = True
+
+    try:
+      from securesystemslib import calibration
+      calibration.calibrate_once()
+
+    finally:
+      # The backends resolved during the calibration are resolved again with
+      # the selected libraries.
+      _resolved_backends.clear()
+      _calibrating = False
+      _calibrated = True
+
+
+
+
+
+def _resolve_backend(keytype, scheme, operation):
+  """
+  Non-public function that selects the backend of (keytype, scheme,
+  operation): the backend of the library selected for the (keytype, scheme,
+  operation) or, otherwise, for 'keytype', if any, and the most preferred
+  backend otherwise.
+  """
+
+  backends = _backends.get((keytype, scheme, operation))
+
+  if not backends:
+    raise securesystemslib.exceptions.UnsupportedAlgorithmError('Unsupported'
+        ' signature scheme is specified: ' + repr(scheme) + ' (' +
+        repr(keytype) + ' keys, ' + repr(operation) + ').')
+
+  library = _selected_backends.get((keytype, scheme, operation),
+      _selected_libraries.get(keytype))
+  if library is None:
+    for backend in backends:
+      if is_library_available(backend.library):
+        break
+
+    else:
+      raise securesystemslib.exceptions.UnsupportedLibraryError('None of the'
+          ' crypto libraries that perform ' + repr(operation) + ' with ' +
+          repr(keytype) + ' keys could be imported: ' + repr([backend.library
+          for backend in backends]) + '.')
+
+  else:
+    for backend in backends:
+      if backend.library == library:
+        break
+
+    else:
+      raise securesystemslib.exceptions.UnsupportedLibraryError('The ' +
+          repr(library) + ' crypto library selected for ' + repr(keytype) +
+          ' keys and the ' + repr(scheme) + ' scheme is unsupported for ' +
+          repr(operation) + '.  Supported libraries: ' +
+          repr([backend.library for backend in backends]) + '.')
+
+    if not is_library_available(library):
+      raise securesystemslib.exceptions.UnsupportedLibraryError('The ' +
+          repr(library) + ' crypto library selected for ' + repr(keytype) +
+          ' keys could not be imported.')
+
+  logger.debug('Resolved the ' + repr(operation) + ' backend of ' +
+      repr(keytype) + ' keys and the ' + repr(scheme) + ' scheme: ' +
+      repr(backend.library) + '.')
+
+  return backend
+
+
+
+
+
+def _create_rsa_signature_pyca(public, private, data, scheme):
+  """
+  The 'sign' backend of RSA keys with pyca/cryptography.
+  """
+
+  return securesystemslib.pyca_crypto_keys.create_rsa_signature(private, data,
+      scheme)[0]
+
+
+
+
+
+def _verify_rsa_signature_pyca(public, signature, data, scheme):
+  """
+  The 'verify' backend of RSA keys with pyca/cryptography.
+  """
+
+  return securesystemslib.pyca_crypto_keys.verify_rsa_signature(signature,
+      scheme, public, data)
+
+
+
+
+
+def _create_rsa_signature_pycrypto(public, private, data, scheme):
+  """
+  The 'sign' backend of RSA keys with PyCrypto.
+  """
+
+  return securesystemslib.pycrypto_keys.create_rsa_signature(private, data,
+      scheme)[0]
+
+
+
+
+
+def _verify_rsa_signature_pycrypto(public, signature, data, scheme):
+  """
+  The 'verify' backend of RSA keys with PyCrypto.
+  """
+
+  return securesystemslib.pycrypto_keys.verify_rsa_signature(signature,
+      scheme, public, data)
+
+
+
+
+
+def _create_ed25519_signature_pynacl(public, private, data, scheme):
+  """
+  The 'sign' backend of ed25519 keys with PyNaCl.
+  """
+
+  return securesystemslib.ed25519_keys.create_signature(public, private, data,
+      scheme)[0]
+
+
+
+
+
+def _verify_ed25519_signature_pynacl(public, signature, data, scheme):
+  """
+  The 'verify' backend of ed25519 keys with PyNaCl.
+  """
+
+  return securesystemslib.ed25519_keys.verify_signature(public, scheme,
+      signature, data, use_pynacl=True)
+
+
+
+
+
+def _verify_ed25519_signature_pure_python(public, signature, data, scheme):
+  """
+  The 'verify' backend of ed25519 keys with the pure Python implementation.
+  """
+
+  return securesystemslib.ed25519_keys.verify_signature(public, scheme,
+      signature, data, use_pynacl=False)
+
+
+
+
+
+def _create_ecdsa_signature_pyca(public, private, data, scheme):
+  """
+  The 'sign' backend of ECDSA keys with pyca/cryptography.
+  """
+
+  return securesystemslib.ecdsa_keys.create_signature(public, private, data,
+      scheme)[0]
+
+
+
+
+
+def _verify_ecdsa_signature_pyca(public, signature, data, scheme):
+  """
+  The 'verify' backend of ECDSA keys with pyca/cryptography.
+  """
+
+  return securesystemslib.ecdsa_keys.verify_signature(public, scheme,
+      signature, data)
+
+
+
+
+
+# Register the backends of the supported libraries, the least preferred first.
+# Their libraries are imported when the backends are resolved.  PyCrypto and
+# the pure Python implementation of ed25519 hold the global interpreter lock,
+# while pyca/cryptography and PyNaCl release it.
+register_backend('ed25519', 'ed25519', 'verify', 'ed25519',
+    _verify_ed25519_signature_pure_python)
+register_backend('rsa', 'rsassa-pss-sha256', 'sign', 'pycrypto',
+    _create_rsa_signature_pycrypto)
+register_backend('rsa', 'rsassa-pss-sha256', 'verify', 'pycrypto',
+    _verify_rsa_signature_pycrypto)
+register_backend('rsa', 'rsassa-pss-sha256', 'sign', 'pyca-cryptography',
+    _create_rsa_signature_pyca, releases_gil=True)
+register_backend('rsa', 'rsassa-pss-sha256', 'verify', 'pyca-cryptography',
+    _verify_rsa_signature_pyca, releases_gil=True)
+register_backend('ecdsa-sha2-nistp256', 'ecdsa-sha2-nistp256', 'sign',
+    'pyca-cryptography', _create_ecdsa_signature_pyca, releases_gil=True)
+register_backend('ecdsa-sha2-nistp256', 'ecdsa-sha2-nistp256', 'verify',
+    'pyca-cryptography', _verify_ecdsa_signature_pyca, releases_gil=True)
+register_backend('ed25519', 'ed25519', 'sign', 'pynacl',
+    _create_ed25519_signature_pynacl, releases_gil=True)
+register_backend('ed25519', 'ed25519', 'verify', 'pynacl',
+    _verify_ed25519_signature_pynacl, releases_gil=True)
+
+
+
+if __name__ == '__main__':
+  # The interactive sessions of the documentation strings can be tested by
+  # running 'backends.py' as a standalone module:
+  # $ python backends.py
+  import doctest
+  doctest.testmod()
@@ -0,0 +1,951 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  cache.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Provide a bounded, thread-safe, least recently used (LRU) cache, and the
+  cache of parsed public key objects used by the signature verification
+  routines of 'pyca_crypto_keys.py', 'pycrypto_keys.py', 'ecdsa_keys.py' and
+  'ed25519_keys.py'.
+
+  Verifying a signature requires the cryptography library to first parse the
+  public key (e.g., a PEM-encoded RSA or ECDSA public key), which is a
+  significant part of the cost of a single verification.  Since the same
+  public keys are used to verify many signatures, the parsed key objects are
+  cached and reused.  Only public key objects are cached; private keys are
+  never stored by this module.  Likewise, the pure Python implementation of
+  ed25519 keeps the decoded points of public keys, with precomputed tables of
+  their multiples, in 'ed25519_point_cache'.
+
+  It also provides the opt-in cache of positive signature verification
+  results ('verification_cache'), with an optional on-disk tier, so that
+  signatures of unchanged data (e.g., metadata that is refreshed
+  periodically) are not verified again, and the opt-in cache of the keys
+  derived with PBKDF2 to decrypt encrypted keys ('derived_key_cache'), so
+  that an encrypted key that is decrypted again with the same password does
+  not cost another key derivation.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import hmac
+import time
+import struct
+import hashlib
+import logging
+import binascii
+import tempfile
+import collections
+import threading
+
+import securesystemslib.settings
+import securesystemslib.formats
+import securesystemslib.exceptions
+
+import six
+
+# See 'log.py' to learn how logging is handled in securesystemslib.
+logger = logging.getLogger('securesystemslib_cache')
+
+
+class LRUCache(object):
+  """
+  <Purpose>
+    A dictionary-like cache that holds at most 'max_size' items.  When the
+    cache is full, the least recently used item is discarded to make room for
+    a new one.  All operations are thread-safe.  The number of cache hits and
+    misses is recorded, and can be retrieved with stats().
+
+    >>> cache = LRUCache(2)
+    >>> cache.put('a', 1)
+    >>> cache.put('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.put('c', 3)
+    >>> 'b' in cache
+    False
+
+  <Arguments>
+    max_size:
+      The maximum number of items held by the cache.  A 'max_size' of 0
+      disables the cache (i.e., nothing is stored).
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'max_size' is improperly
+    formatted.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    An LRUCache object.
+  """
+
+  def __init__(self, max_size):
+    securesystemslib.formats.LENGTH_SCHEMA.check_match(max_size)
+
+    self._max_size = max_size
+    self._items = collections.OrderedDict()
+    self._lock = threading.Lock()
+    self._hits = 0
+    self._misses = 0
+
+
+
+  def get(self, key, default=None):
+    """
+    Return the item cached under 'key' and mark it as the most recently used,
+    or return 'default' if 'key' is not cached.
+    """
+
+    with self._lock:
+      try:
+        value = self._items.pop(key)
+
+      except KeyError:
+        self._misses += 1
+        return default
+
+      # Re-insert 'key' so that it is the last (most recently used) item.
+      self._items[key] = value
+      self._hits += 1
+      return value
+
+
+
+  def put(self, key, value):
+    """
+    Cache 'value' under 'key', discarding the least recently used item(s) if
+    the cache is full.
+    """
+
+    with self._lock:
+      self._items.pop(key, None)
+
+      if self._max_size == 0:
+        return
+
+      while len(self._items) >= self._max_size:
+        self._items.popitem(last=False)
+
+      self._items[key] = value
+
+
+
+  def get_or_create(self, key, create_function):
+    """
+    Return the item cached under 'key'.  If 'key' is not cached, call
+    'create_function()', cache the value that it returns, and return it.
+    Exceptions raised by 'create_function' are not caught, and nothing is
+    cached in that case.  'create_function' is called without holding the
+    cache's lock, so concurrent misses for the same key may each call it.
+    """
+
+    # Cached values can never be this object, which distinguishes a miss from
+    # a cached None.
+    missing = object()
+    value = self.get(key, missing)
+
+    if value is missing:
+      value = create_function()
+      self.put(key, value)
+
+    return value
+
+
+
+  def discard(self, key):
+    """
+    Discard the item cached under 'key', if any.
+    """
+
+    with self._lock:
+      self._items.pop(key, None)
+
+
+
+  def set_max_size(self, max_size):
+    """
+    Change the maximum number of items held by the cache, discarding the least
+    recently used items that no longer fit.
+    """
+
+    securesystemslib.formats.LENGTH_SCHEMA.check_match(max_size)
+
+    with self._lock:
+      self._max_size = max_size
+
+      while len(self._items) > max_size:
+        self._items.popitem(last=False)
+
+
+
+  def clear(self):
+    """
+    Discard all cached items and reset the hit and miss counters.
+    """
+
+    with self._lock:
+      self._items.clear()
+      self._hits = 0
+      self._misses = 0
+
+
+
+  def stats(self):
+    """
+    Return a dictionary with the number of 'hits' and 'misses' recorded since
+    the cache was created (or last cleared), and the current 'size' and
+    'max_size' of the cache.
+    """
+
+    with self._lock:
+      return {'hits': self._hits, 'misses': self._misses,
+          'size': len(self._items), 'max_size': self._max_size}
+
+
+
+  def __contains__(self, key):
+    with self._lock:
+      return key in self._items
+
+
+
+  def __len__(self):
+    with self._lock:
+      return len(self._items)
+
+
+
+
+
+# The cache of parsed public key objects.  Its size may be changed with
+# 'public_key_cache.set_max_size()', or disabled by setting it to 0.
+public_key_cache = LRUCache(securesystemslib.settings.PUBLIC_KEY_CACHE_SIZE)
+
+# The cache of decoded ed25519 public keys, and the tables of their multiples,
+# used by the pure Python implementation of ed25519 (see
+# 'ed25519_keys.verify_signature()'), keyed by the raw public key.  Its
+# statistics are returned by 'ed25519_point_cache.stats()'.
+ed25519_point_cache = \
+    LRUCache(securesystemslib.settings.ED25519_POINT_CACHE_SIZE)
+
+
+
+
+
+def get_public_key_object(keytype, scheme, public_key, library,
+    load_function):
+  """
+  <Purpose>
+    Return the parsed public key object of 'public_key', as created by
+    'load_function(public_key)' for the cryptography library 'library'.  The
+    object is cached in 'public_key_cache', keyed by ('keytype', 'scheme',
+    'public_key', 'library'), so that 'load_function' is only called the first
+    time a public key is used (or after it has been discarded from the cache).
+
+    The library name is part of the cache key because different libraries
+    (e.g., 'pycrypto' and 'pyca-cryptography') return different objects for
+    the same public key.
+
+  <Arguments>
+    keytype:
+      The key type of 'public_key' (e.g., 'rsa', 'ed25519' or
+      'ecdsa-sha2-nistp256').
+
+    scheme:
+      The signature scheme that 'public_key' is used with (e.g.,
+      'rsassa-pss-sha256').
+
+    public_key:
+      The public key material (e.g., a PEM string or the raw bytes of an
+      ed25519 public key).
+
+    library:
+      The name of the cryptography library that 'load_function' belongs to
+      (e.g., 'pyca-cryptography').
+
+    load_function:
+      A function that is called with 'public_key' and returns its parsed
+      public key object.
+
+  <Exceptions>
+    Any exception raised by 'load_function'.  Public keys that cannot be
+    parsed are not cached.
+
+  <Side Effects>
+    Updates 'public_key_cache' and its statistics.
+
+  <Returns>
+    The object returned by 'load_function(public_key)'.
+  """
+
+  return public_key_cache.get_or_create((keytype, scheme, public_key, library),
+      lambda: load_function(public_key))
+
+
+
+
+
+class VerificationCache(object):
+  """
+  <Purpose>
+    A cache of positive signature verification results, used by
+    'securesystemslib.keys.verify_signature()' and
+    'securesystemslib.keys.verify_signature_over_bytes()'.  Each result is
+    identified by a SHA256 digest (see get_cache_key()) of the key type,
+    signature scheme and public key of the verifying key, the library that
+    verified the signature, the signature, and the SHA256 digest of the
+    signed data, so that a cached result can only be reused for the same key,
+    signature and data, by the same library (e.g., the pure Python
+    implementation of ed25519 accepts signatures that PyNaCl rejects).
+    Invalid signatures are never cached.
+
+    The results are held in memory, in an LRUCache of 'max_size' items, and
+    optionally also in a file (see open_file()), so that they survive
+    restarts.  Each entry of the file is authenticated with an HMAC-SHA256
+    tag, computed with a secret key that is provided by the caller, so that
+    entries that were added or modified by anyone else are rejected.  Writing
+    a result to the file is best-effort:  if it fails, a warning is logged
+    and the on-disk tier is disabled, but the verification still succeeds.
+
+    >>> cache = VerificationCache(10)
+    >>> cache_key = VerificationCache.get_cache_key('ed25519', 'ed25519',
+    ...     'pynacl', b'public', b'signature', b'data')
+    >>> cache_key in cache
+    False
+    >>> cache.add(cache_key)
+    >>> cache_key in cache
+    True
+
+  <Arguments>
+    max_size:
+      The maximum number of results held in memory.  A 'max_size' of 0
+      disables the in-memory cache.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'max_size' is improperly
+    formatted.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    A VerificationCache object.
+  """
+
+  def __init__(self, max_size):
+    self._memory = LRUCache(max_size)
+    self._lock = threading.Lock()
+
+    # The on-disk tier: the path of the file, its HMAC key, the maximum
+    # number of results that it holds, the (ordered) results that it holds,
+    # and the number of entries written to the file.
+    self._filepath = None
+    self._secret_key = None
+    self._file_max_size = 0
+    self._file_results = collections.OrderedDict()
+    self._file_entries = 0
+
+    # Held while the file is written, and while the results that are written
+    # are chosen, so that appended entries and rewrites of the file cannot be
+    # interleaved.  It is acquired before the lock of the results, which is
+    # not held while the file is written so that lookups do not wait for it.
+    self._file_lock = threading.Lock()
+
+
+
+  @staticmethod
+  def get_cache_key(keytype, scheme, library, public_key, signature, data):
+    """
+    <Purpose>
+      Return the cache key of the verification of 'signature' over 'data' by
+      'public_key'.  This is a SHA256 digest over the SHA256 digest of 'data'
+      and the other arguments, each prefixed with its length so that
+      different arguments cannot produce the same cache key.
+
+    <Arguments>
+      keytype:
+        The key type of 'public_key' (e.g., 'ed25519').
+
+      scheme:
+        The signature scheme of 'signature' (e.g., 'ed25519').
+
+      library:
+        The library of the backend that verifies 'signature' (e.g.,
+        'pynacl').
+
+      public_key:
+        The public key, as a string (e.g., in PEM format) or raw bytes.
+
+      signature:
+        The signature, as bytes.
+
+      data:
+        The signed data, as bytes.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      The cache key, a 32-byte digest.
+    """
+
+    data_digest = hashlib.sha256(data).digest()
+    digest_object = hashlib.sha256()
+
+    for field in [keytype, scheme, library, public_key, signature,
+        data_digest]:
+      if isinstance(field, six.text_type):
+        field = field.encode('utf-8')
+
+      digest_object.update(struct.pack('>Q', len(field)))
+      digest_object.update(field)
+
+    return digest_object.digest()
+
+
+
+  @property
+  def enabled(self):
+    """True if the in-memory cache or the on-disk tier is enabled."""
+
+    return self._memory.stats()['max_size'] > 0 or self._filepath is not None
+
+
+
+  def add(self, cache_key):
+    """
+    Record that the verification identified by 'cache_key' succeeded.
+    """
+
+    self._memory.put(cache_key, True)
+
+    with self._file_lock:
+      with self._lock:
+        if self._filepath is None or cache_key in self._file_results:
+          return
+
+        self._file_results[cache_key] = True
+        while len(self._file_results) > self._file_max_size:
+          self._file_results.popitem(last=False)
+
+        # Entries are appended to the file, which is rewritten with only the
+        # results still held once it has grown to twice the maximum size.
+        filepath = self._filepath
+        rewrite = self._file_entries >= 2 * self._file_max_size
+        if rewrite:
+          lines = [self._format_entry(held_cache_key)
+              for held_cache_key in self._file_results]
+          self._file_entries = len(lines)
+
+        else:
+          lines = [self._format_entry(cache_key)]
+          self._file_entries += 1
+
+      # Persisting the result is best-effort:  a signature that was verified
+      # is still valid if the file cannot be written, in which case the
+      # on-disk tier is disabled.
+      try:
+        if rewrite:
+          _write_file(filepath, lines)
+
+        else:
+          with open(filepath, 'a') as file_object:
+            file_object.writelines(lines)
+
+      except (IOError, OSError) as e:
+        self._disable_unwritable_file(filepath, e)
+
+
+
+  def __contains__(self, cache_key):
+    if self._memory.get(cache_key, False):
+      return True
+
+    with self._lock:
+      found = cache_key in self._file_results
+
+    # Results found on disk are moved to the in-memory cache.
+    if found:
+      self._memory.put(cache_key, True)
+
+    return found
+
+
+
+  def set_max_size(self, max_size):
+    """
+    Change the maximum number of results held in memory.  A 'max_size' of 0
+    disables the in-memory cache.
+    """
+
+    self._memory.set_max_size(max_size)
+
+
+
+  def clear(self):
+    """
+    Discard all cached results, including those of the on-disk tier (whose
+    file is emptied).
+    """
+
+    self._memory.clear()
+
+    with self._file_lock:
+      with self._lock:
+        self._file_results.clear()
+        self._file_entries = 0
+        filepath = self._filepath
+
+      if filepath is None:
+        return
+
+      # As in add(), if the file cannot be emptied, the on-disk tier is
+      # disabled (and its results are no longer used).
+      try:
+        _write_file(filepath, [])
+
+      except (IOError, OSError) as e:
+        self._disable_unwritable_file(filepath, e)
+
+
+
+  def stats(self):
+    """
+    Return the statistics of the in-memory cache (see LRUCache.stats()), and
+    the number of results held by the on-disk tier ('file_size').
+    """
+
+    stats = self._memory.stats()
+
+    with self._lock:
+      stats['file_size'] = len(self._file_results)
+
+    return stats
+
+
+
+  def open_file(self, filepath, secret_key, max_size=None):
+    """
+    <Purpose>
+      Enable the on-disk tier of the cache, stored in 'filepath'.  The results
+      in 'filepath' (if it exists) whose HMAC tag is valid for 'secret_key'
+      are loaded, and new results are added to it.  Entries with an invalid
+      tag (e.g., written with a different key, or modified) are discarded.
+
+      'secret_key' should be kept secret and be unique to the client: anyone
+      who knows it can add results to the cache, which are then accepted
+      without verifying the signature.
+
+    <Arguments>
+      filepath:
+        The path of the cache file.
+
+      secret_key:
+        The HMAC key (bytes), at least 16 bytes long.
+
+      max_size:
+        The maximum number of results held by the on-disk tier.  If None,
+        'settings.PERSISTENT_VERIFICATION_CACHE_SIZE' is used.  A 'max_size'
+        of 0 disables the on-disk tier, without reading or writing
+        'filepath'.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      securesystemslib.exceptions.Error, if 'filepath' cannot be read or
+      written.
+
+    <Side Effects>
+      'filepath' is read, and created if it does not exist.
+
+    <Returns>
+      None.
+    """
+
+    # Do the arguments have the correct format?
+    securesystemslib.formats.PATH_SCHEMA.check_match(filepath)
+    securesystemslib.formats.DATA_SCHEMA.check_match(secret_key)
+
+    if len(secret_key) < _MINIMUM_SECRET_KEY_SIZE:
+      raise securesystemslib.exceptions.FormatError('The secret key must be'
+        ' at least ' + repr(_MINIMUM_SECRET_KEY_SIZE) + ' bytes long.')
+
+    if max_size is None:
+      max_size = securesystemslib.settings.PERSISTENT_VERIFICATION_CACHE_SIZE
+
+    else:
+      securesystemslib.formats.LENGTH_SCHEMA.check_match(max_size)
+
+    with self._file_lock:
+      with self._lock:
+        self._close_file()
+        if max_size == 0:
+          return
+
+        self._filepath = filepath
+        self._secret_key = secret_key
+        self._file_max_size = max_size
+
+        try:
+          self._load_file()
+
+          # The file is rewritten without any rejected or surplus entries.
+          _write_file(filepath, [self._format_entry(cache_key)
+              for cache_key in self._file_results])
+          self._file_entries = len(self._file_results)
+
+        except (IOError, OSError) as e:
+          self._close_file()
+          raise securesystemslib.exceptions.Error('The verification cache file'
+            ' ' + repr(filepath) + ' cannot be used: ' + str(e))
+
+
+
+  def close_file(self):
+    """
+    Disable the on-disk tier of the cache.  The results that it held are
+    kept in its file, but are no longer used.
+    """
+
+    with self._file_lock:
+      with self._lock:
+        self._close_file()
+
+
+
+  def _disable_unwritable_file(self, filepath, error):
+    """Disable the on-disk tier, whose 'filepath' could not be written."""
+
+    logger.warning('Disabling the verification cache file ' +
+        repr(filepath) + ', which cannot be written: ' + str(error))
+
+    with self._lock:
+      if self._filepath == filepath:
+        self._close_file()
+
+
+
+  def _close_file(self):
+    """Disable the on-disk tier, with the lock held."""
+
+    self._filepath = None
+    self._secret_key = None
+    self._file_results = collections.OrderedDict()
+    self._file_entries = 0
+
+
+
+  def _format_entry(self, cache_key):
+    """Return the line of the file that records 'cache_key'."""
+
+    tag = hmac.new(self._secret_key, cache_key, hashlib.sha256).digest()
+    return binascii.hexlify(cache_key).decode() + ' ' + \
+        binascii.hexlify(tag).decode() + '\n'
+
+
+
+  def _load_file(self):
+    """Load the results of the file with a valid HMAC tag."""
+
+    if not os.path.exists(self._filepath):
+      return
+
+    rejected = 0
+    with open(self._filepath, 'r') as file_object:
+      for line in file_object:
+        try:
+          cache_key, tag = [binascii.unhexlify(field.encode('utf-8'))
+              for field in line.split()]
+
+        except (ValueError, TypeError):
+          rejected += 1
+          continue
+
+        expected_tag = hmac.new(self._secret_key, cache_key,
+            hashlib.sha256).digest()
+
+        if not hmac.compare_digest(tag, expected_tag):
+          rejected += 1
+          continue
+
+        self._file_results.pop(cache_key, None)
+        self._file_results[cache_key] = True
+
+    while len(self._file_results) > self._file_max_size:
+      self._file_results.popitem(last=False)
+
+    if rejected:
+      logger.warning('Discarded ' + repr(rejected) + ' invalid entries of the'
+        ' verification cache file ' + repr(self._filepath) + '.')
+
+
+
+
+
+class DerivedKeyCache(object):
+  """
+  <Purpose>
+    A cache of the symmetric keys derived from passwords with PBKDF2, used by
+    'securesystemslib.keys.decrypt_key()' (and thus by the functions of
+    'securesystemslib.interface' that import encrypted ed25519 and ECDSA key
+    files), so that decrypting the same encrypted key again with the same
+    password costs microseconds instead of 'settings.PBKDF2_ITERATIONS'
+    iterations of HMAC-SHA256.  Only the keys derived for a successful
+    decryption are cached.
+
+    A derived key is identified by an HMAC-SHA256 digest (see
+    get_cache_key()) of the password, salt and number of iterations, computed
+    with a random secret key of the process, so that the cache keys do not
+    reveal the passwords.  The derived keys are held in memory, for at most
+    'ttl' seconds each, until they are wiped with wipe().  Python cannot
+    guarantee that the memory of a discarded key is overwritten, so the cache
+    is disabled by default.
+
+    >>> cache = DerivedKeyCache(10, ttl=60)
+    >>> cache_key = cache.get_cache_key('password', b'salt', 100000)
+    >>> cache.get(cache_key) is None
+    True
+    >>> cache.add(cache_key, b'derived key')
+    >>> cache.get(cache_key)
+    b'derived key'
+
+  <Arguments>
+    max_size:
+      The maximum number of derived keys held by the cache.  A 'max_size' of
+      0 disables the cache.
+
+    ttl:
+      The number of seconds that a derived key is held, or None to hold it
+      until it is discarded to make room for another, or wiped.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    A DerivedKeyCache object.
+  """
+
+  def __init__(self, max_size, ttl=None):
+    if ttl is not None:
+      securesystemslib.formats.THRESHOLD_SCHEMA.check_match(ttl)
+
+    self._memory = LRUCache(max_size)
+    self._ttl = ttl
+    self._secret_key = os.urandom(32)
+
+
+
+  @property
+  def enabled(self):
+    """True if the cache holds derived keys."""
+
+    return self._memory.stats()['max_size'] > 0
+
+
+
+  def get_cache_key(self, password, salt, iterations):
+    """
+    <Purpose>
+      Return the cache key of the key derived from 'password' with 'salt' and
+      'iterations'.  This is an HMAC-SHA256 digest, with the secret key of the
+      cache, over the arguments, each prefixed with its length so that
+      different arguments cannot produce the same cache key.
+
+    <Arguments>
+      password:
+        The password, as a string.
+
+      salt:
+        The salt of the key derivation, as bytes.
+
+      iterations:
+        The number of iterations of the key derivation.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      The cache key, a 32-byte digest.
+    """
+
+    hmac_object = hmac.new(self._secret_key, digestmod=hashlib.sha256)
+
+    for field in [password, salt, str(iterations)]:
+      if isinstance(field, six.text_type):
+        field = field.encode('utf-8')
+
+      hmac_object.update(struct.pack('>Q', len(field)))
+      hmac_object.update(field)
+
+    return hmac_object.digest()
+
+
+
+  def get(self, cache_key):
+    """
+    Return the derived key cached under 'cache_key', or None if it is not
+    cached or its lifetime is over.
+    """
+
+    cached = self._memory.get(cache_key)
+    if cached is None:
+      return None
+
+    derived_key, expiration_time = cached
+    if expiration_time is not None and expiration_time <= time.time():
+      self._memory.discard(cache_key)
+      return None
+
+    return derived_key
+
+
+
+  def add(self, cache_key, derived_key):
+    """
+    Cache 'derived_key' under 'cache_key', for the lifetime of the cache.
+    """
+
+    expiration_time = None
+    if self._ttl is not None:
+      expiration_time = time.time() + self._ttl
+
+    self._memory.put(cache_key, (derived_key, expiration_time))
+
+
+
+  def set_max_size(self, max_size):
+    """
+    Change the maximum number of derived keys held by the cache.  A
+    'max_size' of 0 disables the cache.
+    """
+
+    self._memory.set_max_size(max_size)
+
+
+
+  def set_ttl(self, ttl):
+    """
+    Change the number of seconds that the derived keys added from now on are
+    held, or hold them until they are discarded if 'ttl' is None.
+    """
+
+    if ttl is not None:
+      securesystemslib.formats.THRESHOLD_SCHEMA.check_match(ttl)
+
+    self._ttl = ttl
+
+
+
+  def wipe(self):
+    """
+    Discard all the derived keys, and replace the secret key of the cache
+    keys, so that the cache keys computed before can no longer be used.
+    """
+
+    self._memory.clear()
+    self._secret_key = os.urandom(32)
+
+
+
+  def stats(self):
+    """
+    Return the statistics of the cache (see LRUCache.stats()).
+    """
+
+    return self._memory.stats()
+
+
+
+
+
+def _write_file(filepath, lines):
+  """
+  Non-public function that atomically replaces 'filepath' with a file of
+  'lines'.
+  """
+
+  directory = os.path.dirname(os.path.abspath(filepath))
+  file_descriptor, temporary_filepath = tempfile.mkstemp(dir=directory)
+
+  try:
+    with os.fdopen(file_descriptor, 'w') as file_object:
+      file_object.writelines(lines)
+      file_object.flush()
+      os.fsync(file_object.fileno())
+
+    _replace_file(temporary_filepath, filepath)
+
+  except: # pragma: no cover
+    os.remove(temporary_filepath)
+    raise
+
+
+
+
+
+def _replace_file(source_path, destination_path):
+  """
+  Non-public function that renames 'source_path' to 'destination_path',
+  replacing the latter if it exists.
+  """
+
+  try:
+    os.replace(source_path, destination_path)
+
+  # Python 2 does not have os.replace(), and its os.rename() does not replace
+  # existing files on Windows.
+  except AttributeError: # pragma: no cover
+    if os.name == 'nt' and os.path.exists(destination_path):
+      os.remove(destination_path)
+
+    os.rename(source_path, destination_path)
+
+
+
+
+
+# The minimum size of the secret key that authenticates the entries of an
+# on-disk verification cache.
+_MINIMUM_SECRET_KEY_SIZE = 16
+
+# The cache of positive signature verification results, which is disabled by
+# default.  It may be enabled with 'verification_cache.set_max_size()' and, for
+# an on-disk tier, 'verification_cache.open_file()'.
+verification_cache = \
+    VerificationCache(securesystemslib.settings.VERIFICATION_CACHE_SIZE)
+
+# The cache of the keys derived with PBKDF2 to decrypt encrypted keys, which is
+# disabled by default.  It may be enabled with
+# 'derived_key_cache.set_max_size()', and emptied with
+# 'derived_key_cache.wipe()'.
+derived_key_cache = DerivedKeyCache(
+    securesystemslib.settings.DERIVED_KEY_CACHE_SIZE,
+    securesystemslib.settings.DERIVED_KEY_CACHE_TTL)
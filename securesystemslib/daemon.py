@@ -0,0 +1,913 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  daemon.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Verify signatures in a long-running daemon that loads a trusted set of
+  public keys once, and serves the processes of the same host over a Unix
+  domain socket, so that the keys are parsed (and their objects cached) once
+  rather than by every process.
+
+  VerificationDaemon listens on the socket, collects the requests of all of
+  its clients into batches, and verifies every batch with a
+  'securesystemslib.parallel.VerificationExecutor' that is started with the
+  daemon.  VerificationClient connects to a daemon, and its verify_signature()
+  and verify_signatures() methods take the arguments, and return the results,
+  of 'securesystemslib.keys.verify_signature()' and
+  'securesystemslib.keys.verify_signatures()'.  The key of a signature is
+  identified by its keyid: the daemon verifies it with its own key of that
+  keyid, and raises 'securesystemslib.exceptions.UnknownKeyError' if it has
+  none.
+
+  A request and its response are each sent as a frame: the length of the
+  frame body (a 4-byte unsigned integer in network byte order), followed by
+  the body.  The body of a request is the number of signatures (4 bytes),
+  followed by every signature as the lengths of its keyid (2 bytes), of the
+  signature (2 bytes) and of the signed data (4 bytes), and the keyid
+  (UTF-8), the raw signature, and the data encoded in canonical JSON.  The
+  body of a response is the result of every signature: a byte that is 1 if
+  the signature is valid, 0 if it is invalid, and 2 if its verification
+  raised an exception, which is followed by its length (4 bytes) and the JSON
+  list of the name and message of the exception.
+
+  Anyone who can connect to the socket can use the daemon, so that access to
+  it should be restricted with the permissions of its directory.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import json
+import errno
+import socket
+import struct
+import logging
+import binascii
+import threading
+
+import securesystemslib.exceptions
+import securesystemslib.formats
+import securesystemslib.keys
+import securesystemslib.parallel
+
+import six
+from six.moves import queue
+from six.moves import socketserver
+
+# See 'log.py' to learn how logging is handled in securesystemslib.
+logger = logging.getLogger('securesystemslib_daemon')
+
+# The maximum number of signatures that are verified in a batch.
+DEFAULT_MAX_BATCH_SIZE = 256
+
+# The maximum size of the body of a frame (256 MiB), above which the
+# connection is closed.
+MAX_FRAME_SIZE = 1 << 28
+
+_FRAME_HEADER = struct.Struct('!I')
+_COUNT = struct.Struct('!I')
+_JOB_HEADER = struct.Struct('!HHI')
+_LENGTH = struct.Struct('!I')
+
+# The results of a signature in a response.
+_INVALID = 0
+_VALID = 1
+_EXCEPTION = 2
+
+
+class VerificationDaemon(object):
+  """
+  <Purpose>
+    Serve signature verification requests for the public keys of
+    'key_dicts' over the Unix domain socket 'socket_path'.  serve_forever()
+    serves the requests in the calling thread, and start() in a background
+    thread, until close() is called.  A VerificationDaemon may be used as a
+    context manager, which closes it on exit.
+
+    The requests of all the connections are queued, and verified in batches
+    of at most 'max_batch_size' signatures, i.e., of the signatures that were
+    requested while the previous batch was verified.
+
+    >>> import tempfile
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> data = 'The quick brown fox jumps over the lazy dog'
+    >>> signature = securesystemslib.keys.create_signature(key, data)
+    >>> socket_path = os.path.join(tempfile.mkdtemp(), 'daemon.sock')
+    >>> with VerificationDaemon([key], socket_path, max_workers=1) as daemon:
+    ...   daemon.start()
+    ...   with VerificationClient(socket_path) as client:
+    ...     client.verify_signature(key, signature, data)
+    True
+
+  <Arguments>
+    key_dicts:
+      A list of the trusted keys, conformant to
+      'securesystemslib.formats.ANYKEY_SCHEMA' or Key objects.
+
+    socket_path:
+      The path of the socket, which must not exist.  It is removed by
+      close().
+
+    max_workers, use_processes:
+      The arguments of 'securesystemslib.parallel.VerificationExecutor'.
+
+    max_batch_size:
+      The maximum number of signatures that are verified at once.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if
+    'concurrent.futures' is not available.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if Unix domain
+    sockets are unavailable on this platform.
+
+    socket.error, if the socket cannot be created (e.g., if 'socket_path'
+    exists).
+
+  <Side Effects>
+    Creates the socket, and starts the threads or processes of the
+    VerificationExecutor.
+  """
+
+  def __init__(self, key_dicts, socket_path, max_workers=None,
+      use_processes=None, max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+    _check_unix_sockets()
+
+    securesystemslib.formats.PATH_SCHEMA.check_match(socket_path)
+    securesystemslib.formats.THRESHOLD_SCHEMA.check_match(max_batch_size)
+
+    self.socket_path = socket_path
+    self.max_batch_size = max_batch_size
+
+    self._executor = securesystemslib.parallel.VerificationExecutor(key_dicts,
+        max_workers, use_processes=use_processes)
+
+    self._keyids = set()
+    for key_dict in key_dicts:
+      if isinstance(key_dict, securesystemslib.keys.Key):
+        self._keyids.add(key_dict.keyid)
+
+      else:
+        self._keyids.add(key_dict['keyid'])
+
+    # The pending signatures of all the connections, which are verified in
+    # batches by the thread of _verify_batches().  None is queued once the
+    # daemon is closed.
+    self._queue = queue.Queue()
+    self._queue_lock = threading.Lock()
+    self._closed = False
+    self._batch_thread = threading.Thread(target=self._verify_batches)
+    self._batch_thread.daemon = True
+    self._batch_thread.start()
+
+    self._serving = False
+    self._serve_thread = None
+
+    try:
+      self._server = _UnixStreamServer(socket_path, _RequestHandler)
+
+    except Exception:
+      self._stop_batches()
+      self._executor.close()
+      raise
+
+    self._server.verification_daemon = self
+
+
+
+  def serve_forever(self):
+    """
+    <Purpose>
+      Serve requests in the calling thread until close() is called (from
+      another thread).
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Accepts connections on the socket, and serves each of them in a thread.
+
+    <Returns>
+      None.
+    """
+
+    self._serving = True
+    logger.debug('Serving verification requests on ' + repr(self.socket_path))
+    self._server.serve_forever()
+
+
+
+  def start(self):
+    """
+    <Purpose>
+      Serve requests in a background thread until close() is called.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Starts a thread that calls serve_forever().
+
+    <Returns>
+      None.
+    """
+
+    self._serving = True
+    self._serve_thread = threading.Thread(target=self.serve_forever)
+    self._serve_thread.daemon = True
+    self._serve_thread.start()
+
+
+
+  def close(self):
+    """
+    <Purpose>
+      Stop serving requests, and remove the socket.  The daemon can no longer
+      be used.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Waits for the pending requests to be verified, and stops the threads or
+      processes of the VerificationExecutor.
+
+    <Returns>
+      None.
+    """
+
+    if self._serving:
+      self._server.shutdown()
+      self._serving = False
+
+    self._server.server_close()
+
+    try:
+      os.remove(self.socket_path)
+
+    except OSError as e: # pragma: no cover
+      if e.errno != errno.ENOENT:
+        raise
+
+    self._stop_batches()
+    self._executor.close()
+
+
+
+  def __enter__(self):
+    return self
+
+
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.close()
+
+
+
+  def _stop_batches(self):
+    """
+    Verify the signatures that are queued, and stop the thread of
+    _verify_batches().
+    """
+
+    with self._queue_lock:
+      self._closed = True
+      self._queue.put(None)
+
+    self._batch_thread.join()
+
+
+
+  def _submit(self, keyid, sig, data):
+    """
+    Queue the verification of the signature 'sig' (bytes) by the key of
+    'keyid' over 'data', the signed data encoded in canonical JSON, and
+    return its _PendingSignature.
+    """
+
+    pending_signature = _PendingSignature()
+
+    try:
+      if keyid not in self._keyids:
+        raise securesystemslib.exceptions.UnknownKeyError('The daemon has'
+            ' no key with keyid ' + repr(keyid) + '.')
+
+      # The executor encodes the data in canonical JSON again.  Canonical JSON
+      # strings may contain control characters.
+      pending_signature.job = ({'keyid': keyid, 'sig':
+          binascii.hexlify(sig).decode('utf-8')},
+          json.loads(data.decode('utf-8'), strict=False))
+
+    except Exception as e:
+      pending_signature.set_result(None, e)
+      return pending_signature
+
+    with self._queue_lock:
+      if self._closed:
+        pending_signature.set_result(None,
+            securesystemslib.exceptions.Error('The daemon is closed.'))
+
+      else:
+        self._queue.put(pending_signature)
+
+    return pending_signature
+
+
+
+  def _verify_batches(self):
+    """
+    Verify the queued signatures in batches, until None is queued.
+    """
+
+    while True:
+      pending_signatures = [self._queue.get()]
+
+      while len(pending_signatures) < self.max_batch_size:
+        try:
+          pending_signatures.append(self._queue.get_nowait())
+
+        except queue.Empty:
+          break
+
+      stop = None in pending_signatures
+      pending_signatures = [pending_signature
+          for pending_signature in pending_signatures
+          if pending_signature is not None]
+
+      if pending_signatures:
+        self._verify_batch(pending_signatures)
+
+      if stop:
+        return
+
+
+
+  def _verify_batch(self, pending_signatures):
+    """
+    Verify 'pending_signatures' with the executor, and set their results.
+    The signatures are verified one by one only if one of them raises an
+    exception, so that it is returned with its signature.
+    """
+
+    try:
+      results = self._executor.verify([pending_signature.job
+          for pending_signature in pending_signatures])
+
+    except Exception:
+      for pending_signature in pending_signatures:
+        try:
+          pending_signature.set_result(
+              self._executor.verify([pending_signature.job])[0], None)
+
+        except Exception as e:
+          pending_signature.set_result(None, e)
+
+    else:
+      for pending_signature, result in zip(pending_signatures, results):
+        pending_signature.set_result(result, None)
+
+
+
+
+
+class VerificationClient(object):
+  """
+  <Purpose>
+    A connection to the VerificationDaemon that listens on 'socket_path'.
+    The methods of a client may be called from several threads, whose
+    requests are sent one at a time.  A VerificationClient may be used as a
+    context manager, which closes it on exit.
+
+  <Arguments>
+    socket_path:
+      The path of the socket of the daemon.
+
+    timeout:
+      The timeout of the socket, in seconds, or None to wait for the daemon
+      indefinitely.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'socket_path' is improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if Unix domain
+    sockets are unavailable on this platform.
+
+    socket.error, if the client cannot connect to the daemon.
+
+  <Side Effects>
+    Connects to the daemon.
+  """
+
+  def __init__(self, socket_path, timeout=None):
+    securesystemslib.formats.PATH_SCHEMA.check_match(socket_path)
+    _check_unix_sockets()
+
+    self.socket_path = socket_path
+    self._lock = threading.Lock()
+    self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+      self._socket.settimeout(timeout)
+      self._socket.connect(socket_path)
+
+    except Exception:
+      self._socket.close()
+      raise
+
+    self._file = self._socket.makefile('rb')
+
+
+
+  def verify_signature(self, key_dict, signature, data):
+    """
+    <Purpose>
+      Verify 'signature' of 'data' by the key of the daemon with the keyid of
+      'key_dict'.  See 'securesystemslib.keys.verify_signature()'.
+
+    <Arguments>
+      key_dict:
+        A key conformant to 'securesystemslib.formats.ANYKEY_SCHEMA', or a Key
+        object.
+
+      signature:
+        A signature conformant to 'securesystemslib.formats.SIGNATURE_SCHEMA',
+        or a Signature object.
+
+      data:
+        The data object that was signed.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if the daemon has no key
+      with the keyid of 'key_dict'.
+
+      securesystemslib.exceptions.Error, if the connection to the daemon is
+      closed.
+
+      Any exception raised by 'securesystemslib.keys.verify_signature()' in
+      the daemon.
+
+    <Side Effects>
+      Sends a request to the daemon.
+
+    <Returns>
+      Boolean.  True if the signature is valid, False otherwise.
+    """
+
+    return self.verify_signatures([(key_dict, signature, data)])[0]
+
+
+
+  def verify_signatures(self, jobs):
+    """
+    <Purpose>
+      Verify many signatures with a single request.  See
+      'securesystemslib.keys.verify_signatures()'.
+
+    <Arguments>
+      jobs:
+        A list of (key_dict, signature, data) tuples, the arguments of
+        verify_signature().
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'jobs' is improperly
+      formatted.
+
+      securesystemslib.exceptions.Error, if the connection to the daemon is
+      closed.
+
+      Any exception raised by verify_signature() for a signature, i.e., the
+      exception of the first signature that raised one.
+
+    <Side Effects>
+      Sends a request to the daemon.
+
+    <Returns>
+      A list of booleans, in the order of 'jobs': True if the signature is
+      valid, False otherwise.
+    """
+
+    if not isinstance(jobs, list):
+      raise securesystemslib.exceptions.FormatError('Expected a list of'
+          ' jobs, got ' + repr(type(jobs)) + '.')
+
+    parts = [_COUNT.pack(len(jobs))]
+    for job in jobs:
+      if not isinstance(job, tuple) or len(job) != 3:
+        raise securesystemslib.exceptions.FormatError('Expected a tuple of 3'
+            ' items, got ' + repr(job) + '.')
+
+      key_dict, signature, data = job
+      if isinstance(key_dict, securesystemslib.keys.Key):
+        keyid = key_dict.keyid
+
+      else:
+        securesystemslib.formats.ANYKEY_SCHEMA.check_match(key_dict)
+        keyid = key_dict['keyid']
+
+      if isinstance(signature, securesystemslib.keys.Signature):
+        signature = signature.to_dict()
+
+      securesystemslib.formats.SIGNATURE_SCHEMA.check_match(signature)
+
+      keyid = keyid.encode('utf-8')
+      sig = binascii.unhexlify(signature['sig'].encode('utf-8'))
+      data = securesystemslib.formats.encode_canonical(data).encode('utf-8')
+      parts.extend([_JOB_HEADER.pack(len(keyid), len(sig), len(data)), keyid,
+          sig, data])
+
+    frame = encode_frame(b''.join(parts))
+
+    with self._lock:
+      self._socket.sendall(frame)
+      response = read_frame(self._file)
+
+    if response is None:
+      raise securesystemslib.exceptions.Error('The verification daemon closed'
+          ' the connection.')
+
+    return _decode_results(response, len(jobs))
+
+
+
+  def close(self):
+    """
+    <Purpose>
+      Close the connection to the daemon.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Closes the socket.
+
+    <Returns>
+      None.
+    """
+
+    self._file.close()
+    self._socket.close()
+
+
+
+  def __enter__(self):
+    return self
+
+
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.close()
+
+
+
+
+
+# Unix domain sockets, and the servers of the socketserver module that use
+# them, are unavailable on some platforms (e.g., Windows).  This module can
+# still be imported there, but a VerificationDaemon cannot be started.
+if hasattr(socket, 'AF_UNIX'):
+  class _UnixStreamServer(socketserver.ThreadingMixIn,
+      socketserver.UnixStreamServer):
+    """
+    The server of a VerificationDaemon, which serves every connection in a
+    thread.
+    """
+
+    daemon_threads = True
+
+
+
+
+
+def _check_unix_sockets():
+  """
+  Raise 'securesystemslib.exceptions.UnsupportedLibraryError' if Unix domain
+  sockets are unavailable on this platform.
+  """
+
+  if not hasattr(socket, 'AF_UNIX'): # pragma: no cover
+    raise securesystemslib.exceptions.UnsupportedLibraryError('Unix domain'
+        ' sockets are unavailable on this platform.')
+
+
+
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+  """
+  Serve the requests of a connection, until it is closed or a request is
+  improperly formatted.
+  """
+
+  def handle(self):
+    daemon = self.server.verification_daemon
+
+    while True:
+      try:
+        body = read_frame(self.rfile)
+        if body is None:
+          return
+
+        requests = _decode_requests(body)
+
+      except securesystemslib.exceptions.Error as e:
+        logger.warning('Closing a connection: ' + str(e))
+        return
+
+      pending_signatures = [daemon._submit(keyid, sig, data)
+          for keyid, sig, data in requests]
+
+      parts = []
+      for pending_signature in pending_signatures:
+        pending_signature.event.wait()
+        if pending_signature.exception is not None:
+          message = encode_exception(pending_signature.exception)
+          parts.extend([six.int2byte(_EXCEPTION), _LENGTH.pack(len(message)),
+              message])
+
+        else:
+          parts.append(six.int2byte(_VALID if pending_signature.result
+              else _INVALID))
+
+      self.wfile.write(encode_frame(b''.join(parts)))
+
+
+
+
+
+class _PendingSignature(object):
+  """
+  A queued signature: its 'job' for the executor, and its result or
+  exception, which are set once it is verified.
+  """
+
+  __slots__ = ['job', 'result', 'exception', 'event']
+
+  def __init__(self):
+    self.job = None
+    self.result = None
+    self.exception = None
+    self.event = threading.Event()
+
+
+
+  def set_result(self, result, exception):
+    self.result = result
+    self.exception = exception
+    self.event.set()
+
+
+
+
+
+def encode_frame(body):
+  """
+  <Purpose>
+    Return the frame of 'body', i.e., 'body' prefixed with its length, as
+    sent over the sockets of a VerificationDaemon or a
+    'securesystemslib.agent.SigningAgent'.
+
+  <Arguments>
+    body:
+      The body of the frame, as bytes.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'body' is larger than
+    MAX_FRAME_SIZE.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    The frame, as bytes.
+  """
+
+  if len(body) > MAX_FRAME_SIZE:
+    raise securesystemslib.exceptions.FormatError('The frame of ' +
+        repr(len(body)) + ' bytes is too large.')
+
+  return _FRAME_HEADER.pack(len(body)) + body
+
+
+
+
+
+def read_frame(file_object):
+  """
+  <Purpose>
+    Read a frame (see encode_frame()) from 'file_object', and return its
+    body.
+
+  <Arguments>
+    file_object:
+      The binary file object of a socket (see 'socket.makefile()').
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the frame is truncated or
+    larger than MAX_FRAME_SIZE.
+
+  <Side Effects>
+    Reads from 'file_object'.
+
+  <Returns>
+    The body of the frame, as bytes, or None if the connection is closed
+    before the frame.
+  """
+
+  header = file_object.read(_FRAME_HEADER.size)
+  if not header:
+    return None
+
+  if len(header) < _FRAME_HEADER.size:
+    raise securesystemslib.exceptions.FormatError('Truncated frame.')
+
+  length, = _FRAME_HEADER.unpack(header)
+  if length > MAX_FRAME_SIZE:
+    raise securesystemslib.exceptions.FormatError('The frame of ' +
+        repr(length) + ' bytes is too large.')
+
+  body = file_object.read(length)
+  if len(body) < length:
+    raise securesystemslib.exceptions.FormatError('Truncated frame.')
+
+  return body
+
+
+
+
+
+def _decode_requests(body):
+  """
+  Return the (keyid, sig, data) of every signature of the body of a request.
+  """
+
+  body = memoryview(body)
+
+  try:
+    count, = _COUNT.unpack_from(body, 0)
+    offset = _COUNT.size
+
+    requests = []
+    for index in range(count):
+      keyid_length, sig_length, data_length = \
+          _JOB_HEADER.unpack_from(body, offset)
+      offset += _JOB_HEADER.size
+
+      keyid = body[offset:offset + keyid_length].tobytes().decode('utf-8')
+      offset += keyid_length
+      sig = body[offset:offset + sig_length].tobytes()
+      offset += sig_length
+      data = body[offset:offset + data_length].tobytes()
+      offset += data_length
+
+      if offset > len(body):
+        raise ValueError('Truncated request.')
+
+      requests.append((keyid, sig, data))
+
+  except (struct.error, ValueError) as e:
+    raise securesystemslib.exceptions.FormatError('Invalid request: ' +
+        str(e))
+
+  if offset != len(body):
+    raise securesystemslib.exceptions.FormatError('Invalid request: ' +
+        repr(len(body) - offset) + ' extra bytes.')
+
+  return requests
+
+
+
+
+
+def _decode_results(body, count):
+  """
+  Return the results of the 'count' signatures of the body of a response, or
+  raise the exception of the first signature that raised one.
+  """
+
+  results = []
+  offset = 0
+
+  for index in range(count):
+    result = six.indexbytes(body, offset)
+    offset += 1
+
+    if result == _EXCEPTION:
+      length, = _LENGTH.unpack_from(body, offset)
+      offset += _LENGTH.size
+      raise decode_exception(body[offset:offset + length])
+
+    results.append(result == _VALID)
+
+  return results
+
+
+
+
+
+
+def encode_exception(exception):
+  """
+  <Purpose>
+    Encode 'exception', raised in a daemon, to be raised again by its client
+    with decode_exception().
+
+  <Arguments>
+    exception:
+      The exception object.
+
+  <Exceptions>
+    None.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    The JSON list of the class name and message of 'exception', as bytes.
+  """
+
+  return json.dumps([type(exception).__name__,
+      str(exception)]).encode('utf-8')
+
+
+
+
+
+def decode_exception(message):
+  """
+  <Purpose>
+    Return the exception encoded by encode_exception().  Exceptions other
+    than those of 'securesystemslib.exceptions' are returned as
+    'securesystemslib.exceptions.Error', whose message includes their class
+    name.
+
+  <Arguments>
+    message:
+      The encoded exception, as bytes.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'message' is improperly
+    formatted.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    An exception object.
+  """
+
+  try:
+    name, text = json.loads(message.decode('utf-8'))
+
+  except (ValueError, TypeError) as e:
+    raise securesystemslib.exceptions.FormatError('Invalid exception: ' +
+        str(e))
+
+  exception_class = getattr(securesystemslib.exceptions, name, None)
+  if not isinstance(exception_class, type) or \
+      not issubclass(exception_class, securesystemslib.exceptions.Error):
+    exception_class = securesystemslib.exceptions.Error
+    text = name + ': ' + text
+
+  return exception_class(text)
+
+
+
+if __name__ == '__main__':
+  # The interactive sessions of the documentation strings can
+  # be tested by running 'daemon.py' as a standalone module.
+  # python -B daemon.py
+  import doctest
+  doctest.testmod()
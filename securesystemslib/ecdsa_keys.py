@@ -46,6 +46,7 @@ import logging
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric import utils
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends.interfaces import PEMSerializationBackend
@@ -56,6 +57,7 @@ from cryptography.hazmat.primitives.serialization import load_pem_private_key
 import cryptography.exceptions
 
 # Perform object format-checking and add ability to handle/raise exceptions.
+import securesystemslib.cache
 import securesystemslib.formats
 import securesystemslib.exceptions
 
@@ -177,7 +179,8 @@ def create_signature(public_key, private_key, data, scheme='ecdsa-sha2-nistp256'
       The ECDSA private key in PEM format.
 
     data:
-      Byte data used by create_signature() to generate the signature returned.
+      Byte data used by create_signature() to generate the signature returned,
+      as a bytes-like object (e.g., bytes, bytearray or memoryview).
 
     scheme:
       The signature scheme used to generate the signature.  For example:
@@ -238,6 +241,168 @@ def create_signature(public_key, private_key, data, scheme='ecdsa-sha2-nistp256'
 
 
 
+def load_private_key_object(private_key):
+  """
+  <Purpose>
+    Deserialize the PEM-encoded ECDSA 'private_key' and return its
+    pyca/cryptography private key object.  The returned object may be passed
+    to create_signature_with_key_object() to generate any number of
+    signatures, without deserializing 'private_key' for each of them.
+
+  <Arguments>
+    private_key:
+      The private ECDSA key, a string in PEM format.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'private_key' is improperly
+    formatted or is not an ECDSA private key.
+
+    securesystemslib.exceptions.CryptoError, if 'private_key' cannot be
+    deserialized.
+
+  <Side Effects>
+    pyca/cryptography's load_pem_private_key() is called.
+
+  <Returns>
+    An 'EllipticCurvePrivateKey' object.
+  """
+
+  # Is 'private_key' properly formatted?
+  securesystemslib.formats.PEMECDSA_SCHEMA.check_match(private_key)
+
+  try:
+    private_key_object = load_pem_private_key(private_key.encode('utf-8'),
+        password=None, backend=default_backend())
+
+  except (ValueError, TypeError, cryptography.exceptions.UnsupportedAlgorithm) as e:
+    raise securesystemslib.exceptions.CryptoError('Could not deserialize the'
+      ' private key: ' + str(e))
+
+  if not isinstance(private_key_object, ec.EllipticCurvePrivateKey):
+    raise securesystemslib.exceptions.FormatError('Not an ECDSA private key.')
+
+  return private_key_object
+
+
+
+
+
+def create_signature_with_key_object(private_key_object, data,
+    scheme='ecdsa-sha2-nistp256'):
+  """
+  <Purpose>
+    Generate a 'scheme' signature of 'data' with 'private_key_object', a
+    private key object returned by load_private_key_object().  Unlike
+    create_signature(), the private key is not deserialized again.
+
+  <Arguments>
+    private_key_object:
+      An 'EllipticCurvePrivateKey' object.
+
+    data:
+      Data (bytes) used by create_signature_with_key_object() to generate the
+      signature.
+
+    scheme:
+      The signature scheme used to generate the signature.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'scheme' is improperly
+    formatted.
+
+    securesystemslib.exceptions.CryptoError, if a signature cannot be created.
+
+  <Side Effects>
+    pyca/cryptography's EllipticCurvePrivateKey.signer() is called to generate
+    the signature.
+
+  <Returns>
+    A (signature, scheme) tuple.
+  """
+
+  securesystemslib.formats.ECDSA_SIG_SCHEMA.check_match(scheme)
+
+  try:
+    signer = private_key_object.signer(ec.ECDSA(hashes.SHA256()))
+    signer.update(data)
+    signature = signer.finalize()
+
+  except TypeError as e:
+    raise securesystemslib.exceptions.CryptoError('Could not create'
+      ' signature: ' + str(e))
+
+  return signature, scheme
+
+
+
+
+
+def create_signature_prehashed(public_key, private_key, digest,
+    scheme='ecdsa-sha2-nistp256'):
+  """
+  <Purpose>
+    Return a (signature, scheme) tuple of the data whose SHA256 digest is
+    'digest'.  The signature is identical in format to one generated by
+    create_signature() over the data itself, and may be verified by
+    verify_signature() or verify_signature_prehashed().
+
+    >>> import hashlib
+    >>> public, private = generate_public_and_private()
+    >>> data = b'The quick brown fox jumps over the lazy dog'
+    >>> digest = hashlib.sha256(data).digest()
+    >>> signature, scheme = create_signature_prehashed(public, private, digest)
+    >>> verify_signature(public, scheme, signature, data)
+    True
+
+  <Arguments>
+    public_key:
+      The ECDSA public key in PEM format.
+
+    private_key:
+      The ECDSA private key in PEM format.
+
+    digest:
+      The SHA256 digest (32 bytes) of the data to be signed.
+
+    scheme:
+      The signature scheme used to generate the signature.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted, or if 'digest' is not a SHA256 digest.
+
+    securesystemslib.exceptions.CryptoError, if 'private_key' cannot be
+    deserialized.
+
+  <Side Effects>
+    pyca/cryptography's EllipticCurvePrivateKey.sign() is called to generate
+    the signature.
+
+  <Returns>
+    A (signature, scheme) tuple.
+  """
+
+  # Are the arguments properly formatted?  'private_key' is checked by
+  # load_private_key_object().
+  securesystemslib.formats.PEMECDSA_SCHEMA.check_match(public_key)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(digest)
+  securesystemslib.formats.ECDSA_SIG_SCHEMA.check_match(scheme)
+
+  if len(digest) != hashes.SHA256.digest_size:
+    raise securesystemslib.exceptions.FormatError('Expected a SHA256 digest'
+      ' of ' + repr(hashes.SHA256.digest_size) + ' bytes, got ' +
+      repr(len(digest)) + ' bytes.')
+
+  private_key_object = load_private_key_object(private_key)
+  signature = private_key_object.sign(digest,
+      ec.ECDSA(utils.Prehashed(hashes.SHA256())))
+
+  return signature, scheme
+
+
+
+
+
 def verify_signature(public_key, scheme, signature, data):
   """
   <Purpose>
@@ -267,7 +432,8 @@ def verify_signature(public_key, scheme, signature, data):
       the private key associated with 'public_key'.  'data'.
 
     data:
-      Byte data that was used by create_signature() to generate 'signature'.
+      Byte data that was used by create_signature() to generate 'signature',
+      as a bytes-like object.
 
   <Exceptions>
     securesystemslib.exceptions.FormatError, if any of the arguments are
@@ -294,7 +460,11 @@ def verify_signature(public_key, scheme, signature, data):
   # check for a valid 'scheme'.  The check_match() above should have validated
   # it...
   if scheme in _SUPPORTED_ECDSA_SCHEMES: #pragma: no cover
-    ecdsa_key = load_pem_public_key(public_key.encode('utf-8'), backend=default_backend())
+    # The parsed public key object is cached, so that the PEM is only loaded
+    # the first time 'public_key' is used.
+    ecdsa_key = securesystemslib.cache.get_public_key_object(
+        'ecdsa-sha2-nistp256', scheme, public_key, 'pyca-cryptography',
+        _load_public_pem)
 
     if not isinstance(ecdsa_key, ec.EllipticCurvePublicKey):
       raise securesystemslib.exceptions.FormatError('Invalid ECDSA public'
@@ -329,6 +499,188 @@ def verify_signature(public_key, scheme, signature, data):
 
 
 
+def verify_signature_prehashed(public_key, scheme, signature, digest):
+  """
+  <Purpose>
+    Verify that 'signature' was produced by the private key associated with
+    'public_key', over the data whose SHA256 digest is 'digest'.  Unlike
+    verify_signature(), the data is not hashed here, so that the digest of
+    data signed by several keys need only be computed once.
+
+    >>> import hashlib
+    >>> public, private = generate_public_and_private()
+    >>> data = b'The quick brown fox jumps over the lazy dog'
+    >>> scheme = 'ecdsa-sha2-nistp256'
+    >>> signature, scheme = create_signature(public, private, data, scheme)
+    >>> digest = hashlib.sha256(data).digest()
+    >>> verify_signature_prehashed(public, scheme, signature, digest)
+    True
+
+  <Arguments>
+    public_key:
+      The ECDSA public key in PEM format.
+
+    scheme:
+      The signature scheme used to generate 'signature'.  For example:
+      'ecdsa-sha2-nistp256'.
+
+    signature:
+      The signature to be verified, which should have been generated by
+      the private key associated with 'public_key'.
+
+    digest:
+      The SHA256 digest (32 bytes) of the data that was signed.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if any of the arguments are
+    improperly formatted, or if 'digest' is not a SHA256 digest.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    Boolean, indicating whether the 'signature' of data was generated by
+    the private key associated with 'public_key'.
+  """
+
+  # Are the arguments properly formatted?
+  securesystemslib.formats.PEMECDSA_SCHEMA.check_match(public_key)
+  securesystemslib.formats.ECDSA_SIG_SCHEMA.check_match(scheme)
+  securesystemslib.formats.ECDSASIGNATURE_SCHEMA.check_match(signature)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(digest)
+
+  if len(digest) != hashes.SHA256.digest_size:
+    raise securesystemslib.exceptions.FormatError('Expected a SHA256 digest'
+      ' of ' + repr(hashes.SHA256.digest_size) + ' bytes, got ' +
+      repr(len(digest)) + ' bytes.')
+
+  ecdsa_key = securesystemslib.cache.get_public_key_object(
+      'ecdsa-sha2-nistp256', scheme, public_key, 'pyca-cryptography',
+      _load_public_pem)
+
+  if not isinstance(ecdsa_key, ec.EllipticCurvePublicKey):
+    raise securesystemslib.exceptions.FormatError('Invalid ECDSA public'
+      ' key: ' + repr(public_key))
+
+  try:
+    ecdsa_key.verify(signature, digest,
+        ec.ECDSA(utils.Prehashed(hashes.SHA256())))
+    return True
+
+  except cryptography.exceptions.InvalidSignature:
+    return False
+
+
+
+
+
+def load_public_key_object(public_key):
+  """
+  <Purpose>
+    Deserialize the PEM-encoded ECDSA 'public_key' and return its
+    pyca/cryptography public key object.  The returned object may be passed
+    to verify_signature_with_key_object() to verify any number of
+    signatures, without deserializing 'public_key' for each of them.
+
+  <Arguments>
+    public_key:
+      The ECDSA public key in PEM format.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'public_key' is improperly
+    formatted or is not an ECDSA public key.
+
+    securesystemslib.exceptions.CryptoError, if 'public_key' cannot be
+    deserialized.
+
+  <Side Effects>
+    pyca/cryptography's load_pem_public_key() is called.
+
+  <Returns>
+    An 'EllipticCurvePublicKey' object.
+  """
+
+  # Is 'public_key' properly formatted?
+  securesystemslib.formats.PEMECDSA_SCHEMA.check_match(public_key)
+
+  try:
+    ecdsa_key = _load_public_pem(public_key)
+
+  except (ValueError, cryptography.exceptions.UnsupportedAlgorithm) as e:
+    raise securesystemslib.exceptions.CryptoError('The public key (in PEM'
+      ' format) could not be deserialized: ' + str(e))
+
+  if not isinstance(ecdsa_key, ec.EllipticCurvePublicKey):
+    raise securesystemslib.exceptions.FormatError('Invalid ECDSA public'
+      ' key: ' + repr(public_key))
+
+  return ecdsa_key
+
+
+
+
+
+def verify_signature_with_key_object(public_key_object, signature, data,
+    scheme='ecdsa-sha2-nistp256'):
+  """
+  <Purpose>
+    Verify that 'signature' over 'data' was produced by the private key of
+    'public_key_object', a public key object returned by
+    load_public_key_object().
+
+  <Arguments>
+    public_key_object:
+      An 'EllipticCurvePublicKey' object.
+
+    signature:
+      The signature to be verified.
+
+    data:
+      Byte data that was used by create_signature() to generate 'signature'.
+
+    scheme:
+      The signature scheme used to generate 'signature'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if any of the arguments are
+    improperly formatted.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    Boolean, indicating whether the 'signature' of data was generated by
+    the private key of 'public_key_object'.
+  """
+
+  securesystemslib.formats.ECDSASIGNATURE_SCHEMA.check_match(signature)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
+  securesystemslib.formats.ECDSA_SIG_SCHEMA.check_match(scheme)
+
+  try:
+    public_key_object.verify(signature, data, ec.ECDSA(hashes.SHA256()))
+    return True
+
+  except cryptography.exceptions.InvalidSignature:
+    return False
+
+
+
+
+
+def _load_public_pem(public_key):
+  """
+  Non-public function that returns the pyca/cryptography public key object of
+  the PEM-encoded 'public_key'.
+  """
+
+  return load_pem_public_key(public_key.encode('utf-8'),
+      backend=default_backend())
+
+
+
+
+
 def create_ecdsa_public_and_private_from_pem(pem, password=None):
   """
   <Purpose>
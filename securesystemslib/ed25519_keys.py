@@ -37,10 +37,11 @@
   http://nacl.cr.yp.to/
   https://github.com/pyca/ed25519
 
-  The ed25519-related functions included here are generate(), create_signature()
-  and verify_signature().  The 'ed25519' and PyNaCl (i.e., 'nacl') modules used
-  by ed25519_keys.py perform the actual ed25519 computations and the functions
-  listed above can be viewed as an easy-to-use public interface.
+  The ed25519-related functions included here are generate(), create_signature(),
+  verify_signature() and verify_signatures().  The 'ed25519' and PyNaCl (i.e.,
+  'nacl') modules used by ed25519_keys.py perform the actual ed25519
+  computations and the functions listed above can be viewed as an easy-to-use
+  public interface.
  """
 
 # Help with Python 3 compatibility, where the print statement is a function, an
@@ -105,9 +106,12 @@ with warnings.catch_warnings():
 # 'securesystemslib.exceptions.UnsupportedLibraryError' exception is raised.
 import securesystemslib._vendor.ed25519.ed25519
 
+import securesystemslib.cache
 import securesystemslib.formats
 import securesystemslib.exceptions
 
+import six
+
 # Supported ed25519 signing schemes: 'ed25519'.  The pure Python implementation
 # (i.e., ed25519') and PyNaCl (i.e., 'nacl', libsodium + Python bindings)
 # modules are currently supported in the creation of 'ed25519' signatures.
@@ -211,7 +215,8 @@ def create_signature(public_key, private_key, data, scheme):
       The ed25519 private key, which is a 32-byte string.
 
     data:
-      Data object used by create_signature() to generate the signature.
+      Data object used by create_signature() to generate the signature, as a
+      bytes-like object (e.g., bytes, bytearray or memoryview).
 
     scheme:
       The signature scheme used to generate the signature.
@@ -258,7 +263,7 @@ def create_signature(public_key, private_key, data, scheme):
   if scheme == 'ed25519': #pragma: no cover
     try:
       nacl_key = nacl.signing.SigningKey(private)
-      nacl_sig = nacl_key.sign(data)
+      nacl_sig = nacl_key.sign(_get_bytes(data))
       signature = nacl_sig.signature
 
     except NameError: # pragma: no cover
@@ -279,6 +284,175 @@ def create_signature(public_key, private_key, data, scheme):
 
 
 
+def load_private_key_object(private_key):
+  """
+  <Purpose>
+    Return the PyNaCl signing key object of the ed25519 seed 'private_key'.
+    The returned object may be passed to create_signature_with_key_object() to
+    generate any number of signatures, without re-deriving the signing key
+    from the seed for each of them.
+
+  <Arguments>
+    private_key:
+      The private ed25519 key (i.e., the 32-byte seed).
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'private_key' is improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if PyNaCl is
+    unavailable.
+
+  <Side Effects>
+    nacl.signing.SigningKey() is called.
+
+  <Returns>
+    A 'nacl.signing.SigningKey' object.
+  """
+
+  # Is 'private_key' properly formatted?
+  securesystemslib.formats.ED25519SEED_SCHEMA.check_match(private_key)
+
+  try:
+    return nacl.signing.SigningKey(private_key)
+
+  except NameError: # pragma: no cover
+    message = 'The PyNaCl library and/or its dependencies unavailable.'
+    raise securesystemslib.exceptions.UnsupportedLibraryError(message)
+
+
+
+
+
+def create_signature_with_key_object(private_key_object, data,
+    scheme='ed25519'):
+  """
+  <Purpose>
+    Generate a 'scheme' signature of 'data' with 'private_key_object', a
+    signing key object returned by load_private_key_object().
+
+  <Arguments>
+    private_key_object:
+      A 'nacl.signing.SigningKey' object.
+
+    data:
+      Data (bytes) used by create_signature_with_key_object() to generate the
+      signature.
+
+    scheme:
+      The signature scheme used to generate the signature.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'scheme' is improperly
+    formatted.
+
+    securesystemslib.exceptions.CryptoError, if a signature cannot be created.
+
+  <Side Effects>
+    nacl.signing.SigningKey.sign() called to generate the actual signature.
+
+  <Returns>
+    A (signature, scheme) tuple, where the signature is 64 bytes.
+  """
+
+  securesystemslib.formats.ED25519_SIG_SCHEMA.check_match(scheme)
+
+  try:
+    return private_key_object.sign(_get_bytes(data)).signature, scheme
+
+  except (ValueError, TypeError, nacl.exceptions.CryptoError) as e:
+    message = 'An "ed25519" signature could not be created with PyNaCl.'
+    raise securesystemslib.exceptions.CryptoError(message + str(e))
+
+
+
+
+
+def load_public_key_object(public_key):
+  """
+  <Purpose>
+    Return the PyNaCl verify key object of the ed25519 'public_key'.  The
+    returned object may be passed to verify_signature_with_key_object() to
+    verify any number of signatures.
+
+  <Arguments>
+    public_key:
+      The public key is a 32-byte string.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'public_key' is improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if PyNaCl is
+    unavailable.
+
+  <Side Effects>
+    nacl.signing.VerifyKey() is called.
+
+  <Returns>
+    A 'nacl.signing.VerifyKey' object.
+  """
+
+  # Is 'public_key' properly formatted?
+  securesystemslib.formats.ED25519PUBLIC_SCHEMA.check_match(public_key)
+
+  try:
+    return nacl.signing.VerifyKey(public_key)
+
+  except NameError: # pragma: no cover
+    message = 'The PyNaCl library and/or its dependencies unavailable.'
+    raise securesystemslib.exceptions.UnsupportedLibraryError(message)
+
+
+
+
+
+def verify_signature_with_key_object(public_key_object, signature, data,
+    scheme='ed25519'):
+  """
+  <Purpose>
+    Determine whether the private key of 'public_key_object', a verify key
+    object returned by load_public_key_object(), produced the 'scheme'
+    'signature' of 'data'.
+
+  <Arguments>
+    public_key_object:
+      A 'nacl.signing.VerifyKey' object.
+
+    signature:
+      The signature is a 64-byte string.
+
+    data:
+      Data object used by create_signature() to generate 'signature'.
+
+    scheme:
+      The signature scheme used to generate 'signature'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'signature' or 'scheme' are
+    improperly formatted.
+
+  <Side Effects>
+    nacl.signing.VerifyKey.verify() called to do the actual verification.
+
+  <Returns>
+    Boolean.  True if the signature is valid, False otherwise.
+  """
+
+  securesystemslib.formats.ED25519SIGNATURE_SCHEMA.check_match(signature)
+  securesystemslib.formats.ED25519_SIG_SCHEMA.check_match(scheme)
+
+  try:
+    public_key_object.verify(_get_bytes(data), signature)
+    return True
+
+  except nacl.exceptions.BadSignatureError:
+    return False
+
+
+
+
+
 def verify_signature(public_key, scheme, signature, data, use_pynacl=False):
   """
   <Purpose>
@@ -319,7 +493,9 @@ def verify_signature(public_key, scheme, signature, data, use_pynacl=False):
     use_pynacl:
       True, if the ed25519 signature should be verified by PyNaCl.  False,
       if the signature should be verified with the pure Python implementation
-      of ed25519 (slower).
+      of ed25519 (slower), which checks the cofactored verification equation
+      of RFC 8032 (i.e., unlike PyNaCl, it accepts a signature whose R has a
+      small-order component).
 
   <Exceptions>
     securesystemslib.exceptions.UnsupportedAlgorithmError.  Raised if the
@@ -331,8 +507,9 @@ def verify_signature(public_key, scheme, signature, data, use_pynacl=False):
 
   <Side Effects>
     securesystemslib._vendor.ed25519.ed25519.checkvalid() called to do the
-    actual verification.  nacl.signing.VerifyKey.verify() called if
-    'use_pynacl' is True.
+    actual verification, with the decoded 'public_key' that is cached in
+    'securesystemslib.cache.ed25519_point_cache'.
+    nacl.signing.VerifyKey.verify() called if 'use_pynacl' is True.
 
   <Returns>
     Boolean.  True if the signature is valid, False otherwise.
@@ -365,8 +542,11 @@ def verify_signature(public_key, scheme, signature, data, use_pynacl=False):
   if scheme in _SUPPORTED_ED25519_SIGNING_SCHEMES: #pragma: no cover
     if use_pynacl:
       try:
-        nacl_verify_key = nacl.signing.VerifyKey(public)
-        nacl_message = nacl_verify_key.verify(data, signature)
+        # The VerifyKey object is cached, so that it is only created the first
+        # time 'public' is used.
+        nacl_verify_key = securesystemslib.cache.get_public_key_object(
+            'ed25519', scheme, public, 'pynacl', nacl.signing.VerifyKey)
+        nacl_message = nacl_verify_key.verify(_get_bytes(data), signature)
         valid_signature = True
 
       except NameError: # pragma: no cover
@@ -376,10 +556,12 @@ def verify_signature(public_key, scheme, signature, data, use_pynacl=False):
       except nacl.exceptions.BadSignatureError:
         pass
 
-    # Verify 'ed25519' signature with the pure Python implementation.
+    # Verify 'ed25519' signature with the pure Python implementation, which
+    # hashes 'data' as is.
     else:
       try:
-        securesystemslib._vendor.ed25519.ed25519.checkvalid(signature, data, public)
+        securesystemslib._vendor.ed25519.ed25519.checkvalid(signature, data,
+            public, _get_precomputed_public_key(public))
         valid_signature = True
 
       # The pure Python implementation raises 'Exception' if 'signature' is
@@ -396,6 +578,133 @@ def verify_signature(public_key, scheme, signature, data, use_pynacl=False):
 
 
 
+
+
+def verify_signatures(jobs, use_pynacl=False):
+  """
+  <Purpose>
+    Verify many ed25519 signatures, with the results of verify_signature()
+    for each of them.  The pure Python implementation of ed25519 verifies the
+    signatures together, in a batch, which is faster than verifying them one
+    by one (especially if a key made several of the signatures).  If the
+    batch fails, the signatures are verified one by one to identify the
+    invalid ones.
+
+    The batch accepts a signature that verify_signature() rejects only with
+    negligible probability: both check the cofactored verification equation,
+    so that a signature made with a small-order component by the holder of
+    the private key is accepted by both, whichever batch it is part of.
+
+    >>> public, private = generate_public_and_private()
+    >>> data = b'The quick brown fox jumps over the lazy dog'
+    >>> signature, scheme = create_signature(public, private, data, 'ed25519')
+    >>> verify_signatures([(public, scheme, signature, data),
+    ...     (public, scheme, signature, b'bad_data')])
+    [True, False]
+
+  <Arguments>
+    jobs:
+      A list of (public_key, scheme, signature, data) tuples, the arguments
+      of verify_signature().
+
+    use_pynacl:
+      True, if the signatures should be verified one by one by PyNaCl.
+      False, if they should be verified with the pure Python implementation
+      of ed25519.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if 'use_pynacl' is
+    True but PyNaCl is unavailable.
+
+  <Side Effects>
+    securesystemslib._vendor.ed25519.ed25519.checkbatch() called to verify
+    the batch, with the decoded public keys that are cached in
+    'securesystemslib.cache.ed25519_point_cache'.
+
+  <Returns>
+    A list of booleans, in the order of 'jobs': True if the signature is
+    valid, False otherwise.
+  """
+
+  if not isinstance(jobs, list):
+    raise securesystemslib.exceptions.FormatError('Expected a list of'
+        ' jobs, got ' + repr(type(jobs)) + '.')
+
+  for job in jobs:
+    if not isinstance(job, tuple) or len(job) != 4:
+      raise securesystemslib.exceptions.FormatError('Expected a tuple of 4'
+          ' items, got ' + repr(job) + '.')
+
+    public_key, scheme, signature, data = job
+    securesystemslib.formats.ED25519PUBLIC_SCHEMA.check_match(public_key)
+    securesystemslib.formats.ED25519_SIG_SCHEMA.check_match(scheme)
+    securesystemslib.formats.ED25519SIGNATURE_SCHEMA.check_match(signature)
+
+  securesystemslib.formats.BOOLEAN_SCHEMA.check_match(use_pynacl)
+
+  # A batch of a single signature would only be slower.
+  if not use_pynacl and len(jobs) > 1:
+    try:
+      securesystemslib._vendor.ed25519.ed25519.checkbatch([(signature, data,
+          public_key, _get_precomputed_public_key(public_key))
+          for public_key, scheme, signature, data in jobs])
+      return [True] * len(jobs)
+
+    # The pure Python implementation raises 'Exception' if a signature is
+    # invalid, or cannot be verified (e.g., if 'data' is not bytes-like).
+    except Exception as e:
+      pass
+
+  return [verify_signature(public_key, scheme, signature, data, use_pynacl)
+      for public_key, scheme, signature, data in jobs]
+
+
+
+
+
+def _get_precomputed_public_key(public):
+  """
+  Non-public function that returns the decoded public key 'public', as
+  precomputed by the pure Python implementation of ed25519.  It is cached in
+  'securesystemslib.cache.ed25519_point_cache', so that it is only computed
+  the first time 'public' is used.
+  """
+
+  return securesystemslib.cache.ed25519_point_cache.get_or_create(public,
+      lambda: securesystemslib._vendor.ed25519.ed25519.precompute_publickey(
+      public))
+
+
+
+
+
+def _get_bytes(data):
+  """
+  Non-public function that returns the bytes-like 'data' as bytes.  PyNaCl
+  only accepts bytes (and copies the message into the signed message that
+  libsodium expects), so only 'data' that is not bytes is copied here.
+  Objects that are not bytes-like are returned as is, for PyNaCl to reject.
+  """
+
+  if isinstance(data, six.binary_type):
+    return data
+
+  # Python 2.6 does not have memoryview, but only accepts bytes and bytearray
+  # objects (see 'securesystemslib.formats.BUFFER_SCHEMA').
+  if isinstance(data, bytearray):
+    return six.binary_type(data)
+
+  try:
+    return memoryview(data).tobytes()
+
+  except TypeError:
+    return data
+
+
+
 if __name__ == '__main__':
   # The interactive sessions of the documentation strings can
   # be tested by running 'ed25519_keys.py' as a standalone module.
@@ -115,6 +115,10 @@ KEYID_SCHEMA = HASH_SCHEMA
 # A list of KEYID_SCHEMA.
 KEYIDS_SCHEMA = SCHEMA.ListOf(KEYID_SCHEMA)
 
+# The raw bytes of a key identifier, as held by 'securesystemslib.keys.Key'
+# and 'securesystemslib.keys.Signature'.
+RAW_KEYID_SCHEMA = SCHEMA.AnyBytes()
+
 # The signing scheme used by a key to generate a signature (e.g.,
 # 'rsassa-pss-sha256' is one of the signing schemes for key type 'rsa').
 SIG_SCHEME_SCHEMA = SCHEMA.AnyString()
@@ -155,6 +159,11 @@ NAMES_SCHEMA = SCHEMA.ListOf(NAME_SCHEMA)
 # A byte string representing data.
 DATA_SCHEMA = SCHEMA.AnyBytes()
 
+# A bytes-like object representing data (e.g., bytes, bytearray, memoryview
+# or mmap), which is passed to the cryptography libraries as is.  Memoryviews
+# must be contiguous and of bytes.
+BUFFER_SCHEMA = SCHEMA.AnyBuffer()
+
 # Supported hash algorithms.
 HASHALGORITHMS_SCHEMA = SCHEMA.ListOf(SCHEMA.OneOf(
   [SCHEMA.String('md5'), SCHEMA.String('sha1'),
@@ -173,6 +182,9 @@ BOOLEAN_SCHEMA = SCHEMA.Boolean()
 # Must be 1 and greater.
 THRESHOLD_SCHEMA = SCHEMA.Integer(lo=1)
 
+# The number of PBKDF2 iterations used to derive a key from a password.
+PBKDF2_ITERATIONS_SCHEMA = SCHEMA.Integer(lo=1)
+
 # A string representing a role's name.
 ROLENAME_SCHEMA = SCHEMA.AnyString()
 
@@ -239,6 +251,9 @@ KEY_SCHEMA = SCHEMA.Object(
   keyval = KEYVAL_SCHEMA,
   expires = SCHEMA.Optional(ISO8601_DATETIME_SCHEMA))
 
+# A list of KEY_SCHEMA objects.
+KEYLIST_SCHEMA = SCHEMA.ListOf(KEY_SCHEMA)
+
 # Like KEY_SCHEMA, but requires keyval's private portion to be unset or empty,
 # and optionally includes the supported keyid hash algorithms used to generate
 # the key's keyid.
@@ -306,6 +321,36 @@ REQUIRED_LIBRARIES_SCHEMA = SCHEMA.ListOf(SCHEMA.OneOf(
   [SCHEMA.String('general'), SCHEMA.String('ed25519'), SCHEMA.String('rsa'),
    SCHEMA.String('ecdsa-sha2-nistp256')]))
 
+# The cryptographic operations of the backends in 'backends.py'.
+CRYPTO_OPERATION_SCHEMA = SCHEMA.OneOf(
+  [SCHEMA.String('sign'), SCHEMA.String('verify')])
+
+# The measurement of the backends of a cryptographic operation by
+# 'calibration.py': the time ('seconds') each correct library takes to
+# perform it, the selected (fastest) library, and the libraries rejected
+# because they produced incorrect results.  Key derivation ('kdf') is
+# performed by the 'general' library.
+CALIBRATION_ENTRY_SCHEMA = SCHEMA.Object(
+  object_name = 'CALIBRATION_ENTRY_SCHEMA',
+  keytype = SCHEMA.OneOf([SCHEMA.String('general'), KEYTYPE_SCHEMA]),
+  scheme = SCHEMA.AnyString(),
+  operation = SCHEMA.OneOf([CRYPTO_OPERATION_SCHEMA, SCHEMA.String('kdf')]),
+  library = SCHEMA.Optional(NAME_SCHEMA),
+  seconds = SCHEMA.DictOf(key_schema=NAME_SCHEMA, value_schema=SCHEMA.Any()),
+  rejected = SCHEMA.ListOf(NAME_SCHEMA))
+
+# The calibration report of every measured operation.
+CALIBRATION_REPORT_SCHEMA = SCHEMA.ListOf(CALIBRATION_ENTRY_SCHEMA)
+
+# A calibration report cached on disk, with the environment (e.g., the
+# registered backends and the versions of their libraries) it was measured in.
+CALIBRATION_FILE_SCHEMA = SCHEMA.Object(
+  object_name = 'CALIBRATION_FILE_SCHEMA',
+  version = SCHEMA.Integer(lo=1),
+  environment = SCHEMA.DictOf(key_schema=SCHEMA.AnyString(),
+      value_schema=SCHEMA.Any()),
+  report = CALIBRATION_REPORT_SCHEMA)
+
 # Ed25519 signature schemes.  The vanilla Ed25519 signature scheme is currently
 # supported.
 ED25519_SIG_SCHEMA = SCHEMA.OneOf([SCHEMA.String('ed25519')])
@@ -364,6 +409,9 @@ SIGNATURE_SCHEMA = SCHEMA.Object(
   keyid = KEYID_SCHEMA,
   sig = HEX_SCHEMA)
 
+# The raw bytes of a signature, as held by 'securesystemslib.keys.Signature'.
+RAW_SIGNATURE_SCHEMA = SCHEMA.AnyBytes()
+
 # List of SIGNATURE_SCHEMA.
 SIGNATURES_SCHEMA = SCHEMA.ListOf(SIGNATURE_SCHEMA)
 
@@ -429,12 +477,12 @@ DELEGATIONS_SCHEMA = SCHEMA.Object(
   keys = KEYDICT_SCHEMA,
   roles = ROLELIST_SCHEMA)
 
-# Supported compression extension (e.g., 'gz').
-COMPRESSION_SCHEMA = SCHEMA.OneOf([SCHEMA.String(''), SCHEMA.String('gz')])
+# Supported compression extension (e.g., 'gz', 'bz2', 'xz').
+COMPRESSION_SCHEMA = SCHEMA.OneOf([SCHEMA.String(''), SCHEMA.String('gz'),
+  SCHEMA.String('bz2'), SCHEMA.String('xz')])
 
 # List of supported compression extensions.
-COMPRESSIONS_SCHEMA = SCHEMA.ListOf(
-  SCHEMA.OneOf([SCHEMA.String(''), SCHEMA.String('gz')]))
+COMPRESSIONS_SCHEMA = SCHEMA.ListOf(COMPRESSION_SCHEMA)
 
 # The fileinfo format of targets specified in the repository and
 # developer tools.  The second element of this list holds custom data about the
@@ -32,6 +32,7 @@ from __future__ import division
 from __future__ import unicode_literals
 
 import logging
+import importlib
 
 import six
 
@@ -46,23 +47,28 @@ _supported_libraries = []
 # Hash libraries currently supported by securesystemslib.hash.
 _SUPPORTED_LIB_LIST = ['hashlib', 'pycrypto']
 
-# Let's try importing the pycrypto hash algorithms.  Pycrypto will
-# not be added to the supported list of libraries if the specified
-# hash algorithms below cannot all be imported.
+# The pycrypto hash algorithms are imported the first time a pycrypto digest
+# object is requested, because importing them is slow and most callers only
+# use hashlib.  Pycrypto is added to the supported list of libraries if it is
+# installed.
 try:
-  from Crypto.Hash import MD5
-  from Crypto.Hash import SHA
-  from Crypto.Hash import SHA224
-  from Crypto.Hash import SHA256
-  from Crypto.Hash import SHA384
-  from Crypto.Hash import SHA512
-  _supported_libraries.append('pycrypto')
+  from importlib.util import find_spec as _find_module
 
 except ImportError: # pragma: no cover
+  from pkgutil import find_loader as _find_module
+
+if _find_module('Crypto') is not None:
+  _supported_libraries.append('pycrypto')
+
+else: # pragma: no cover
   logger.debug('Pycrypto hash algorithms could not be imported.  '
               'Supported libraries: '+str(_SUPPORTED_LIB_LIST))
 
-  pass
+# The names of the pycrypto modules of the supported hash algorithms, and the
+# modules imported so far.
+_PYCRYPTO_HASH_MODULES = {'md5': 'MD5', 'sha1': 'SHA', 'sha224': 'SHA224',
+    'sha256': 'SHA256', 'sha384': 'SHA384', 'sha512': 'SHA512'}
+_pycrypto_hash_modules = {}
 
 # Python <=2.4 does not have the hashlib module by default.
 # Let's try importing hashlib and adding it to our supported list.
@@ -149,21 +155,11 @@ def digest(algorithm=_DEFAULT_HASH_ALGORITHM,
     # Pycrypto does not offer a comparable hashlib.new(hashname).
     # Let's first check the 'algorithm' argument before returning
     # the correct pycrypto digest object using pycrypto's object construction.
-    if algorithm == 'md5':
-      return MD5.new()
-    elif algorithm == 'sha1':
-      return SHA.new()
-    elif algorithm == 'sha224':
-      return SHA224.new()
-    elif algorithm == 'sha256':
-      return SHA256.new()
-    elif algorithm == 'sha384':
-      return SHA384.new()
-    elif algorithm == 'sha512':
-      return SHA512.new()
-    else:
+    if algorithm not in _PYCRYPTO_HASH_MODULES:
       raise securesystemslib.exceptions.UnsupportedAlgorithmError(algorithm)
 
+    return _get_pycrypto_hash_module(algorithm).new()
+
   # The requested hash library is not supported.
   else:
     raise securesystemslib.exceptions.UnsupportedLibraryError('Unsupported library requested.  '
@@ -173,6 +169,31 @@ def digest(algorithm=_DEFAULT_HASH_ALGORITHM,
 
 
 
+def _get_pycrypto_hash_module(algorithm):
+  """
+  Non-public function that returns the pycrypto module of 'algorithm',
+  importing it the first time it is requested.
+  """
+
+  try:
+    return _pycrypto_hash_modules[algorithm]
+
+  except KeyError:
+    try:
+      module = importlib.import_module('Crypto.Hash.' +
+          _PYCRYPTO_HASH_MODULES[algorithm])
+
+    except ImportError: # pragma: no cover
+      raise securesystemslib.exceptions.UnsupportedLibraryError('The pycrypto'
+          ' hash algorithms could not be imported.')
+
+    _pycrypto_hash_modules[algorithm] = module
+    return module
+
+
+
+
+
 def digest_fileobject(file_object, algorithm=_DEFAULT_HASH_ALGORITHM,
                       hash_library=_DEFAULT_HASH_LIBRARY):
   """
@@ -219,8 +240,26 @@ def digest_fileobject(file_object, algorithm=_DEFAULT_HASH_ALGORITHM,
   # Read the contents of the file object in at most 4096-byte chunks.
   # Update the hash with the data read from each chunk and return after
   # the entire file is processed.
+  chunksize = 4096
+
+  # Binary file objects read each chunk into the same buffer, rather than
+  # into a new bytes object, and the hash is updated with a view of it.
+  # Python 2.6 does not have memoryview, and reads each chunk instead.
+  if hasattr(file_object, 'readinto') and \
+      hasattr(six.moves.builtins, 'memoryview'):
+    buffer = bytearray(chunksize)
+    view = memoryview(buffer)
+
+    while True:
+      length = file_object.readinto(buffer)
+      if not length:
+        break
+
+      digest_object.update(view[:length])
+
+    return digest_object
+
   while True:
-    chunksize = 4096
     data = file_object.read(chunksize)
     if not data:
       break
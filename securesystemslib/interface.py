@@ -41,7 +41,9 @@ import json
 import gzip
 import random
 
+import securesystemslib.exceptions
 import securesystemslib.formats
+import securesystemslib.parallel
 import securesystemslib.settings
 import securesystemslib.util
 import securesystemslib.keys
@@ -405,22 +407,9 @@ def generate_and_write_ed25519_keypair(filepath, password=None):
     private=False)
 
   # Write the public key, conformant to 'securesystemslib.formats.KEY_SCHEMA', to
-  # '<filepath>.pub'.
-  securesystemslib.util.ensure_parent_dir(filepath)
-
-  # Create a tempororary file, write the contents of the public key, and move
-  # to final destination.
-  file_object = securesystemslib.util.TempFile()
-  file_object.write(json.dumps(ed25519key_metadata_format).encode('utf-8'))
-
-  # The temporary file is closed after the final move.
-  file_object.move(filepath + '.pub')
-
-  # Write the encrypted key string, conformant to
+  # '<filepath>.pub', and the encrypted key string, conformant to
   # 'securesystemslib.formats.ENCRYPTEDKEY_SCHEMA', to '<filepath>'.
-  file_object = securesystemslib.util.TempFile()
-  file_object.write(encrypted_key.encode('utf-8'))
-  file_object.move(filepath)
+  _write_keypair(filepath, ed25519key_metadata_format, encrypted_key)
 
 
 
@@ -637,22 +626,9 @@ def generate_and_write_ecdsa_keypair(filepath, password=None):
     securesystemslib.keys.format_keyval_to_metadata(keytype, scheme, keyval, private=False)
 
   # Write the public key, conformant to 'securesystemslib.formats.KEY_SCHEMA', to
-  # '<filepath>.pub'.
-  securesystemslib.util.ensure_parent_dir(filepath)
-
-  # Create a tempororary file, write the contents of the public key, and move
-  # to final destination.
-  file_object = securesystemslib.util.TempFile()
-  file_object.write(json.dumps(ecdsakey_metadata_format).encode('utf-8'))
-
-  # The temporary file is closed after the final move.
-  file_object.move(filepath + '.pub')
-
-  # Write the encrypted key string, conformant to
+  # '<filepath>.pub', and the encrypted key string, conformant to
   # 'securesystemslib.formats.ENCRYPTEDKEY_SCHEMA', to '<filepath>'.
-  file_object = securesystemslib.util.TempFile()
-  file_object.write(encrypted_key.encode('utf-8'))
-  file_object.move(filepath)
+  _write_keypair(filepath, ecdsakey_metadata_format, encrypted_key)
 
 
 
@@ -789,6 +765,393 @@ def import_ecdsa_privatekey_from_file(filepath, password=None):
 
 
 
+
+
+def import_signer_from_file(filepath, keytype, password=None):
+  """
+  <Purpose>
+    Import the encrypted private key file in 'filepath' of key type 'keytype',
+    and return a 'securesystemslib.keys.Signer' object that holds the
+    deserialized private key.  The Signer can generate any number of
+    signatures without decrypting or deserializing the key file again.
+
+  <Arguments>
+    filepath:
+      <filepath> file, an encrypted key file (e.g., generated by
+      generate_and_write_rsa_keypair()).
+
+    keytype:
+      The key type of the key file, one of 'rsa', 'ed25519' or
+      'ecdsa-sha2-nistp256'.
+
+    password:
+      The password, or passphrase, to decrypt the key file.  The user is
+      prompted for it if it is None.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted or the imported key is not of type 'keytype'.
+
+    securesystemslib.exceptions.CryptoError, if 'filepath' cannot be decrypted
+    or deserialized.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if 'filepath' cannot
+    be decrypted due to an invalid configuration setting (i.e., invalid
+    'settings.py' setting).
+
+  <Side Effects>
+    'password' is used to decrypt the 'filepath' key file.
+
+  <Returns>
+    A 'securesystemslib.keys.Signer' object.
+  """
+
+  key_object = _import_privatekey_from_file(filepath, keytype, password)
+  return securesystemslib.keys.Signer(key_object)
+
+
+
+def add_key_to_agent(filepath, keytype, password=None, lifetime=None,
+    socket_path=None):
+  """
+  <Purpose>
+    Import the encrypted private key file in 'filepath' of key type 'keytype',
+    and add the key to the signing agent that listens on 'socket_path' (see
+    'securesystemslib.agent.SigningAgent').  The key file is decrypted once,
+    and other processes can then sign with the key (e.g., with
+    import_signer_from_agent()) until the agent removes it.
+
+  <Arguments>
+    filepath:
+      <filepath> file, an encrypted key file (e.g., generated by
+      generate_and_write_rsa_keypair()).
+
+    keytype:
+      The key type of the key file, one of 'rsa', 'ed25519' or
+      'ecdsa-sha2-nistp256'.
+
+    password:
+      The password, or passphrase, to decrypt the key file.  The user is
+      prompted for it if it is None.
+
+    lifetime:
+      The number of seconds after which the agent removes the key, or None to
+      use the maximum lifetime of the agent.
+
+    socket_path:
+      The path of the socket of the agent, or None for
+      'settings.SIGNING_AGENT_SOCKET'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted or the imported key is not of type 'keytype'.
+
+    securesystemslib.exceptions.CryptoError, if 'filepath' cannot be decrypted
+    or deserialized.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if Unix domain
+    sockets are unavailable on this platform.
+
+    socket.error, if the agent cannot be reached.
+
+  <Side Effects>
+    'password' is used to decrypt the 'filepath' key file, and the private key
+    is sent to the agent.
+
+  <Returns>
+    The keyid of the key.
+  """
+
+  # The agent module is imported on first use, rather than with this module,
+  # since it requires Unix domain sockets, which some platforms (e.g.,
+  # Windows) lack.
+  import securesystemslib.agent
+
+  key_object = _import_privatekey_from_file(filepath, keytype, password)
+
+  with securesystemslib.agent.AgentClient(socket_path) as client:
+    client.add_key(key_object, lifetime)
+
+  return key_object['keyid']
+
+
+
+def import_signer_from_agent(keyid, socket_path=None):
+  """
+  <Purpose>
+    Return a signer that signs with the key of 'keyid' held by the signing
+    agent that listens on 'socket_path' (e.g., added with add_key_to_agent()).
+    The signer is a drop-in replacement for the Signer returned by
+    import_signer_from_file(), but no key file is decrypted.
+
+  <Arguments>
+    keyid:
+      The keyid of the key.
+
+    socket_path:
+      The path of the socket of the agent, or None for
+      'settings.SIGNING_AGENT_SOCKET'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnknownKeyError, if the agent does not hold
+    the key.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if Unix domain
+    sockets are unavailable on this platform.
+
+    socket.error, if the agent cannot be reached.
+
+  <Side Effects>
+    Connects to the agent.
+
+  <Returns>
+    A 'securesystemslib.agent.AgentSigner' object.
+  """
+
+  # See add_key_to_agent().
+  import securesystemslib.agent
+
+  return securesystemslib.agent.AgentSigner(keyid, socket_path)
+
+
+
+def generate_and_write_keypairs(directory, names, keytype='ed25519',
+    password=None, max_workers=None):
+  """
+  <Purpose>
+    Generate a key of type 'keytype' for each name of 'names', and write the
+    key files of each to '<directory>/<name>' and '<directory>/<name>.pub', as
+    generate_and_write_ed25519_keypair() and
+    generate_and_write_ecdsa_keypair() do.  The keys are encrypted with
+    'password' in parallel (see 'securesystemslib.parallel.encrypt_keys()'),
+    so that provisioning many keys does not cost one PBKDF2 key derivation
+    after the other.
+
+  <Arguments>
+    directory:
+      The directory of the key files, which is created if it does not exist.
+
+    names:
+      A list of the filenames of the private key files.
+
+    keytype:
+      The key type of the keys, 'ed25519' or 'ecdsa-sha2-nistp256'.  RSA key
+      files are encrypted PEM files, which are generated by
+      generate_and_write_rsa_keypair().
+
+    password:
+      The password, or passphrase, to encrypt the keys.  The user is prompted
+      for it, once, if it is None.
+
+    max_workers:
+      The number of threads or processes that encrypt the keys.  The number
+      of CPUs by default.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+  <Side Effects>
+    Writes the key files of the keys that are encrypted.
+
+  <Returns>
+    A dictionary that maps every name of 'names' to a (keyid, exception)
+    tuple: the keyid of the key whose files are written, or None if its
+    encryption raised 'exception'.
+  """
+
+  securesystemslib.formats.PATH_SCHEMA.check_match(directory)
+  securesystemslib.formats.NAMES_SCHEMA.check_match(names)
+  _check_encrypted_keytype(keytype)
+
+  if password is None: # pragma: no cover
+    password = _get_password('Enter a password for the keys: ', confirm=True)
+
+  securesystemslib.formats.PASSWORD_SCHEMA.check_match(password)
+
+  if keytype == 'ed25519':
+    key_dicts = [securesystemslib.keys.generate_ed25519_key()
+        for name in names]
+
+  else:
+    key_dicts = [securesystemslib.keys.generate_ecdsa_key() for name in names]
+
+  results = securesystemslib.parallel.encrypt_keys([(key_dict, password)
+      for key_dict in key_dicts], max_workers)
+
+  keyids = {}
+  for name, key_dict, (encrypted_key, exception) in \
+      zip(names, key_dicts, results):
+    if exception is not None:
+      keyids[name] = (None, exception)
+      continue
+
+    key_metadata_format = securesystemslib.keys.format_keyval_to_metadata(
+        key_dict['keytype'], key_dict['scheme'], key_dict['keyval'],
+        private=False)
+    _write_keypair(os.path.join(directory, name), key_metadata_format,
+        encrypted_key)
+    keyids[name] = (key_dict['keyid'], None)
+
+  return keyids
+
+
+
+def import_privatekeys_from_directory(directory, keytype, password=None,
+    max_workers=None):
+  """
+  <Purpose>
+    Import the encrypted private key files of 'directory', i.e., the files
+    '<directory>/<name>' for which there is a public key file
+    '<directory>/<name>.pub', as import_ed25519_privatekey_from_file() and
+    import_ecdsa_privatekey_from_file() do.  The keys are decrypted with
+    'password' in parallel (see 'securesystemslib.parallel.decrypt_keys()').
+
+  <Arguments>
+    directory:
+      The directory of the key files.
+
+    keytype:
+      The key type of the keys, 'ed25519' or 'ecdsa-sha2-nistp256'.
+
+    password:
+      The password, or passphrase, to decrypt the keys.  The user is prompted
+      for it, once, if it is None.
+
+    max_workers:
+      The number of threads or processes that decrypt the keys.  The number
+      of CPUs by default.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.Error, if 'directory' cannot be listed.
+
+  <Side Effects>
+    Reads the private key files of 'directory'.
+
+  <Returns>
+    A dictionary that maps the filename of every private key file to a
+    (key_object, exception) tuple: the key, conformant to
+    'securesystemslib.formats.ANYKEY_SCHEMA', or None if the file cannot be
+    read, is not a key of type 'keytype', or cannot be decrypted (e.g.,
+    'securesystemslib.exceptions.CryptoError' for a wrong password), with the
+    exception raised.
+  """
+
+  securesystemslib.formats.PATH_SCHEMA.check_match(directory)
+  _check_encrypted_keytype(keytype)
+
+  if password is None: # pragma: no cover
+    password = _get_password('Enter a password for the encrypted keys: ',
+        confirm=False)
+
+  securesystemslib.formats.PASSWORD_SCHEMA.check_match(password)
+
+  try:
+    filenames = sorted(os.listdir(directory))
+
+  except OSError as e:
+    raise securesystemslib.exceptions.Error('Cannot list the key files of ' +
+        repr(directory) + ': ' + str(e))
+
+  names = [filename for filename in filenames
+      if filename + '.pub' in filenames and
+      os.path.isfile(os.path.join(directory, filename))]
+
+  keys = {}
+  jobs = []
+  for name in names:
+    try:
+      with open(os.path.join(directory, name), 'rb') as file_object:
+        jobs.append((file_object.read().decode('utf-8'), password))
+
+    except (IOError, UnicodeDecodeError) as e:
+      keys[name] = (None, securesystemslib.exceptions.Error('Cannot read the'
+          ' key file ' + repr(name) + ': ' + str(e)))
+
+  names = [name for name in names if name not in keys]
+  results = securesystemslib.parallel.decrypt_keys(jobs, max_workers)
+
+  for name, (key_object, exception) in zip(names, results):
+    if exception is None and key_object['keytype'] != keytype:
+      key_object, exception = None, securesystemslib.exceptions.FormatError(
+          'Invalid key type loaded: ' + repr(key_object['keytype']))
+
+    # Add "keyid_hash_algorithms", as the functions that import a single key
+    # file do.
+    if key_object is not None:
+      key_object['keyid_hash_algorithms'] = \
+          securesystemslib.settings.HASH_ALGORITHMS
+
+    keys[name] = (key_object, exception)
+
+  return keys
+
+
+
+def _import_privatekey_from_file(filepath, keytype, password):
+  """
+  Import the encrypted private key file in 'filepath' with the import function
+  of 'keytype', and return the key dictionary.
+  """
+
+  # Is 'keytype' properly formatted?  'filepath' and 'password' are validated
+  # by the import functions called below.
+  securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+
+  if keytype == 'rsa':
+    return import_rsa_privatekey_from_file(filepath, password)
+
+  elif keytype == 'ed25519':
+    return import_ed25519_privatekey_from_file(filepath, password)
+
+  else:
+    return import_ecdsa_privatekey_from_file(filepath, password)
+
+
+
+def _check_encrypted_keytype(keytype):
+  """
+  Check that 'keytype' is a key type whose private key files are encrypted
+  with 'securesystemslib.keys.encrypt_key()'.
+  """
+
+  securesystemslib.formats.KEYTYPE_SCHEMA.check_match(keytype)
+
+  if keytype not in ['ed25519', 'ecdsa-sha2-nistp256']:
+    raise securesystemslib.exceptions.FormatError('Expected an ed25519 or'
+        ' ECDSA key type, got ' + repr(keytype) + '.')
+
+
+
+def _write_keypair(filepath, key_metadata_format, encrypted_key):
+  """
+  Write the public key 'key_metadata_format' to '<filepath>.pub', and the
+  encrypted private key 'encrypted_key' to '<filepath>', through temporary
+  files.
+  """
+
+  securesystemslib.util.ensure_parent_dir(filepath)
+
+  # Create a tempororary file, write the contents of the public key, and move
+  # to final destination.
+  file_object = securesystemslib.util.TempFile()
+  file_object.write(json.dumps(key_metadata_format).encode('utf-8'))
+
+  # The temporary file is closed after the final move.
+  file_object.move(filepath + '.pub')
+
+  file_object = securesystemslib.util.TempFile()
+  file_object.write(encrypted_key.encode('utf-8'))
+  file_object.move(filepath)
+
+
+
 if __name__ == '__main__':
   # The interactive sessions of the documentation strings can
   # be tested by running interface.py as a standalone module:
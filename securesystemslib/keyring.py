@@ -0,0 +1,488 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  keyring.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Provide 'KeyRing', an in-memory index of public keys for key sets of the
+  size of a large key database (e.g., the keys of many delegated roles).
+
+  Every key is indexed by each of its keyids, i.e., the keyid computed with
+  every supported keyid hash algorithm, as well as the keyid that the key was
+  listed under, so that the key of any keyid found in a signature is looked up
+  with a single dictionary access.  Identical public keys are stored only
+  once, regardless of the number of keyids or metadata entries that refer to
+  them, and the parsed public key object (a 'securesystemslib.keys.Verifier')
+  of a key is created the first time the key is used to verify a signature,
+  and is held by the key ring thereafter.  Only the public part of a key is
+  stored.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import logging
+
+import securesystemslib.exceptions
+import securesystemslib.formats
+import securesystemslib.keys
+import securesystemslib.settings
+
+# See 'log.py' to learn how logging is handled in securesystemslib.
+logger = logging.getLogger('securesystemslib_keyring')
+
+
+class _KeyRingEntry(object):
+  """
+  Non-public class that holds a key of a KeyRing, the keyids it is indexed by,
+  and its Verifier (None until the key is first used).  '__slots__' keeps the
+  per-key memory of large key rings low.
+  """
+
+  __slots__ = ['key', 'keyids', 'verifier']
+
+  def __init__(self, key, keyids):
+    self.key = key
+    self.keyids = keyids
+    self.verifier = None
+
+
+
+
+
+class KeyRing(object):
+  """
+  <Purpose>
+    An index of public keys that maps every keyid of a key to a single,
+    shared entry.  Lookups by keyid take constant time.
+
+    >>> key_ring = KeyRing()
+    >>> ed25519_key = securesystemslib.keys.generate_ed25519_key()
+    >>> keyid = key_ring.add_key(ed25519_key)
+    >>> keyid == ed25519_key['keyid']
+    True
+    >>> key_ring.add_key(ed25519_key) == keyid
+    True
+    >>> len(key_ring)
+    1
+    >>> data = 'The quick brown fox jumps over the lazy dog'
+    >>> signature = securesystemslib.keys.create_signature(ed25519_key, data)
+    >>> key_ring.verify_signature(signature, data)
+    True
+
+  <Arguments>
+    hash_algorithms:
+      The hash algorithms of the keyids that keys are indexed by.  If None,
+      the default keyid hash algorithm ('sha256') and
+      'settings.HASH_ALGORITHMS' are used.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'hash_algorithms' is
+    improperly formatted.
+
+  <Side Effects>
+    None.
+
+  <Returns>
+    A KeyRing object.
+  """
+
+  def __init__(self, hash_algorithms=None):
+    if hash_algorithms is None:
+      hash_algorithms = ['sha256'] + securesystemslib.settings.HASH_ALGORITHMS
+
+    else:
+      securesystemslib.formats.HASHALGORITHMS_SCHEMA.check_match(
+          hash_algorithms)
+
+    # The default keyid is always computed, since it identifies the entry of
+    # a key (and thus detects identical public keys).
+    self._hash_algorithms = ['sha256'] + \
+        [algorithm for algorithm in hash_algorithms if algorithm != 'sha256']
+
+    # Maps every indexed keyid to the _KeyRingEntry of its key.  All of the
+    # keyids of a key share the same entry.
+    self._entries = {}
+
+    # The number of distinct keys.
+    self._size = 0
+
+
+
+  def add_key(self, key_dict, keyid=None):
+    """
+    <Purpose>
+      Add the public part of 'key_dict' to the key ring, indexed by each of
+      its keyids, and by 'keyid' (if given) and 'key_dict['keyid']' (if
+      'key_dict' is a key dictionary).  These must be keyids of the key,
+      computed with one of the hash algorithms of the key ring or of
+      'key_dict['keyid_hash_algorithms']', as in load_metadata().  If the key
+      ring already holds the same public key, the existing key is kept and
+      only indexed by any new keyids.
+
+    <Arguments>
+      key_dict:
+        A key, conformant to 'securesystemslib.formats.KEY_SCHEMA' (e.g., a
+        key dictionary or a key object as stored in metadata), or a
+        'securesystemslib.keys.Key'.
+
+      keyid:
+        An additional keyid that the key is listed under (e.g., in the keys
+        of a metadata file), or None.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if the arguments are
+      improperly formatted, or if 'keyid' or 'key_dict['keyid']' does not
+      match the key.
+
+      securesystemslib.exceptions.UnsupportedAlgorithmError, if one of the
+      keyid hash algorithms of 'key_dict' is unsupported.
+
+      securesystemslib.exceptions.KeyAlreadyExistsError, if one of the keyids
+      of 'key_dict' already identifies a different key.
+
+    <Side Effects>
+      The key ring is updated.
+
+    <Returns>
+      The keyid of the key (computed with the default keyid hash algorithm).
+    """
+
+    # Do the arguments have the correct format?
+    if isinstance(key_dict, securesystemslib.keys.Key):
+      key_dict = key_dict.to_dict()
+
+    securesystemslib.formats.KEY_SCHEMA.check_match(key_dict)
+
+    if keyid is not None:
+      securesystemslib.formats.KEYID_SCHEMA.check_match(keyid)
+
+    # The key is indexed by its keyids of the hash algorithms of the key
+    # ring.  A keyid that it is listed under may also be that of one of its
+    # own keyid hash algorithms, but not any other keyid, which could be that
+    # of another key.
+    hash_algorithms = self._hash_algorithms + [algorithm for algorithm in
+        key_dict.get('keyid_hash_algorithms', [])
+        if algorithm not in self._hash_algorithms]
+    keyids_by_algorithm = securesystemslib.keys.get_keyids([key_dict],
+        hash_algorithms)[0]
+    default_keyid = keyids_by_algorithm['sha256']
+
+    keyids = set([keyids_by_algorithm[algorithm]
+        for algorithm in self._hash_algorithms])
+    for listed_keyid in [key_dict.get('keyid'), keyid]:
+      if listed_keyid is None:
+        continue
+
+      if listed_keyid not in keyids_by_algorithm.values():
+        raise securesystemslib.exceptions.FormatError('Keyid ' +
+          repr(listed_keyid) + ' does not match its key.')
+
+      keyids.add(listed_keyid)
+
+    entry = self._entries.get(default_keyid)
+
+    # Check all of the keyids before the key ring is modified, so that a
+    # conflicting key is not partially added.
+    for new_keyid in keyids:
+      existing_entry = self._entries.get(new_keyid)
+      if existing_entry is not None and existing_entry is not entry:
+        raise securesystemslib.exceptions.KeyAlreadyExistsError('Keyid '
+          + repr(new_keyid) + ' already identifies a different key.')
+
+    if entry is None:
+      public_key = {'keytype': key_dict['keytype'],
+          'scheme': key_dict['scheme'], 'keyid': default_keyid,
+          'keyid_hash_algorithms': key_dict.get('keyid_hash_algorithms',
+          securesystemslib.settings.HASH_ALGORITHMS),
+          'keyval': {'public': key_dict['keyval']['public']}}
+
+      entry = _KeyRingEntry(public_key, ())
+      self._size += 1
+
+    new_keyids = keyids.difference(entry.keyids)
+    if new_keyids:
+      entry.keyids = entry.keyids + tuple(sorted(new_keyids))
+      for new_keyid in new_keyids:
+        self._entries[new_keyid] = entry
+
+    return default_keyid
+
+
+
+  def add_keys(self, key_dicts):
+    """
+    <Purpose>
+      Add each of the keys in 'key_dicts' to the key ring, as add_key() does.
+
+    <Arguments>
+      key_dicts:
+        A list of keys, conformant to
+        'securesystemslib.formats.KEYLIST_SCHEMA', or of
+        'securesystemslib.keys.Key' objects.
+
+    <Exceptions>
+      Same as add_key().  The keys before a key that cannot be added remain
+      in the key ring.
+
+    <Side Effects>
+      The key ring is updated.
+
+    <Returns>
+      The list of the keyids returned by add_key(), in the order of
+      'key_dicts'.
+    """
+
+    if not isinstance(key_dicts, list):
+      raise securesystemslib.exceptions.FormatError('Expected a list of'
+        ' keys, got ' + repr(type(key_dicts)) + '.')
+
+    return [self.add_key(key_dict) for key_dict in key_dicts]
+
+
+
+  def load_metadata(self, keys_metadata):
+    """
+    <Purpose>
+      Add the keys listed in the 'keys' of a metadata file (e.g., root.json or
+      the delegations of a targets metadata file), which map a keyid to a key
+      object, to the key ring.  Each keyid must be one of the keyids computed
+      for its key (see add_key()).
+
+    <Arguments>
+      keys_metadata:
+        A dictionary conformant to 'securesystemslib.formats.KEYDICT_SCHEMA'.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'keys_metadata' is
+      improperly formatted, or if one of its keyids does not match its key.
+
+      securesystemslib.exceptions.UnsupportedAlgorithmError, if one of the
+      keyid hash algorithms of a key is unsupported.
+
+      securesystemslib.exceptions.KeyAlreadyExistsError, if one of the keyids
+      already identifies a different key.
+
+    <Side Effects>
+      The key ring is updated.
+
+    <Returns>
+      A dictionary that maps each keyid of 'keys_metadata' to the keyid
+      returned by add_key().
+    """
+
+    securesystemslib.formats.KEYDICT_SCHEMA.check_match(keys_metadata)
+
+    added_keyids = {}
+    for keyid, key_metadata in keys_metadata.items():
+      added_keyids[keyid] = self.add_key(key_metadata, keyid)
+
+    logger.debug('Loaded ' + repr(len(added_keyids)) + ' keys from metadata.')
+
+    return added_keyids
+
+
+
+  def get_key(self, keyid):
+    """
+    <Purpose>
+      Return the public key dictionary, conformant to
+      'securesystemslib.formats.ANYKEY_SCHEMA', identified by 'keyid'.  The
+      returned dictionary is shared and should not be modified.
+
+    <Arguments>
+      keyid:
+        Any of the keyids of the key.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'keyid' is improperly
+      formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if 'keyid' is not in the
+      key ring.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      A key dictionary.
+    """
+
+    return self._get_entry(keyid).key
+
+
+
+  def get_verifier(self, keyid):
+    """
+    <Purpose>
+      Return the 'securesystemslib.keys.Verifier' of the key identified by
+      'keyid'.  The Verifier is created (i.e., the public key is parsed) the
+      first time it is requested, and is held by the key ring thereafter.
+
+    <Arguments>
+      keyid:
+        Any of the keyids of the key.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'keyid' is improperly
+      formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if 'keyid' is not in the
+      key ring.
+
+      Any exception raised by 'securesystemslib.keys.Verifier()'.
+
+    <Side Effects>
+      The public key is parsed, if it has not been already.
+
+    <Returns>
+      A 'securesystemslib.keys.Verifier' object.
+    """
+
+    entry = self._get_entry(keyid)
+
+    # Concurrent first uses of a key may each create a Verifier, which is
+    # harmless since they are equivalent.
+    if entry.verifier is None:
+      entry.verifier = securesystemslib.keys.Verifier(entry.key)
+
+    return entry.verifier
+
+
+
+  def verify_signature(self, signature, data):
+    """
+    <Purpose>
+      Verify 'signature' over 'data' with the key identified by the keyid of
+      'signature', as securesystemslib.keys.verify_signature() does.
+
+    <Arguments>
+      signature:
+        A signature dictionary, conformant to
+        'securesystemslib.formats.SIGNATURE_SCHEMA', or a
+        'securesystemslib.keys.Signature'.
+
+      data:
+        Data object that was signed.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'signature' is improperly
+      formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if the keyid of
+      'signature' is not in the key ring.
+
+      Any exception raised by 'securesystemslib.keys.Verifier'.
+
+    <Side Effects>
+      The public key is parsed, if it has not been already.
+
+    <Returns>
+      Boolean.  True if the signature is valid, False otherwise.
+    """
+
+    if isinstance(signature, securesystemslib.keys.Signature):
+      keyid = signature.keyid
+
+    else:
+      securesystemslib.formats.SIGNATURE_SCHEMA.check_match(signature)
+      keyid = signature['keyid']
+
+    return self.get_verifier(keyid).verify(signature, data)
+
+
+
+  def remove_key(self, keyid):
+    """
+    <Purpose>
+      Remove the key identified by 'keyid', and all of its other keyids, from
+      the key ring.
+
+    <Arguments>
+      keyid:
+        Any of the keyids of the key.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'keyid' is improperly
+      formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if 'keyid' is not in the
+      key ring.
+
+    <Side Effects>
+      The key ring is updated.
+
+    <Returns>
+      None.
+    """
+
+    entry = self._get_entry(keyid)
+
+    for indexed_keyid in entry.keyids:
+      del self._entries[indexed_keyid]
+
+    self._size -= 1
+
+
+
+  def get_keyids(self, keyid):
+    """
+    <Purpose>
+      Return the sorted list of all of the keyids that the key identified by
+      'keyid' is indexed by.
+
+    <Arguments>
+      keyid:
+        Any of the keyids of the key.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'keyid' is improperly
+      formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if 'keyid' is not in the
+      key ring.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      A list of keyids.
+    """
+
+    return sorted(self._get_entry(keyid).keyids)
+
+
+
+  def _get_entry(self, keyid):
+    """Return the _KeyRingEntry of 'keyid'."""
+
+    securesystemslib.formats.KEYID_SCHEMA.check_match(keyid)
+
+    try:
+      return self._entries[keyid]
+
+    except KeyError:
+      raise securesystemslib.exceptions.UnknownKeyError('Key ' + repr(keyid)
+        + ' is not in the key ring.')
+
+
+
+  def __contains__(self, keyid):
+    return keyid in self._entries
+
+
+
+  def __len__(self):
+    return self._size
@@ -0,0 +1,845 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  parallel.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Verify many signatures in parallel, with the results of the serial path
+  (i.e., 'securesystemslib.keys.verify_signature()' called for each signature
+  in turn).
+
+  The cryptography libraries that release Python's global interpreter lock
+  while they verify a signature (pyca/cryptography and PyNaCl) are run in a
+  pool of threads.  PyCrypto and the pure Python implementation of ed25519 do
+  not release it, so that signatures verified with these are distributed over
+  a pool of processes instead.  The processes are started, and the public keys
+  loaded into each of them, once per 'VerificationExecutor', so that only the
+  signatures and the signed data are sent to a process for each verification.
+  Every chunk of signatures that a worker is given is verified with
+  'securesystemslib.keys.verify_signatures()', so that the ed25519 signatures
+  of the pure Python implementation are verified in a batch.
+
+  Likewise, sign_payloads() signs several payloads with several keys each
+  (e.g., the metadata of a release, with the threshold of keys of every role)
+  in a pool of threads or processes, and encodes every payload only once.
+  encrypt_keys() and decrypt_keys() encrypt and decrypt many keys, each of
+  which costs a PBKDF2 key derivation, in a pool of threads if the
+  general-purpose library releases the global interpreter lock
+  (pyca/cryptography), and of processes otherwise, and report the exception
+  of every key that fails rather than only the first.
+
+  'concurrent.futures' is part of the standard library of Python 3, and is
+  available for Python 2 as the 'futures' backport.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import logging
+import multiprocessing
+
+import securesystemslib.backends
+import securesystemslib.exceptions
+import securesystemslib.formats
+import securesystemslib.keys
+
+try:
+  import concurrent.futures
+
+except ImportError: # pragma: no cover
+  concurrent = None
+
+# See 'log.py' to learn how logging is handled in securesystemslib.
+logger = logging.getLogger('securesystemslib_parallel')
+
+# The number of chunks that every worker is given, on average, when the chunk
+# size is not specified.  More, smaller chunks even out the load of workers
+# whose chunks take longer to verify (e.g., RSA vs. ed25519 signatures).
+_CHUNKS_PER_WORKER = 4
+
+# The objects that the tasks of a process pool need (e.g., the public keys of
+# a VerificationExecutor), as loaded into the worker process by
+# _initialize_worker().
+_worker_objects = None
+
+
+class VerificationExecutor(object):
+  """
+  <Purpose>
+    Verify signatures by a fixed list of public keys in a pool of threads or
+    processes.  The pool is started, and the keys are loaded into each process
+    of a process pool, when the executor is created, and is reused for every
+    call to verify() until close() is called.  A VerificationExecutor may be
+    used as a context manager, which closes it on exit.
+
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> data = 'The quick brown fox jumps over the lazy dog'
+    >>> signature = securesystemslib.keys.create_signature(key, data)
+    >>> with VerificationExecutor([key], max_workers=2) as executor:
+    ...   executor.verify([(signature, data), (signature, 'bad_data')])
+    [True, False]
+
+  <Arguments>
+    key_dicts:
+      A list of the keys, conformant to 'securesystemslib.formats.ANYKEY_SCHEMA'
+      or Key objects, whose signatures are verified.  The signatures are
+      matched to the keys by keyid.
+
+    max_workers:
+      The number of threads or processes.  The number of CPUs by default.
+
+    chunk_size:
+      The number of signatures that are handed to a worker at once.  By
+      default, the signatures of a call to verify() are split so that every
+      worker is given a few chunks.
+
+    use_processes:
+      True to verify in a pool of processes, False to verify in a pool of
+      threads.  By default, threads are used if the cryptography libraries of
+      all the keys release the global interpreter lock (see
+      'securesystemslib.keys.library_releases_gil()'), and processes
+      otherwise.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if
+    'concurrent.futures' is not available.
+
+  <Side Effects>
+    Starts 'max_workers' threads or processes.
+  """
+
+  def __init__(self, key_dicts, max_workers=None, chunk_size=None,
+      use_processes=None):
+
+    self._key_dicts = _get_key_dicts(key_dicts)
+    max_workers, use_processes = _get_pool_arguments(self._key_dicts,
+        max_workers, chunk_size, use_processes)
+
+    # The index of the key of every keyid, which is sent to the workers in
+    # place of the key.
+    self._key_indexes = {}
+    for index, key_dict in enumerate(self._key_dicts):
+      self._key_indexes.setdefault(key_dict['keyid'], index)
+
+    self.max_workers = max_workers
+    self.chunk_size = chunk_size
+    self.use_processes = use_processes
+
+    self._pool, self._chunk_objects = _start_pool(max_workers, use_processes,
+        (self._key_dicts,))
+
+
+
+  def verify(self, jobs):
+    """
+    <Purpose>
+      Verify the signatures of 'jobs' in parallel.  The key of each signature
+      is the key of the executor with the keyid of the signature.
+
+    <Arguments>
+      jobs:
+        A list of (signature, data) tuples, where 'signature' is conformant to
+        'securesystemslib.formats.SIGNATURE_SCHEMA' or is a Signature object,
+        and 'data' is the data object that was signed, as passed to
+        'securesystemslib.keys.verify_signature()'.
+
+    <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'jobs' is improperly
+      formatted.
+
+      securesystemslib.exceptions.UnknownKeyError, if the executor has no key
+      with the keyid of a signature.
+
+      Any exception raised by 'securesystemslib.keys.verify_signature()' for
+      a signature, i.e., the exception that the serial path would raise first.
+
+    <Side Effects>
+      None.
+
+    <Returns>
+      A list of booleans, in the order of 'jobs': True if the signature is
+      valid, False otherwise.
+    """
+
+    _check_jobs(jobs, 2)
+
+    indexed_jobs = []
+    for signature, data in jobs:
+      if isinstance(signature, securesystemslib.keys.Signature):
+        signature = signature.to_dict()
+
+      securesystemslib.formats.SIGNATURE_SCHEMA.check_match(signature)
+
+      try:
+        key_index = self._key_indexes[signature['keyid']]
+
+      except KeyError:
+        raise securesystemslib.exceptions.UnknownKeyError('The executor has'
+            ' no key with keyid ' + repr(signature['keyid']) + '.')
+
+      indexed_jobs.append((key_index, signature, data))
+
+    return self._verify_jobs(indexed_jobs)
+
+
+
+  def _verify_jobs(self, indexed_jobs):
+    """
+    Verify 'indexed_jobs', a list of (key index, signature, data) tuples, in
+    chunks, and return the results in order, or raise the exception of the
+    first job that failed.
+    """
+
+    return _run_chunks(self._pool, _verify_chunk, self._chunk_objects,
+        indexed_jobs, self.max_workers, self.chunk_size)
+
+
+
+  def close(self):
+    """
+    <Purpose>
+      Stop the threads or processes of the executor.  The executor can no
+      longer be used.
+
+    <Arguments>
+      None.
+
+    <Exceptions>
+      None.
+
+    <Side Effects>
+      Waits for the workers to finish.
+
+    <Returns>
+      None.
+    """
+
+    self._pool.shutdown(wait=True)
+
+
+
+  def __enter__(self):
+    return self
+
+
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.close()
+
+
+
+
+
+def verify_signatures(jobs, max_workers=None, chunk_size=None,
+    use_processes=None):
+  """
+  <Purpose>
+    Verify many signatures in parallel, each with its own key.  A
+    VerificationExecutor for the distinct keys of 'jobs' is created for the
+    call, so that a VerificationExecutor should be used instead to verify
+    several batches of signatures by the same keys.
+
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> data = 'The quick brown fox jumps over the lazy dog'
+    >>> signature = securesystemslib.keys.create_signature(key, data)
+    >>> verify_signatures([(key, signature, data), (key, signature, 'bad')])
+    [True, False]
+
+  <Arguments>
+    jobs:
+      A list of (key_dict, signature, data) tuples, as passed to
+      'securesystemslib.keys.verify_signature()'.
+
+    max_workers, chunk_size, use_processes:
+      See 'VerificationExecutor'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if
+    'concurrent.futures' is not available.
+
+    Any exception raised by 'securesystemslib.keys.verify_signature()' for
+    a signature, i.e., the exception that the serial path would raise first.
+
+  <Side Effects>
+    Starts and stops 'max_workers' threads or processes.
+
+  <Returns>
+    A list of booleans, in the order of 'jobs': True if the signature is
+    valid, False otherwise.
+  """
+
+  _check_jobs(jobs, 3)
+
+  key_dicts, key_indexes, keyids = _index_keys(
+      [key_dict for key_dict, signature, data in jobs])
+  indexed_jobs = []
+
+  for key_index, (ignored, signature, data) in zip(key_indexes, jobs):
+    if isinstance(signature, securesystemslib.keys.Signature):
+      signature = signature.to_dict()
+
+    securesystemslib.formats.SIGNATURE_SCHEMA.check_match(signature)
+    indexed_jobs.append((key_index, signature, data))
+
+  if not indexed_jobs:
+    return []
+
+  with VerificationExecutor(key_dicts, max_workers, chunk_size,
+      use_processes) as executor:
+    return executor._verify_jobs(indexed_jobs)
+
+
+
+
+
+def sign_payloads(payloads, max_workers=None, chunk_size=None,
+    use_processes=None):
+  """
+  <Purpose>
+    Sign every payload of 'payloads' with each of its keys, in parallel.
+    Every payload is encoded in canonical JSON once, rather than once per key
+    as by 'securesystemslib.keys.create_signature()', and the signatures are
+    created in a pool of threads if the cryptography libraries of all the keys
+    release the global interpreter lock, and in a pool of processes otherwise
+    (see 'VerificationExecutor').
+
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> data = 'The quick brown fox jumps over the lazy dog'
+    >>> signatures = sign_payloads({'root.json': (data, [key])})
+    >>> signatures['root.json'] == [
+    ...     securesystemslib.keys.create_signature(key, data)]
+    True
+
+  <Arguments>
+    payloads:
+      A dictionary that maps the name of every payload (e.g., the filename of
+      a metadata file) to a (data, key_dicts) tuple, where 'data' is the data
+      object to be signed, as passed to
+      'securesystemslib.keys.create_signature()', and 'key_dicts' is a list of
+      the keys, conformant to 'securesystemslib.formats.ANYKEY_SCHEMA' or Key
+      objects, that 'data' is signed with.  A key may sign several payloads.
+
+    max_workers, chunk_size, use_processes:
+      See 'VerificationExecutor'.  'chunk_size' is the number of signatures
+      created by a worker at once.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if
+    'concurrent.futures' is not available.
+
+    Any exception raised by 'securesystemslib.keys.create_signature()' for a
+    signature, i.e., the exception that signing the payloads one after the
+    other, in the order of 'payloads', would raise first.
+
+  <Side Effects>
+    Starts and stops 'max_workers' threads or processes.  The private keys
+    are passed to the processes of a process pool.
+
+  <Returns>
+    A dictionary that maps the name of every payload to the list of its
+    signatures, conformant to 'securesystemslib.formats.SIGNATURES_SCHEMA',
+    in the order of its keys.
+  """
+
+  if not isinstance(payloads, dict):
+    raise securesystemslib.exceptions.FormatError('Expected a dictionary of'
+        ' payloads, got ' + repr(type(payloads)) + '.')
+
+  names = list(payloads)
+  encoded_payloads = []
+  payload_key_dicts = []
+
+  for name in names:
+    payload = payloads[name]
+    if not isinstance(payload, tuple) or len(payload) != 2 or \
+        not isinstance(payload[1], list):
+      raise securesystemslib.exceptions.FormatError('Expected a (data,'
+          ' key_dicts) tuple, got ' + repr(payload) + '.')
+
+    data, key_dicts = payload
+    encoded_payloads.append(
+        securesystemslib.formats.encode_canonical(data).encode('utf-8'))
+    payload_key_dicts.extend(key_dicts)
+
+  key_dicts, key_indexes, keyids = _index_keys(payload_key_dicts,
+      include_private=True)
+
+  # One task per signature, in the order of the payloads and their keys.
+  tasks = []
+  for payload_index, name in enumerate(names):
+    for key_dict in payloads[name][1]:
+      tasks.append((key_indexes[len(tasks)], payload_index))
+
+  signatures = dict([(name, []) for name in names])
+  if not tasks:
+    return signatures
+
+  max_workers, use_processes = _get_pool_arguments(key_dicts, max_workers,
+      chunk_size, use_processes)
+  pool, chunk_objects = _start_pool(max_workers, use_processes,
+      (key_dicts, encoded_payloads))
+
+  try:
+    results = _run_chunks(pool, _sign_chunk, chunk_objects, tasks,
+        max_workers, chunk_size)
+
+  finally:
+    pool.shutdown(wait=True)
+
+  # A signature is created with the distinct key of its task, but has the
+  # keyid of the key that the payload lists.
+  for (key_index, payload_index), keyid, signature in \
+      zip(tasks, keyids, results):
+    signature['keyid'] = keyid
+    signatures[names[payload_index]].append(signature)
+
+  return signatures
+
+
+
+
+
+def encrypt_keys(jobs, max_workers=None, chunk_size=None, use_processes=None):
+  """
+  <Purpose>
+    Encrypt many keys in parallel, each with its own password (see
+    'securesystemslib.keys.encrypt_key()').  The keys are encrypted in a pool
+    of threads if the general-purpose library releases the global
+    interpreter lock (see
+    'securesystemslib.backends.general_library_releases_gil()'), and in a
+    pool of processes otherwise.
+
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> [(encrypted_key, exception)] = encrypt_keys([(key, 'password')])
+    >>> securesystemslib.keys.decrypt_key(encrypted_key, 'password') == key
+    True
+
+  <Arguments>
+    jobs:
+      A list of (key_object, password) tuples, as passed to
+      'securesystemslib.keys.encrypt_key()'.
+
+    max_workers, chunk_size, use_processes:
+      See 'VerificationExecutor'.  'chunk_size' is the number of keys
+      encrypted by a worker at once.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'jobs' is not a list of
+    tuples of two items, or the other arguments are improperly formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if
+    'concurrent.futures' is not available.
+
+  <Side Effects>
+    Starts and stops 'max_workers' threads or processes.  The keys and
+    passwords are passed to the processes of a process pool.
+
+  <Returns>
+    A list of (encrypted_key, exception) tuples, in the order of 'jobs':
+    'encrypted_key' is conformant to
+    'securesystemslib.formats.ENCRYPTEDKEY_SCHEMA', or None if encrypt_key()
+    raised 'exception' for the key.
+  """
+
+  return _run_key_jobs(securesystemslib.keys.encrypt_key, jobs, max_workers,
+      chunk_size, use_processes)
+
+
+
+
+
+def decrypt_keys(jobs, max_workers=None, chunk_size=None, use_processes=None):
+  """
+  <Purpose>
+    Decrypt many encrypted keys in parallel, each with its own password (see
+    'securesystemslib.keys.decrypt_key()'), in a pool of threads or
+    processes, as encrypt_keys() does.
+
+    >>> key = securesystemslib.keys.generate_ed25519_key()
+    >>> encrypted_key = securesystemslib.keys.encrypt_key(key, 'password')
+    >>> results = decrypt_keys([(encrypted_key, 'password'),
+    ...     (encrypted_key, 'wrong password')])
+    >>> results[0] == (key, None)
+    True
+    >>> type(results[1][1]).__name__
+    'CryptoError'
+
+  <Arguments>
+    jobs:
+      A list of (encrypted_key, password) tuples, as passed to
+      'securesystemslib.keys.decrypt_key()'.
+
+    max_workers, chunk_size, use_processes:
+      See encrypt_keys().
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'jobs' is not a list of
+    tuples of two items, or the other arguments are improperly formatted.
+
+    securesystemslib.exceptions.UnsupportedLibraryError, if
+    'concurrent.futures' is not available.
+
+  <Side Effects>
+    Starts and stops 'max_workers' threads or processes.  The encrypted keys
+    and passwords are passed to the processes of a process pool.
+
+  <Returns>
+    A list of (key_object, exception) tuples, in the order of 'jobs':
+    'key_object' is conformant to 'securesystemslib.formats.ANYKEY_SCHEMA',
+    or None if decrypt_key() raised 'exception' for the key (e.g.,
+    'securesystemslib.exceptions.CryptoError' for a wrong password).
+  """
+
+  return _run_key_jobs(securesystemslib.keys.decrypt_key, jobs, max_workers,
+      chunk_size, use_processes)
+
+
+
+
+
+def _get_key_dicts(key_dicts, include_private=False):
+  """
+  Check that 'key_dicts' is a list of keys, and return the keys as
+  dictionaries, without their private parts unless 'include_private' is True,
+  so that the private keys are not passed to workers that only verify.
+  """
+
+  if not isinstance(key_dicts, list):
+    raise securesystemslib.exceptions.FormatError('Expected a list of'
+        ' keys, got ' + repr(type(key_dicts)) + '.')
+
+  checked_key_dicts = []
+  for key_dict in key_dicts:
+    if isinstance(key_dict, securesystemslib.keys.Key):
+      key_dict = key_dict.to_dict()
+
+    securesystemslib.formats.ANYKEY_SCHEMA.check_match(key_dict)
+
+    if not include_private:
+      key_dict = dict(key_dict)
+      key_dict['keyval'] = {'public': key_dict['keyval']['public']}
+
+    checked_key_dicts.append(key_dict)
+
+  return checked_key_dicts
+
+
+
+
+
+def _index_keys(key_dicts, include_private=False):
+  """
+  Return the distinct keys of 'key_dicts' (see _get_key_dicts()), the index
+  of every key of 'key_dicts' in the distinct keys, and its keyid.  A key is
+  identified by its public key rather than its keyid, which is not necessarily
+  computed from the key, so that the same key may be listed with different
+  keyids (e.g., with the keyids of several hash algorithms), whose distinct
+  key only has the first one.
+  """
+
+  distinct_key_dicts = []
+  key_indexes = []
+  keyids = []
+  indexes = {}
+
+  for key_dict in _get_key_dicts(key_dicts, include_private):
+    identity = (key_dict['keytype'], key_dict['scheme'],
+        key_dict['keyval']['public'])
+    if identity not in indexes:
+      indexes[identity] = len(distinct_key_dicts)
+      distinct_key_dicts.append(key_dict)
+
+    key_indexes.append(indexes[identity])
+    keyids.append(key_dict['keyid'])
+
+  return distinct_key_dicts, key_indexes, keyids
+
+
+
+
+
+def _get_pool_arguments(key_dicts, max_workers, chunk_size, use_processes):
+  """
+  Check the arguments of a pool for 'key_dicts', and return 'max_workers' and
+  'use_processes', with their defaults filled in.
+  """
+
+  if max_workers is None:
+    max_workers = multiprocessing.cpu_count()
+
+  securesystemslib.formats.THRESHOLD_SCHEMA.check_match(max_workers)
+
+  if chunk_size is not None:
+    securesystemslib.formats.THRESHOLD_SCHEMA.check_match(chunk_size)
+
+  if use_processes is None:
+    use_processes = not all([securesystemslib.keys.library_releases_gil(
+        key_dict['keytype']) for key_dict in key_dicts])
+
+  securesystemslib.formats.BOOLEAN_SCHEMA.check_match(use_processes)
+
+  return max_workers, use_processes
+
+
+
+
+
+def _start_pool(max_workers, use_processes, objects):
+  """
+  Start a pool of 'max_workers' threads or processes, and return the pool and
+  the objects to pass to every chunk of tasks: 'objects' for a thread pool,
+  and None for a process pool that has 'objects' loaded into every process.
+  """
+
+  if concurrent is None: # pragma: no cover
+    raise securesystemslib.exceptions.UnsupportedLibraryError(
+        'Parallel signing and verification requires "concurrent.futures"'
+        ' (install the "futures" backport on Python 2).')
+
+  chunk_objects = None
+
+  if not use_processes:
+    chunk_objects = objects
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers)
+
+  else:
+    try:
+      pool = concurrent.futures.ProcessPoolExecutor(max_workers,
+          initializer=_initialize_worker, initargs=(objects,))
+
+    # 'initializer' is supported since Python 3.7.  Older versions get the
+    # objects with every chunk.
+    except TypeError: # pragma: no cover
+      chunk_objects = objects
+      pool = concurrent.futures.ProcessPoolExecutor(max_workers)
+
+  # Start all the workers now rather than on the first chunk.  Processes are
+  # started as needed by the process pool, i.e., one for each pending task,
+  # so that a task is submitted for each worker.
+  for future in [pool.submit(_warm_up) for index in range(max_workers)]:
+    future.result()
+
+  logger.debug('Started ' + repr(max_workers) +
+      (' processes.' if use_processes else ' threads.'))
+
+  return pool, chunk_objects
+
+
+
+
+
+def _run_key_jobs(function, jobs, max_workers, chunk_size, use_processes):
+  """
+  Call 'function', which encrypts or decrypts a key, with each (key,
+  password) tuple of 'jobs' in a pool for the general-purpose library, and
+  return a (result, exception) tuple for each job.
+  """
+
+  _check_jobs(jobs, 2)
+
+  if not jobs:
+    return []
+
+  if use_processes is None:
+    use_processes = \
+        not securesystemslib.backends.general_library_releases_gil()
+
+  max_workers, use_processes = _get_pool_arguments([], max_workers,
+      chunk_size, use_processes)
+  pool, chunk_objects = _start_pool(max_workers, use_processes, (function,))
+
+  try:
+    return _run_chunks(pool, _call_chunk, chunk_objects, jobs, max_workers,
+        chunk_size, raise_exceptions=False)
+
+  finally:
+    pool.shutdown(wait=True)
+
+
+
+
+
+def _run_chunks(pool, function, chunk_objects, tasks, max_workers,
+    chunk_size=None, raise_exceptions=True):
+  """
+  Call 'function' with 'chunk_objects' and each chunk of 'tasks' in 'pool',
+  and return the results of the tasks in order, or raise the exception of the
+  first task that failed.  If 'raise_exceptions' is False, return a (result,
+  exception) tuple for every task instead.
+  """
+
+  if chunk_size is None:
+    chunk_size = max(1, -(-len(tasks) // (max_workers * _CHUNKS_PER_WORKER)))
+
+  futures = []
+  for start in range(0, len(tasks), chunk_size):
+    futures.append(pool.submit(function, chunk_objects,
+        tasks[start:start + chunk_size]))
+
+  results = []
+  for future in futures:
+    for result, exception in future.result():
+      if exception is not None and raise_exceptions:
+        raise exception
+
+      results.append(result if raise_exceptions else (result, exception))
+
+  return results
+
+
+
+
+
+def _check_jobs(jobs, length):
+  """
+  Check that 'jobs' is a list of tuples of 'length' items.
+  """
+
+  if not isinstance(jobs, list):
+    raise securesystemslib.exceptions.FormatError('Expected a list of'
+        ' jobs, got ' + repr(type(jobs)) + '.')
+
+  for job in jobs:
+    if not isinstance(job, tuple) or len(job) != length:
+      raise securesystemslib.exceptions.FormatError('Expected a tuple of ' +
+          repr(length) + ' items, got ' + repr(job) + '.')
+
+
+
+
+
+def _initialize_worker(objects): # pragma: no cover
+  """
+  Load 'objects' into a process of a process pool.  (Runs in the worker
+  process, which the coverage of the test run does not include.)
+  """
+
+  global _worker_objects
+  _worker_objects = objects
+
+
+
+
+
+def _warm_up():
+  """
+  The task that starts every worker of a pool.
+  """
+
+  return None
+
+
+
+
+
+def _verify_chunk(objects, indexed_jobs):
+  """
+  Verify the (key index, signature, data) tuples of 'indexed_jobs' with the
+  keys of 'objects', a (key_dicts,) tuple, or with the keys loaded into the
+  worker process if 'objects' is None.  Return a (result, exception) tuple
+  for each job, so that the exception of a job is raised in the order of the
+  serial path.
+  """
+
+  if objects is None: # pragma: no cover
+    objects = _worker_objects
+
+  key_dicts, = objects
+
+  # The pure Python ed25519 signatures of the chunk are verified in a batch.
+  # The jobs are only verified one by one if one of them raises an exception,
+  # so that it is returned with its job.
+  try:
+    return [(result, None) for result in
+        securesystemslib.keys.verify_signatures([(key_dicts[key_index],
+        signature, data) for key_index, signature, data in indexed_jobs])]
+
+  except Exception:
+    pass
+
+  results = []
+  for key_index, signature, data in indexed_jobs:
+    try:
+      results.append((securesystemslib.keys.verify_signature(
+          key_dicts[key_index], signature, data), None))
+
+    except Exception as exception:
+      results.append((None, exception))
+
+  return results
+
+
+
+
+
+def _sign_chunk(objects, tasks):
+  """
+  Sign the encoded payloads of the (key index, payload index) tuples of
+  'tasks' with the keys of 'objects', a (key_dicts, encoded_payloads) tuple,
+  or with those loaded into the worker process if 'objects' is None.  Return
+  a (signature, exception) tuple for each task, as _verify_chunk() does.
+  """
+
+  if objects is None: # pragma: no cover
+    objects = _worker_objects
+
+  key_dicts, encoded_payloads = objects
+
+  results = []
+  for key_index, payload_index in tasks:
+    try:
+      results.append((securesystemslib.keys.create_signature_over_bytes(
+          key_dicts[key_index], encoded_payloads[payload_index]), None))
+
+    except Exception as exception:
+      results.append((None, exception))
+
+  return results
+
+
+
+
+
+def _call_chunk(objects, tasks):
+  """
+  Call the function of 'objects', a (function,) tuple, or the one loaded into
+  the worker process if 'objects' is None, with the arguments of each tuple of
+  'tasks'.  Return a (result, exception) tuple for each task, as
+  _verify_chunk() does.
+  """
+
+  if objects is None: # pragma: no cover
+    objects = _worker_objects
+
+  function, = objects
+
+  results = []
+  for arguments in tasks:
+    try:
+      results.append((function(*arguments), None))
+
+    except Exception as exception:
+      results.append((None, exception))
+
+  return results
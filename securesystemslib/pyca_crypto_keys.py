@@ -79,11 +79,6 @@ import cryptography.exceptions
 # generate RSA keys and PS
 from cryptography.hazmat.primitives.asymmetric import rsa
 
-# PyCrypo's RSA module is needed to generate and import encrypted RSA keys.
-# Generating and loading encrypted key files with pyca/cryptography will be
-# added once these routines are supported.
-import Crypto.PublicKey.RSA
-
 # pyca/Cryptography requires hash objects to generate PKCS#1 PSS
 # signatures (i.e., padding.PSS).  The 'hmac' module is needed to verify
 # ciphertexts in encrypted key files.
@@ -100,6 +95,10 @@ from cryptography.hazmat.primitives import hmac
 # The 'padding' module is needed for PSS signatures.
 from cryptography.hazmat.primitives.asymmetric import padding
 
+# 'utils.Prehashed' allows signatures to be verified against a digest that was
+# computed in advance (e.g., once for many signatures over the same data).
+from cryptography.hazmat.primitives.asymmetric import utils
+
 # Import pyca/cryptography's Key Derivation Function (KDF) module.
 # 'securesystemslib.keys.py' needs this module to derive a secret key according
 # to the Password-Based Key Derivation Function 2 specification.  The derived
@@ -121,6 +120,7 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
 # allowing the AES algorithm to perform cipher block operations on them.
 from cryptography.hazmat.primitives.ciphers import modes
 
+import securesystemslib.cache
 import securesystemslib.exceptions
 import securesystemslib.formats
 import securesystemslib.util
@@ -263,7 +263,9 @@ def create_rsa_signature(private_key, data, scheme='rsassa-pss-sha256'):
       The private RSA key, a string in PEM format.
 
     data:
-      Data (string) used by create_rsa_signature() to generate the signature.
+      Data used by create_rsa_signature() to generate the signature, as a
+      bytes-like object (e.g., bytes, bytearray or memoryview), which is not
+      copied.
 
     scheme:
       The signature scheme used to generate the signature.
@@ -290,10 +292,10 @@ def create_rsa_signature(private_key, data, scheme='rsassa-pss-sha256'):
   # Does the arguments have the correct format?
   # This check will ensure the arguments conform to
   # 'securesystemslib.formats.PEMRSA_SCHEMA'.  and
-  # 'securesystemslib.formats.DATA_SCHEMA' Raise
+  # 'securesystemslib.formats.BUFFER_SCHEMA' Raise
   # 'securesystemslib.exceptions.FormatError' if the checks fail.
   securesystemslib.formats.PEMRSA_SCHEMA.check_match(private_key)
-  securesystemslib.formats.DATA_SCHEMA.check_match(data)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
   securesystemslib.formats.RSA_SIG_SCHEMA.check_match(scheme)
 
   # Signing 'data' requires a private key.  'rsassa-pss-sha256' is the only
@@ -365,6 +367,168 @@ def create_rsa_signature(private_key, data, scheme='rsassa-pss-sha256'):
 
 
 
+def load_rsa_private_key_object(private_key):
+  """
+  <Purpose>
+    Deserialize the PEM-encoded RSA 'private_key' and return its
+    pyca/cryptography private key object.  The returned object may be passed
+    to create_rsa_signature_with_key_object() to generate any number of
+    signatures, without deserializing 'private_key' for each of them.
+
+  <Arguments>
+    private_key:
+      The private RSA key, a string in PEM format.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'private_key' is improperly
+    formatted or is not an RSA private key.
+
+    securesystemslib.exceptions.CryptoError, if 'private_key' cannot be
+    deserialized.
+
+  <Side Effects>
+    pyca/cryptography's load_pem_private_key() is called.
+
+  <Returns>
+    An 'RSAPrivateKey' object.
+  """
+
+  # Does 'private_key' have the correct format?
+  securesystemslib.formats.PEMRSA_SCHEMA.check_match(private_key)
+
+  try:
+    private_key_object = load_pem_private_key(private_key.encode('utf-8'),
+        password=None, backend=default_backend())
+
+  # If the PEM data could not be decrypted, or if its structure could not be
+  # decoded successfully.  'TypeError' is raised if the private key is
+  # unexpectedly encrypted.
+  except (ValueError, TypeError, cryptography.exceptions.UnsupportedAlgorithm):
+    raise securesystemslib.exceptions.CryptoError('The private key'
+      ' (in PEM format) could not be deserialized.')
+
+  if not isinstance(private_key_object, rsa.RSAPrivateKey):
+    raise securesystemslib.exceptions.FormatError('Not an RSA private key.')
+
+  return private_key_object
+
+
+
+
+
+def create_rsa_signature_with_key_object(private_key_object, data,
+    scheme='rsassa-pss-sha256'):
+  """
+  <Purpose>
+    Generate a 'scheme' signature of 'data' with 'private_key_object', a
+    private key object returned by load_rsa_private_key_object().  Unlike
+    create_rsa_signature(), the private key is not deserialized again.
+
+  <Arguments>
+    private_key_object:
+      An 'RSAPrivateKey' object.
+
+    data:
+      Data (bytes) used by create_rsa_signature_with_key_object() to generate
+      the signature.
+
+    scheme:
+      The signature scheme used to generate the signature.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'data' or 'scheme' are
+    improperly formatted.
+
+  <Side Effects>
+    pyca/cryptography's RSAPrivateKey.signer() is called to generate the
+    signature.
+
+  <Returns>
+    A (signature, scheme) tuple, where the signature is a string and the scheme
+    is one of the supported RSA signature schemes (e.g., 'rsassa-pss-sha256').
+  """
+
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
+  securesystemslib.formats.RSA_SIG_SCHEMA.check_match(scheme)
+
+  rsa_signer = private_key_object.signer(padding.PSS(mgf=padding.MGF1(hashes.SHA256()),
+      salt_length=hashes.SHA256().digest_size), hashes.SHA256())
+  rsa_signer.update(data)
+
+  return rsa_signer.finalize(), scheme
+
+
+
+
+
+def create_rsa_signature_prehashed(private_key, digest,
+    scheme='rsassa-pss-sha256'):
+  """
+  <Purpose>
+    Generate a 'scheme' signature of the data whose SHA256 digest is 'digest'.
+    The signature is identical in format to one generated by
+    create_rsa_signature() over the data itself, and may be verified by
+    verify_rsa_signature() or verify_rsa_signature_prehashed().  It allows
+    data that is not held in memory (e.g., a large file that is hashed in
+    chunks) to be signed.
+
+    >>> import hashlib
+    >>> public, private = generate_rsa_public_and_private(2048)
+    >>> data = b'The quick brown fox jumps over the lazy dog'
+    >>> digest = hashlib.sha256(data).digest()
+    >>> signature, scheme = create_rsa_signature_prehashed(private, digest)
+    >>> verify_rsa_signature(signature, scheme, public, data)
+    True
+
+  <Arguments>
+    private_key:
+      The private RSA key, a string in PEM format.
+
+    digest:
+      The SHA256 digest (32 bytes) of the data to be signed.
+
+    scheme:
+      The signature scheme used to generate the signature.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted, or if 'digest' is not a SHA256 digest.
+
+    securesystemslib.exceptions.CryptoError, if 'private_key' cannot be
+    deserialized.
+
+  <Side Effects>
+    pyca/cryptography's RSAPrivateKey.sign() is called to generate the
+    signature.
+
+  <Returns>
+    A (signature, scheme) tuple, where the signature is a string and the scheme
+    is one of the supported RSA signature schemes (e.g., 'rsassa-pss-sha256').
+  """
+
+  # Do the arguments have the correct format?  'private_key' is checked by
+  # load_rsa_private_key_object().
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(digest)
+  securesystemslib.formats.RSA_SIG_SCHEMA.check_match(scheme)
+
+  if len(digest) != hashes.SHA256.digest_size:
+    raise securesystemslib.exceptions.FormatError('Expected a SHA256 digest'
+      ' of ' + repr(hashes.SHA256.digest_size) + ' bytes, got ' +
+      repr(len(digest)) + ' bytes.')
+
+  private_key_object = load_rsa_private_key_object(private_key)
+
+  signature = private_key_object.sign(digest,
+      padding.PSS(mgf=padding.MGF1(hashes.SHA256()),
+      salt_length=hashes.SHA256().digest_size),
+      utils.Prehashed(hashes.SHA256()))
+
+  return signature, scheme
+
+
+
+
+
 def verify_rsa_signature(signature, signature_scheme, public_key, data):
   """
   <Purpose>
@@ -395,7 +559,8 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
 
     data:
       Data used by securesystemslib.keys.create_signature() to generate
-      'signature'.  'data' (a string) is needed here to verify 'signature'.
+      'signature'.  'data' (a bytes-like object) is needed here to verify
+      'signature'.
 
   <Exceptions>
     securesystemslib.exceptions.FormatError, if 'signature',
@@ -429,7 +594,7 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
   securesystemslib.formats.PYCACRYPTOSIGNATURE_SCHEMA.check_match(signature)
 
   # What about 'data'?
-  securesystemslib.formats.DATA_SCHEMA.check_match(data)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
 
   # Verify whether the private key of 'public_key' produced 'signature'.
   # Before returning the 'valid_signature' Boolean result, ensure 'RSASSA-PSS'
@@ -443,8 +608,10 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
 
   # Verify the RSASSA-PSS signature with pyca/cryptography.
   try:
-    public_key_object = serialization.load_pem_public_key(public_key.encode('utf-8'),
-                                                   backend=default_backend())
+    # The parsed public key object is cached, so that the PEM is only loaded
+    # the first time 'public_key' is used.
+    public_key_object = securesystemslib.cache.get_public_key_object('rsa',
+        signature_scheme, public_key, 'pyca-cryptography', _load_public_pem)
 
     # 'salt_length' is set to the digest size of the hashing algorithm (to
     # match the default size used by 'securesystemslib.pycrypto_keys.py').
@@ -470,6 +637,196 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
       ' decoded successfully, or contained an unsupported key type: ' + str(e))
 
 
+def verify_rsa_signature_prehashed(signature, signature_scheme, public_key,
+    digest):
+  """
+  <Purpose>
+    Determine whether the corresponding private key of 'public_key' produced
+    'signature' over the data whose SHA256 digest is 'digest'.  Unlike
+    verify_rsa_signature(), the data is not hashed here, so that the digest
+    of data signed by several keys need only be computed once.
+
+    >>> import hashlib
+    >>> public, private = generate_rsa_public_and_private(2048)
+    >>> data = b'The quick brown fox jumps over the lazy dog'
+    >>> signature, scheme = create_rsa_signature(private, data)
+    >>> digest = hashlib.sha256(data).digest()
+    >>> verify_rsa_signature_prehashed(signature, scheme, public, digest)
+    True
+
+  <Arguments>
+    signature:
+      A signature, as a string.  This is the signature returned
+      by create_rsa_signature().
+
+    signature_scheme:
+      A string that indicates the signature scheme used to generate
+      'signature'.  'rsassa-pss-sha256' is currently supported.
+
+    public_key:
+      The RSA public key, a string in PEM format.
+
+    digest:
+      The SHA256 digest (32 bytes) of the data that was signed.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted, or if 'digest' is not a SHA256 digest.
+
+    securesystemslib.exceptions.CryptoError, if the public key cannot be
+    decoded or its key type is unsupported.
+
+  <Side Effects>
+    pyca/cryptography's RSAPublicKey.verify() called to do the actual
+    verification.
+
+  <Returns>
+    Boolean.  True if the signature is valid, False otherwise.
+  """
+
+  # Do the arguments have the correct format?
+  securesystemslib.formats.PEMRSA_SCHEMA.check_match(public_key)
+  securesystemslib.formats.RSA_SIG_SCHEMA.check_match(signature_scheme)
+  securesystemslib.formats.PYCRYPTOSIGNATURE_SCHEMA.check_match(signature)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(digest)
+
+  if len(digest) != hashes.SHA256.digest_size:
+    raise securesystemslib.exceptions.FormatError('Expected a SHA256 digest'
+      ' of ' + repr(hashes.SHA256.digest_size) + ' bytes, got ' +
+      repr(len(digest)) + ' bytes.')
+
+  try:
+    public_key_object = securesystemslib.cache.get_public_key_object('rsa',
+        signature_scheme, public_key, 'pyca-cryptography', _load_public_pem)
+
+  # Raised by load_pem_public_key().
+  except (ValueError, cryptography.exceptions.UnsupportedAlgorithm) as e:
+    raise securesystemslib.exceptions.CryptoError('The PEM could not be'
+      ' decoded successfully, or contained an unsupported key type: ' + str(e))
+
+  try:
+    public_key_object.verify(signature, digest,
+        padding.PSS(mgf=padding.MGF1(hashes.SHA256()),
+        salt_length=hashes.SHA256().digest_size),
+        utils.Prehashed(hashes.SHA256()))
+    return True
+
+  except cryptography.exceptions.InvalidSignature:
+    return False
+
+
+
+
+
+def load_rsa_public_key_object(public_key):
+  """
+  <Purpose>
+    Deserialize the PEM-encoded RSA 'public_key' and return its
+    pyca/cryptography public key object.  The returned object may be passed
+    to verify_rsa_signature_with_key_object() to verify any number of
+    signatures, without deserializing 'public_key' for each of them.
+
+  <Arguments>
+    public_key:
+      The RSA public key, a string in PEM format.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'public_key' is improperly
+    formatted or is not an RSA public key.
+
+    securesystemslib.exceptions.CryptoError, if 'public_key' cannot be
+    deserialized.
+
+  <Side Effects>
+    pyca/cryptography's load_pem_public_key() is called.
+
+  <Returns>
+    An 'RSAPublicKey' object.
+  """
+
+  # Does 'public_key' have the correct format?
+  securesystemslib.formats.PEMRSA_SCHEMA.check_match(public_key)
+
+  try:
+    public_key_object = _load_public_pem(public_key)
+
+  except (ValueError, cryptography.exceptions.UnsupportedAlgorithm) as e:
+    raise securesystemslib.exceptions.CryptoError('The PEM could not be'
+      ' decoded successfully, or contained an unsupported key type: ' + str(e))
+
+  if not isinstance(public_key_object, rsa.RSAPublicKey):
+    raise securesystemslib.exceptions.FormatError('Not an RSA public key.')
+
+  return public_key_object
+
+
+
+
+
+def verify_rsa_signature_with_key_object(public_key_object, signature, data,
+    scheme='rsassa-pss-sha256'):
+  """
+  <Purpose>
+    Determine whether the private key of 'public_key_object', a public key
+    object returned by load_rsa_public_key_object(), produced the 'scheme'
+    'signature' of 'data'.
+
+  <Arguments>
+    public_key_object:
+      An 'RSAPublicKey' object.
+
+    signature:
+      A signature, as a string.  This is the signature returned
+      by create_rsa_signature().
+
+    data:
+      Data (bytes) used by create_rsa_signature() to generate 'signature'.
+
+    scheme:
+      The signature scheme used to generate 'signature'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'signature', 'data' or
+    'scheme' are improperly formatted.
+
+  <Side Effects>
+    pyca/cryptography's RSAPublicKey.verify() called to do the actual
+    verification.
+
+  <Returns>
+    Boolean.  True if the signature is valid, False otherwise.
+  """
+
+  securesystemslib.formats.PYCRYPTOSIGNATURE_SCHEMA.check_match(signature)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
+  securesystemslib.formats.RSA_SIG_SCHEMA.check_match(scheme)
+
+  try:
+    public_key_object.verify(signature, data,
+        padding.PSS(mgf=padding.MGF1(hashes.SHA256()),
+        salt_length=hashes.SHA256().digest_size), hashes.SHA256())
+    return True
+
+  except cryptography.exceptions.InvalidSignature:
+    return False
+
+
+
+
+
+def _load_public_pem(public_key):
+  """
+  Non-public function that returns the pyca/cryptography public key object of
+  the PEM-encoded 'public_key'.
+  """
+
+  return serialization.load_pem_public_key(public_key.encode('utf-8'),
+      backend=default_backend())
+
+
+
+
+
 def create_rsa_encrypted_pem(private_key, passphrase):
   """
   <Purpose>
@@ -852,6 +1209,44 @@ def decrypt_key(encrypted_key, password):
 
 
 
+def derive_key(password, salt, iterations):
+  """
+  <Purpose>
+    Derive a 256-bit key from 'password' with PBKDF2-HMAC-SHA256, the key
+    derivation function used by encrypt_key() and decrypt_key().
+
+  <Arguments>
+    password:
+      The password, or passphrase, from which the key is derived.
+
+    salt:
+      The salt, a byte string.
+
+    iterations:
+      The number of PBKDF2 iterations to perform.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+  <Side Effects>
+    pyca/cryptography's PBKDF2 implementation is called to derive the key.
+
+  <Returns>
+    The derived key, a 32-byte string.
+  """
+
+  # Do the arguments have the correct format?
+  securesystemslib.formats.PASSWORD_SCHEMA.check_match(password)
+  securesystemslib.formats.DATA_SCHEMA.check_match(salt)
+  securesystemslib.formats.PBKDF2_ITERATIONS_SCHEMA.check_match(iterations)
+
+  return _generate_derived_key(password, salt, iterations)[2]
+
+
+
+
+
 def _generate_derived_key(password, salt=None, iterations=None):
   """
   Generate a derived key by feeding 'password' to the Password-Based Key
@@ -991,11 +1386,27 @@ def _decrypt(file_contents, password):
   iv = binascii.unhexlify(iv.encode('utf-8'))
   ciphertext = binascii.unhexlify(ciphertext.encode('utf-8'))
 
-  # Generate derived key from 'password'.  The salt and iterations are specified
-  # so that the expected derived key is regenerated correctly.  Discard the old
-  # "salt" and "iterations" values, as we only need the old derived key.
-  junk_old_salt, junk_old_iterations, symmetric_key = \
-    _generate_derived_key(password, salt, iterations)
+  # Generate derived key from 'password'.  The salt and iterations are
+  # specified so that the expected derived key is regenerated correctly.
+  # Discard the old "salt" and "iterations" values, as we only need the old
+  # derived key.  If the derived key cache is enabled, the key derived for a
+  # previous decryption with the same password, salt and iterations is reused.
+  derived_key_cache = securesystemslib.cache.derived_key_cache
+  cache_key = None
+  symmetric_key = None
+
+  if derived_key_cache.enabled:
+    cache_key = derived_key_cache.get_cache_key(password, salt, iterations)
+    symmetric_key = derived_key_cache.get(cache_key)
+
+  if symmetric_key is None:
+    junk_old_salt, junk_old_iterations, symmetric_key = \
+      _generate_derived_key(password, salt, iterations)
+
+  # A cached key is not added again, which would postpone its expiration for
+  # as long as it is used.
+  else:
+    cache_key = None
 
   # Verify the hmac to ensure the ciphertext is valid and has not been altered.
   # See the encryption routine for why we use the encrypt-then-MAC approach.
@@ -1011,6 +1422,11 @@ def _decrypt(file_contents, password):
   if not securesystemslib.util.digests_are_equal(generated_hmac.decode(), hmac):
     raise securesystemslib.exceptions.CryptoError('Decryption failed.')
 
+  # Only the keys derived for a successful decryption are cached.  A cached
+  # key expires 'ttl' seconds after it was derived, however often it is used.
+  if cache_key is not None:
+    derived_key_cache.add(cache_key, symmetric_key)
+
   # Construct a Cipher object, with the key and iv.
   decryptor = Cipher(algorithms.AES(symmetric_key), modes.CTR(iv),
                      backend=default_backend()).decryptor()
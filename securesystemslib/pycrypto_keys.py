@@ -104,6 +104,7 @@ import Crypto.Random
 # the AES algorithm to perform cipher block operations on them.
 import Crypto.Util.Counter
 
+import securesystemslib.cache
 import securesystemslib.exceptions
 import securesystemslib.hash
 import securesystemslib.formats
@@ -245,7 +246,8 @@ def create_rsa_signature(private_key, data, scheme='rsassa-pss-sha256'):
       The private RSA key, a string in PEM format.
 
     data:
-      Data (string) used by create_rsa_signature() to generate the signature.
+      Data used by create_rsa_signature() to generate the signature, as a
+      bytes-like object (e.g., bytes, bytearray or memoryview).
 
     scheme:
       The signature scheme used by the provided 'private_key' to create
@@ -278,7 +280,7 @@ def create_rsa_signature(private_key, data, scheme='rsassa-pss-sha256'):
   securesystemslib.formats.RSA_SIG_SCHEMA.check_match(scheme)
 
   # Does 'data' have the correct format?
-  securesystemslib.formats.DATA_SCHEMA.check_match(data)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
 
   # Signing the 'data' object requires a private key.  'rssa-pss-sha256' is the
   # only signature scheme currently supported.
@@ -301,7 +303,7 @@ def create_rsa_signature(private_key, data, scheme='rsassa-pss-sha256'):
       # (possibly because the passphrase is wrong)." If the passphrase is
       # incorrect, PyCrypto returns: "RSA key format is not supported".
       try:
-        sha256_object = Crypto.Hash.SHA256.new(data)
+        sha256_object = Crypto.Hash.SHA256.new(_get_buffer(data))
         rsa_key_object = Crypto.PublicKey.RSA.importKey(private_key)
 
       except (ValueError, IndexError, TypeError) as e:
@@ -339,6 +341,103 @@ def create_rsa_signature(private_key, data, scheme='rsassa-pss-sha256'):
 
 
 
+def load_rsa_private_key_object(private_key):
+  """
+  <Purpose>
+    Import the PEM-encoded RSA 'private_key' and return its PyCrypto RSA key
+    object.  The returned object may be passed to
+    create_rsa_signature_with_key_object() to generate any number of
+    signatures, without importing 'private_key' for each of them.
+
+  <Arguments>
+    private_key:
+      The private RSA key, a string in PEM format.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'private_key' is improperly
+    formatted or is not a private key.
+
+    securesystemslib.exceptions.CryptoError, if 'private_key' cannot be
+    imported.
+
+  <Side Effects>
+    PyCrypto's 'Crypto.PublicKey.RSA.importKey()' is called.
+
+  <Returns>
+    A 'Crypto.PublicKey.RSA' key object.
+  """
+
+  # Does 'private_key' have the correct format?
+  securesystemslib.formats.PEMRSA_SCHEMA.check_match(private_key)
+
+  try:
+    rsa_key_object = Crypto.PublicKey.RSA.importKey(private_key)
+
+  except (ValueError, IndexError, TypeError) as e:
+    raise securesystemslib.exceptions.CryptoError('Invalid private key: ' +
+      str(e))
+
+  if not rsa_key_object.has_private():
+    raise securesystemslib.exceptions.FormatError('Not an RSA private key.')
+
+  return rsa_key_object
+
+
+
+
+
+def create_rsa_signature_with_key_object(rsa_key_object, data,
+    scheme='rsassa-pss-sha256'):
+  """
+  <Purpose>
+    Generate a 'scheme' signature of 'data' with 'rsa_key_object', a private
+    key object returned by load_rsa_private_key_object().  Unlike
+    create_rsa_signature(), the private key is not imported again.
+
+  <Arguments>
+    rsa_key_object:
+      A private 'Crypto.PublicKey.RSA' key object.
+
+    data:
+      Data (bytes) used by create_rsa_signature_with_key_object() to generate
+      the signature.
+
+    scheme:
+      The signature scheme used to generate the signature.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'data' or 'scheme' are
+    improperly formatted.
+
+    securesystemslib.exceptions.CryptoError, if the signature cannot be
+    generated.
+
+  <Side Effects>
+    PyCrypto's 'Crypto.Signature.PKCS1_PSS' is called to generate the signature.
+
+  <Returns>
+    A (signature, scheme) tuple, where the signature is a string and the scheme
+    is one of the supported RSA signature schemes (e.g., 'rsassa-pss-sha256').
+  """
+
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
+  securesystemslib.formats.RSA_SIG_SCHEMA.check_match(scheme)
+
+  try:
+    sha256_object = Crypto.Hash.SHA256.new(_get_buffer(data))
+    pkcs1_pss_signer = Crypto.Signature.PKCS1_PSS.new(rsa_key_object)
+    signature = pkcs1_pss_signer.sign(sha256_object)
+
+  except (ValueError, IndexError, TypeError) as e:
+    raise securesystemslib.exceptions.CryptoError('The RSA signature could not'
+      ' be generated: ' + str(e))
+
+  return signature, scheme
+
+
+
+
+
 def verify_rsa_signature(signature, signature_scheme, public_key, data):
   """
   <Purpose>
@@ -369,7 +468,8 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
 
     data:
       Data object used by securesystemslib.keys.create_signature() to generate
-      'signature'.  'data' is needed here to verify the signature.
+      'signature'.  'data' (a bytes-like object) is needed here to verify the
+      signature.
 
   <Exceptions>
     securesystemslib.exceptions.UnsupportedAlgorithmError.  Raised if the
@@ -399,7 +499,7 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
   securesystemslib.formats.PYCRYPTOSIGNATURE_SCHEMA.check_match(signature)
 
   # Does 'data' have the correct format?
-  securesystemslib.formats.DATA_SCHEMA.check_match(data)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
 
   # Verify whether the private key of 'public_key' produced 'signature'.
   # Before returning the 'valid_signature' Boolean result, ensure
@@ -412,9 +512,13 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
   # an extra check...
   if signature_scheme == 'rsassa-pss-sha256': #pragma: no cover
     try:
-      rsa_key_object = Crypto.PublicKey.RSA.importKey(public_key)
+      # The imported RSA key object is cached, so that 'public_key' is only
+      # parsed the first time it is used.
+      rsa_key_object = securesystemslib.cache.get_public_key_object('rsa',
+          signature_scheme, public_key, 'pycrypto',
+          Crypto.PublicKey.RSA.importKey)
       pkcs1_pss_verifier = Crypto.Signature.PKCS1_PSS.new(rsa_key_object)
-      sha256_object = Crypto.Hash.SHA256.new(data)
+      sha256_object = Crypto.Hash.SHA256.new(_get_buffer(data))
       valid_signature = pkcs1_pss_verifier.verify(sha256_object, signature)
 
     except (ValueError, IndexError, TypeError):
@@ -430,6 +534,99 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
 
 
 
+def load_rsa_public_key_object(public_key):
+  """
+  <Purpose>
+    Import the PEM-encoded RSA 'public_key' and return its PyCrypto RSA key
+    object.  The returned object may be passed to
+    verify_rsa_signature_with_key_object() to verify any number of
+    signatures, without importing 'public_key' for each of them.
+
+  <Arguments>
+    public_key:
+      The RSA public key, a string in PEM format.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'public_key' is improperly
+    formatted.
+
+    securesystemslib.exceptions.CryptoError, if 'public_key' cannot be
+    imported.
+
+  <Side Effects>
+    PyCrypto's 'Crypto.PublicKey.RSA.importKey()' is called.
+
+  <Returns>
+    A 'Crypto.PublicKey.RSA' key object.
+  """
+
+  # Does 'public_key' have the correct format?
+  securesystemslib.formats.PEMRSA_SCHEMA.check_match(public_key)
+
+  try:
+    return Crypto.PublicKey.RSA.importKey(public_key)
+
+  except (ValueError, IndexError, TypeError) as e:
+    raise securesystemslib.exceptions.CryptoError('Invalid public key: ' +
+      str(e))
+
+
+
+
+
+def verify_rsa_signature_with_key_object(rsa_key_object, signature, data,
+    scheme='rsassa-pss-sha256'):
+  """
+  <Purpose>
+    Determine whether the private key of 'rsa_key_object', a key object
+    returned by load_rsa_public_key_object(), produced the 'scheme'
+    'signature' of 'data'.
+
+  <Arguments>
+    rsa_key_object:
+      A 'Crypto.PublicKey.RSA' key object.
+
+    signature:
+      A signature, as a string.  This is the signature returned
+      by create_rsa_signature().
+
+    data:
+      Data (bytes) used by create_rsa_signature() to generate 'signature'.
+
+    scheme:
+      The signature scheme used to generate 'signature'.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if 'signature', 'data' or
+    'scheme' are improperly formatted.
+
+    securesystemslib.exceptions.CryptoError, if the signature cannot be
+    verified.
+
+  <Side Effects>
+    Crypto.Signature.PKCS1_PSS.verify() called to do the actual verification.
+
+  <Returns>
+    Boolean.  True if the signature is valid, False otherwise.
+  """
+
+  securesystemslib.formats.PYCRYPTOSIGNATURE_SCHEMA.check_match(signature)
+  securesystemslib.formats.BUFFER_SCHEMA.check_match(data)
+  securesystemslib.formats.RSA_SIG_SCHEMA.check_match(scheme)
+
+  try:
+    pkcs1_pss_verifier = Crypto.Signature.PKCS1_PSS.new(rsa_key_object)
+    sha256_object = Crypto.Hash.SHA256.new(_get_buffer(data))
+    return bool(pkcs1_pss_verifier.verify(sha256_object, signature))
+
+  except (ValueError, IndexError, TypeError):
+    raise securesystemslib.exceptions.CryptoError('The RSA signature could not'
+      ' be verified.')
+
+
+
+
+
 def create_rsa_encrypted_pem(private_key, passphrase):
   """
   <Purpose>
@@ -803,6 +1000,44 @@ def decrypt_key(encrypted_key, password):
 
 
 
+def derive_key(password, salt, iterations):
+  """
+  <Purpose>
+    Derive a 256-bit key from 'password' with PBKDF2-HMAC-SHA256, the key
+    derivation function used by encrypt_key() and decrypt_key().
+
+  <Arguments>
+    password:
+      The password, or passphrase, from which the key is derived.
+
+    salt:
+      The salt, a byte string.
+
+    iterations:
+      The number of PBKDF2 iterations to perform.
+
+  <Exceptions>
+    securesystemslib.exceptions.FormatError, if the arguments are improperly
+    formatted.
+
+  <Side Effects>
+    PyCrypto's PBKDF2 implementation is called to derive the key.
+
+  <Returns>
+    The derived key, a 32-byte string.
+  """
+
+  # Do the arguments have the correct format?
+  securesystemslib.formats.PASSWORD_SCHEMA.check_match(password)
+  securesystemslib.formats.DATA_SCHEMA.check_match(salt)
+  securesystemslib.formats.PBKDF2_ITERATIONS_SCHEMA.check_match(iterations)
+
+  return _generate_derived_key(password, salt, iterations)[2]
+
+
+
+
+
 def _generate_derived_key(password, salt=None, iterations=None):
   """
   Generate a derived key by feeding 'password' to the Password-Based Key
@@ -953,9 +1188,24 @@ def _decrypt(file_contents, password):
   # Generate derived key from 'password'.  The salt and iterations are
   # specified so that the expected derived key is regenerated correctly.
   # Discard the old "salt" and "iterations" values, as we only need the old
-  # derived key.
-  junk_old_salt, junk_old_iterations, derived_key = \
-    _generate_derived_key(password, salt, iterations)
+  # derived key.  If the derived key cache is enabled, the key derived for a
+  # previous decryption with the same password, salt and iterations is reused.
+  derived_key_cache = securesystemslib.cache.derived_key_cache
+  cache_key = None
+  derived_key = None
+
+  if derived_key_cache.enabled:
+    cache_key = derived_key_cache.get_cache_key(password, salt, iterations)
+    derived_key = derived_key_cache.get(cache_key)
+
+  if derived_key is None:
+    junk_old_salt, junk_old_iterations, derived_key = \
+      _generate_derived_key(password, salt, iterations)
+
+  # A cached key is not added again, which would postpone its expiration for
+  # as long as it is used.
+  else:
+    cache_key = None
 
   # Verify the hmac to ensure the ciphertext is valid and has not been altered.
   # See the encryption routine for why we use the encrypt-then-MAC approach.
@@ -966,6 +1216,11 @@ def _decrypt(file_contents, password):
   if not securesystemslib.util.digests_are_equal(generated_hmac, hmac):
     raise securesystemslib.exceptions.CryptoError('Decryption failed.')
 
+  # Only the keys derived for a successful decryption are cached.  A cached
+  # key expires 'ttl' seconds after it was derived, however often it is used.
+  if cache_key is not None:
+    derived_key_cache.add(cache_key, derived_key)
+
   # The following decryption routine assumes 'ciphertext' was encrypted with
   # AES-256.
   stateful_counter_128bit_blocks = Crypto.Util.Counter.new(128,
@@ -989,6 +1244,25 @@ def _decrypt(file_contents, password):
 
 
 
+
+
+def _get_buffer(data):
+  """
+  Non-public function that returns the bytes-like 'data' in a form that
+  PyCrypto hashes without a copy.  Bytes, bytearray and memoryview objects are
+  returned as is, and other bytes-like objects (e.g., mmap) are viewed as a
+  memoryview.
+  """
+
+  # Python 2.6 does not have memoryview, but only accepts bytes and bytearray
+  # objects (see 'securesystemslib.formats.BUFFER_SCHEMA').
+  if isinstance(data, (bytes, bytearray)) or isinstance(data, memoryview):
+    return data
+
+  return memoryview(data)
+
+
+
 if __name__ == '__main__':
   # The interactive sessions of the documentation strings can
   # be tested by running 'pycrypto_keys.py' as a standalone module:
@@ -235,6 +235,68 @@ class AnyBytes(Schema):
 
 
 
+class AnyBuffer(Schema):
+  """
+  <Purpose>
+    Matches any bytes-like object, i.e., a byte string or any other object
+    that supports the buffer protocol (e.g., bytearray, memoryview or mmap),
+    but not a text string.  Unlike AnyBytes(), the object is not required to
+    be copied into a byte string before it is checked.  The buffer must be a
+    contiguous, one-dimensional sequence of bytes, so that its length is its
+    size in bytes and it can be passed to the cryptography libraries.
+    Supported methods include
+      matches(): returns a Boolean result.
+      check_match(): raises 'exceptions.FormatError' on a mismatch.
+  <Example Use>
+
+    >>> schema = AnyBuffer()
+    >>> schema.matches(b'a string')
+    True
+    >>> schema.matches(bytearray(b'a string'))
+    True
+    >>> schema.matches(memoryview(b'a string'))
+    True
+    >>> schema.matches(memoryview(b'a string')[::2])
+    False
+    >>> schema.matches('a string')
+    False
+    >>> schema.matches(['a'])
+    False
+    >>> schema.matches(3)
+    False
+  """
+
+  def __init__(self):
+    pass
+
+
+  def check_match(self, object):
+    if isinstance(object, (six.binary_type, bytearray)):
+      return
+
+    # Other objects that support the buffer protocol can be viewed (without a
+    # copy) as a memoryview, which Python 2.6 does not have.
+    if not hasattr(six.moves.builtins, 'memoryview'): # pragma: no cover
+      raise securesystemslib.exceptions.FormatError('Expected a byte string'
+          ' or bytearray but got ' + repr(object))
+
+    try:
+      view = memoryview(object)
+
+    except TypeError:
+      raise securesystemslib.exceptions.FormatError('Expected a bytes-like'
+          ' object but got ' + repr(object))
+
+    # Python 2 memoryviews do not have 'c_contiguous'.
+    if view.ndim != 1 or view.itemsize != 1 or \
+        not getattr(view, 'c_contiguous', view.strides == (1,)):
+      raise securesystemslib.exceptions.FormatError('Expected a contiguous'
+          ' buffer of bytes but got ' + repr(object))
+
+
+
+
+
 class LengthString(Schema):
   """
   <Purpose>
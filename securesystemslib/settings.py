@@ -66,3 +66,55 @@ GENERAL_CRYPTO_LIBRARY = 'pyca-cryptography'
 
 # The algorithm(s) in HASH_ALGORITHMS are used to generate key IDs.
 HASH_ALGORITHMS = ['sha256', 'sha512']
+
+# The maximum number of parsed public key objects (e.g., the objects returned
+# by pyca/cryptography's load_pem_public_key() or nacl.signing.VerifyKey())
+# kept by 'securesystemslib.cache.public_key_cache'.  Parsing a public key is
+# a large part of the cost of verifying a single signature, so the least
+# recently used objects are cached for reuse.  Set to 0 to disable the cache.
+PUBLIC_KEY_CACHE_SIZE = 256
+
+# The maximum number of ed25519 public keys, decoded with the tables of their
+# multiples, kept by 'securesystemslib.cache.ed25519_point_cache' for the pure
+# Python implementation of ed25519 (i.e., when PyNaCl is not used).  Each
+# entry takes about 10 KB, and halves the cost of verifying further
+# signatures of its key.  Set to 0 to disable the cache.
+ED25519_POINT_CACHE_SIZE = 64
+
+# The maximum number of keys whose keyids are cached by
+# 'securesystemslib.keys'.  Computing a keyid requires encoding the key in
+# canonical JSON and hashing it, which is repeated each time the same key is
+# loaded (e.g., from metadata).  Set to 0 to disable the cache.
+KEYID_CACHE_SIZE = 16384
+
+# The maximum number of positive signature verification results kept by
+# 'securesystemslib.cache.verification_cache', so that verifying an unchanged
+# signature again costs a hash of the signed data instead of a public-key
+# operation.  The cache is disabled (0) by default, and may be enabled with
+# 'verification_cache.set_max_size()'.
+VERIFICATION_CACHE_SIZE = 0
+
+# The maximum number of verification results kept by the optional on-disk
+# tier of the verification cache (see 'VerificationCache.open_file()').
+PERSISTENT_VERIFICATION_CACHE_SIZE = 65536
+
+# The maximum number of keys derived with PBKDF2 that are kept by the opt-in
+# cache of 'securesystemslib.keys.decrypt_key()' (see
+# 'securesystemslib.cache.derived_key_cache'), and the number of seconds that
+# each is kept.  The cache is disabled if the size is 0.
+DERIVED_KEY_CACHE_SIZE = 0
+DERIVED_KEY_CACHE_TTL = 300
+
+# Whether the fastest correct backend of every signing, verification and key
+# derivation operation is selected by 'securesystemslib.calibration', which
+# micro-benchmarks the available crypto libraries the first time an operation
+# is performed.  The selection overrides the libraries above, and is cached
+# in CALIBRATION_FILEPATH (by default, '~/.securesystemslib/calibration.json')
+# until the libraries change.
+CALIBRATE_BACKENDS = False
+CALIBRATION_FILEPATH = None
+
+# The path of the Unix domain socket of the signing agent to which
+# 'securesystemslib.agent.AgentClient' and 'securesystemslib.agent.AgentSigner'
+# connect by default (see 'securesystemslib.agent.SigningAgent').
+SIGNING_AGENT_SOCKET = None
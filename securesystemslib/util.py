@@ -29,6 +29,7 @@ from __future__ import unicode_literals
 import os
 import sys
 import gzip
+import bz2
 import shutil
 import logging
 import tempfile
@@ -41,6 +42,15 @@ import securesystemslib.formats
 
 import six
 
+# The 'lzma' module, which provides xz compression, is only included in the
+# standard library of Python 3.3 and later.  xz-compressed files cannot be
+# decompressed if it is unavailable.
+try:
+  import lzma
+
+except ImportError: # pragma: no cover
+  lzma = None
+
 # The algorithm used by the repository to generate the digests of the
 # target filepaths, which are included in metadata files and may be prepended
 # to the filenames of consistent snapshots.
@@ -49,6 +59,22 @@ HASH_FUNCTION = 'sha256'
 # See 'log.py' to learn how logging is handled in TUF.
 logger = logging.getLogger('securesystemslib_util')
 
+# The compression formats that TempFile and load_json_file() can decompress.
+# 'xz' is added below only if the 'lzma' module could be imported.
+SUPPORTED_COMPRESSIONS = ['gzip', 'bz2']
+
+if lzma is not None:
+  SUPPORTED_COMPRESSIONS.append('xz')
+
+# Map the filename extensions of compressed metadata files (i.e., the
+# extensions listed in 'securesystemslib.formats.COMPRESSION_SCHEMA') to the
+# compression format used to decompress them.
+_COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+# The number of bytes decompressed at a time.  Compressed files are streamed
+# in chunks of this size, rather than fully loaded into memory.
+_DECOMPRESSION_CHUNK_SIZE = 65536
+
 
 class TempFile(object):
   """
@@ -253,7 +279,7 @@ class TempFile(object):
     self.temporary_file.seek(*args)
 
 
-  def decompress_temp_file_object(self, compression):
+  def decompress_temp_file_object(self, compression, max_length=None):
     """
     <Purpose>
       To decompress a compressed temp file object.  Decompression is performed
@@ -263,6 +289,11 @@ class TempFile(object):
       compressed meta file will be decompressed using this function.
       Note that after calling this method, write() can no longer be called.
 
+      The compressed data is decompressed in chunks, so memory usage does not
+      depend on the size of the file.  If 'max_length' is given, decompression
+      is aborted as soon as more than 'max_length' bytes have been produced
+      (e.g., to protect against decompression bombs).
+
                             meta.json.gz
                                |...[download]
                         temporary_file (containing meta.json.gz)
@@ -274,14 +305,21 @@ class TempFile(object):
     <Arguments>
       compression:
         A string indicating the type of compression that was used to compress
-        a file.  Only gzip is allowed.
+        a file.  One of 'SUPPORTED_COMPRESSIONS' (i.e., 'gzip', 'bz2' or
+        'xz').
+
+      max_length:
+        The maximum number of decompressed bytes allowed, or None if the
+        decompressed length is not limited.
 
     <Exceptions>
-      securesystemslib.exceptions.FormatError: If 'compression' is improperly formatted.
+      securesystemslib.exceptions.FormatError: If 'compression' or
+      'max_length' are improperly formatted.
 
       securesystemslib.exceptions.Error: If an invalid compression is given.
 
-      securesystemslib.exceptions.DecompressionError: If the compression failed for any reason.
+      securesystemslib.exceptions.DecompressionError: If the compression
+      failed for any reason, or if the decompressed data exceeds 'max_length'.
 
     <Side Effects>
       'self._orig_file' is used to store the original data of 'temporary_file'.
@@ -294,21 +332,25 @@ class TempFile(object):
     # Raise 'securesystemslib.exceptions.FormatError' if there is a mismatch.
     securesystemslib.formats.NAME_SCHEMA.check_match(compression)
 
+    if max_length is not None:
+      securesystemslib.formats.LENGTH_SCHEMA.check_match(max_length)
+
     if self._orig_file is not None:
       raise securesystemslib.exceptions.Error('Can only set compression on a TempFile once.')
 
-    if compression != 'gzip':
-      raise securesystemslib.exceptions.Error('Only gzip compression is supported.')
+    if compression not in SUPPORTED_COMPRESSIONS:
+      raise securesystemslib.exceptions.Error('Unsupported compression: ' +
+        repr(compression) + '.  Supported compressions: ' +
+        repr(SUPPORTED_COMPRESSIONS) + '.')
 
     self.seek(0)
     self._compression = compression
     self._orig_file = self.temporary_file
 
     try:
-      gzip_file_object = gzip.GzipFile(fileobj=self.temporary_file, mode='rb')
-      uncompressed_content = gzip_file_object.read()
       self.temporary_file = tempfile.NamedTemporaryFile()
-      self.temporary_file.write(uncompressed_content)
+      _decompress_file_object(self._orig_file, compression,
+        self.temporary_file, max_length)
       self.flush()
 
     except Exception as exception:
@@ -344,6 +386,99 @@ class TempFile(object):
       self._orig_file.close()
 
 
+def _open_compressed_file_object(file_object, compression):
+  """
+  Non-public function that returns a file-like object that decompresses the
+  data read from 'file_object', which was compressed with 'compression' (one
+  of 'SUPPORTED_COMPRESSIONS').
+  """
+
+  if compression == 'gzip':
+    return gzip.GzipFile(fileobj=file_object, mode='rb')
+
+  elif compression == 'bz2':
+    return _BZ2DecompressedFile(file_object)
+
+  elif compression == 'xz' and lzma is not None:
+    return lzma.LZMAFile(file_object, mode='rb')
+
+  else:
+    raise securesystemslib.exceptions.Error('Unsupported compression: ' +
+      repr(compression) + '.  Supported compressions: ' +
+      repr(SUPPORTED_COMPRESSIONS) + '.')
+
+
+def _decompress_file_object(file_object, compression, output_file,
+    max_length=None):
+  """
+  Non-public function that decompresses 'file_object', which was compressed
+  with 'compression', and writes the decompressed data to 'output_file' in
+  chunks.  'securesystemslib.exceptions.Error' is raised as soon as more than
+  'max_length' bytes (if not None) have been decompressed.
+  """
+
+  decompressed_file_object = \
+    _open_compressed_file_object(file_object, compression)
+  decompressed_length = 0
+
+  while True:
+    data = decompressed_file_object.read(_DECOMPRESSION_CHUNK_SIZE)
+    if not data:
+      break
+
+    decompressed_length += len(data)
+    if max_length is not None and decompressed_length > max_length:
+      raise securesystemslib.exceptions.Error('Decompressed data exceeds'
+        ' the maximum length allowed: ' + repr(max_length) + ' bytes.')
+
+    output_file.write(data)
+
+
+class _BZ2DecompressedFile(object):
+  """
+  Non-public file-like object that decompresses the bz2 data read from
+  'file_object'.  Python 2's bz2.BZ2File only accepts a filename, so the data
+  is fed to a bz2.BZ2Decompressor instead.  Concatenated streams are
+  decompressed one after the other, as bz2.BZ2File does.
+  """
+
+  def __init__(self, file_object):
+    self._file_object = file_object
+    self._decompressor = bz2.BZ2Decompressor()
+    self._buffer = b''
+
+
+  def read(self, size):
+    while len(self._buffer) < size:
+      data = self._file_object.read(_DECOMPRESSION_CHUNK_SIZE)
+
+      if not data:
+        # A decompressor raises 'EOFError' once it has reached the end of its
+        # stream, and otherwise the compressed data is truncated.
+        try:
+          self._decompressor.decompress(b'')
+
+        except EOFError:
+          break
+
+        raise IOError('Compressed file ended before the end-of-stream marker'
+          ' was reached.')
+
+      while data:
+        try:
+          self._buffer += self._decompressor.decompress(data)
+          data = self._decompressor.unused_data
+
+        except EOFError:
+          # 'data' follows the end of the previous stream.
+          self._decompressor = bz2.BZ2Decompressor()
+
+    data = self._buffer[:size]
+    self._buffer = self._buffer[size:]
+
+    return data
+
+
 def get_file_details(filepath, hash_algorithms=['sha256']):
   """
   <Purpose>
@@ -855,19 +990,30 @@ def load_json_string(data):
     return deserialized_object
 
 
-def load_json_file(filepath):
+def load_json_file(filepath, max_length=None):
   """
   <Purpose>
-    Deserialize a JSON object from a file containing the object.
+    Deserialize a JSON object from a file containing the object.  Files
+    ending in '.gz', '.bz2' or '.xz' are transparently decompressed with
+    gzip, bz2 or xz, respectively.  The data is decompressed in chunks, and
+    decompression is aborted as soon as more than 'max_length' bytes have
+    been produced.
 
   <Arguments>
     filepath:
       Absolute path of JSON file.
 
+    max_length:
+      The maximum number of decompressed bytes allowed, or None if the
+      decompressed length is not limited.
+
   <Exceptions>
-    securesystemslib.exceptions.FormatError: If 'filepath' is improperly formatted.
+    securesystemslib.exceptions.FormatError: If the arguments are improperly
+    formatted.
 
-    securesystemslib.exceptions.Error: If 'filepath' cannot be deserialized to a Python object.
+    securesystemslib.exceptions.Error: If 'filepath' cannot be deserialized to
+    a Python object, is compressed with an unsupported compression, or if its
+    decompressed data exceeds 'max_length'.
 
     IOError in case of runtime IO exceptions.
 
@@ -882,12 +1028,25 @@ def load_json_file(filepath):
   # securesystemslib.exceptions.FormatError is raised on incorrect format.
   securesystemslib.formats.PATH_SCHEMA.check_match(filepath)
 
+  if max_length is not None:
+    securesystemslib.formats.LENGTH_SCHEMA.check_match(max_length)
+
   deserialized_object = None
 
-  # The file is mostly likely gzipped.
-  if filepath.endswith('.gz'):
-    logger.debug('gzip.open(' + str(filepath) + ')')
-    fileobject = six.StringIO(gzip.open(filepath).read().decode('utf-8'))
+  # Is the file compressed?  The compression is determined by the filename
+  # extension (e.g., 'root.json.gz' or 'targets.json.xz').
+  compression = _COMPRESSION_EXTENSIONS.get(os.path.splitext(filepath)[1])
+
+  if compression is not None:
+    logger.debug('Decompressing ' + repr(filepath) + ' with ' +
+      repr(compression) + '.')
+    decompressed_fileobject = six.BytesIO()
+    with open(filepath, 'rb') as compressed_fileobject:
+      _decompress_file_object(compressed_fileobject, compression,
+        decompressed_fileobject, max_length)
+
+    fileobject = six.StringIO(
+      decompressed_fileobject.getvalue().decode('utf-8'))
 
   else:
     logger.debug('open(' + str(filepath) + ')')
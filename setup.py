@@ -96,7 +96,8 @@ setup(
     'Topic :: Security',
     'Topic :: Software Development'
   ],
-  install_requires = ['six', 'cryptography>=1.9.0', 'pycrypto>=2.6.1', 'pynacl>=0.2.3'],
+  install_requires = ['six', 'cryptography>=1.9.0', 'pycrypto>=2.6.1', 'pynacl>=0.2.3',
+      'futures; python_version < "3"'],
   packages = find_packages(exclude=['tests']),
   scripts = []
 )
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  test_agent.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Unit test for 'agent.py'.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import sys
+import stat
+import time
+import socket
+import shutil
+import tempfile
+import unittest
+import logging
+import subprocess
+
+import securesystemslib.agent
+import securesystemslib.exceptions
+import securesystemslib.interface
+import securesystemslib.keys
+import securesystemslib.settings
+
+logger = logging.getLogger('securesystemslib_test_agent')
+
+KEYS = securesystemslib.keys
+DATA = 'The quick brown fox jumps over the lazy dog'
+
+
+class TestAgent(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.key_dicts = [KEYS.generate_rsa_key(), KEYS.generate_ed25519_key(),
+        KEYS.generate_ecdsa_key()]
+
+
+
+  def setUp(self):
+    self.temporary_directory = tempfile.mkdtemp(dir=os.getcwd())
+    self.socket_path = os.path.join(self.temporary_directory, 'agent.sock')
+
+
+
+  def tearDown(self):
+    shutil.rmtree(self.temporary_directory)
+
+
+
+  def test_sign(self):
+    umask = os.umask(0o022)
+
+    try:
+      agent = securesystemslib.agent.SigningAgent(self.socket_path)
+
+    finally:
+      # The umask of the process is restored once the socket exists.
+      self.assertEqual(0o022, os.umask(umask))
+
+    with agent:
+      agent.start()
+
+      # The socket is only accessible to its owner.
+      self.assertEqual(0o600, stat.S_IMODE(os.stat(self.socket_path).st_mode))
+
+      with securesystemslib.agent.AgentClient(self.socket_path) as client:
+        self.assertEqual([], client.list_keys())
+
+        for key_dict in self.key_dicts:
+          client.add_key(key_dict)
+
+        # Only the public keys are listed.
+        public_keys = dict((key['keyid'], key) for key in client.list_keys())
+        self.assertEqual(len(self.key_dicts), len(public_keys))
+        for key_dict in self.key_dicts:
+          self.assertEqual({'public': key_dict['keyval']['public']},
+              public_keys[key_dict['keyid']]['keyval'])
+
+        for key_dict in self.key_dicts:
+          signature = client.sign(key_dict['keyid'], DATA)
+          self.assertTrue(KEYS.verify_signature(key_dict, signature, DATA))
+
+          signature = client.sign_over_bytes(key_dict['keyid'],
+              bytearray(b'data'))
+          self.assertTrue(KEYS.verify_signature_over_bytes(key_dict,
+              signature, b'data'))
+
+          # The drop-in signer.
+          signer = securesystemslib.agent.AgentSigner(key_dict['keyid'],
+              self.socket_path)
+          self.assertEqual(key_dict['scheme'], signer.scheme)
+          signatures = signer.sign_many([DATA, {'data': DATA}])
+          self.assertTrue(KEYS.verify_signature(key_dict, signatures[1],
+              {'data': DATA}))
+          signer.close()
+
+        # Deterministic signatures are those of a local Signer.
+        self.assertEqual(KEYS.create_signature(self.key_dicts[1], DATA),
+            client.sign(self.key_dicts[1]['keyid'], DATA))
+
+        client.remove_key(self.key_dicts[0]['keyid'])
+        self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+            client.sign, self.key_dicts[0]['keyid'], DATA)
+        self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+            client.remove_key, self.key_dicts[0]['keyid'])
+        self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+            securesystemslib.agent.AgentSigner, self.key_dicts[0]['keyid'],
+            self.socket_path)
+
+        client.remove_all_keys()
+        self.assertEqual([], client.list_keys())
+
+        # Improperly formatted arguments.
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            client.add_key, self.key_dicts[0], 0)
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            client.sign_over_bytes, self.key_dicts[0]['keyid'], DATA)
+
+        # A key without a private part cannot be added.
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            client.add_key, public_keys[self.key_dicts[1]['keyid']])
+
+        # The connection is still usable.
+        client.add_key(KEYS.Key.from_dict(self.key_dicts[1]))
+        self.assertEqual([self.key_dicts[1]['keyid']],
+            [key['keyid'] for key in client.list_keys()])
+
+    # The socket is removed.
+    self.assertFalse(os.path.exists(self.socket_path))
+
+
+
+  def test_lifetime(self):
+    with securesystemslib.agent.SigningAgent(self.socket_path,
+        max_lifetime=3600) as agent:
+      agent.add_key(self.key_dicts[1], lifetime=1)
+      agent.add_key(self.key_dicts[2])
+      self.assertEqual(2, len(agent.list_keys()))
+
+      # The lifetime of the keys is limited to the maximum lifetime.
+      self.assertTrue(all(expiration_time <= time.time() + 3600
+          for signer, key_dict, expiration_time in agent._keys.values()))
+
+      # A key is removed when its lifetime is over, even if the agent serves
+      # no request.
+      time.sleep(1.1)
+      self.assertEqual([self.key_dicts[2]['keyid']], list(agent._keys))
+      self.assertEqual([self.key_dicts[2]['keyid']], list(agent._timers))
+      self.assertEqual([self.key_dicts[2]['keyid']],
+          [key['keyid'] for key in agent.list_keys()])
+      self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+          agent.sign, self.key_dicts[1]['keyid'], b'data')
+
+      # Replaced and removed keys are not removed by the timers of the
+      # previous keys.
+      agent.add_key(self.key_dicts[1], lifetime=1)
+      agent.add_key(self.key_dicts[1], lifetime=3600)
+      agent.remove_key(self.key_dicts[2]['keyid'])
+      agent.add_key(self.key_dicts[2], lifetime=1)
+      time.sleep(1.1)
+      self.assertEqual([self.key_dicts[1]['keyid']], list(agent._keys))
+
+      agent.remove_all_keys()
+      self.assertEqual({}, agent._timers)
+
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          securesystemslib.agent.SigningAgent, self.socket_path + '2', 0)
+
+
+
+  def test_interface(self):
+    filepath = os.path.join(self.temporary_directory, 'ed25519_key')
+    securesystemslib.interface.generate_and_write_ed25519_keypair(filepath,
+        password='pw')
+    public_key = securesystemslib.interface.import_ed25519_publickey_from_file(
+        filepath + '.pub')
+
+    with securesystemslib.agent.SigningAgent(self.socket_path) as agent:
+      agent.start()
+
+      keyid = securesystemslib.interface.add_key_to_agent(filepath, 'ed25519',
+          password='pw', socket_path=self.socket_path)
+      self.assertEqual(public_key['keyid'], keyid)
+
+      # The default socket of the agent.
+      securesystemslib.settings.SIGNING_AGENT_SOCKET = self.socket_path
+
+      try:
+        signer = securesystemslib.interface.import_signer_from_agent(keyid)
+        self.assertTrue(KEYS.verify_signature(public_key, signer.sign(DATA),
+            DATA))
+        signer.close()
+
+      finally:
+        securesystemslib.settings.SIGNING_AGENT_SOCKET = None
+
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          securesystemslib.agent.AgentClient)
+
+      # An unknown operation.
+      with securesystemslib.agent.AgentClient(self.socket_path) as client:
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            client._request, 9, b'')
+
+    # The agent is closed.
+    self.assertRaises(socket.error, securesystemslib.agent.AgentClient,
+        self.socket_path)
+
+
+
+  def test_unix_sockets_unavailable(self):
+    # 'interface.py', the agent and the daemon can be imported on platforms
+    # without Unix domain sockets (e.g., Windows), where they cannot be used.
+    code = ('import socket\n'
+        'del socket.AF_UNIX\n'
+        'import securesystemslib.exceptions\n'
+        'import securesystemslib.interface\n'
+        'import securesystemslib.agent\n'
+        'import securesystemslib.daemon\n'
+        'for function, arguments in [\n'
+        '    (securesystemslib.interface.import_signer_from_agent,\n'
+        '    ("a" * 64, "agent.sock")),\n'
+        '    (securesystemslib.agent.SigningAgent, ("agent.sock",)),\n'
+        '    (securesystemslib.daemon.VerificationClient, ("daemon.sock",))]:\n'
+        '  try:\n'
+        '    function(*arguments)\n'
+        '  except securesystemslib.exceptions.UnsupportedLibraryError:\n'
+        '    print("unsupported")\n')
+
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))
+    output = subprocess.check_output([sys.executable, '-c', code],
+        env=environment)
+    self.assertEqual(['unsupported'] * 3, output.decode('utf-8').split())
+
+
+
+# Run the unit tests.
+if __name__ == '__main__':
+  unittest.main()
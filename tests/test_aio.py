@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  test_aio.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Unit test for 'aio.py'.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import logging
+
+import securesystemslib.aio
+import securesystemslib.backends
+import securesystemslib.exceptions
+import securesystemslib.interface
+import securesystemslib.keys
+
+try:
+  import asyncio
+  import concurrent.futures
+
+except ImportError: # pragma: no cover
+  asyncio = None
+
+logger = logging.getLogger('securesystemslib_test_aio')
+
+KEYS = securesystemslib.keys
+AIO = securesystemslib.aio
+DATA = 'The quick brown fox jumps over the lazy dog'
+
+
+@unittest.skipIf(asyncio is None, 'requires asyncio')
+class TestAio(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.key_dicts = [KEYS.generate_rsa_key(), KEYS.generate_ed25519_key(),
+        KEYS.generate_ecdsa_key()]
+
+
+
+  def setUp(self):
+    self.loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(self.loop)
+
+    # Keys are encrypted and decrypted with pyca/cryptography, whichever
+    # general-purpose library other tests left selected.
+    self.default_general_library = \
+        securesystemslib.backends.get_general_library()
+    securesystemslib.backends.set_general_library('pyca-cryptography')
+
+
+
+  def tearDown(self):
+    self.loop.close()
+    asyncio.set_event_loop(None)
+    securesystemslib.backends.set_general_library(
+        self.default_general_library)
+
+
+
+  def run_until_complete(self, *futures):
+    return self.loop.run_until_complete(asyncio.gather(*futures))
+
+
+
+  def test_operations(self):
+    with AIO.AsyncExecutor(max_workers=2) as executor:
+      signatures = self.run_until_complete(*[executor.create_signature(
+          key_dict, DATA) for key_dict in self.key_dicts])
+
+      self.assertEqual([True, True, True], self.run_until_complete(*[
+          executor.verify_signature(key_dict, signature, DATA)
+          for key_dict, signature in zip(self.key_dicts, signatures)]))
+
+      jobs = [(key_dict, signature, DATA)
+          for key_dict, signature in zip(self.key_dicts, signatures)]
+      jobs.append((KEYS.Key.from_dict(self.key_dicts[1]), signatures[1],
+          'bad data'))
+      self.assertEqual([KEYS.verify_signatures(jobs)],
+          self.run_until_complete(executor.verify_signatures(jobs)))
+
+      encrypted_key, = self.run_until_complete(executor.encrypt_key(
+          self.key_dicts[1], 'pw'))
+      self.assertEqual([self.key_dicts[1]], self.run_until_complete(
+          executor.decrypt_key(encrypted_key, 'pw')))
+
+      # The exception of an operation is raised by its future.
+      self.assertRaises(securesystemslib.exceptions.CryptoError,
+          self.run_until_complete, executor.decrypt_key(encrypted_key,
+          'wrong password'))
+
+      temporary_directory = tempfile.mkdtemp(dir=os.getcwd())
+      try:
+        filepath = os.path.join(temporary_directory, 'ed25519_key')
+        securesystemslib.interface.generate_and_write_ed25519_keypair(
+            filepath, password='pw')
+        key_dict, = self.run_until_complete(
+            executor.import_privatekey_from_file(filepath, 'ed25519', 'pw'))
+        self.assertEqual(
+            securesystemslib.interface.import_ed25519_publickey_from_file(
+            filepath + '.pub')['keyid'], key_dict['keyid'])
+
+      finally:
+        shutil.rmtree(temporary_directory)
+
+      # Improperly formatted arguments are rejected before any operation is
+      # submitted.
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          executor.create_signature, 'bad_key', DATA)
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          executor.verify_signatures, tuple(jobs))
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          executor.verify_signatures, [jobs[0][:2]])
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          executor.decrypt_key, encrypted_key, 123)
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          executor.import_privatekey_from_file, 'key', 'bad_keytype', 'pw')
+
+    # A closed executor.
+    self.assertRaises(securesystemslib.exceptions.Error,
+        executor.create_signature, self.key_dicts[1], DATA)
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        AIO.AsyncExecutor, max_pending=0)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        AIO.AsyncExecutor, thread_pool='bad_pool')
+
+
+
+  def test_process_pool(self):
+    # PyCrypto does not release the global interpreter lock, so that its
+    # signatures are created in the process pool.
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
+    securesystemslib.backends.set_library('rsa', 'pycrypto')
+
+    try:
+      with AIO.AsyncExecutor(max_workers=1) as executor:
+        signature, = self.run_until_complete(executor.create_signature(
+            self.key_dicts[0], DATA))
+        self.assertTrue(executor._process_pool is not None)
+        self.assertTrue(executor._thread_pool is None)
+
+    finally:
+      securesystemslib.backends.set_library('rsa', default_rsa_library)
+
+    self.assertTrue(KEYS.verify_signature(self.key_dicts[0], signature,
+        DATA))
+
+
+
+  def test_backpressure_and_cancellation(self):
+    event = threading.Event()
+    thread_pool = concurrent.futures.ThreadPoolExecutor(1)
+
+    with AIO.AsyncExecutor(max_pending=1, thread_pool=thread_pool,
+        process_pool=thread_pool) as executor:
+
+      # An operation that blocks the only submitted operation, so that the
+      # others wait.
+      blocking_future = executor._submit(True, event.wait)
+      futures = [executor.create_signature(key_dict, DATA)
+          for key_dict in self.key_dicts]
+      self.assertEqual(1, executor._number_of_submitted_operations)
+      self.assertEqual(3, len(executor._waiting_operations))
+
+      futures[1].cancel()
+      self.loop.run_until_complete(asyncio.sleep(0))
+      self.assertEqual(2, len(executor._waiting_operations))
+
+      event.set()
+      self.assertEqual(True, self.loop.run_until_complete(blocking_future))
+      self.run_until_complete(futures[0], futures[2])
+      self.assertTrue(futures[1].cancelled())
+      self.assertTrue(KEYS.verify_signature(self.key_dicts[2],
+          futures[2].result(), DATA))
+
+      self.assertEqual(0, executor._number_of_submitted_operations)
+      self.assertEqual(0, len(executor._waiting_operations))
+
+      # Closing the executor cancels the operations that wait.
+      event.clear()
+      blocking_future = executor._submit(True, event.wait)
+      future = executor.create_signature(self.key_dicts[1], DATA)
+      executor.close()
+      event.set()
+      self.loop.run_until_complete(blocking_future)
+      self.loop.run_until_complete(asyncio.sleep(0))
+      self.assertTrue(future.cancelled())
+
+    # The pool given to the executor is not shut down.
+    self.assertTrue(thread_pool.submit(len, 'data').result() == 4)
+    thread_pool.shutdown()
+
+
+
+  def test_default_executor(self):
+    with AIO.AsyncExecutor(max_workers=1) as executor:
+      AIO.set_default_executor(executor)
+
+      try:
+        self.assertTrue(AIO.get_default_executor() is executor)
+
+        key_dict = self.key_dicts[1]
+        signature, = self.run_until_complete(AIO.create_signature(key_dict,
+            DATA))
+        self.assertEqual([True, [True]], self.run_until_complete(
+            AIO.verify_signature(key_dict, signature, DATA),
+            AIO.verify_signatures([(key_dict, signature, DATA)])))
+
+        encrypted_key, = self.run_until_complete(AIO.encrypt_key(key_dict,
+            'pw'))
+        self.assertEqual([key_dict], self.run_until_complete(
+            AIO.decrypt_key(encrypted_key, 'pw')))
+
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            AIO.import_privatekey_from_file, 123, 'ed25519', 'pw')
+
+      finally:
+        AIO.set_default_executor(None)
+
+    self.assertTrue(isinstance(AIO.get_default_executor(), AIO.AsyncExecutor))
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        AIO.set_default_executor, 'bad_executor')
+
+
+
+# Run the unit tests.
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  test_backends.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Unit test for 'backends.py'.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import sys
+import subprocess
+import unittest
+import logging
+
+import securesystemslib.backends
+import securesystemslib.exceptions
+import securesystemslib.keys
+import securesystemslib.settings
+
+logger = logging.getLogger('securesystemslib_test_backends')
+
+BACKENDS = securesystemslib.backends
+KEYS = securesystemslib.keys
+DATA = 'The quick brown fox jumps over the lazy dog'
+
+
+class TestBackends(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.rsakey_dict = KEYS.generate_rsa_key()
+    cls.ed25519key_dict = KEYS.generate_ed25519_key()
+
+
+
+  def test_get_backend(self):
+    backend = BACKENDS.get_backend('ed25519', 'ed25519', 'sign')
+    self.assertEqual('pynacl', backend.library)
+    self.assertTrue(backend.releases_gil)
+
+    # The resolved backend is reused.
+    self.assertTrue(backend is BACKENDS.get_backend('ed25519', 'ed25519',
+        'sign'))
+
+    # The RSA library is selected by 'settings'.
+    self.assertEqual(securesystemslib.settings.RSA_CRYPTO_LIBRARY,
+        BACKENDS.get_library('rsa'))
+    self.assertEqual(BACKENDS.get_library('rsa'),
+        BACKENDS.get_backend('rsa', 'rsassa-pss-sha256', 'verify').library)
+
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        BACKENDS.get_backend, 'rsa', 'unsupported_scheme', 'sign')
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        BACKENDS.get_backend, 'ed25519', 'ed25519', 'unsupported_operation')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        BACKENDS.get_library, 'unsupported_keytype')
+
+
+
+  def test_set_library(self):
+    default_rsa_library = BACKENDS.get_library('rsa')
+
+    try:
+      for library in ['pycrypto', 'pyca-cryptography']:
+        BACKENDS.set_library('rsa', library)
+        self.assertEqual(library, BACKENDS.get_backend('rsa',
+            'rsassa-pss-sha256', 'sign').library)
+
+        signature = KEYS.create_signature(self.rsakey_dict, DATA)
+        self.assertTrue(KEYS.verify_signature(self.rsakey_dict, signature,
+            DATA))
+
+      # PyCrypto holds the global interpreter lock.
+      BACKENDS.set_library('rsa', 'pycrypto')
+      self.assertFalse(BACKENDS.releases_gil('rsa'))
+      self.assertFalse(KEYS.library_releases_gil('rsa'))
+
+      # A selected library without backends is reported when it is used.
+      BACKENDS.set_library('rsa', 'unavailable')
+      self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
+          KEYS.create_signature, self.rsakey_dict, DATA)
+      self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
+          KEYS.Verifier, self.rsakey_dict)
+
+      # The pure python implementation of ed25519 only verifies.
+      BACKENDS.set_library('ed25519', 'ed25519')
+      self.assertFalse(BACKENDS.releases_gil('ed25519'))
+      self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
+          KEYS.create_signature, self.ed25519key_dict, DATA)
+
+      BACKENDS.set_library('ed25519', None)
+      self.assertEqual(None, BACKENDS.get_library('ed25519'))
+      signature = KEYS.create_signature(self.ed25519key_dict, DATA)
+
+      BACKENDS.set_library('ed25519', 'ed25519')
+      self.assertTrue(KEYS.verify_signature(self.ed25519key_dict, signature,
+          DATA))
+      self.assertTrue(KEYS.Verifier(self.ed25519key_dict).verify(signature,
+          DATA))
+
+    finally:
+      BACKENDS.set_library('rsa', default_rsa_library)
+      BACKENDS.set_library('ed25519', None)
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        BACKENDS.set_library, 'rsa', 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        BACKENDS.set_library, 'unsupported_keytype', 'pycrypto')
+
+
+
+  def test_register_backend(self):
+    calls = []
+
+    def create_signature(public, private, data, scheme):
+      calls.append(('sign', data))
+      return b'\x00' * 64
+
+    def verify_signature(public, signature, data, scheme):
+      calls.append(('verify', data))
+      return signature == b'\x00' * 64
+
+    BACKENDS.register_backend('ed25519', 'ed25519', 'sign', 'example',
+        create_signature, releases_gil=True)
+    BACKENDS.register_backend('ed25519', 'ed25519', 'verify', 'example',
+        verify_signature, releases_gil=True)
+
+    try:
+      # Without a selected library, the latest registered backend is used,
+      # by every signing and verification routine.
+      signature = KEYS.create_signature(self.ed25519key_dict, DATA)
+      self.assertEqual('00' * 64, signature['sig'])
+      self.assertEqual(signature, KEYS.Signer(self.ed25519key_dict).sign(DATA))
+
+      self.assertTrue(KEYS.verify_signature(self.ed25519key_dict, signature,
+          DATA))
+      self.assertTrue(KEYS.Verifier(self.ed25519key_dict).verify(signature,
+          DATA))
+      signable = {'signed': DATA, 'signatures': [signature]}
+      self.assertEqual({self.ed25519key_dict['keyid']: True},
+          KEYS.verify_signable(signable, [self.ed25519key_dict]))
+
+      self.assertEqual(['sign', 'sign', 'verify', 'verify', 'verify'],
+          [operation for operation, data in calls])
+      self.assertTrue(BACKENDS.releases_gil('ed25519'))
+
+      # A library other than the selected one is not used.
+      BACKENDS.set_library('ed25519', 'pynacl')
+      self.assertFalse(KEYS.verify_signature(self.ed25519key_dict, signature,
+          DATA))
+
+    finally:
+      BACKENDS.set_library('ed25519', None)
+      BACKENDS.unregister_backend('ed25519', 'ed25519', 'sign', 'example')
+      BACKENDS.unregister_backend('ed25519', 'ed25519', 'verify', 'example')
+
+    self.assertEqual('pynacl', BACKENDS.get_backend('ed25519', 'ed25519',
+        'verify').library)
+
+    self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
+        BACKENDS.unregister_backend, 'ed25519', 'ed25519', 'sign', 'example')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        BACKENDS.register_backend, 'ed25519', 'ed25519', 'sign', 'example',
+        'not_callable')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        BACKENDS.register_backend, 'ed25519', 'ed25519', 'bad_operation',
+        'example', create_signature)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        BACKENDS.register_backend, 'ed25519', 'ed25519', 'sign', 'example',
+        create_signature, 'bad_releases_gil')
+
+
+
+  def test_is_library_available(self):
+    for library in ['pycrypto', 'pyca-cryptography', 'pynacl', 'ed25519']:
+      self.assertTrue(BACKENDS.is_library_available(library))
+
+    # Libraries that only provide registered backends have nothing to import.
+    self.assertTrue(BACKENDS.is_library_available('example'))
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        BACKENDS.is_library_available, 123)
+
+    # The crypto libraries are not imported with 'keys.py', but the first
+    # time they are used.
+    code = ('import sys\n'
+        'import securesystemslib.keys\n'
+        'def imported():\n'
+        '  return sorted(set([name.split(".")[0] for name in sys.modules\n'
+        '      if name.split(".")[0] in ["Crypto", "cryptography", "nacl"]]))\n'
+        'print(imported())\n'
+        'securesystemslib.keys.generate_ecdsa_key()\n'
+        'print(imported())\n')
+
+    # The child imports the securesystemslib of this checkout, wherever the
+    # tests are run from.
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))
+    output = subprocess.check_output([sys.executable, '-c', code],
+        env=environment)
+    self.assertEqual(["[]", "['cryptography']"],
+        output.decode('utf-8').split())
+
+
+# Run the unit tests.
+if __name__ == '__main__':
+  unittest.main()
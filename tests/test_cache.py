@@ -0,0 +1,607 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  test_cache.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Unit test for 'cache.py'.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import time
+import binascii
+import shutil
+import tempfile
+import threading
+import unittest
+import logging
+
+import securesystemslib._vendor.ed25519.ed25519
+import securesystemslib.backends
+import securesystemslib.cache
+import securesystemslib.ed25519_keys
+import securesystemslib.exceptions
+import securesystemslib.keys
+import securesystemslib.settings
+
+logger = logging.getLogger('securesystemslib_test_cache')
+
+
+class TestLRUCache(unittest.TestCase):
+
+  def test_get_and_put(self):
+    cache = securesystemslib.cache.LRUCache(2)
+    self.assertEqual(None, cache.get('a'))
+    self.assertEqual('default', cache.get('a', 'default'))
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    self.assertEqual(1, cache.get('a'))
+    self.assertEqual(2, len(cache))
+
+    # 'b' is the least recently used item, and is discarded.
+    cache.put('c', 3)
+    self.assertTrue('a' in cache)
+    self.assertFalse('b' in cache)
+    self.assertTrue('c' in cache)
+    self.assertEqual(2, len(cache))
+
+    # Replacing an existing item does not discard another item.
+    cache.put('a', 4)
+    self.assertEqual(4, cache.get('a'))
+    self.assertTrue('c' in cache)
+
+    self.assertEqual({'hits': 2, 'misses': 2, 'size': 2, 'max_size': 2},
+        cache.stats())
+
+    cache.clear()
+    self.assertEqual({'hits': 0, 'misses': 0, 'size': 0, 'max_size': 2},
+        cache.stats())
+
+    # A cache with a maximum size of 0 stores nothing.
+    cache = securesystemslib.cache.LRUCache(0)
+    cache.put('a', 1)
+    self.assertFalse('a' in cache)
+
+    # Test improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.cache.LRUCache, -1)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.cache.LRUCache, '2')
+
+
+
+  def test_get_or_create(self):
+    cache = securesystemslib.cache.LRUCache(2)
+    calls = []
+
+    def create():
+      calls.append(None)
+      return None
+
+    # A cached None is a hit.
+    self.assertEqual(None, cache.get_or_create('a', create))
+    self.assertEqual(None, cache.get_or_create('a', create))
+    self.assertEqual(1, len(calls))
+
+    # Nothing is cached if 'create_function' raises an exception.
+    def fail():
+      raise ValueError()
+
+    self.assertRaises(ValueError, cache.get_or_create, 'b', fail)
+    self.assertFalse('b' in cache)
+
+
+
+  def test_set_max_size(self):
+    cache = securesystemslib.cache.LRUCache(3)
+    for key in ['a', 'b', 'c']:
+      cache.put(key, key)
+
+    cache.set_max_size(1)
+    self.assertEqual(['c'], [key for key in ['a', 'b', 'c'] if key in cache])
+    self.assertEqual(1, cache.stats()['max_size'])
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        cache.set_max_size, -1)
+
+
+
+  def test_thread_safety(self):
+    cache = securesystemslib.cache.LRUCache(10)
+
+    def worker():
+      for index in range(1000):
+        cache.get_or_create(index % 20, lambda: index)
+
+    threads = [threading.Thread(target=worker) for index in range(4)]
+    for thread in threads:
+      thread.start()
+
+    for thread in threads:
+      thread.join()
+
+    stats = cache.stats()
+    self.assertEqual(4000, stats['hits'] + stats['misses'])
+    self.assertEqual(10, stats['size'])
+
+
+
+
+
+class TestPublicKeyCache(unittest.TestCase):
+
+  def setUp(self):
+    securesystemslib.cache.public_key_cache.clear()
+
+
+  def tearDown(self):
+    securesystemslib.cache.public_key_cache.clear()
+
+
+
+  def test_verify_signature_uses_cache(self):
+    data = 'The quick brown fox jumps over the lazy dog'
+
+    for key in [securesystemslib.keys.generate_rsa_key(),
+        securesystemslib.keys.generate_ed25519_key(),
+        securesystemslib.keys.generate_ecdsa_key()]:
+      securesystemslib.cache.public_key_cache.clear()
+      signature = securesystemslib.keys.create_signature(key, data)
+
+      for index in range(3):
+        self.assertTrue(securesystemslib.keys.verify_signature(key, signature,
+            data))
+
+      # The public key is only parsed by the first verification.
+      stats = securesystemslib.cache.public_key_cache.stats()
+      self.assertEqual(1, stats['size'])
+      self.assertEqual(1, stats['misses'])
+      self.assertEqual(2, stats['hits'])
+
+      # Invalid signatures are also detected with a cached key object.
+      self.assertFalse(securesystemslib.keys.verify_signature(key, signature,
+          'mismatched data'))
+
+
+
+  def test_get_public_key_object(self):
+    calls = []
+
+    def load(public_key):
+      calls.append(public_key)
+      return public_key.upper()
+
+    for index in range(2):
+      self.assertEqual('ABC', securesystemslib.cache.get_public_key_object(
+          'rsa', 'rsassa-pss-sha256', 'abc', 'pyca-cryptography', load))
+    self.assertEqual(['abc'], calls)
+
+    # Objects of different libraries are cached separately.
+    securesystemslib.cache.get_public_key_object('rsa', 'rsassa-pss-sha256',
+        'abc', 'pycrypto', load)
+    self.assertEqual(['abc', 'abc'], calls)
+
+
+
+  def test_ed25519_point_cache(self):
+    data = b'The quick brown fox jumps over the lazy dog'
+    public, private = securesystemslib.ed25519_keys.generate_public_and_private()
+    signature, scheme = securesystemslib.ed25519_keys.create_signature(public,
+        private, data, 'ed25519')
+    point_cache = securesystemslib.cache.ed25519_point_cache
+    point_cache.clear()
+
+    try:
+      # The pure Python implementation decodes the public key (and computes
+      # the tables of its multiples) only for the first verification.
+      for index in range(3):
+        self.assertTrue(securesystemslib.ed25519_keys.verify_signature(public,
+            'ed25519', signature, data, use_pynacl=False))
+      self.assertFalse(securesystemslib.ed25519_keys.verify_signature(public,
+          'ed25519', signature, b'mismatched data', use_pynacl=False))
+
+      stats = point_cache.stats()
+      self.assertEqual(1, stats['size'])
+      self.assertEqual(1, stats['misses'])
+      self.assertEqual(3, stats['hits'])
+
+      # Public keys that cannot be decoded are not cached.
+      bad_public = b'\x02' + b'\x00' * 31
+      self.assertFalse(securesystemslib.ed25519_keys.verify_signature(
+          bad_public, 'ed25519', signature, data, use_pynacl=False))
+      self.assertEqual(1, len(point_cache))
+
+      # Without the cache, every verification decodes the public key.
+      point_cache.set_max_size(0)
+      self.assertTrue(securesystemslib.ed25519_keys.verify_signature(public,
+          'ed25519', signature, data, use_pynacl=False))
+      self.assertEqual(0, len(point_cache))
+
+    finally:
+      point_cache.set_max_size(securesystemslib.settings.ED25519_POINT_CACHE_SIZE)
+      point_cache.clear()
+
+
+
+class TestVerificationCache(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.temporary_directory = tempfile.mkdtemp(dir=os.getcwd())
+    cls.ed25519_key = securesystemslib.keys.generate_ed25519_key()
+
+
+
+  @classmethod
+  def tearDownClass(cls):
+    shutil.rmtree(cls.temporary_directory)
+
+
+
+  def tearDown(self):
+    securesystemslib.cache.verification_cache.close_file()
+    securesystemslib.cache.verification_cache.set_max_size(0)
+    securesystemslib.cache.verification_cache.clear()
+
+
+
+  def test_get_cache_key(self):
+    get_cache_key = securesystemslib.cache.VerificationCache.get_cache_key
+    cache_key = get_cache_key('ed25519', 'ed25519', 'pynacl', b'public',
+        b'sig', b'data')
+    self.assertEqual(32, len(cache_key))
+
+    # Every argument is part of the cache key.
+    for arguments in [('rsa', 'ed25519', 'pynacl', b'public', b'sig', b'data'),
+        ('ed25519', 'rsassa-pss-sha256', 'pynacl', b'public', b'sig', b'data'),
+        ('ed25519', 'ed25519', 'ed25519', b'public', b'sig', b'data'),
+        ('ed25519', 'ed25519', 'pynacl', 'public', b'sig', b'dat'),
+        ('ed25519', 'ed25519', 'pynacl', b'publi', b'csig', b'data'),
+        ('ed25519', 'ed25519', 'pynacl', b'public', b'sig', b'other data')]:
+      self.assertNotEqual(cache_key, get_cache_key(*arguments))
+
+
+
+  def test_verify_signature_uses_cache(self):
+    cache = securesystemslib.cache.verification_cache
+    data = 'The quick brown fox jumps over the lazy dog'
+    signature = securesystemslib.keys.create_signature(self.ed25519_key, data)
+
+    # The cache is disabled by default.
+    self.assertFalse(cache.enabled)
+    self.assertTrue(securesystemslib.keys.verify_signature(self.ed25519_key,
+        signature, data))
+    self.assertEqual(0, cache.stats()['size'])
+
+    cache.set_max_size(10)
+    self.assertTrue(cache.enabled)
+    for index in range(3):
+      self.assertTrue(securesystemslib.keys.verify_signature(self.ed25519_key,
+          signature, data))
+    self.assertEqual(1, cache.stats()['size'])
+    self.assertEqual(2, cache.stats()['hits'])
+
+    # Invalid signatures are not cached.
+    self.assertFalse(securesystemslib.keys.verify_signature(self.ed25519_key,
+        signature, 'mismatched data'))
+    self.assertFalse(securesystemslib.keys.verify_signature(self.ed25519_key,
+        signature, 'mismatched data'))
+    self.assertEqual(1, cache.stats()['size'])
+
+    # A cached result is not reused for a different key with the same keyid.
+    other_key = securesystemslib.keys.generate_ed25519_key()
+    other_key['keyid'] = self.ed25519_key['keyid']
+    self.assertFalse(securesystemslib.keys.verify_signature(other_key,
+        signature, data))
+
+
+
+  def test_cache_key_includes_library(self):
+    # The pure Python implementation of ed25519 checks the cofactored
+    # equation, and accepts a signature whose R has a component of order 2,
+    # which PyNaCl rejects.
+    ed25519 = securesystemslib._vendor.ed25519.ed25519
+    secret = ed25519.secret_scalar(ed25519.H(os.urandom(32)))
+    public_key = ed25519.encodepoint(ed25519.scalarmult_B(secret))
+    R = ed25519.edwards_add(ed25519.scalarmult_B(12345),
+        (0, ed25519.q - 1, 1, 0))
+    h = ed25519.Hint(ed25519.encodepoint(R) + public_key, b'data')
+    sig = ed25519.encodepoint(R) + \
+        ed25519.encodeint((12345 + h * secret) % ed25519.l)
+
+    key_dict, junk = securesystemslib.keys.format_metadata_to_key({
+        'keytype': 'ed25519', 'scheme': 'ed25519',
+        'keyval': {'public': binascii.hexlify(public_key).decode()}})
+    signature = {'keyid': key_dict['keyid'],
+        'sig': binascii.hexlify(sig).decode()}
+
+    securesystemslib.cache.verification_cache.set_max_size(10)
+    try:
+      securesystemslib.backends.set_backend('ed25519', 'ed25519', 'verify',
+          'ed25519')
+      self.assertTrue(securesystemslib.keys.verify_signature_over_bytes(
+          key_dict, signature, b'data'))
+
+      # The result of the pure Python implementation is not reused by PyNaCl.
+      securesystemslib.backends.set_backend('ed25519', 'ed25519', 'verify',
+          'pynacl')
+      self.assertFalse(securesystemslib.keys.verify_signature_over_bytes(
+          key_dict, signature, b'data'))
+
+    finally:
+      securesystemslib.backends.set_backend('ed25519', 'ed25519', 'verify',
+          None)
+
+
+
+  def test_open_file(self):
+    filepath = os.path.join(self.temporary_directory, 'verification_cache')
+    secret_key = b'0123456789abcdef'
+    cache = securesystemslib.cache.VerificationCache(10)
+    cache_keys = [securesystemslib.cache.VerificationCache.get_cache_key(
+        'ed25519', 'ed25519', 'pynacl', b'public', b'sig',
+        str(index).encode('utf-8'))
+        for index in range(5)]
+
+    cache.open_file(filepath, secret_key, max_size=3)
+    for cache_key in cache_keys:
+      cache.add(cache_key)
+    self.assertEqual(3, cache.stats()['file_size'])
+
+    # The results survive a restart (i.e., a new cache), up to the maximum
+    # size of the on-disk tier.
+    cache = securesystemslib.cache.VerificationCache(10)
+    self.assertFalse(cache_keys[4] in cache)
+    cache.open_file(filepath, secret_key, max_size=3)
+    self.assertEqual([False, False, True, True, True],
+        [cache_key in cache for cache_key in cache_keys])
+
+    # Entries are rejected if the secret key differs...
+    cache = securesystemslib.cache.VerificationCache(10)
+    cache.open_file(filepath, b'fedcba9876543210')
+    self.assertEqual(0, cache.stats()['file_size'])
+
+    # ... or if they were tampered with.
+    cache.add(cache_keys[0])
+    cache.close_file()
+    with open(filepath) as file_object:
+      entry = file_object.read()
+    with open(filepath, 'w') as file_object:
+      file_object.write('0' * 64 + entry[64:])
+      file_object.write('not an entry\n')
+
+    cache = securesystemslib.cache.VerificationCache(10)
+    cache.open_file(filepath, b'fedcba9876543210')
+    self.assertEqual(0, cache.stats()['file_size'])
+    self.assertFalse(cache_keys[0] in cache)
+
+    # clear() empties the file.
+    cache.open_file(filepath, secret_key)
+    cache.add(cache_keys[0])
+    cache.clear()
+    self.assertEqual(0, os.path.getsize(filepath))
+
+    # A 'max_size' of 0 disables the on-disk tier, whose file is not touched.
+    zero_filepath = os.path.join(self.temporary_directory, 'zero_cache')
+    cache.open_file(zero_filepath, secret_key, max_size=0)
+    cache.add(cache_keys[1])
+    self.assertEqual(0, cache.stats()['file_size'])
+    self.assertFalse(os.path.exists(zero_filepath))
+
+    # A result that cannot be written to the file is still added, and the
+    # on-disk tier is then disabled.
+    directory = tempfile.mkdtemp(dir=self.temporary_directory)
+    cache = securesystemslib.cache.VerificationCache(10)
+    cache.open_file(os.path.join(directory, 'verification_cache'), secret_key)
+    shutil.rmtree(directory)
+    cache.add(cache_keys[0])
+    self.assertTrue(cache_keys[0] in cache)
+    self.assertEqual(0, cache.stats()['file_size'])
+    cache.add(cache_keys[1])
+    self.assertTrue(cache_keys[1] in cache)
+
+    # Likewise, clear() disables an on-disk tier whose file cannot be emptied.
+    directory = tempfile.mkdtemp(dir=self.temporary_directory)
+    cache = securesystemslib.cache.VerificationCache(10)
+    cache.open_file(os.path.join(directory, 'verification_cache'), secret_key)
+    cache.add(cache_keys[0])
+    shutil.rmtree(directory)
+    cache.clear()
+    self.assertFalse(cache_keys[0] in cache)
+    cache.add(cache_keys[1])
+    self.assertEqual(0, cache.stats()['file_size'])
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        cache.open_file, filepath, b'short')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        cache.open_file, 123, secret_key)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        cache.open_file, filepath, secret_key, -1)
+    self.assertRaises(securesystemslib.exceptions.Error,
+        cache.open_file, os.path.join(self.temporary_directory, 'missing',
+        'verification_cache'), secret_key)
+
+
+
+  def test_concurrent_file_writes(self):
+    filepath = os.path.join(self.temporary_directory, 'verification_cache')
+    secret_key = b'0123456789abcdef'
+    cache_keys = [securesystemslib.cache.VerificationCache.get_cache_key(
+        'ed25519', 'ed25519', 'pynacl', b'public', b'sig',
+        str(index).encode('utf-8'))
+        for index in range(400)]
+
+    # Without the in-memory cache, results are looked up in the on-disk tier.
+    cache = securesystemslib.cache.VerificationCache(0)
+    cache.open_file(filepath, secret_key, max_size=4)
+
+    def add_results(cache_keys):
+      for cache_key in cache_keys:
+        cache.add(cache_key)
+
+    threads = [threading.Thread(target=add_results,
+        args=(cache_keys[index::4],)) for index in range(4)]
+    for thread in threads:
+      thread.start()
+    while any(thread.is_alive() for thread in threads):
+      cache.clear()
+    for thread in threads:
+      thread.join()
+
+    # Entries appended to the file while it is emptied or rewritten are not
+    # lost, nor do they outlive clear():  the file holds the same results.
+    reloaded_cache = securesystemslib.cache.VerificationCache(0)
+    reloaded_cache.open_file(filepath, secret_key, max_size=4)
+    self.assertEqual([cache_key in cache for cache_key in cache_keys],
+        [cache_key in reloaded_cache for cache_key in cache_keys])
+
+
+
+
+
+class TestDerivedKeyCache(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.ed25519_key = securesystemslib.keys.generate_ed25519_key()
+
+
+
+  def setUp(self):
+    self.default_general_library = \
+        securesystemslib.backends.get_general_library()
+
+
+
+  def tearDown(self):
+    securesystemslib.backends.set_general_library(
+        self.default_general_library)
+    securesystemslib.cache.derived_key_cache.set_max_size(
+        securesystemslib.settings.DERIVED_KEY_CACHE_SIZE)
+    securesystemslib.cache.derived_key_cache.set_ttl(
+        securesystemslib.settings.DERIVED_KEY_CACHE_TTL)
+    securesystemslib.cache.derived_key_cache.wipe()
+
+
+
+  def test_get_cache_key(self):
+    cache = securesystemslib.cache.DerivedKeyCache(10)
+    cache_key = cache.get_cache_key('password', b'salt', 100000)
+    self.assertEqual(32, len(cache_key))
+    self.assertEqual(cache_key, cache.get_cache_key('password', b'salt',
+        100000))
+
+    # Every argument is part of the cache key.
+    for arguments in [('passwor', b'dsalt', 100000),
+        ('password', b'other salt', 100000), ('password', b'salt', 10000)]:
+      self.assertNotEqual(cache_key, cache.get_cache_key(*arguments))
+
+    # The cache keys are computed with a secret key of the cache.
+    self.assertNotEqual(cache_key, securesystemslib.cache.DerivedKeyCache(
+        10).get_cache_key('password', b'salt', 100000))
+
+    cache.add(cache_key, b'derived key')
+    self.assertEqual(b'derived key', cache.get(cache_key))
+    cache.wipe()
+    self.assertEqual(None, cache.get(cache_key))
+    self.assertNotEqual(cache_key, cache.get_cache_key('password', b'salt',
+        100000))
+
+
+
+  def test_ttl(self):
+    cache = securesystemslib.cache.DerivedKeyCache(10, ttl=1)
+    cache_key = cache.get_cache_key('password', b'salt', 100000)
+    cache.add(cache_key, b'derived key')
+    self.assertEqual(b'derived key', cache.get(cache_key))
+
+    time.sleep(1.1)
+    self.assertEqual(None, cache.get(cache_key))
+    self.assertEqual(0, cache.stats()['size'])
+
+    cache.set_ttl(None)
+    cache.add(cache_key, b'derived key')
+    self.assertEqual(b'derived key', cache.get(cache_key))
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.cache.DerivedKeyCache, 10, 0)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        cache.set_ttl, -1)
+
+
+
+  def test_decrypt_key_uses_cache(self):
+    cache = securesystemslib.cache.derived_key_cache
+
+    # Only the pyca/cryptography general-purpose library is tested:  the
+    # encryption of keys with PyCrypto is broken with current PyCryptodome.
+    securesystemslib.backends.set_general_library('pyca-cryptography')
+
+    # The cache is disabled by default.
+    self.assertFalse(cache.enabled)
+    encrypted_key = securesystemslib.keys.encrypt_key(self.ed25519_key, 'pw')
+    securesystemslib.keys.decrypt_key(encrypted_key, 'pw')
+    self.assertEqual(0, cache.stats()['size'])
+
+    cache.set_max_size(10)
+    self.assertTrue(cache.enabled)
+
+    for index in range(3):
+      self.assertEqual(self.ed25519_key,
+          securesystemslib.keys.decrypt_key(encrypted_key, 'pw'))
+
+    self.assertEqual(1, cache.stats()['size'])
+    self.assertEqual(2, cache.stats()['hits'])
+
+    # The keys derived from a wrong password are not cached.
+    for index in range(2):
+      self.assertRaises(securesystemslib.exceptions.CryptoError,
+          securesystemslib.keys.decrypt_key, encrypted_key, 'wrong')
+
+    self.assertEqual(1, cache.stats()['size'])
+
+    # A cached derived key does not decrypt a modified key.
+    salt, iterations, hmac, iv, ciphertext = encrypted_key.split('@@@@')
+    modified_key = '@@@@'.join([salt, iterations, hmac, iv,
+        ciphertext[:-2] + ('00' if ciphertext[-2:] != '00' else '01')])
+    self.assertRaises(securesystemslib.exceptions.CryptoError,
+        securesystemslib.keys.decrypt_key, modified_key, 'pw')
+
+    cache.wipe()
+    self.assertEqual(0, cache.stats()['size'])
+    self.assertEqual(self.ed25519_key,
+        securesystemslib.keys.decrypt_key(encrypted_key, 'pw'))
+
+    # A derived key expires 'ttl' seconds after it was derived, even if it is
+    # used in the meantime.
+    cache.wipe()
+    cache.set_ttl(1)
+    securesystemslib.keys.decrypt_key(encrypted_key, 'pw')
+    time.sleep(0.6)
+    securesystemslib.keys.decrypt_key(encrypted_key, 'pw')
+    time.sleep(0.6)
+    self.assertEqual(None, cache.get(cache.get_cache_key('pw',
+        binascii.unhexlify(salt), int(iterations))))
+
+
+
+# Run the unit tests.
+if __name__ == '__main__':
+  unittest.main()
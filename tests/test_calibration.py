@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  test_calibration.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Unit test for 'calibration.py'.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import json
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+import logging
+
+import securesystemslib.backends
+import securesystemslib.calibration
+import securesystemslib.exceptions
+import securesystemslib.formats
+import securesystemslib.settings
+
+logger = logging.getLogger('securesystemslib_test_calibration')
+
+BACKENDS = securesystemslib.backends
+CALIBRATION = securesystemslib.calibration
+
+
+class TestCalibration(unittest.TestCase):
+
+  def setUp(self):
+    self.temporary_directory = tempfile.mkdtemp(dir=os.getcwd())
+    self.filepath = os.path.join(self.temporary_directory, 'calibration',
+        'calibration.json')
+    self.default_general_library = BACKENDS.get_general_library()
+
+
+
+  def tearDown(self):
+    # Undo the selections of the calibrations.
+    for keytype, scheme, operation in BACKENDS.get_registered_backends():
+      BACKENDS.set_backend(keytype, scheme, operation, None)
+
+    BACKENDS.set_general_library(self.default_general_library)
+    shutil.rmtree(self.temporary_directory)
+
+
+
+  def test_calibrate(self):
+    # Backends that produce incorrect results are rejected.
+    BACKENDS.register_backend('ed25519', 'ed25519', 'sign', 'example',
+        lambda public, private, data, scheme: b'\x00' * 64)
+    BACKENDS.register_backend('ed25519', 'ed25519', 'verify', 'example',
+        lambda public, signature, data, scheme: True)
+
+    # A verifier that accepts a valid signature over other data is rejected.
+    BACKENDS.register_backend('ed25519', 'ed25519', 'verify', 'lenient',
+        lambda public, signature, data, scheme: data == CALIBRATION._DATA)
+
+    try:
+      report = CALIBRATION.calibrate(self.filepath, number=1, repeat=1)
+      self.assertTrue(securesystemslib.formats.CALIBRATION_REPORT_SCHEMA.matches(
+          report))
+
+      entries = dict([((entry['keytype'], entry['scheme'],
+          entry['operation']), entry) for entry in report])
+
+      for operation in ['sign', 'verify']:
+        entry = entries[('ed25519', 'ed25519', operation)]
+        self.assertTrue('example' in entry['rejected'])
+        self.assertFalse('example' in entry['seconds'])
+        self.assertEqual(entry['library'], BACKENDS.get_backend('ed25519',
+            'ed25519', operation).library)
+
+      self.assertEqual(['example', 'lenient'], sorted(entries[('ed25519',
+          'ed25519', 'verify')]['rejected']))
+
+      # The backends of every keytype are calibrated.
+      self.assertEqual(set(['rsa', 'ed25519', 'ecdsa-sha2-nistp256',
+          'general']), set([entry['keytype'] for entry in report]))
+
+      # The pure Python implementation of ed25519 only verifies.
+      self.assertTrue('ed25519' in
+          entries[('ed25519', 'ed25519', 'verify')]['seconds'])
+
+      for library in BACKENDS.get_general_libraries():
+        self.assertTrue(library in
+            entries[('general', 'pbkdf2-hmac-sha256', 'kdf')]['seconds'])
+      self.assertEqual(entries[('general', 'pbkdf2-hmac-sha256',
+          'kdf')]['library'], BACKENDS.get_general_library())
+
+      # The report is saved, along with the environment it was measured in.
+      self.assertEqual(report, CALIBRATION.load_calibration(self.filepath))
+      self.assertTrue('example' in CALIBRATION.format_report(report))
+
+    finally:
+      BACKENDS.unregister_backend('ed25519', 'ed25519', 'sign', 'example')
+      BACKENDS.unregister_backend('ed25519', 'ed25519', 'verify', 'example')
+      BACKENDS.unregister_backend('ed25519', 'ed25519', 'verify', 'lenient')
+
+    # The report is out of date once the registered backends change.
+    self.assertEqual(None, CALIBRATION.load_calibration(self.filepath))
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        CALIBRATION.calibrate, self.filepath, 0)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        CALIBRATION.calibrate, self.filepath, 1, 'bad_repeat')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        CALIBRATION.load_calibration, 123)
+
+
+
+  def test_calibrate_once(self):
+    # Missing and invalid files are ignored.
+    self.assertEqual(None, CALIBRATION.load_calibration(self.filepath))
+    os.makedirs(os.path.dirname(self.filepath))
+    with open(self.filepath, 'w') as file_object:
+      file_object.write('{"version": 1}')
+    self.assertEqual(None, CALIBRATION.load_calibration(self.filepath))
+
+    report = [{'keytype': 'ed25519', 'scheme': 'ed25519',
+        'operation': 'verify', 'library': 'ed25519',
+        'seconds': {'ed25519': 0.01, 'pynacl': 0.02}, 'rejected': []},
+        {'keytype': 'general', 'scheme': 'pbkdf2-hmac-sha256',
+        'operation': 'kdf', 'seconds': {}, 'rejected': ['pycrypto']}]
+
+    with open(self.filepath, 'w') as file_object:
+      json.dump({'version': 1, 'report': report,
+          'environment': CALIBRATION._get_environment()}, file_object)
+
+    # An up-to-date report is applied by the first backend that is used if
+    # 'settings.CALIBRATE_BACKENDS' is set.
+    default_calibrated = BACKENDS._calibrated
+    securesystemslib.settings.CALIBRATE_BACKENDS = True
+    securesystemslib.settings.CALIBRATION_FILEPATH = self.filepath
+    BACKENDS._calibrated = False
+    BACKENDS.set_backend('ed25519', 'ed25519', 'verify', None)
+
+    try:
+      self.assertEqual('ed25519', BACKENDS.get_backend('ed25519', 'ed25519',
+          'verify').library)
+      self.assertTrue(BACKENDS._calibrated)
+
+      # An operation without a correct library is left unchanged.
+      self.assertEqual(self.default_general_library,
+          BACKENDS.get_general_library())
+
+    finally:
+      securesystemslib.settings.CALIBRATE_BACKENDS = False
+      securesystemslib.settings.CALIBRATION_FILEPATH = None
+      BACKENDS._calibrated = default_calibrated
+
+    self.assertEqual(report, CALIBRATION.calibrate_once(self.filepath))
+    self.assertEqual('ed25519 ed25519 verify: ed25519 (ed25519 0.010000s,'
+        ' pynacl 0.020000s)\ngeneral pbkdf2-hmac-sha256 kdf: None (),'
+        ' rejected: pycrypto', CALIBRATION.format_report(report))
+
+    # A file that selects a library without a registered backend is ignored.
+    for entry in [{'keytype': 'ed25519', 'scheme': 'ed25519',
+        'operation': 'verify', 'library': 'example', 'seconds': {},
+        'rejected': []}, {'keytype': 'general', 'scheme': 'pbkdf2-hmac-sha256',
+        'operation': 'kdf', 'library': 'pynacl', 'seconds': {},
+        'rejected': []}, {'keytype': 'general', 'scheme': 'other',
+        'operation': 'kdf', 'library': 'pycrypto', 'seconds': {},
+        'rejected': []}]:
+      with open(self.filepath, 'w') as file_object:
+        json.dump({'version': 1, 'report': [entry],
+            'environment': CALIBRATION._get_environment()}, file_object)
+
+      self.assertEqual(None, CALIBRATION.load_calibration(self.filepath))
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        CALIBRATION.apply_calibration, [{'operation': 'verify'}])
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        CALIBRATION.format_report, 'bad_report')
+
+
+
+  def test_concurrent_calibration(self):
+    # The calibration selects the pure Python verifier of ed25519 signatures,
+    # after a delay.
+    os.makedirs(os.path.dirname(self.filepath))
+    with open(self.filepath, 'w') as file_object:
+      json.dump({'version': 1, 'report': [{'keytype': 'ed25519',
+          'scheme': 'ed25519', 'operation': 'verify', 'library': 'ed25519',
+          'seconds': {'ed25519': 0.01}, 'rejected': []}],
+          'environment': CALIBRATION._get_environment()}, file_object)
+
+    calibrate_once = CALIBRATION.calibrate_once
+    calls = []
+    def slow_calibrate_once(filepath=None):
+      calls.append(filepath)
+      time.sleep(0.2)
+      return calibrate_once(filepath)
+
+    # Threads that use a backend while another calibrates them wait for the
+    # calibration, and are given the selected backend.
+    default_calibrated = BACKENDS._calibrated
+    securesystemslib.settings.CALIBRATE_BACKENDS = True
+    securesystemslib.settings.CALIBRATION_FILEPATH = self.filepath
+    CALIBRATION.calibrate_once = slow_calibrate_once
+    BACKENDS._calibrated = False
+    BACKENDS.set_backend('ed25519', 'ed25519', 'verify', None)
+
+    libraries = []
+    def get_library():
+      libraries.append(BACKENDS.get_backend('ed25519', 'ed25519',
+          'verify').library)
+
+    threads = [threading.Thread(target=get_library) for index in range(4)]
+
+    try:
+      for thread in threads:
+        thread.start()
+      for thread in threads:
+        thread.join()
+
+    finally:
+      securesystemslib.settings.CALIBRATE_BACKENDS = False
+      securesystemslib.settings.CALIBRATION_FILEPATH = None
+      CALIBRATION.calibrate_once = calibrate_once
+      BACKENDS._calibrated = default_calibrated
+
+    self.assertEqual(1, len(calls))
+    self.assertEqual(['ed25519'] * len(threads), libraries)
+
+
+
+# Run the unit tests.
+if __name__ == '__main__':
+  unittest.main()
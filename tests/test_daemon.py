@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  test_daemon.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Unit test for 'daemon.py'.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import socket
+import shutil
+import struct
+import tempfile
+import threading
+import unittest
+import logging
+
+import securesystemslib.daemon
+import securesystemslib.exceptions
+import securesystemslib.keys
+
+logger = logging.getLogger('securesystemslib_test_daemon')
+
+KEYS = securesystemslib.keys
+DATA = 'The quick brown fox jumps over the lazy dog'
+
+
+class TestDaemon(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.key_dicts = [KEYS.generate_rsa_key(), KEYS.generate_ed25519_key(),
+        KEYS.generate_ecdsa_key()]
+
+    # A valid and an invalid signature of every key, including data with a
+    # control character, which canonical JSON does not escape.
+    cls.jobs = []
+    for index, key_dict in enumerate(cls.key_dicts):
+      data = {'index': index, 'data': DATA + '\n'}
+      signature = KEYS.create_signature(key_dict, data)
+      cls.jobs.append((key_dict, signature, data))
+      cls.jobs.append((key_dict, signature, 'mismatched data'))
+
+    cls.serial_results = KEYS.verify_signatures(cls.jobs)
+
+
+
+  def setUp(self):
+    self.temporary_directory = tempfile.mkdtemp(dir=os.getcwd())
+    self.socket_path = os.path.join(self.temporary_directory, 'daemon.sock')
+
+
+
+  def tearDown(self):
+    shutil.rmtree(self.temporary_directory)
+
+
+
+  def test_verify_signatures(self):
+    with securesystemslib.daemon.VerificationDaemon(self.key_dicts,
+        self.socket_path, max_workers=2, use_processes=False) as daemon:
+      daemon.start()
+
+      with securesystemslib.daemon.VerificationClient(
+          self.socket_path) as client:
+        self.assertEqual(self.serial_results,
+            [client.verify_signature(*job) for job in self.jobs])
+        self.assertEqual(self.serial_results, client.verify_signatures(
+            self.jobs))
+        self.assertEqual([], client.verify_signatures([]))
+
+        # Key and Signature objects.
+        key_dict, signature, data = self.jobs[0]
+        self.assertTrue(client.verify_signature(KEYS.Key.from_dict(key_dict),
+            KEYS.Signature.from_dict(signature), data))
+
+        # A key that the daemon does not have.
+        unknown_key_dict = KEYS.generate_ed25519_key()
+        self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+            client.verify_signature, unknown_key_dict,
+            KEYS.create_signature(unknown_key_dict, DATA), DATA)
+
+        # The exception of the first signature that raised one is raised.
+        self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+            client.verify_signatures, self.jobs + [(unknown_key_dict,
+            signature, DATA)])
+
+        # Improperly formatted arguments are rejected by the client.
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            client.verify_signature, key_dict, 'bad_signature', data)
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            client.verify_signature, 'bad_key', signature, data)
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            client.verify_signatures, tuple(self.jobs))
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            client.verify_signatures, [self.jobs[0][:2]])
+
+        # The connection is still usable.
+        self.assertTrue(client.verify_signature(*self.jobs[0]))
+
+    # The socket is removed.
+    self.assertFalse(os.path.exists(self.socket_path))
+
+
+
+  def test_concurrent_clients(self):
+    results = {}
+
+    def verify(index):
+      with securesystemslib.daemon.VerificationClient(
+          self.socket_path) as client:
+        results[index] = [client.verify_signatures(self.jobs)
+            for iteration in range(5)]
+
+    with securesystemslib.daemon.VerificationDaemon(self.key_dicts,
+        self.socket_path, max_workers=2, use_processes=False,
+        max_batch_size=4) as daemon:
+      daemon.start()
+
+      threads = [threading.Thread(target=verify, args=(index,))
+          for index in range(4)]
+      for thread in threads:
+        thread.start()
+
+      for thread in threads:
+        thread.join()
+
+    self.assertEqual(dict([(index, [self.serial_results] * 5)
+        for index in range(4)]), results)
+
+
+
+  def test_invalid_requests(self):
+    with securesystemslib.daemon.VerificationDaemon(self.key_dicts,
+        self.socket_path, max_workers=1, use_processes=False) as daemon:
+      daemon.start()
+
+      # The daemon closes the connection of an improperly formatted request.
+      for request in [b'\x00\x00\x00\x02\x00\x00',
+          struct.pack('!II', 4, 1),
+          struct.pack('!IIHHI', 12, 1, 64, 64, 0)]:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(self.socket_path)
+        connection.sendall(request)
+        self.assertEqual(b'', connection.recv(1))
+        connection.close()
+
+      # A signature over data that is not JSON.
+      with securesystemslib.daemon.VerificationClient(
+          self.socket_path) as client:
+        keyid = self.key_dicts[1]['keyid'].encode('utf-8')
+        body = struct.pack('!IHHI', 1, len(keyid), 1, 1) + keyid + b'a{'
+        client._socket.sendall(struct.pack('!I', len(body)) + body)
+        response = securesystemslib.daemon.read_frame(client._file)
+        self.assertRaises(securesystemslib.exceptions.Error,
+            securesystemslib.daemon._decode_results, response, 1)
+
+        # A client of a closed daemon.
+        daemon.close()
+        self.assertRaises(securesystemslib.exceptions.Error,
+            client.verify_signature, *self.jobs[0])
+
+    # The socket must not exist.
+    open(self.socket_path, 'w').close()
+    self.assertRaises(socket.error,
+        securesystemslib.daemon.VerificationDaemon, self.key_dicts,
+        self.socket_path, max_workers=1, use_processes=False)
+
+    # Test improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.daemon.VerificationDaemon, self.key_dicts, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.daemon.VerificationDaemon, self.key_dicts,
+        self.socket_path, max_batch_size=0)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.daemon.VerificationClient, 123)
+
+
+
+# Run the unit tests.
+if __name__ == '__main__':
+  unittest.main()
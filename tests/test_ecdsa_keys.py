@@ -25,6 +25,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import hashlib
 import unittest
 import os
 import logging
@@ -105,6 +106,106 @@ class TestECDSA_keys(unittest.TestCase):
                       securesystemslib.ecdsa_keys.create_signature, public, private, 123)
 
 
+  def test_create_signature_with_key_object(self):
+    global public
+    global private
+    data = b'The quick brown fox jumps over the lazy dog'
+
+    private_key_object = \
+      securesystemslib.ecdsa_keys.load_private_key_object(private)
+    signature, scheme = \
+      securesystemslib.ecdsa_keys.create_signature_with_key_object(
+      private_key_object, data)
+    self.assertEqual('ecdsa-sha2-nistp256', scheme)
+    self.assertTrue(securesystemslib.ecdsa_keys.verify_signature(public,
+        scheme, signature, data))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.CryptoError,
+        securesystemslib.ecdsa_keys.load_private_key_object, public)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ecdsa_keys.load_private_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.CryptoError,
+        securesystemslib.ecdsa_keys.create_signature_with_key_object,
+        private_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ecdsa_keys.create_signature_with_key_object,
+        private_key_object, data, 'bad_scheme')
+
+
+
+  def test_verify_signature_with_key_object(self):
+    global public
+    global private
+    data = b'The quick brown fox jumps over the lazy dog'
+
+    signature, scheme = securesystemslib.ecdsa_keys.create_signature(public,
+        private, data)
+    public_key_object = \
+      securesystemslib.ecdsa_keys.load_public_key_object(public)
+
+    self.assertTrue(securesystemslib.ecdsa_keys.verify_signature_with_key_object(
+        public_key_object, signature, data))
+    self.assertFalse(securesystemslib.ecdsa_keys.verify_signature_with_key_object(
+        public_key_object, signature, b'bad data'))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.CryptoError,
+        securesystemslib.ecdsa_keys.load_public_key_object, private)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ecdsa_keys.load_public_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ecdsa_keys.verify_signature_with_key_object,
+        public_key_object, signature, data, 'bad_scheme')
+
+
+
+  def test_create_signature_prehashed(self):
+    global public
+    global private
+    data = b'The quick brown fox jumps over the lazy dog'
+    digest = hashlib.sha256(data).digest()
+
+    signature, scheme = securesystemslib.ecdsa_keys.create_signature_prehashed(
+        public, private, digest)
+    self.assertEqual('ecdsa-sha2-nistp256', scheme)
+    self.assertTrue(securesystemslib.ecdsa_keys.verify_signature(public,
+        scheme, signature, data))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ecdsa_keys.create_signature_prehashed, public,
+        private, data)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ecdsa_keys.create_signature_prehashed, public,
+        private, digest, 'bad_scheme')
+
+
+
+  def test_verify_signature_prehashed(self):
+    global public
+    global private
+    data = b'The quick brown fox jumps over the lazy dog'
+    digest = hashlib.sha256(data).digest()
+    scheme = 'ecdsa-sha2-nistp256'
+    signature, scheme = securesystemslib.ecdsa_keys.create_signature(public,
+        private, data, scheme)
+
+    self.assertTrue(securesystemslib.ecdsa_keys.verify_signature_prehashed(
+        public, scheme, signature, digest))
+    self.assertFalse(securesystemslib.ecdsa_keys.verify_signature_prehashed(
+        public, scheme, signature, hashlib.sha256(b'bad_data').digest()))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ecdsa_keys.verify_signature_prehashed, public, scheme,
+        signature, data)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ecdsa_keys.verify_signature_prehashed, public,
+        'bad_scheme', signature, digest)
+
+
+
   def test_verify_signature(self):
     global public
     global private
@@ -27,11 +27,13 @@ from __future__ import unicode_literals
 
 import unittest
 import os
+import binascii
 import logging
 
 import securesystemslib.exceptions
 import securesystemslib.formats
 import securesystemslib.ed25519_keys
+import securesystemslib._vendor.ed25519.ed25519
 
 logger = logging.getLogger('securesystemslib.test_ed25519_keys')
 
@@ -83,6 +85,62 @@ class TestEd25519_keys(unittest.TestCase):
         scheme)
 
 
+  def test_create_signature_with_key_object(self):
+    global public
+    global private
+    data = b'The quick brown fox jumps over the lazy dog'
+
+    private_key_object = \
+      securesystemslib.ed25519_keys.load_private_key_object(private)
+    signature, scheme = \
+      securesystemslib.ed25519_keys.create_signature_with_key_object(
+      private_key_object, data)
+
+    # ed25519 signatures are deterministic.
+    self.assertEqual((signature, scheme),
+        securesystemslib.ed25519_keys.create_signature(public, private, data,
+        'ed25519'))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.load_private_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.CryptoError,
+        securesystemslib.ed25519_keys.create_signature_with_key_object,
+        private_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.create_signature_with_key_object,
+        private_key_object, data, 'bad_scheme')
+
+
+
+  def test_verify_signature_with_key_object(self):
+    global public
+    global private
+    data = b'The quick brown fox jumps over the lazy dog'
+
+    signature, scheme = securesystemslib.ed25519_keys.create_signature(public,
+        private, data, 'ed25519')
+    public_key_object = \
+      securesystemslib.ed25519_keys.load_public_key_object(public)
+
+    self.assertTrue(
+        securesystemslib.ed25519_keys.verify_signature_with_key_object(
+        public_key_object, signature, data))
+    self.assertFalse(
+        securesystemslib.ed25519_keys.verify_signature_with_key_object(
+        public_key_object, signature, b'bad data'))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.load_public_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.verify_signature_with_key_object,
+        public_key_object, 123, data)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.verify_signature_with_key_object,
+        public_key_object, signature, data, 'bad_scheme')
+
+
   def test_verify_signature(self):
     global public
     global private
@@ -152,6 +210,150 @@ class TestEd25519_keys(unittest.TestCase):
 
 
 
+  def test_precomputed_constants(self):
+    # The constants of the pure Python implementation of ed25519 are
+    # precomputed, and must equal those it would compute.
+    ed25519 = securesystemslib._vendor.ed25519.ed25519
+    q = ed25519.q
+
+    self.assertEqual(-121665 * ed25519.inv(121666) % q, ed25519.d)
+    self.assertEqual(pow(2, (q - 1) // 4, q), ed25519.I)
+    self.assertEqual(4 * ed25519.inv(5) % q, ed25519.By)
+    self.assertEqual(ed25519.xrecover(ed25519.By), ed25519.Bx)
+
+    # Bpow[i] == scalarmult(B, 2**i), in affine coordinates.
+    self.assertEqual(253, len(ed25519.Bpow))
+    point = ed25519.B
+    for precomputed_point in ed25519.Bpow:
+      self.assertEqual(ed25519.encodepoint(point),
+          ed25519.encodepoint(precomputed_point))
+      self.assertTrue(ed25519.isoncurve(precomputed_point))
+      point = ed25519.edwards_double(point)
+
+
+
+  def test_scalar_multiplication(self):
+    # The windowed, fixed-base and double-scalar multiplications of the pure
+    # Python implementation of ed25519 equal repeated doubling and addition.
+    ed25519 = securesystemslib._vendor.ed25519.ed25519
+
+    def double_and_add(point, scalar):
+      result = ed25519.ident
+      for bit in bin(scalar)[2:]:
+        result = ed25519.edwards_double(result)
+        if bit == '1':
+          result = ed25519.edwards_add(result, point)
+
+      return result
+
+    A = ed25519.decodepoint(ed25519.publickey_unsafe(os.urandom(32)))
+
+    for scalar in [0, 1, 7, 16, 2**252, ed25519.l - 1, ed25519.l,
+        int(binascii.hexlify(os.urandom(64)), 16)]:
+      digits = ed25519.wnaf(scalar, 5)
+      self.assertEqual(scalar, sum([digit << i
+          for i, digit in enumerate(digits)]))
+
+      expected_point = ed25519.encodepoint(double_and_add(A, scalar))
+      self.assertEqual(expected_point,
+          ed25519.encodepoint(ed25519.scalarmult(A, scalar)))
+      self.assertEqual(ed25519.encodepoint(double_and_add(ed25519.B, scalar)),
+          ed25519.encodepoint(ed25519.scalarmult_B(scalar)))
+
+      # [scalar]B + [scalar + 1]A, in a single pass.
+      self.assertEqual(ed25519.encodepoint(ed25519.edwards_add(
+          double_and_add(ed25519.B, scalar), double_and_add(A, scalar + 1))),
+          ed25519.encodepoint(ed25519.multiscalarmult([
+          (ed25519.wnaf(scalar, ed25519.B_WINDOW), ed25519.Bodd_multiples()),
+          (ed25519.wnaf(scalar + 1, 5), ed25519.odd_multiples(A, 8))])))
+
+
+
+  def test_verify_signatures(self):
+    global public
+    global private
+    other_public, other_private = \
+        securesystemslib.ed25519_keys.generate_public_and_private()
+    jobs = []
+    for index in range(6):
+      data = b'The quick brown fox jumps over the lazy dog ' + \
+          str(index).encode('utf-8')
+      public_key, private_key = [(public, private),
+          (other_public, other_private)][index % 2]
+      signature, scheme = securesystemslib.ed25519_keys.create_signature(
+          public_key, private_key, data, 'ed25519')
+      jobs.append((public_key, scheme, signature, data))
+
+    # Valid signatures pass the batch, and invalid ones are identified.
+    bad_jobs = list(jobs)
+    bad_jobs[1] = jobs[1][:3] + (b'mismatched data',)
+    bad_jobs[4] = jobs[4][:2] + (jobs[2][2],) + jobs[4][3:]
+
+    for use_pynacl in [False, True]:
+      self.assertEqual([True] * 6,
+          securesystemslib.ed25519_keys.verify_signatures(jobs, use_pynacl))
+      self.assertEqual([True, False, True, True, False, True],
+          securesystemslib.ed25519_keys.verify_signatures(bad_jobs,
+          use_pynacl))
+      self.assertEqual([True],
+          securesystemslib.ed25519_keys.verify_signatures(jobs[:1],
+          use_pynacl))
+
+    # The pure Python implementation rejects data that is not bytes-like.
+    bad_jobs[4] = jobs[4][:3] + (123,)
+    self.assertEqual([True, False, True, True, False, True],
+        securesystemslib.ed25519_keys.verify_signatures(bad_jobs))
+
+    # The batch equation of the pure Python implementation fails if one of
+    # the signatures is invalid.
+    ed25519 = securesystemslib._vendor.ed25519.ed25519
+    batch = [(signature, data, public_key, None)
+        for public_key, scheme, signature, data in jobs]
+    ed25519.checkbatch(batch)
+    for index in range(len(batch)):
+      signature, data, public_key, precomputed = batch[index]
+      bad_signature = signature[:32] + \
+          ed25519.encodeint(ed25519.decodeint(signature[32:]) + 1)
+      self.assertRaises(ed25519.SignatureMismatch, ed25519.checkbatch,
+          batch[:index] + [(bad_signature, data, public_key, None)] +
+          batch[index + 1:])
+
+    # A signature whose R has a component of order 2 passes the cofactored
+    # equation of both checkvalid() and checkbatch(), whatever the random
+    # coefficients of the batch.
+    seed = os.urandom(32)
+    digest = ed25519.H(seed)
+    secret = ed25519.secret_scalar(digest)
+    public_key = ed25519.encodepoint(ed25519.scalarmult_B(secret))
+    R = ed25519.edwards_add(ed25519.scalarmult_B(12345),
+        (0, ed25519.q - 1, 1, 0))
+    h = ed25519.Hint(ed25519.encodepoint(R) + public_key, b'data')
+    torsion_signature = ed25519.encodepoint(R) + \
+        ed25519.encodeint((12345 + h * secret) % ed25519.l)
+
+    ed25519.checkvalid(torsion_signature, b'data', public_key)
+    for index in range(20):
+      ed25519.checkbatch(batch + [(torsion_signature, b'data', public_key,
+          None)])
+    self.assertEqual([True] * 7,
+        securesystemslib.ed25519_keys.verify_signatures(jobs +
+        [(public_key, 'ed25519', torsion_signature, b'data')]))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.verify_signatures, tuple(jobs))
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.verify_signatures, [jobs[0][:3]])
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.verify_signatures,
+        [(public, 'bad_scheme') + jobs[0][2:]])
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.verify_signatures,
+        [jobs[0][:2] + (b'bad_signature',) + jobs[0][3:]])
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.ed25519_keys.verify_signatures, jobs, 'False')
+
+
 # Run the unit tests.
 if __name__ == '__main__':
   unittest.main()
@@ -238,6 +238,38 @@ class TestHash(unittest.TestCase):
       self.assertEqual(digest_object_truth.digest(), digest_object.digest())
 
 
+  def test_update_binary_file_obj(self):
+    self._run_with_all_hash_libraries(self._do_update_binary_file_obj)
+
+
+  def _do_update_binary_file_obj(self, library):
+    # Binary file objects are read into a buffer, including a last chunk that
+    # is shorter than the others.
+    data = b'abcdefgh' * 4096 + b'abc'
+    file_obj = six.BytesIO(data)
+    file_obj.seek(10)
+    for algorithm in ['md5', 'sha1', 'sha224', 'sha256', 'sha384', 'sha512']:
+      digest_object_truth = securesystemslib.hash.digest(algorithm, library)
+      digest_object_truth.update(data)
+      digest_object = securesystemslib.hash.digest_fileobject(file_obj, algorithm, library)
+      self.assertEqual(digest_object_truth.digest(), digest_object.digest())
+
+    # Without memoryview (i.e., in Python 2.6), the chunks are read instead.
+    memoryview_type = six.moves.builtins.memoryview
+    del six.moves.builtins.memoryview
+
+    try:
+      digest_object = securesystemslib.hash.digest_fileobject(file_obj,
+          'sha256', library)
+
+    finally:
+      six.moves.builtins.memoryview = memoryview_type
+
+    digest_object_truth = securesystemslib.hash.digest('sha256', library)
+    digest_object_truth.update(data)
+    self.assertEqual(digest_object_truth.digest(), digest_object.digest())
+
+
   def test_unsupported_digest_algorithm_and_library(self):
     self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError, securesystemslib.hash.digest,
                       'sha123', 'hashlib')
@@ -42,6 +42,7 @@ if sys.version_info >= (2, 7):
 else:
   import unittest2 as unittest
 
+import securesystemslib.backends
 import securesystemslib.formats
 import securesystemslib.formats
 import securesystemslib.hash
@@ -180,6 +181,116 @@ class TestInterfaceFunctions(unittest.TestCase):
 
 
 
+  def test_import_signer_from_file(self):
+    # Test normal case.
+    temporary_directory = tempfile.mkdtemp(dir=self.temporary_directory)
+    data = 'The quick brown fox jumps over the lazy dog'
+
+    key_filepath = os.path.join('data', 'keystore', 'rsa_key')
+    signer = interface.import_signer_from_file(key_filepath, 'rsa', 'password')
+    public_key = interface.import_rsa_publickey_from_file(key_filepath + '.pub')
+    self.assertEqual(public_key['keyid'], signer.keyid)
+    self.assertTrue(securesystemslib.keys.verify_signature(public_key,
+        signer.sign(data), data))
+
+    ed25519_keypath = os.path.join(temporary_directory, 'ed25519_key')
+    interface.generate_and_write_ed25519_keypair(ed25519_keypath, password='pw')
+    signer = interface.import_signer_from_file(ed25519_keypath, 'ed25519', 'pw')
+    public_key = interface.import_ed25519_publickey_from_file(
+        ed25519_keypath + '.pub')
+    self.assertTrue(securesystemslib.keys.verify_signature(public_key,
+        signer.sign(data), data))
+
+    ecdsa_keypath = os.path.join(temporary_directory, 'ecdsa_key')
+    interface.generate_and_write_ecdsa_keypair(ecdsa_keypath, password='pw')
+    signer = interface.import_signer_from_file(ecdsa_keypath,
+        'ecdsa-sha2-nistp256', 'pw')
+    public_key = interface.import_ecdsa_publickey_from_file(
+        ecdsa_keypath + '.pub')
+    self.assertTrue(securesystemslib.keys.verify_signature(public_key,
+        signer.sign(data), data))
+
+    # Test a key file of an unexpected key type.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        interface.import_signer_from_file, ecdsa_keypath, 'ed25519', 'pw')
+
+    # Test improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        interface.import_signer_from_file, ecdsa_keypath, 'bad_keytype', 'pw')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        interface.import_signer_from_file, 3, 'rsa', 'pw')
+
+
+
+  def test_generate_and_import_keypairs(self):
+    temporary_directory = tempfile.mkdtemp(dir=self.temporary_directory)
+    keys_directory = os.path.join(temporary_directory, 'keys')
+
+    # Keys are encrypted and decrypted with pyca/cryptography, whichever
+    # general-purpose library other tests left selected.
+    default_general_library = securesystemslib.backends.get_general_library()
+    securesystemslib.backends.set_general_library('pyca-cryptography')
+
+    try:
+      names = ['root', 'targets', 'snapshot']
+      keyids = interface.generate_and_write_keypairs(keys_directory, names,
+          'ed25519', password='pw', max_workers=2)
+      self.assertEqual(sorted(names), sorted(keyids))
+
+      for name in names:
+        keyid, exception = keyids[name]
+        self.assertEqual(None, exception)
+        public_key = interface.import_ed25519_publickey_from_file(
+            os.path.join(keys_directory, name + '.pub'))
+        self.assertEqual(public_key['keyid'], keyid)
+
+      # A key of another type, a key with another password, and a file that
+      # is not a private key file.
+      interface.generate_and_write_keypairs(keys_directory, ['timestamp'],
+          'ecdsa-sha2-nistp256', password='pw')
+      interface.generate_and_write_ed25519_keypair(
+          os.path.join(keys_directory, 'mirrors'), password='other password')
+      with open(os.path.join(keys_directory, 'README'), 'w') as file_object:
+        file_object.write('Keys')
+
+      keys = interface.import_privatekeys_from_directory(keys_directory,
+          'ed25519', password='pw', max_workers=2)
+      self.assertEqual(sorted(names + ['mirrors', 'timestamp']), sorted(keys))
+
+      for name in names:
+        key_dict, exception = keys[name]
+        self.assertEqual(None, exception)
+        self.assertEqual(keyids[name][0], key_dict['keyid'])
+        self.assertEqual(interface.import_ed25519_privatekey_from_file(
+            os.path.join(keys_directory, name), 'pw'), key_dict)
+
+      self.assertEqual((None, securesystemslib.exceptions.FormatError),
+          (keys['timestamp'][0], type(keys['timestamp'][1])))
+      self.assertEqual((None, securesystemslib.exceptions.CryptoError),
+          (keys['mirrors'][0], type(keys['mirrors'][1])))
+
+      keys = interface.import_privatekeys_from_directory(keys_directory,
+          'ecdsa-sha2-nistp256', password='pw')
+      self.assertEqual(None, keys['timestamp'][1])
+
+    finally:
+      securesystemslib.backends.set_general_library(default_general_library)
+
+    # Test improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        interface.generate_and_write_keypairs, keys_directory, ['root'], 'rsa',
+        'pw')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        interface.generate_and_write_keypairs, keys_directory, 'root',
+        'ed25519', 'pw')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        interface.import_privatekeys_from_directory, 3, 'ed25519', 'pw')
+    self.assertRaises(securesystemslib.exceptions.Error,
+        interface.import_privatekeys_from_directory,
+        os.path.join(temporary_directory, 'missing'), 'ed25519', 'pw')
+
+
+
   def test_import_rsa_publickey_from_file(self):
     # Test normal case.
     temporary_directory = tempfile.mkdtemp(dir=self.temporary_directory)
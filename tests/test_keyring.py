@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  test_keyring.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Unit test for 'keyring.py'.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import copy
+import unittest
+import logging
+
+import securesystemslib.exceptions
+import securesystemslib.formats
+import securesystemslib.keyring
+import securesystemslib.keys
+
+logger = logging.getLogger('securesystemslib_test_keyring')
+
+KEYS = securesystemslib.keys
+DATA = 'The quick brown fox jumps over the lazy dog'
+
+
+class TestKeyRing(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.rsakey_dict = KEYS.generate_rsa_key()
+    cls.ed25519key_dict = KEYS.generate_ed25519_key()
+    cls.ecdsakey_dict = KEYS.generate_ecdsa_key()
+
+
+
+  def test_add_key(self):
+    key_ring = securesystemslib.keyring.KeyRing(['sha256', 'sha512'])
+
+    for key_dict in [self.rsakey_dict, self.ed25519key_dict,
+        self.ecdsakey_dict]:
+      keyid = key_ring.add_key(key_dict)
+      self.assertEqual(key_dict['keyid'], keyid)
+
+      # The key is indexed by the keyid of each hash algorithm.
+      keyids = KEYS.get_keyids([key_dict], ['sha256', 'sha512'])[0]
+      self.assertEqual(sorted(keyids.values()), key_ring.get_keyids(keyid))
+      for indexed_keyid in keyids.values():
+        self.assertTrue(indexed_keyid in key_ring)
+        self.assertTrue(key_ring.get_key(indexed_keyid) is
+            key_ring.get_key(keyid))
+
+      # Only the public part of the key is stored.
+      key = key_ring.get_key(keyid)
+      self.assertTrue(securesystemslib.formats.ANYKEY_SCHEMA.matches(key))
+      self.assertEqual({'public': key_dict['keyval']['public']},
+          key['keyval'])
+
+    self.assertEqual(3, len(key_ring))
+
+    # An identical public key is stored once, and indexed by any new keyid,
+    # e.g., that of one of its own keyid hash algorithms.
+    public_key_dict = copy.deepcopy(self.ed25519key_dict)
+    del public_key_dict['keyval']['private']
+    public_key_dict['keyid_hash_algorithms'] = ['sha384']
+    sha384_keyid = KEYS.get_keyids([public_key_dict], ['sha384'])[0]['sha384']
+    self.assertEqual(self.ed25519key_dict['keyid'],
+        key_ring.add_key(public_key_dict, keyid=sha384_keyid))
+    self.assertEqual(3, len(key_ring))
+    self.assertTrue(key_ring.get_key(sha384_keyid) is
+        key_ring.get_key(self.ed25519key_dict['keyid']))
+
+    # A key cannot be indexed by a keyid that is not one of its own, which
+    # could be that of another key.
+    for keyid in ['a' * 64, sha384_keyid]:
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          key_ring.add_key, self.rsakey_dict, keyid)
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          key_ring.add_key, dict(self.ecdsakey_dict, keyid=keyid))
+    self.assertFalse('a' * 64 in key_ring)
+    self.assertEqual(3, len(key_ring))
+
+    # A keyid cannot identify two different keys.
+    other_key_ring = securesystemslib.keyring.KeyRing()
+    other_key_ring.add_key(self.rsakey_dict)
+    other_key_ring._entries[sha384_keyid] = \
+        other_key_ring._entries[self.rsakey_dict['keyid']]
+    self.assertRaises(securesystemslib.exceptions.KeyAlreadyExistsError,
+        other_key_ring.add_key, public_key_dict, sha384_keyid)
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        key_ring.add_key, 'bad_key')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        key_ring.add_key, self.rsakey_dict, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.keyring.KeyRing, ['bad_algorithm'])
+
+
+
+  def test_add_keys_and_load_metadata(self):
+    key_ring = securesystemslib.keyring.KeyRing()
+    key_dicts = [self.rsakey_dict, self.ed25519key_dict]
+    self.assertEqual([key_dict['keyid'] for key_dict in key_dicts],
+        key_ring.add_keys(key_dicts))
+
+    # Keys as listed in metadata, including a duplicate.
+    keys_metadata = {}
+    for key_dict in [self.ed25519key_dict, self.ecdsakey_dict]:
+      key_metadata = KEYS.format_keyval_to_metadata(key_dict['keytype'],
+          key_dict['scheme'], key_dict['keyval'])
+      keys_metadata[key_dict['keyid']] = key_metadata
+
+    self.assertEqual(dict([(keyid, keyid) for keyid in keys_metadata]),
+        key_ring.load_metadata(keys_metadata))
+    self.assertEqual(3, len(key_ring))
+
+    # A keyid that does not match its key.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        key_ring.load_metadata, {'b' * 64: key_metadata})
+    self.assertFalse('b' * 64 in key_ring)
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        key_ring.load_metadata, 'bad_metadata')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        key_ring.add_keys, 'bad_keys')
+
+
+
+  def test_verify_signature(self):
+    key_ring = securesystemslib.keyring.KeyRing()
+
+    for key_dict in [self.rsakey_dict, self.ed25519key_dict,
+        self.ecdsakey_dict]:
+      keyid = key_ring.add_key(key_dict)
+      signature = KEYS.create_signature(key_dict, DATA)
+
+      self.assertTrue(key_ring.verify_signature(signature, DATA))
+      self.assertFalse(key_ring.verify_signature(signature, 'mismatched data'))
+
+      # The Verifier of a key is created once.
+      verifier = key_ring.get_verifier(keyid)
+      self.assertTrue(isinstance(verifier, KEYS.Verifier))
+      self.assertTrue(verifier is key_ring.get_verifier(keyid))
+
+    # A signature by a key that is not in the key ring.
+    signature = KEYS.create_signature(self.ed25519key_dict, DATA)
+    signature['keyid'] = 'c' * 64
+    self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+        key_ring.verify_signature, signature, DATA)
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        key_ring.verify_signature, 'bad_signature', DATA)
+
+
+
+  def test_remove_key(self):
+    key_ring = securesystemslib.keyring.KeyRing(['sha256', 'sha512'])
+    keyid = key_ring.add_key(self.ed25519key_dict)
+    keyids = key_ring.get_keyids(keyid)
+    self.assertEqual(2, len(keyids))
+
+    # The key may be removed by any of its keyids.
+    key_ring.remove_key(keyids[1])
+    self.assertEqual(0, len(key_ring))
+    for indexed_keyid in keyids:
+      self.assertFalse(indexed_keyid in key_ring)
+
+    self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+        key_ring.remove_key, keyid)
+    self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+        key_ring.get_key, keyid)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        key_ring.get_key, 123)
+
+
+
+# Run the unit tests.
+if __name__ == '__main__':
+  unittest.main()
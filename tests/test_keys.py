@@ -25,14 +25,33 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import os
+import array
+import sys
+import copy
+import mmap
+import shutil
+import binascii
+import tempfile
 import unittest
 import logging
+import subprocess
 
+try:
+  import tracemalloc
 
+except ImportError: # pragma: no cover
+  tracemalloc = None
+
+import securesystemslib.backends
 import securesystemslib.exceptions
 import securesystemslib.formats
 import securesystemslib.keys
 import securesystemslib.ecdsa_keys
+import securesystemslib.pyca_crypto_keys
+import securesystemslib.settings
+
+import six
 
 logger = logging.getLogger('securesystemslib_test_keys')
 
@@ -52,9 +71,9 @@ class TestKeys(unittest.TestCase):
     cls.ecdsakey_dict = KEYS.generate_ecdsa_key()
 
   def test_generate_rsa_key(self):
-    default_rsa_library = KEYS._RSA_CRYPTO_LIBRARY
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
     for rsa_crypto_library in ['pycrypto', 'pyca-cryptography']:
-      KEYS._RSA_CRYPTO_LIBRARY = rsa_crypto_library
+      securesystemslib.backends.set_library('rsa', rsa_crypto_library)
 
       _rsakey_dict = KEYS.generate_rsa_key()
 
@@ -77,8 +96,43 @@ class TestKeys(unittest.TestCase):
       self.assertTrue(securesystemslib.formats.RSAKEY_SCHEMA.matches(KEYS.generate_rsa_key(2048)))
       self.assertTrue(securesystemslib.formats.RSAKEY_SCHEMA.matches(KEYS.generate_rsa_key(4096)))
 
+    # The library selected in 'securesystemslib.backends' generates the keys.
+    securesystemslib.backends.set_library('rsa', 'invalid')
+    self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
+        KEYS.generate_rsa_key)
+
     # Reset to originally set RSA crypto library.
-    KEYS._RSA_CRYPTO_LIBRARY = default_rsa_library
+    securesystemslib.backends.set_library('rsa', default_rsa_library)
+
+
+
+  def test_check_crypto_libraries(self):
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
+    default_general_library = securesystemslib.backends.get_general_library()
+
+    try:
+      KEYS.check_crypto_libraries(['rsa', 'ed25519', 'ecdsa-sha2-nistp256',
+          'general'])
+
+      # The libraries selected in 'securesystemslib.backends' are checked.
+      securesystemslib.backends.set_library('rsa', 'invalid')
+      self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
+          KEYS.check_crypto_libraries, ['rsa'])
+
+      # The most preferred available library is used if none is selected.
+      securesystemslib.backends.set_library('rsa', None)
+      KEYS.check_crypto_libraries(['rsa'])
+
+      securesystemslib.backends.set_general_library('invalid')
+      self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
+          KEYS.check_crypto_libraries, ['general'])
+
+      self.assertRaises(securesystemslib.exceptions.FormatError,
+          KEYS.check_crypto_libraries, ['bad_library'])
+
+    finally:
+      securesystemslib.backends.set_library('rsa', default_rsa_library)
+      securesystemslib.backends.set_general_library(default_general_library)
 
 
 
@@ -236,10 +290,56 @@ class TestKeys(unittest.TestCase):
                      FORMAT_ERROR_MSG)
 
 
+  def test_get_keyids(self):
+    key_dicts = [self.rsakey_dict, self.ed25519key_dict, self.ecdsakey_dict]
+
+    KEYS._keyid_cache.clear()
+    keyids = KEYS.get_keyids(key_dicts, ['sha256', 'sha512'])
+    self.assertEqual(3, len(keyids))
+
+    for key_dict, key_keyids in zip(key_dicts, keyids):
+      self.assertEqual(key_dict['keyid'], key_keyids['sha256'])
+      self.assertTrue(securesystemslib.formats.KEYID_SCHEMA.matches(
+          key_keyids['sha512']))
+
+      # Compare against keyids computed without the cache.
+      KEYS._keyid_cache.clear()
+      for hash_algorithm in ['sha256', 'sha512']:
+        self.assertEqual(key_keyids[hash_algorithm], KEYS._get_keyid(
+            key_dict['keytype'], key_dict['scheme'], key_dict['keyval'],
+            hash_algorithm))
+
+    # The default hash algorithms.
+    keyids = KEYS.get_keyids(key_dicts[:1])
+    self.assertEqual(set(['sha256'] + securesystemslib.settings.HASH_ALGORITHMS),
+        set(keyids[0]))
+
+    # Cached keyids are reused.
+    stats = KEYS._keyid_cache.stats()
+    KEYS.format_metadata_to_key(self.rsakey_dict)
+    self.assertEqual(stats['hits'] + 1, KEYS._keyid_cache.stats()['hits'])
+
+    # Keyids depend on 'settings.HASH_ALGORITHMS'.
+    hash_algorithms = securesystemslib.settings.HASH_ALGORITHMS
+    securesystemslib.settings.HASH_ALGORITHMS = ['sha256']
+    self.assertNotEqual(self.rsakey_dict['keyid'],
+        KEYS.get_keyids([self.rsakey_dict])[0]['sha256'])
+    securesystemslib.settings.HASH_ALGORITHMS = hash_algorithms
+    self.assertEqual(self.rsakey_dict['keyid'],
+        KEYS.get_keyids([self.rsakey_dict])[0]['sha256'])
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.get_keyids, self.rsakey_dict)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.get_keyids, key_dicts, ['bad_algorithm'])
+
+
+
   def test_create_signature(self):
-    default_rsa_library = KEYS._RSA_CRYPTO_LIBRARY
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
     for rsa_crypto_library in ['pycrypto', 'pyca-cryptography']:
-      KEYS._RSA_CRYPTO_LIBRARY = rsa_crypto_library
+      securesystemslib.backends.set_library('rsa', rsa_crypto_library)
 
       # Creating a signature for 'DATA'.
       rsa_signature = KEYS.create_signature(self.rsakey_dict, DATA)
@@ -272,12 +372,14 @@ class TestKeys(unittest.TestCase):
       self.assertRaises(TypeError, KEYS.create_signature)
       self.rsakey_dict['keyval']['private'] = private
 
-    KEYS._RSA_CRYPTO_LIBRARY = default_rsa_library
+    securesystemslib.backends.set_library('rsa', default_rsa_library)
 
     # Test generation of ECDSA signatures.
-    default_ecdsa_library = KEYS._ECDSA_CRYPTO_LIBRARY
+    default_ecdsa_library = securesystemslib.backends.get_library(
+        'ecdsa-sha2-nistp256')
     for ecdsa_crypto_library in ['pyca-cryptography']:
-      KEYS._ECDSA_CRYPTO_LIBRARY = ecdsa_crypto_library
+      securesystemslib.backends.set_library('ecdsa-sha2-nistp256',
+          ecdsa_crypto_library)
 
       # Creating a signature for 'DATA'.
       ecdsa_signature = KEYS.create_signature(self.ecdsakey_dict, DATA)
@@ -302,16 +404,287 @@ class TestKeys(unittest.TestCase):
       self.assertRaises(TypeError, KEYS.create_signature)
       self.ecdsakey_dict['keyval']['private'] = private
 
+    securesystemslib.backends.set_library('ecdsa-sha2-nistp256',
+        default_ecdsa_library)
+
+
+
+
+  def test_signer(self):
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
+    for rsa_crypto_library in ['pycrypto', 'pyca-cryptography']:
+      securesystemslib.backends.set_library('rsa', rsa_crypto_library)
+
+      for key_dict in [self.rsakey_dict, self.ed25519key_dict,
+          self.ecdsakey_dict]:
+        signer = KEYS.Signer(key_dict)
+        self.assertEqual(key_dict['keyid'], signer.keyid)
+
+        signature = signer.sign(DATA)
+        self.assertTrue(securesystemslib.formats.SIGNATURE_SCHEMA.matches(signature))
+        self.assertTrue(KEYS.verify_signature(key_dict, signature, DATA))
+
+        signatures = signer.sign_many([DATA, 'other data'])
+        self.assertEqual(2, len(signatures))
+        self.assertTrue(KEYS.verify_signature(key_dict, signatures[0], DATA))
+        self.assertTrue(KEYS.verify_signature(key_dict, signatures[1],
+            'other data'))
+
+        signature = signer.sign_over_bytes(bytearray(b'data'))
+        self.assertTrue(KEYS.verify_signature_over_bytes(key_dict, signature,
+            b'data'))
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            signer.sign_over_bytes, DATA)
+
+    securesystemslib.backends.set_library('rsa', default_rsa_library)
+
+    # ed25519 signatures are deterministic, and are identical to those of
+    # create_signature().
+    self.assertEqual(KEYS.create_signature(self.ed25519key_dict, DATA),
+        KEYS.Signer(self.ed25519key_dict).sign(DATA))
+
+    # Test for a key without a private part.
+    for key_dict in [self.rsakey_dict, self.ed25519key_dict,
+        self.ecdsakey_dict]:
+      private = key_dict['keyval']['private']
+      key_dict['keyval']['private'] = ''
+      self.assertRaises(securesystemslib.exceptions.FormatError, KEYS.Signer,
+          key_dict)
+      key_dict['keyval']['private'] = private
+
+    # Test for an invalid signature scheme.
+    valid_scheme = self.rsakey_dict['scheme']
+    self.rsakey_dict['scheme'] = 'invalid_scheme'
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        KEYS.Signer, self.rsakey_dict)
+    self.rsakey_dict['scheme'] = valid_scheme
+
+    # Test for an invalid private key.
+    private = self.ecdsakey_dict['keyval']['private']
+    self.ecdsakey_dict['keyval']['private'] = self.rsakey_dict['keyval']['private']
+    self.assertRaises(securesystemslib.exceptions.FormatError, KEYS.Signer,
+        self.ecdsakey_dict)
+    self.ecdsakey_dict['keyval']['private'] = private
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError, KEYS.Signer,
+        'bad_key')
+
+
+
+  def test_verifier(self):
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
+    for rsa_crypto_library in ['pycrypto', 'pyca-cryptography']:
+      securesystemslib.backends.set_library('rsa', rsa_crypto_library)
+
+      for key_dict in [self.rsakey_dict, self.ed25519key_dict,
+          self.ecdsakey_dict]:
+        verifier = KEYS.Verifier(key_dict)
+        self.assertEqual(key_dict['keyid'], verifier.keyid)
+
+        signature = KEYS.create_signature(key_dict, DATA)
+        self.assertTrue(verifier.verify(signature, DATA))
+        self.assertFalse(verifier.verify(signature, 'mismatched data'))
+
+    securesystemslib.backends.set_library('rsa', default_rsa_library)
+
+    # Only the public part of the key is needed.
+    public_key_dict = copy.deepcopy(self.ed25519key_dict)
+    del public_key_dict['keyval']['private']
+    signature = KEYS.create_signature(self.ed25519key_dict, DATA)
+    self.assertTrue(KEYS.Verifier(public_key_dict).verify(signature, DATA))
+
+    # Test for an invalid signature scheme.
+    valid_scheme = self.ecdsakey_dict['scheme']
+    self.ecdsakey_dict['scheme'] = 'invalid_scheme'
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        KEYS.Verifier, self.ecdsakey_dict)
+    self.ecdsakey_dict['scheme'] = valid_scheme
+
+    # Test for an invalid public key.
+    public = self.ecdsakey_dict['keyval']['public']
+    self.ecdsakey_dict['keyval']['public'] = self.rsakey_dict['keyval']['public']
+    self.assertRaises(securesystemslib.exceptions.FormatError, KEYS.Verifier,
+        self.ecdsakey_dict)
+    self.ecdsakey_dict['keyval']['public'] = public
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError, KEYS.Verifier,
+        'bad_key')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.Verifier(self.ed25519key_dict).verify, 'bad_signature', DATA)
+
+
+
+  def test_key_and_signature_objects(self):
+    for key_dict in [self.rsakey_dict, self.ed25519key_dict,
+        self.ecdsakey_dict]:
+      key = KEYS.Key.from_dict(key_dict)
+      self.assertEqual(key_dict, key.to_dict())
+      self.assertEqual(key_dict['keyid'], key.keyid)
+      self.assertEqual(binascii.unhexlify(key_dict['keyid']), key.keyid_bytes)
+      self.assertEqual(key, KEYS.Key.from_dict(key_dict))
+      self.assertEqual(hash(key), hash(KEYS.Key.from_dict(key_dict)))
+      self.assertEqual(key, copy.deepcopy(key))
+
+      # Key and Signature objects are accepted in place of dictionaries.
+      signature = KEYS.create_signature(key, DATA)
+      self.assertTrue(KEYS.verify_signature(key_dict, signature, DATA))
+
+      signature = KEYS.Signature.from_dict(signature)
+      self.assertEqual(signature, KEYS.Signature.from_dict(signature.to_dict()))
+      self.assertTrue(KEYS.verify_signature(key, signature, DATA))
+      self.assertFalse(KEYS.verify_signature(key, signature, 'bad data'))
+      self.assertTrue(KEYS.Verifier(key).verify(signature, DATA))
+      self.assertEqual({key.keyid: True}, KEYS.verify_signable(
+          {'signed': DATA, 'signatures': [signature]}, [key]))
+
+    # The raw bytes of ed25519 keys, and the lazily computed hex strings.
+    key = KEYS.Key.from_dict(self.ed25519key_dict)
+    self.assertEqual(32, len(key.raw_public))
+    self.assertEqual(self.ed25519key_dict['keyval']['public'], key.public)
+    self.assertEqual(self.ed25519key_dict['keyval']['private'], key.private)
+    self.assertTrue(key.keyid is key.keyid)
+
+    # Key objects without a private part, and constructed from raw bytes.
+    public_key = KEYS.Key(key.keytype, key.scheme, key.keyid_bytes,
+        key.raw_public)
+    self.assertEqual(None, public_key.private)
+    self.assertFalse('private' in public_key.to_dict()['keyval'])
+    self.assertNotEqual(key, public_key)
+    self.assertFalse('private' in repr(key))
+
+    # Hex strings that hexlify() would not reproduce are kept.
+    signature_dict = KEYS.create_signature(self.ed25519key_dict, DATA)
+    signature_dict['sig'] = signature_dict['sig'].upper()
+    self.assertEqual(signature_dict,
+        KEYS.Signature.from_dict(signature_dict).to_dict())
+
+    # Key and Signature objects are immutable.
+    signature = KEYS.Signature.from_dict(signature_dict)
+    self.assertRaises(AttributeError, setattr, key, 'keytype', 'rsa')
+    self.assertRaises(AttributeError, setattr, signature, '_sig', b'')
+    self.assertRaises(AttributeError, delattr, key, '_keyid')
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.Key.from_dict, 'bad_key')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.Key, 'ed25519', 'ed25519', key.keyid, key.raw_public)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.Key, 'ed25519', 'ed25519', key.keyid_bytes, b'short')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.Signature.from_dict, {'keyid': key.keyid, 'sig': 'abc'})
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.Signature, key.keyid_bytes, 'not bytes')
+
+
+
+  def test_signature_over_bytes(self):
+    canonical_data = \
+      securesystemslib.formats.encode_canonical(DATA).encode('utf-8')
+
+    for key_dict in [self.rsakey_dict, self.ed25519key_dict,
+        self.ecdsakey_dict]:
+      for data in [canonical_data, bytearray(canonical_data),
+          memoryview(canonical_data)]:
+        signature = KEYS.create_signature_over_bytes(key_dict, data)
+        self.assertTrue(securesystemslib.formats.SIGNATURE_SCHEMA.matches(signature))
+
+        # Signatures over the canonical encoding of 'DATA' are signatures of
+        # 'DATA'.
+        self.assertTrue(KEYS.verify_signature(key_dict, signature, DATA))
+        self.assertTrue(KEYS.verify_signature_over_bytes(key_dict, signature,
+            data))
+        self.assertFalse(KEYS.verify_signature_over_bytes(key_dict, signature,
+            b'bad_data'))
+
+      signature = KEYS.create_signature(key_dict, DATA)
+      self.assertTrue(KEYS.verify_signature_over_bytes(key_dict, signature,
+          canonical_data))
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.create_signature_over_bytes, self.ed25519key_dict, DATA)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.create_signature_over_bytes, 'bad_key', canonical_data)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.create_signature_over_bytes, self.ed25519key_dict,
+        memoryview(canonical_data)[::2])
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signature_over_bytes, self.ed25519key_dict, signature,
+        array.array('I', [1, 2, 3]))
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signature_over_bytes, self.ed25519key_dict, signature, DATA)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signature_over_bytes, self.ed25519key_dict, 'bad_signature',
+        canonical_data)
+
+
+
+  @unittest.skipIf(tracemalloc is None, 'tracemalloc is unavailable')
+  def test_signature_over_large_buffers(self):
+    # Bytes-like data is passed to the cryptography libraries without a copy,
+    # so that signing and verifying it allocates much less memory than its
+    # size.  Ed25519 signatures with PyNaCl, which only accepts bytes (and
+    # copies the message itself), are not measured.
+    size = 8 * 1024 * 1024
+    data = bytearray(size)
+    mapped_data = mmap.mmap(-1, size)
+
+    def get_peak_allocation(function, *args):
+      # The library is imported, and the key loaded, before the allocations
+      # are measured.
+      function(*args)
+      tracemalloc.start()
+      try:
+        result = function(*args)
+        return result, tracemalloc.get_traced_memory()[1]
+
+      finally:
+        tracemalloc.stop()
+
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
+
+    try:
+      for key_dict, library in [(self.rsakey_dict, 'pyca-cryptography'),
+          (self.rsakey_dict, 'pycrypto'), (self.ecdsakey_dict, None)]:
+        if library is not None:
+          securesystemslib.backends.set_library('rsa', library)
+
+        for buffer in [data, memoryview(data), mapped_data]:
+          signature, peak = get_peak_allocation(
+              KEYS.create_signature_over_bytes, key_dict, buffer)
+          self.assertTrue(peak < size // 8)
+
+          valid_signature, peak = get_peak_allocation(
+              KEYS.verify_signature_over_bytes, key_dict, signature, buffer)
+          self.assertTrue(valid_signature)
+          self.assertTrue(peak < size // 8)
+
+      # The pure Python implementation of ed25519 hashes the data as is.
+      signature = KEYS.create_signature_over_bytes(self.ed25519key_dict, data)
+      securesystemslib.backends.set_backend('ed25519', 'ed25519', 'verify',
+          'ed25519')
+      valid_signature, peak = get_peak_allocation(
+          KEYS.verify_signature_over_bytes, self.ed25519key_dict, signature,
+          memoryview(data))
+      self.assertTrue(valid_signature)
+      self.assertTrue(peak < size // 8)
+
+    finally:
+      securesystemslib.backends.set_library('rsa', default_rsa_library)
+      securesystemslib.backends.set_backend('ed25519', 'ed25519', 'verify',
+          None)
+      mapped_data.close()
 
 
 
   def test_verify_signature(self):
-    default_rsa_library = KEYS._RSA_CRYPTO_LIBRARY
-    default_available_libraries = KEYS._available_crypto_libraries
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
 
     for crypto_library in ['pycrypto', 'pyca-cryptography']:
-      KEYS._RSA_CRYPTO_LIBRARY = crypto_library
-      KEYS._ECDSA_CRYPTO_LIBRARY = crypto_library
+      securesystemslib.backends.set_library('rsa', crypto_library)
 
       # Creating a signature of 'DATA' to be verified.
       rsa_signature = KEYS.create_signature(self.rsakey_dict, DATA)
@@ -393,25 +766,302 @@ class TestKeys(unittest.TestCase):
       # Passing incorrect number of arguments.
       self.assertRaises(TypeError, KEYS.verify_signature)
 
-      # Verify that the pure python 'ed25519' base case (triggered if 'pynacl'
-      # is unavailable) is executed in securesystemslib.keys.verify_signature().
-      KEYS._ED25519_CRYPTO_LIBRARY = 'invalid'
-      KEYS._available_crypto_libraries = ['invalid']
+      # Verify that the pure python 'ed25519' backend (used if 'pynacl' is
+      # unavailable) is executed in securesystemslib.keys.verify_signature().
+      securesystemslib.backends.set_library('ed25519', 'ed25519')
       verified = KEYS.verify_signature(self.ed25519key_dict, ed25519_signature, DATA)
       self.assertTrue(verified, "Incorrect signature.")
 
-      # Reset to the expected available crypto libraries.
-      KEYS._ED25519_CRYPTO_LIBRARY = 'pynacl'
-      KEYS._available_crypto_libraries = default_available_libraries
+      # Reset to the most preferred available library.
+      securesystemslib.backends.set_library('ed25519', None)
+
+    securesystemslib.backends.set_library('rsa', default_rsa_library)
+
+
+
+  def test_verify_signatures(self):
+    other_ed25519key_dict = KEYS.generate_ed25519_key()
+    _DATA = '1111' + DATA + '1111'
+    jobs = []
+    for key_dict in [self.rsakey_dict, self.ed25519key_dict,
+        self.ecdsakey_dict, other_ed25519key_dict]:
+      signature = KEYS.create_signature(key_dict, DATA)
+      jobs.extend([(key_dict, signature, DATA), (key_dict, signature, _DATA)])
+
+    expected_results = [KEYS.verify_signature(*job) for job in jobs]
+    self.assertEqual([True, False] * 4, expected_results)
+
+    # The ed25519 signatures are verified in a batch by the pure Python
+    # implementation.
+    try:
+      for library in [None, 'ed25519']:
+        securesystemslib.backends.set_library('ed25519', library)
+        self.assertEqual(expected_results, KEYS.verify_signatures(jobs))
+
+        valid_jobs = [job for job, valid in zip(jobs, expected_results)
+            if valid]
+        self.assertEqual([True] * 4, KEYS.verify_signatures(valid_jobs))
+        self.assertEqual([], KEYS.verify_signatures([]))
+
+        # The exception of the first job that raises one is raised.
+        bad_key_dict = copy.deepcopy(self.ed25519key_dict)
+        bad_key_dict['scheme'] = 'invalid_scheme'
+        self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+            KEYS.verify_signatures, valid_jobs + [(bad_key_dict, jobs[2][1],
+            DATA), (self.ed25519key_dict, 123, DATA)])
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            KEYS.verify_signatures, valid_jobs + [(self.ed25519key_dict, 123,
+            DATA), (bad_key_dict, jobs[2][1], DATA)])
+
+    finally:
+      securesystemslib.backends.set_library('ed25519', None)
+
+    # The signatures of other key types are verified before 'ed25519_keys.py'
+    # has been imported.
+    code = ('import securesystemslib.keys\n'
+        'key_dict = securesystemslib.keys.generate_ecdsa_key()\n'
+        'signature = securesystemslib.keys.create_signature(key_dict, "data")\n'
+        'print(securesystemslib.keys.verify_signatures([(key_dict,'
+        ' signature, "data")]))\n')
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))
+    output = subprocess.check_output([sys.executable, '-c', code],
+        env=environment)
+    self.assertEqual('[True]', output.decode('utf-8').strip())
+
+    # Test improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signatures, tuple(jobs))
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signatures, [jobs[0][:2]])
+
+
+
+  def test_verify_signable(self):
+    signed = {'data': DATA}
+    key_dicts = [self.rsakey_dict, self.ed25519key_dict, self.ecdsakey_dict]
+
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
+    for rsa_crypto_library in ['pycrypto', 'pyca-cryptography']:
+      securesystemslib.backends.set_library('rsa', rsa_crypto_library)
+
+      signable = {'signed': signed, 'signatures':
+          [KEYS.create_signature(key_dict, signed) for key_dict in key_dicts]}
+      expected_results = dict([(key_dict['keyid'], True)
+          for key_dict in key_dicts])
+      self.assertEqual(expected_results, KEYS.verify_signable(signable,
+          key_dicts))
+
+      # The results agree with verify_signature().
+      for signature, key_dict in zip(signable['signatures'], key_dicts):
+        self.assertTrue(KEYS.verify_signature(key_dict, signature, signed))
+
+    securesystemslib.backends.set_library('rsa', default_rsa_library)
+
+    # Signatures over different data are invalid.
+    bad_signable = {'signed': signed, 'signatures':
+        [KEYS.create_signature(key_dict, 'bad_data') for key_dict in key_dicts]}
+    expected_results = dict([(key_dict['keyid'], False)
+        for key_dict in key_dicts])
+    self.assertEqual(expected_results, KEYS.verify_signable(bad_signable,
+        key_dicts))
+
+    # A valid signature of a key that also has an invalid one.
+    bad_signable['signatures'].append(signable['signatures'][1])
+    self.assertTrue(KEYS.verify_signable(bad_signable,
+        key_dicts)[self.ed25519key_dict['keyid']])
+
+    # Signatures by keys that are not given are ignored.
+    self.assertEqual({self.ecdsakey_dict['keyid']: True},
+        KEYS.verify_signable(signable, [self.ecdsakey_dict]))
+    self.assertEqual({}, KEYS.verify_signable(signable, []))
+
+    # A signature that is improperly formatted for its key type is invalid.
+    truncated_signable = {'signed': signed, 'signatures':
+        [{'keyid': self.ed25519key_dict['keyid'], 'sig': 'abcd'}]}
+    self.assertEqual({self.ed25519key_dict['keyid']: False},
+        KEYS.verify_signable(truncated_signable, key_dicts))
+
+    # So is a signature that is an odd-length hex string, which
+    # verify_signature() rejects as improperly formatted.
+    odd_length_signature = {'keyid': self.ed25519key_dict['keyid'],
+        'sig': 'abc'}
+    truncated_signable['signatures'] = [odd_length_signature]
+    self.assertEqual({self.ed25519key_dict['keyid']: False},
+        KEYS.verify_signable(truncated_signable, key_dicts))
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signature, self.ed25519key_dict, odd_length_signature,
+        signed)
+
+    # Test for an invalid signature scheme.
+    valid_scheme = self.rsakey_dict['scheme']
+    self.rsakey_dict['scheme'] = 'invalid_scheme'
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        KEYS.verify_signable, signable, key_dicts)
+    self.rsakey_dict['scheme'] = valid_scheme
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signable, signed, key_dicts)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signable, signable, self.rsakey_dict)
+
+
+
+  def test_get_signature_status(self):
+    signed = {'data': DATA}
+    key_dicts = [self.rsakey_dict, self.ed25519key_dict, self.ecdsakey_dict]
+    keyids = [key_dict['keyid'] for key_dict in key_dicts]
+    signatures = [KEYS.create_signature(key_dict, signed)
+        for key_dict in key_dicts]
+    signable = {'signed': signed, 'signatures': signatures}
+
+    # All signatures are verified if 'full_status' is True.
+    status = KEYS.get_signature_status(signable, key_dicts, keyids, 1,
+        full_status=True)
+    self.assertTrue(securesystemslib.formats.SIGNATURESTATUS_SCHEMA.matches(status))
+    self.assertEqual(keyids, status['good_sigs'])
+    self.assertEqual(1, status['threshold'])
+
+    # Verification stops as soon as the threshold is met.
+    status = KEYS.get_signature_status(signable, key_dicts, keyids, 2)
+    self.assertEqual(keyids[:2], status['good_sigs'])
+
+    # The threshold is not met.
+    status = KEYS.get_signature_status(signable, key_dicts, keyids[:1], 2)
+    self.assertEqual(keyids[:1], status['good_sigs'])
+    self.assertEqual(keyids[1:], status['untrusted_sigs'])
+
+    # Unknown and untrusted signatures are not verified, and duplicate
+    # signatures by the same key are listed once.
+    bad_signature = {'keyid': keyids[1], 'sig': signatures[0]['sig']}
+    unknown_signature = {'keyid': '0' * 64, 'sig': signatures[0]['sig']}
+    signable = {'signed': signed, 'signatures': [bad_signature, bad_signature,
+        unknown_signature, unknown_signature, signatures[0], signatures[2],
+        signatures[1], signatures[1]]}
+
+    status = KEYS.get_signature_status(signable, key_dicts, keyids[1:], 2,
+        full_status=True)
+    self.assertEqual({'threshold': 2, 'good_sigs': [keyids[2], keyids[1]],
+        'bad_sigs': [], 'unknown_sigs': ['0' * 64],
+        'untrusted_sigs': [keyids[0]]}, status)
+
+    status = KEYS.get_signature_status(signable, key_dicts, keyids[2:], 1,
+        full_status=True)
+    self.assertEqual([keyids[2]], status['good_sigs'])
+    self.assertEqual([keyids[1], keyids[0]], status['untrusted_sigs'])
+
+    status = KEYS.get_signature_status(signable, key_dicts, keyids[1:2], 1)
+    self.assertEqual([keyids[1]], status['good_sigs'])
+    self.assertEqual([], status['bad_sigs'])
+
+    # Only a bad signature.
+    signable['signatures'] = [bad_signature]
+    status = KEYS.get_signature_status(signable, key_dicts, keyids, 1)
+    self.assertEqual([], status['good_sigs'])
+    self.assertEqual([keyids[1]], status['bad_sigs'])
+
+    # A signature that is an odd-length hex string is bad, but the other
+    # signatures are still verified.
+    signable['signatures'] = [{'keyid': keyids[1], 'sig': 'abc'},
+        signatures[2]]
+    status = KEYS.get_signature_status(signable, key_dicts, keyids, 1)
+    self.assertEqual([keyids[2]], status['good_sigs'])
+    self.assertEqual([keyids[1]], status['bad_sigs'])
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.get_signature_status, signable, key_dicts, keyids, 0)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.get_signature_status, signed, key_dicts, keyids, 1)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.get_signature_status, signable, key_dicts, keyids[0], 1)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.get_signature_status, signable, key_dicts, keyids, 1, 'True')
+
+
+
+  def test_signature_over_file(self):
+    key_dicts = [self.rsakey_dict, self.ed25519key_dict, self.ecdsakey_dict]
+    contents = b'The quick brown fox jumps over the lazy dog' * 10000
+
+    temporary_directory = tempfile.mkdtemp()
+    filename = os.path.join(temporary_directory, 'file')
+    with open(filename, 'wb') as file_object:
+      file_object.write(contents)
+
+    for key_dict in key_dicts:
+      signature = KEYS.create_signature_over_filename(key_dict, filename)
+      self.assertTrue(securesystemslib.formats.SIGNATURE_SCHEMA.matches(signature))
+      self.assertTrue(KEYS.verify_signature_over_filename(key_dict, signature,
+          filename))
+      self.assertTrue(KEYS.verify_signature_over_fileobject(key_dict,
+          signature, six.BytesIO(contents)))
+      self.assertFalse(KEYS.verify_signature_over_fileobject(key_dict,
+          signature, six.BytesIO(contents + b'.')))
+
+      # File objects are read from their current position.
+      file_object = six.BytesIO(b'header' + contents)
+      file_object.read(len(b'header'))
+      self.assertTrue(KEYS.verify_signature_over_fileobject(key_dict,
+          signature, file_object))
+
+      signature = KEYS.create_signature_over_fileobject(key_dict,
+          six.BytesIO(contents))
+      self.assertTrue(KEYS.verify_signature_over_filename(key_dict, signature,
+          filename))
+
+    # Prehashed RSA and ECDSA signatures are ordinary signatures over the
+    # contents.
+    for key_dict in [self.rsakey_dict, self.ecdsakey_dict]:
+      signature = KEYS.create_signature_over_filename(key_dict, filename)
+      sig = binascii.unhexlify(signature['sig'].encode('utf-8'))
+      if key_dict['keytype'] == 'rsa':
+        self.assertTrue(securesystemslib.pyca_crypto_keys.verify_rsa_signature(
+            sig, key_dict['scheme'], key_dict['keyval']['public'], contents))
+
+      else:
+        self.assertTrue(securesystemslib.ecdsa_keys.verify_signature(
+            key_dict['keyval']['public'], key_dict['scheme'], sig, contents))
+
+    # Ed25519 file signatures are verified with the selected backend.
+    signature = KEYS.create_signature_over_filename(self.ed25519key_dict,
+        filename)
+    try:
+      for library in ['pynacl', 'ed25519']:
+        securesystemslib.backends.set_backend('ed25519', 'ed25519', 'verify',
+            library)
+        self.assertTrue(KEYS.verify_signature_over_filename(
+            self.ed25519key_dict, signature, filename))
+        self.assertFalse(KEYS.verify_signature_over_fileobject(
+            self.ed25519key_dict, signature, six.BytesIO(contents + b'.')))
+
+    finally:
+      securesystemslib.backends.set_backend('ed25519', 'ed25519', 'verify',
+          None)
+
+    # Test for a key without a private part.
+    private = self.ed25519key_dict['keyval']['private']
+    self.ed25519key_dict['keyval']['private'] = ''
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.create_signature_over_filename, self.ed25519key_dict, filename)
+    self.ed25519key_dict['keyval']['private'] = private
+
+    # Test for improperly formatted arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.create_signature_over_filename, self.ed25519key_dict, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.verify_signature_over_filename, self.ed25519key_dict, 'bad', filename)
 
-    KEYS._RSA_CRYPTO_LIBRARY = default_rsa_library
+    shutil.rmtree(temporary_directory)
 
 
 
   def test_create_rsa_encrypted_pem(self):
-    default_rsa_library = KEYS._RSA_CRYPTO_LIBRARY
+    default_rsa_library = securesystemslib.backends.get_library('rsa')
     for rsa_crypto_library in ['pycrypto', 'pyca-cryptography']:
-      KEYS._RSA_CRYPTO_LIBRARY = rsa_crypto_library
+      securesystemslib.backends.set_library('rsa', rsa_crypto_library)
 
       # Test valid arguments.
       private = self.rsakey_dict['keyval']['private']
@@ -434,13 +1084,12 @@ class TestKeys(unittest.TestCase):
                         private, 8)
 
       # Test for missing required library.
-      KEYS._RSA_CRYPTO_LIBRARY = 'invalid'
+      securesystemslib.backends.set_library('rsa', 'invalid')
       self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
                         KEYS.create_rsa_encrypted_pem,
                         private, passphrase)
-      KEYS._RSA_CRYPTO_LIBRARY = 'pycrypto'
 
-    KEYS._RSA_CRYPTO_LIBRARY = default_rsa_library
+    securesystemslib.backends.set_library('rsa', default_rsa_library)
 
 
 
@@ -643,9 +1292,9 @@ class TestKeys(unittest.TestCase):
 
 
   def test_decrypt_key(self):
-    default_general_library = KEYS._GENERAL_CRYPTO_LIBRARY
+    default_general_library = securesystemslib.backends.get_general_library()
     for general_crypto_library in ['pycrypto', 'pyca-cryptography']:
-      KEYS._GENERAL_CRYPTO_LIBRARY = general_crypto_library
+      securesystemslib.backends.set_general_library(general_crypto_library)
 
       # Test valid arguments.
       passphrase = 'secret'
@@ -662,13 +1311,13 @@ class TestKeys(unittest.TestCase):
                         encrypted_key, 8)
 
       # Test for missing required library.
-      KEYS._GENERAL_CRYPTO_LIBRARY = 'invalid'
+      securesystemslib.backends.set_general_library('invalid')
       self.assertRaises(securesystemslib.exceptions.UnsupportedLibraryError,
                         KEYS.decrypt_key,
                         encrypted_key, passphrase)
-      KEYS._GENERAL_CRYPTO_LIBRARY = 'pycrypto'
+      securesystemslib.backends.set_general_library('pycrypto')
 
-    KEYS._GENERAL_CRYPTO_LIBRARY = default_general_library
+    securesystemslib.backends.set_general_library(default_general_library)
 
 
 
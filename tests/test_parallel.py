@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+
+"""
+<Program Name>
+  test_parallel.py
+
+<Started>
+  October 18, 2026.
+
+<Copyright>
+  See LICENSE for licensing information.
+
+<Purpose>
+  Unit test for 'parallel.py'.
+"""
+
+# Help with Python 3 compatibility, where the print statement is a function, an
+# implicit relative import is invalid, and the '/' operator performs true
+# division.  Example:  print 'hello world' raises a 'SyntaxError' exception.
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import unittest
+import logging
+
+import securesystemslib.backends
+import securesystemslib.exceptions
+import securesystemslib.keys
+import securesystemslib.parallel
+
+logger = logging.getLogger('securesystemslib_test_parallel')
+
+KEYS = securesystemslib.keys
+DATA = 'The quick brown fox jumps over the lazy dog'
+
+
+class TestParallel(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.key_dicts = [KEYS.generate_rsa_key(), KEYS.generate_ed25519_key(),
+        KEYS.generate_ecdsa_key()]
+
+    # A valid and an invalid signature of every key.
+    cls.jobs = []
+    for index, key_dict in enumerate(cls.key_dicts):
+      data = {'index': index, 'data': DATA}
+      signature = KEYS.create_signature(key_dict, data)
+      cls.jobs.append((key_dict, signature, data))
+      cls.jobs.append((key_dict, signature, 'mismatched data'))
+
+    cls.serial_results = [KEYS.verify_signature(key_dict, signature, data)
+        for key_dict, signature, data in cls.jobs]
+
+
+
+  def test_verification_executor(self):
+    jobs = [(signature, data) for key_dict, signature, data in self.jobs]
+
+    for use_processes in [False, True]:
+      with securesystemslib.parallel.VerificationExecutor(self.key_dicts,
+          max_workers=2, chunk_size=1, use_processes=use_processes) as executor:
+        self.assertEqual(use_processes, executor.use_processes)
+        self.assertEqual(self.serial_results, executor.verify(jobs))
+
+        # The pool is reused, with Key and Signature objects as well.
+        self.assertEqual(self.serial_results, executor.verify(
+            [(KEYS.Signature.from_dict(signature), data)
+            for signature, data in jobs]))
+        self.assertEqual([], executor.verify([]))
+
+        # A signature by a key that the executor does not have.
+        signature = dict(jobs[0][0], keyid='a' * 64)
+        self.assertRaises(securesystemslib.exceptions.UnknownKeyError,
+            executor.verify, [(signature, DATA)])
+
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            executor.verify, 'bad_jobs')
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            executor.verify, [(jobs[0][0],)])
+        self.assertRaises(securesystemslib.exceptions.FormatError,
+            executor.verify, [('bad_signature', DATA)])
+
+    # Threads are used by default with GIL-releasing libraries only.
+    executor = securesystemslib.parallel.VerificationExecutor(
+        [KEYS.Key.from_dict(self.key_dicts[2])], max_workers=1)
+    self.assertFalse(executor.use_processes)
+    executor.close()
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.VerificationExecutor, 'bad_keys')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.VerificationExecutor, self.key_dicts, 0)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.VerificationExecutor, self.key_dicts, 1, 0)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.VerificationExecutor, self.key_dicts, 1,
+        None, 'bad_use_processes')
+
+
+
+  def test_verify_signatures(self):
+    for use_processes in [False, True]:
+      self.assertEqual(self.serial_results,
+          securesystemslib.parallel.verify_signatures(self.jobs, max_workers=3,
+          use_processes=use_processes))
+
+    self.assertEqual([], securesystemslib.parallel.verify_signatures([]))
+
+    # The exception of the first failed job is raised, as in the serial path.
+    key_dict = dict(self.key_dicts[1], scheme='unsupported_scheme')
+    signature = self.jobs[2][1]
+    jobs = self.jobs + [(key_dict, signature, DATA)]
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        KEYS.verify_signature, key_dict, signature, DATA)
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        securesystemslib.parallel.verify_signatures, jobs, 2, 1)
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.verify_signatures, 'bad_jobs')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.verify_signatures,
+        [('bad_key', self.jobs[0][1], DATA)])
+
+
+
+  def test_sign_payloads(self):
+    rsakey_dict, ed25519key_dict, ecdsakey_dict = self.key_dicts
+    payloads = {
+      'root.json': ({'_type': 'Root'}, [rsakey_dict, ed25519key_dict]),
+      'targets.json': ({'_type': 'Targets'},
+          [ed25519key_dict, KEYS.Key.from_dict(ecdsakey_dict)]),
+      'empty.json': ({'_type': 'Empty'}, [])}
+
+    for use_processes in [False, True]:
+      signatures = securesystemslib.parallel.sign_payloads(payloads,
+          max_workers=2, chunk_size=1, use_processes=use_processes)
+      self.assertEqual(sorted(payloads), sorted(signatures))
+      self.assertEqual([], signatures['empty.json'])
+
+      # The signatures are grouped per payload, in the order of its keys.
+      for name in ['root.json', 'targets.json']:
+        data, key_dicts = payloads[name]
+        self.assertEqual(len(key_dicts), len(signatures[name]))
+
+        for key_dict, signature in zip(key_dicts, signatures[name]):
+          if isinstance(key_dict, KEYS.Key):
+            key_dict = key_dict.to_dict()
+
+          self.assertEqual(key_dict['keyid'], signature['keyid'])
+          self.assertTrue(KEYS.verify_signature(key_dict, signature, data))
+
+      # Ed25519 signatures are deterministic, and equal those of the serial path.
+      self.assertEqual(KEYS.create_signature(ed25519key_dict, {'_type': 'Root'}),
+          signatures['root.json'][1])
+
+    # A key that is listed with several keyids signs once per listing, and
+    # each signature has the keyid of its listing.
+    metadata = KEYS.format_keyval_to_metadata(ed25519key_dict['keytype'],
+        ed25519key_dict['scheme'], ed25519key_dict['keyval'], private=True)
+    metadata['keyid_hash_algorithms'] = ['sha256', 'sha512']
+    key_dict, keyids = KEYS.format_metadata_to_key(metadata)
+    sha512_key_dict = dict(key_dict, keyid=[keyid for keyid in keyids
+        if keyid != key_dict['keyid']][0])
+
+    for use_processes in [False, True]:
+      signatures = securesystemslib.parallel.sign_payloads({'root.json':
+          (DATA, [key_dict, sha512_key_dict])}, use_processes=use_processes)
+      self.assertEqual([key_dict['keyid'], sha512_key_dict['keyid']],
+          [signature['keyid'] for signature in signatures['root.json']])
+      signable = {'signed': DATA, 'signatures': signatures['root.json']}
+      self.assertEqual({sha512_key_dict['keyid']: True},
+          KEYS.verify_signable(signable, [sha512_key_dict]))
+
+    self.assertEqual({}, securesystemslib.parallel.sign_payloads({}))
+
+    # The exception of the first failed signature is raised.
+    key_dict = dict(ed25519key_dict, scheme='unsupported_scheme')
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        KEYS.create_signature, key_dict, DATA)
+    self.assertRaises(securesystemslib.exceptions.UnsupportedAlgorithmError,
+        securesystemslib.parallel.sign_payloads,
+        {'root.json': (DATA, [ed25519key_dict, key_dict])}, 1)
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.sign_payloads, 'bad_payloads')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.sign_payloads, {'root.json': DATA})
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.sign_payloads,
+        {'root.json': (DATA, ['bad_key'])})
+
+
+
+  def test_encrypt_and_decrypt_keys(self):
+    # Keys are encrypted and decrypted with pyca/cryptography, whichever
+    # general-purpose library other tests left selected.
+    default_general_library = securesystemslib.backends.get_general_library()
+    securesystemslib.backends.set_general_library('pyca-cryptography')
+    self.assertTrue(securesystemslib.backends.general_library_releases_gil())
+
+    try:
+      for use_processes in [False, True]:
+        jobs = [(key_dict, 'password ' + str(index))
+            for index, key_dict in enumerate(self.key_dicts)]
+        jobs.append((KEYS.Key.from_dict(self.key_dicts[1]), 'password'))
+        results = securesystemslib.parallel.encrypt_keys(jobs, max_workers=2,
+            chunk_size=1, use_processes=use_processes)
+        self.assertEqual([None] * 4,
+            [exception for encrypted_key, exception in results])
+
+        jobs = [(encrypted_key, password) for (encrypted_key, exception),
+            (key_dict, password) in zip(results, jobs)]
+        jobs.append((jobs[0][0], 'wrong password'))
+        jobs.append((jobs[0][0], 123))
+        results = securesystemslib.parallel.decrypt_keys(jobs, max_workers=2,
+            use_processes=use_processes)
+
+        self.assertEqual(self.key_dicts + [self.key_dicts[1]],
+            [key_dict for key_dict, exception in results[:4]])
+
+        # The exception of every key that fails is reported.
+        self.assertEqual((None, securesystemslib.exceptions.CryptoError),
+            (results[4][0], type(results[4][1])))
+        self.assertEqual((None, securesystemslib.exceptions.FormatError),
+            (results[5][0], type(results[5][1])))
+
+    finally:
+      securesystemslib.backends.set_general_library(default_general_library)
+
+    self.assertEqual([], securesystemslib.parallel.encrypt_keys([]))
+    self.assertEqual([(None, securesystemslib.exceptions.FormatError)],
+        [(key_dict, type(exception)) for key_dict, exception in
+        securesystemslib.parallel.encrypt_keys([('bad_key', 'pw')], 1)])
+
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.decrypt_keys, 'bad_jobs')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.decrypt_keys, [('encrypted_key',)])
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.parallel.encrypt_keys, jobs, 0)
+
+
+
+  def test_library_releases_gil(self):
+    self.assertTrue(KEYS.library_releases_gil('ecdsa-sha2-nistp256'))
+    self.assertTrue(KEYS.library_releases_gil('ed25519') in [True, False])
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        KEYS.library_releases_gil, 123)
+
+
+
+# Run the unit tests.
+if __name__ == '__main__':
+  unittest.main()
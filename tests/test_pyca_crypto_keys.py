@@ -25,6 +25,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import hashlib
 import unittest
 import logging
 
@@ -93,6 +94,90 @@ class TestPyca_crypto_keys(unittest.TestCase):
 
 
 
+  def test_create_rsa_signature_with_key_object(self):
+    global private_rsa
+    global public_rsa
+    data = b'The quick brown fox jumps over the lazy dog'
+
+    private_key_object = \
+      securesystemslib.pyca_crypto_keys.load_rsa_private_key_object(private_rsa)
+    signature, scheme = \
+      securesystemslib.pyca_crypto_keys.create_rsa_signature_with_key_object(
+      private_key_object, data)
+    self.assertEqual('rsassa-pss-sha256', scheme)
+    self.assertTrue(securesystemslib.pyca_crypto_keys.verify_rsa_signature(
+        signature, scheme, public_rsa, data))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.CryptoError,
+        securesystemslib.pyca_crypto_keys.load_rsa_private_key_object,
+        public_rsa)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.load_rsa_private_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.create_rsa_signature_with_key_object,
+        private_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.create_rsa_signature_with_key_object,
+        private_key_object, data, 'bad_scheme')
+
+
+
+  def test_verify_rsa_signature_with_key_object(self):
+    global private_rsa
+    global public_rsa
+    data = b'The quick brown fox jumps over the lazy dog'
+
+    signature, scheme = securesystemslib.pyca_crypto_keys.create_rsa_signature(
+        private_rsa, data)
+    public_key_object = \
+      securesystemslib.pyca_crypto_keys.load_rsa_public_key_object(public_rsa)
+
+    self.assertTrue(
+        securesystemslib.pyca_crypto_keys.verify_rsa_signature_with_key_object(
+        public_key_object, signature, data))
+    self.assertFalse(
+        securesystemslib.pyca_crypto_keys.verify_rsa_signature_with_key_object(
+        public_key_object, signature, b'bad data'))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.CryptoError,
+        securesystemslib.pyca_crypto_keys.load_rsa_public_key_object,
+        private_rsa)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.load_rsa_public_key_object, 123)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.verify_rsa_signature_with_key_object,
+        public_key_object, signature, data, 'bad_scheme')
+
+
+
+  def test_create_rsa_signature_prehashed(self):
+    global public_rsa
+    global private_rsa
+    data = b'The quick brown fox jumps over the lazy dog'
+    digest = hashlib.sha256(data).digest()
+
+    signature, scheme = \
+      securesystemslib.pyca_crypto_keys.create_rsa_signature_prehashed(
+      private_rsa, digest)
+    self.assertEqual('rsassa-pss-sha256', scheme)
+    self.assertTrue(securesystemslib.pyca_crypto_keys.verify_rsa_signature(
+        signature, scheme, public_rsa, data))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.create_rsa_signature_prehashed,
+        private_rsa, data)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.create_rsa_signature_prehashed,
+        private_rsa, digest, 'bad_scheme')
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.create_rsa_signature_prehashed,
+        123, digest)
+
+
+
   def test_verify_rsa_signature(self):
     global public_rsa
     global private_rsa
@@ -138,6 +223,32 @@ class TestPyca_crypto_keys(unittest.TestCase):
                             scheme, public_rsa, data))
 
 
+  def test_verify_rsa_signature_prehashed(self):
+    global public_rsa
+    global private_rsa
+    data = b'The quick brown fox jumps over the lazy dog'
+    digest = hashlib.sha256(data).digest()
+    signature, scheme = \
+      securesystemslib.pyca_crypto_keys.create_rsa_signature(private_rsa, data)
+
+    self.assertTrue(securesystemslib.pyca_crypto_keys.verify_rsa_signature_prehashed(
+        signature, scheme, public_rsa, digest))
+    self.assertFalse(securesystemslib.pyca_crypto_keys.verify_rsa_signature_prehashed(
+        signature, scheme, public_rsa, hashlib.sha256(b'bad_data').digest()))
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.verify_rsa_signature_prehashed,
+        signature, scheme, public_rsa, data)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.verify_rsa_signature_prehashed,
+        signature, 'bad_scheme', public_rsa, digest)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.verify_rsa_signature_prehashed,
+        signature, scheme, public_rsa, 123)
+
+
+
   def test_create_rsa_encrypted_pem(self):
     global public_rsa
     global private_rsa
@@ -248,6 +359,21 @@ class TestPyca_crypto_keys(unittest.TestCase):
 
 
 
+  def test_derive_key(self):
+    derived_key = securesystemslib.pyca_crypto_keys.derive_key('pw', b'salt', 1000)
+    self.assertEqual(hashlib.pbkdf2_hmac('sha256', b'pw', b'salt', 1000, 32),
+        derived_key)
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.derive_key, 8, b'salt', 1000)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.derive_key, 'pw', 'salt', 1000)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pyca_crypto_keys.derive_key, 'pw', b'salt', 0)
+
+
+
 # Run the unit tests.
 if __name__ == '__main__':
   unittest.main()
@@ -25,6 +25,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import hashlib
 import unittest
 import logging
 
@@ -312,6 +313,20 @@ class TestPycrypto_keys(unittest.TestCase):
 
 
 
+  def test_derive_key(self):
+    derived_key = securesystemslib.pycrypto_keys.derive_key('pw', b'salt', 1000)
+    self.assertEqual(hashlib.pbkdf2_hmac('sha256', b'pw', b'salt', 1000, 32),
+        derived_key)
+
+    # Test for invalid arguments.
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pycrypto_keys.derive_key, 8, b'salt', 1000)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pycrypto_keys.derive_key, 'pw', 'salt', 1000)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.pycrypto_keys.derive_key, 'pw', b'salt', 0)
+
+
 
 # Run the unit tests.
 if __name__ == '__main__':
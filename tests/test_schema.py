@@ -27,6 +27,7 @@ from __future__ import unicode_literals
 
 import unittest
 import re
+import array
 import logging
 
 import securesystemslib.exceptions
@@ -419,6 +420,29 @@ class TestSchema(unittest.TestCase):
     self.assertFalse(anybytes_schema.matches(['a']))
     self.assertFalse(anybytes_schema.matches(3))
     self.assertFalse(anybytes_schema.matches({'a': 'string'}))
+    self.assertFalse(anybytes_schema.matches(bytearray(b'a string')))
+
+
+
+  def test_AnyBuffer(self):
+    # Test conditions for valid arguments.
+    anybuffer_schema = SCHEMA.AnyBuffer()
+
+    self.assertTrue(anybuffer_schema.matches(b''))
+    self.assertTrue(anybuffer_schema.matches(b'a string'))
+    self.assertTrue(anybuffer_schema.matches(bytearray(b'a string')))
+    self.assertTrue(anybuffer_schema.matches(memoryview(b'a string')[2:]))
+    self.assertTrue(anybuffer_schema.matches(array.array('B', [1, 2, 3])))
+
+    # Test conditions for invalid arguments.
+    self.assertFalse(anybuffer_schema.matches('a string'))
+    self.assertFalse(anybuffer_schema.matches(['a']))
+    self.assertFalse(anybuffer_schema.matches(3))
+    self.assertFalse(anybuffer_schema.matches({'a': 'string'}))
+
+    # Buffers must be contiguous and of bytes.
+    self.assertFalse(anybuffer_schema.matches(memoryview(b'a string')[::2]))
+    self.assertFalse(anybuffer_schema.matches(array.array('I', [1, 2, 3])))
 
 
 # Run the unit tests.
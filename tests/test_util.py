@@ -28,6 +28,7 @@ from __future__ import unicode_literals
 import os
 import sys
 import gzip
+import bz2
 import shutil
 import logging
 import tempfile
@@ -249,6 +250,65 @@ class TestUtil(unittest_toolbox.Modified_TestCase):
 
 
 
+  def test_A7_tempfile_decompress_bz2_and_xz(self):
+    data = b'securesystemslib' * 10000
+    compressed_data = {'bz2': bz2.compress(data)}
+
+    if 'xz' in securesystemslib.util.SUPPORTED_COMPRESSIONS:
+      import lzma
+      compressed_data['xz'] = lzma.compress(data)
+
+    for compression, compressed in six.iteritems(compressed_data):
+      temp_file = securesystemslib.util.TempFile()
+      temp_file.write(compressed)
+      temp_file.decompress_temp_file_object(compression)
+      self.assertEqual(data, temp_file.read())
+      temp_file.close_temp_file()
+
+      # Decompressed data that exceeds 'max_length'.
+      temp_file = securesystemslib.util.TempFile()
+      temp_file.write(compressed)
+      self.assertRaises(securesystemslib.exceptions.DecompressionError,
+          temp_file.decompress_temp_file_object, compression, len(data) - 1)
+      temp_file.close_temp_file()
+
+      # Decompressed data that is exactly 'max_length' bytes.
+      temp_file = securesystemslib.util.TempFile()
+      temp_file.write(compressed)
+      temp_file.decompress_temp_file_object(compression, len(data))
+      self.assertEqual(data, temp_file.read())
+      temp_file.close_temp_file()
+
+      # Invalid compressed data.
+      temp_file = securesystemslib.util.TempFile()
+      temp_file.write(b'bad compressed data')
+      self.assertRaises(securesystemslib.exceptions.DecompressionError,
+          temp_file.decompress_temp_file_object, compression)
+      temp_file.close_temp_file()
+
+    # Concatenated bz2 streams are decompressed one after the other, and
+    # truncated streams are rejected.
+    temp_file = securesystemslib.util.TempFile()
+    temp_file.write(compressed_data['bz2'] + bz2.compress(b'more data'))
+    temp_file.decompress_temp_file_object('bz2')
+    self.assertEqual(data + b'more data', temp_file.read())
+    temp_file.close_temp_file()
+
+    temp_file = securesystemslib.util.TempFile()
+    temp_file.write(compressed_data['bz2'][:-1])
+    self.assertRaises(securesystemslib.exceptions.DecompressionError,
+        temp_file.decompress_temp_file_object, 'bz2')
+    temp_file.close_temp_file()
+
+    # Improperly formatted 'max_length'.
+    temp_file = securesystemslib.util.TempFile()
+    temp_file.write(compressed_data['bz2'])
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        temp_file.decompress_temp_file_object, 'bz2', '1024')
+    temp_file.close_temp_file()
+
+
+
   def test_B1_get_file_details(self):
     # Goal: Verify proper output given certain expected/unexpected input.
 
@@ -355,6 +415,29 @@ class TestUtil(unittest_toolbox.Modified_TestCase):
     compressed_filepath = self._compress_existing_file(filepath)
     self.assertEqual(data, securesystemslib.util.load_json_file(compressed_filepath))
 
+    # Test bz2 and xz compressed files.
+    with open(filepath, 'rb') as file_object:
+      json_data = file_object.read()
+
+    with open(filepath + '.bz2', 'wb') as file_object:
+      file_object.write(bz2.compress(json_data))
+    self.assertEqual(data, securesystemslib.util.load_json_file(filepath + '.bz2'))
+
+    # Decompressed data that exceeds 'max_length'.
+    self.assertEqual(data, securesystemslib.util.load_json_file(
+        filepath + '.bz2', len(json_data)))
+    self.assertRaises(securesystemslib.exceptions.Error,
+        securesystemslib.util.load_json_file, filepath + '.bz2',
+        len(json_data) - 1)
+    self.assertRaises(securesystemslib.exceptions.FormatError,
+        securesystemslib.util.load_json_file, filepath + '.bz2', '1024')
+
+    if 'xz' in securesystemslib.util.SUPPORTED_COMPRESSIONS:
+      import lzma
+      with open(filepath + '.xz', 'wb') as file_object:
+        file_object.write(lzma.compress(json_data))
+      self.assertEqual(data, securesystemslib.util.load_json_file(filepath + '.xz'))
+
     # Improperly formatted arguments.
     for bogus_arg in [1, [b'a'], {'a':b'b'}]:
       self.assertRaises(securesystemslib.exceptions.FormatError, securesystemslib.util.load_json_file, bogus_arg)